@@ -0,0 +1,127 @@
+"""
+analysis_cache.py — Persistent intermediates for incremental pathway analysis.
+
+:class:`~metakg.analyze.PathwayAnalyzer` can keep what it computed in a
+SQLite sidecar (``<db>.analysis.sqlite`` by default) so later runs redo only
+what the graph changes invalidate:
+
+  **report** — the finished :class:`~metakg.analyze.PathwayAnalysisReport`,
+    reused as-is while the ``meta_nodes`` / ``meta_edges`` content version
+    (see :meth:`~metakg.store.MetaStore.content_version`) and the analyzer
+    options (``top_n``, centrality settings) match.
+    Changes to kinetic parameters or regulatory interactions do not affect
+    the analysis and keep the report valid.  Reuse is all-or-nothing: every
+    phase reads both tables, so any graph write reruns every phase (the
+    coupling phase then patches its matrix, below).
+
+  **coupling** — the full pathway × pathway shared-compound matrix with the
+    membership it was computed from; after a graph change only the rows of
+    pathways whose compound sets changed are recomputed.
+
+Entries are pickled; a format bump or an unreadable payload is a miss.
+
+Usage::
+
+    from metakg.analysis_cache import AnalysisCache
+    from metakg.analyze import PathwayAnalyzer
+
+    with PathwayAnalyzer(db, cache=AnalysisCache.for_db(db)) as analyzer:
+        report = analyzer.run()   # recomputes only what changed
+"""
+
+from __future__ import annotations
+
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+#: Bump when cached objects change shape so old pickles are never loaded.
+CACHE_FORMAT: int = 3
+
+_SCHEMA_SQL = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+
+CREATE TABLE IF NOT EXISTS analysis_cache (
+    name     TEXT PRIMARY KEY,
+    format   INTEGER NOT NULL,
+    version  TEXT NOT NULL,
+    created  REAL NOT NULL,
+    payload  BLOB NOT NULL
+);
+"""
+
+
+class AnalysisCache:
+    """
+    Named, versioned analyzer intermediates in a SQLite file.
+
+    :param path: SQLite file holding the cache.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA_SQL)
+        self._conn.commit()
+
+    @classmethod
+    def for_db(cls, db_path: str | Path) -> AnalysisCache:
+        """
+        Create a cache next to a MetaKG database.
+
+        :param db_path: Path to the MetaKG SQLite database.
+        :return: :class:`AnalysisCache` backed by ``<db>.analysis.sqlite``.
+        """
+        db = Path(db_path)
+        return cls(db.with_name(db.name + ".analysis.sqlite"))
+
+    def get(self, name: str) -> tuple[str, Any] | None:
+        """
+        Return ``(version, value)`` stored under *name*, or ``None``.
+
+        :param name: Entry name, e.g. ``"report"``.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT version, payload FROM analysis_cache WHERE name = ? AND format = ?",
+                (name, CACHE_FORMAT),
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return row[0], pickle.loads(row[1])
+        except Exception:  # corrupt or incompatible pickle — treat as a miss
+            return None
+
+    def put(self, name: str, version: str, value: Any) -> None:
+        """
+        Store *value* under *name*, replacing any previous entry.
+
+        :param name: Entry name.
+        :param version: Store content version the value was computed at.
+        :param value: Picklable object.
+        """
+        payload = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO analysis_cache (name, format, version, created, payload) "
+                "VALUES (?,?,?,?,?)",
+                (name, CACHE_FORMAT, version, time.time(), payload),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM analysis_cache")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        self._conn.close()
@@ -0,0 +1,257 @@
+"""
+analysis_export.py — Columnar export of pathway analysis reports.
+
+The Markdown renderers are for people; this module writes every section of
+a :class:`~metakg.analyze.PathwayAnalysisReport` as a typed table for
+notebooks, dataframes and downstream pipelines:
+
+  **Tables** — one file per list/dict section (``hub_metabolites``,
+    ``pathway_couplings``, ``node_counts``, ``modules``, …), in Arrow IPC
+    file format (``.arrow``, memory-mappable without a copy) or Parquet
+    (``.parquet``).  Schemas come from the report dataclasses, so a section
+    with no rows still has its columns.
+
+  **Manifest** — ``manifest.json`` listing every table with its file, row
+    count, column types and producing phase, plus the report's scalars
+    (totals, modularity, …), phase timings and cache info.
+
+:class:`AnalysisExporter` can be passed to
+:meth:`~metakg.analyze.PathwayAnalyzer.run` as ``on_phase`` so each section
+is written as soon as its phase finishes; the manifest is rewritten after
+every phase with ``"complete": false`` and finalised by
+:meth:`AnalysisExporter.finish`.
+
+PyArrow is imported lazily (it ships with the LanceDB dependency).
+
+Usage::
+
+    from metakg.analysis_export import AnalysisExporter, read_table
+
+    exporter = AnalysisExporter("out/analysis")
+    report = analyzer.run(on_phase=exporter.write_fields)
+    manifest = exporter.finish(report)
+    hubs = read_table(manifest, "hub_metabolites")   # pyarrow.Table, memory-mapped
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import types
+import typing
+from dataclasses import fields as dataclass_fields
+from dataclasses import is_dataclass
+from pathlib import Path
+from typing import Any
+
+from metakg.analyze import PHASE_FIELDS, PathwayAnalysisReport
+
+#: Supported table formats and their file extensions.
+EXPORT_FORMATS: dict[str, str] = {"arrow": ".arrow", "parquet": ".parquet"}
+
+#: Bump when the manifest layout changes.
+MANIFEST_VERSION: int = 1
+
+#: Column names of the sections stored as plain dicts.
+_DICT_COLUMNS: dict[str, dict[str, type]] = {
+    "isolated_nodes": {"id": str, "name": str, "kind": str},
+    "top_enzymes": {"id": str, "name": str, "ec_number": str, "rxn_cnt": int},
+}
+
+#: Column names of the mapping sections, as ``(key, value)``.
+_MAPPING_COLUMNS: dict[str, tuple[str, str]] = {
+    "node_counts": ("kind", "count"),
+    "edge_counts": ("rel", "count"),
+    "core_sizes": ("k", "count"),
+}
+
+_FIELD_PHASE: dict[str, str] = {f: phase for phase, names in PHASE_FIELDS.items() for f in names}
+
+
+def _arrow_type(tp: Any) -> Any:
+    """PyArrow type for a dataclass field type (``str | None`` → nullable string)."""
+    import pyarrow as pa
+
+    args = typing.get_args(tp)
+    if isinstance(tp, types.UnionType) or typing.get_origin(tp) is typing.Union:
+        (tp,) = [a for a in args if a is not type(None)]
+        return _arrow_type(tp)
+    if typing.get_origin(tp) is list:
+        return pa.list_(_arrow_type(args[0]))
+    scalar = {str: pa.string(), int: pa.int64(), float: pa.float64(), bool: pa.bool_()}
+    return scalar[tp]
+
+
+def _section_table(name: str, value: Any, hint: Any) -> Any:
+    """Convert the report section *name* to a :class:`pyarrow.Table`."""
+    import pyarrow as pa
+
+    if name in _MAPPING_COLUMNS:
+        key_col, val_col = _MAPPING_COLUMNS[name]
+        key_tp, val_tp = typing.get_args(hint)
+        schema = pa.schema([(key_col, _arrow_type(key_tp)), (val_col, _arrow_type(val_tp))])
+        items = sorted(value.items())
+        return pa.table([[k for k, _ in items], [v for _, v in items]], schema=schema)
+
+    (elem,) = typing.get_args(hint)
+    if is_dataclass(elem):
+        hints = typing.get_type_hints(elem)
+        columns = {f.name: hints[f.name] for f in dataclass_fields(elem)}
+        rows = [vars(item) for item in value]
+    else:
+        columns = _DICT_COLUMNS[name]
+        rows = value
+    schema = pa.schema([(col, _arrow_type(tp)) for col, tp in columns.items()])
+    return pa.Table.from_pylist(rows, schema=schema)
+
+
+class AnalysisExporter:
+    """
+    Write report sections to a directory of columnar files plus a manifest.
+
+    Thread-safe, so it can receive phases from a concurrent
+    :class:`~metakg.analyze.PathwayAnalyzer` run.
+
+    :param out_dir: Output directory (created if missing).
+    :param fmt: ``"arrow"`` (IPC file) or ``"parquet"``.
+    """
+
+    def __init__(self, out_dir: str | Path, *, fmt: str = "arrow") -> None:
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(
+                f"unknown export format {fmt!r}; expected one of {list(EXPORT_FORMATS)}"
+            )
+        self.out_dir = Path(out_dir)
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        self.fmt = fmt
+        self._hints = typing.get_type_hints(PathwayAnalysisReport)
+        self._lock = threading.Lock()
+        self._tables: dict[str, dict[str, Any]] = {}
+        self._scalars: dict[str, Any] = {}
+
+    @property
+    def manifest_path(self) -> Path:
+        """Path of ``manifest.json``."""
+        return self.out_dir / "manifest.json"
+
+    def write_fields(self, phase: str, fields: dict[str, Any]) -> None:
+        """
+        Write the report fields produced by one phase.
+
+        Signature matches the ``on_phase`` hook of
+        :meth:`~metakg.analyze.PathwayAnalyzer.run`.
+
+        :param phase: Phase name, e.g. ``"phase2"``.
+        :param fields: Report field name → value.
+        """
+        for name, value in fields.items():
+            if name in _MAPPING_COLUMNS or typing.get_origin(self._hints[name]) is list:
+                self._write_table(name, value, phase)
+            else:
+                with self._lock:
+                    self._scalars[name] = value
+        with self._lock:
+            self._write_manifest(complete=False)
+
+    def finish(self, report: PathwayAnalysisReport) -> Path:
+        """
+        Write the sections not yet written and the final manifest.
+
+        :param report: The finished report (all sections are written when it
+            came from the cache and no phase ran).
+        :return: Path of ``manifest.json``.
+        """
+        pending: dict[str, dict[str, Any]] = {}
+        for name, phase in _FIELD_PHASE.items():
+            if name not in self._tables and name not in self._scalars:
+                pending.setdefault(phase, {})[name] = getattr(report, name)
+        for phase, fields in pending.items():
+            self.write_fields(phase, fields)
+        with self._lock:
+            self._write_manifest(complete=True, report=report)
+        return self.manifest_path
+
+    # ------------------------------------------------------------------
+
+    def _write_table(self, name: str, value: Any, phase: str) -> None:
+        table = _section_table(name, value, self._hints[name])
+        path = self.out_dir / f"{name}{EXPORT_FORMATS[self.fmt]}"
+        tmp = path.with_name(path.name + ".tmp")
+        if self.fmt == "parquet":
+            import pyarrow.parquet as pq
+
+            pq.write_table(table, tmp)
+        else:
+            import pyarrow as pa
+
+            with pa.OSFile(str(tmp), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp, path)  # readers never see a half-written file
+        with self._lock:
+            self._tables[name] = {
+                "file": path.name,
+                "rows": table.num_rows,
+                "phase": phase,
+                "columns": {f.name: str(f.type) for f in table.schema},
+            }
+
+    def _write_manifest(
+        self, *, complete: bool, report: PathwayAnalysisReport | None = None
+    ) -> None:
+        from metakg import __version__
+
+        manifest: dict[str, Any] = {
+            "manifest_version": MANIFEST_VERSION,
+            "metakg_version": __version__,
+            "format": self.fmt,
+            "complete": complete,
+            "scalars": dict(self._scalars),
+            "tables": dict(sorted(self._tables.items())),
+        }
+        if report is not None:
+            manifest.update(
+                db_path=report.db_path,
+                generated_at=report.generated_at,
+                timings=report.timings,
+                cache_info=report.cache_info,
+            )
+        tmp = self.manifest_path.with_name("manifest.json.tmp")
+        tmp.write_text(json.dumps(manifest, indent=2, default=str), encoding="utf-8")
+        os.replace(tmp, self.manifest_path)
+
+
+def export_report(
+    report: PathwayAnalysisReport, out_dir: str | Path, *, fmt: str = "arrow"
+) -> Path:
+    """
+    Export a finished report in one go.
+
+    :param report: Report to export.
+    :param out_dir: Output directory.
+    :param fmt: ``"arrow"`` or ``"parquet"``.
+    :return: Path of ``manifest.json``.
+    """
+    return AnalysisExporter(out_dir, fmt=fmt).finish(report)
+
+
+def read_table(manifest_path: str | Path, name: str) -> Any:
+    """
+    Load one exported table, memory-mapping the file.
+
+    :param manifest_path: ``manifest.json`` written by :class:`AnalysisExporter`.
+    :param name: Table name, e.g. ``"pathway_couplings"``.
+    :return: :class:`pyarrow.Table`.
+    :raises KeyError: If the manifest has no table *name*.
+    """
+    import pyarrow as pa
+
+    manifest_path = Path(manifest_path)
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    path = manifest_path.parent / manifest["tables"][name]["file"]
+    if manifest["format"] == "parquet":
+        import pyarrow.parquet as pq
+
+        return pq.read_table(path, memory_map=True)
+    # The table's buffers keep the mapping alive; it is unmapped once they are freed
+    return pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
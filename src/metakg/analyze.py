@@ -25,7 +25,11 @@ Analysis Phases
   5. Pathway Coupling             — pairs of pathways sharing many compounds
   6. Topological Patterns         — dead-ends, isolated nodes, metabolic cycles
   7. Top Enzymes                  — enzymes catalysing the most reactions
-  8. Actionable Biological Insights
+  8. Network Centrality           — PageRank, sampled betweenness and k-cores
+                                    on the compound–reaction graph
+  9. Metabolic Modules            — Louvain communities and their overlap
+                                    with pathway boundaries
+ 10. Actionable Biological Insights
 
 Usage::
 
@@ -35,6 +39,9 @@ Usage::
     report   = analyzer.run()
     print(render_report(report))
 
+``run(on_phase=...)`` hands each phase's report fields to a callback as soon
+as the phase finishes (see :mod:`metakg.analysis_export` for columnar export).
+
 Or via CLI::
 
     metakg-analyze --db .metakg/meta.sqlite
@@ -47,11 +54,67 @@ Last Revision: 2026-02-28 20:55:28
 
 from __future__ import annotations
 
+import heapq
+import json
 import sqlite3
-from collections import defaultdict
-from dataclasses import dataclass, field
+import threading
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
+from itertools import combinations
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from metakg.store import (
+    node_degrees_current,
+    node_modules_current,
+    node_modules_settings,
+    pathway_members_current,
+    read_content_version,
+)
+
+if TYPE_CHECKING:
+    from metakg.analysis_cache import AnalysisCache
+
+#: Rows of the pathway × pathway coupling matrix materialised at a time.
+COUPLING_BLOCK = 512
+
+#: Largest coupling matrix (non-zero pathway pairs) kept in the analysis cache.
+MAX_CACHED_PAIRS = 5_000_000
+
+#: BFS sources sampled for approximate betweenness in phase 8.
+BETWEENNESS_SAMPLES = 256
+
+#: Louvain resolution of the phase 9 modules (a stored assignment must match).
+MODULE_RESOLUTION = 1.0
+
+#: Report fields filled by each phase of :meth:`PathwayAnalyzer.run`, in order.
+PHASE_FIELDS: dict[str, tuple[str, ...]] = {
+    "phase1": ("total_nodes", "total_edges", "node_counts", "edge_counts"),
+    "phase2": ("hub_metabolites",),
+    "phase3": ("complex_reactions",),
+    "phase4": ("cross_pathway_hubs",),
+    "phase5": ("pathway_couplings",),
+    "phase6": ("dead_end_metabolites", "isolated_nodes"),
+    "phase7": ("top_enzymes",),
+    "phase8": (
+        "pagerank_hubs",
+        "bottlenecks",
+        "core_sizes",
+        "centrality_samples",
+        "currency_excluded",
+    ),
+    "phase9": ("modules", "module_count", "modularity", "modules_source"),
+    "profiles": ("pathway_profiles",),
+}
+
+#: Tables whose content the analysis depends on.
+ANALYSIS_TABLES = ("meta_nodes", "meta_edges")
 
 # ---------------------------------------------------------------------------
 # Result data classes
@@ -131,6 +194,34 @@ class PathwayProfile:
     enzyme_count: int
 
 
+@dataclass
+class CentralNode:
+    """A compound or reaction ranked by its position in the compound–reaction graph."""
+
+    node_id: str
+    name: str
+    kind: str
+    pagerank: float
+    betweenness: float
+    core: int  # k-core number in the undirected graph
+
+
+@dataclass
+class MetabolicModule:
+    """A data-driven module and the pathway it overlaps most (by compound Jaccard)."""
+
+    module: int
+    size: int
+    compound_count: int
+    reaction_count: int
+    enzyme_count: int
+    pathway_count: int  # pathways sharing at least one compound
+    best_pathway_id: str | None
+    best_pathway_name: str | None
+    shared_compounds: int
+    jaccard: float
+
+
 @dataclass
 class PathwayAnalysisReport:
     """Full output of :class:`PathwayAnalyzer.run`."""
@@ -163,9 +254,54 @@ class PathwayAnalysisReport:
     # Phase 7
     top_enzymes: list[dict] = field(default_factory=list)
 
+    # Phase 8
+    pagerank_hubs: list[CentralNode] = field(default_factory=list)
+    bottlenecks: list[CentralNode] = field(default_factory=list)
+    core_sizes: dict[int, int] = field(default_factory=dict)  # k → nodes with core number k
+    centrality_samples: int = 0  # BFS sources behind the betweenness estimate
+    currency_excluded: int = 0
+
+    # Phase 9
+    modules: list[MetabolicModule] = field(default_factory=list)
+    module_count: int = 0
+    modularity: float = 0.0
+    modules_source: str = ""  # "stored" (node_modules table) or "computed"
+
     # Pathway profiles
     pathway_profiles: list[PathwayProfile] = field(default_factory=list)
 
+    # Wall-clock seconds per phase (``load``, ``membership``, ``phase1`` … ``profiles``)
+    # and for the whole run (``total``)
+    timings: dict[str, float] = field(default_factory=dict)
+
+    # What an analysis cache contributed: ``report`` is ``"reused"`` or
+    # ``"computed"``; ``coupling_recomputed`` counts pathways whose coupling
+    # rows were recalculated, out of ``pathways``
+    cache_info: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class _GraphTables:
+    """
+    In-memory lookups shared by all phases, loaded with a fixed number of
+    queries so no phase needs a per-node ``SELECT``.  Degrees are read from
+    the ``node_degrees`` table, or counted from ``meta_edges`` on databases
+    that predate it.
+
+    :param nodes: ``id → row`` (``id, kind, name, formula, xrefs``) in table order.
+    :param out_degree: ``rel → {src: edge count}``.
+    :param in_degree: ``rel → {dst: edge count}``.
+    """
+
+    nodes: dict[str, sqlite3.Row]
+    out_degree: dict[str, dict[str, int]]
+    in_degree: dict[str, dict[str, int]]
+
+    def name(self, node_id: str) -> str:
+        """Return the node name, or *node_id* if unknown."""
+        row = self.nodes.get(node_id)
+        return row["name"] if row else node_id
+
 
 # ---------------------------------------------------------------------------
 # Analyzer
@@ -174,16 +310,56 @@ class PathwayAnalysisReport:
 
 class PathwayAnalyzer:
     """
-    Runs the full 7-phase metabolic pathway analysis against a MetaKG database.
+    Runs the full 9-phase metabolic pathway analysis against a MetaKG database.
+
+    Each thread gets its own read-only connection, so with ``workers > 1``
+    :meth:`run` executes the phases concurrently in a thread pool: the shared
+    lookup tables and the compound-pathway membership are built first (in
+    parallel with each other), then phases 1–7 and the profiles all run at
+    once against them.  SQLite releases the GIL while it executes, so the
+    query-bound phases overlap and wall time approaches the slowest phase.
+
+    With a *cache*, a report is reused while the graph is unchanged, and the
+    pathway coupling matrix is patched rather than recomputed after a change.
+    Reuse of the report is all-or-nothing: every phase reads both
+    ``meta_nodes`` (names, kinds) and ``meta_edges``, so there is no subset
+    of phases a graph write leaves valid, and any write reruns all of them.
 
     :param db_path: Path to the MetaKG SQLite database.
     :param top_n: How many items to return in ranked lists.
+    :param workers: Threads for :meth:`run`; ``1`` (default) runs phases in order.
+    :param cache: Optional :class:`~metakg.analysis_cache.AnalysisCache` for
+        incremental runs.
+    :param exclude_currency: Leave currency metabolites (water, ATP, NAD⁺, …)
+        out of the phase 8 centrality and phase 9 module graphs.
+    :param betweenness_samples: BFS sources for the betweenness estimate;
+        ``0`` computes it exactly.  With ``workers > 1`` the sources are
+        split across that many processes.
     """
 
-    def __init__(self, db_path: str | Path, *, top_n: int = 20) -> None:
+    def __init__(
+        self,
+        db_path: str | Path,
+        *,
+        top_n: int = 20,
+        workers: int = 1,
+        cache: AnalysisCache | None = None,
+        exclude_currency: bool = False,
+        betweenness_samples: int = BETWEENNESS_SAMPLES,
+    ) -> None:
         self.db_path = Path(db_path)
         self.top_n = top_n
-        self._conn: sqlite3.Connection | None = None
+        self.workers = workers
+        self.exclude_currency = exclude_currency
+        self.betweenness_samples = betweenness_samples
+        self.cache = cache
+        self._cache_info: dict[str, Any] = {}
+        self._version = ""
+        self._local = threading.local()
+        self._conns: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._tables_lock = threading.Lock()
+        self._tables: _GraphTables | None = None
 
     # ------------------------------------------------------------------
     # Connection management
@@ -191,17 +367,27 @@ class PathwayAnalyzer:
 
     @property
     def conn(self) -> sqlite3.Connection:
-        """Get or create the database connection."""
-        if self._conn is None:
-            self._conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
-            self._conn.row_factory = sqlite3.Row
-        return self._conn
+        """Get or create the calling thread's read-only database connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Used only by this thread, but closed from whichever thread calls close()
+            conn = sqlite3.connect(
+                f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False
+            )
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+            with self._lock:
+                self._conns.append(conn)
+        return conn
 
     def close(self) -> None:
-        """Close the database connection."""
-        if self._conn is not None:
-            self._conn.close()
-            self._conn = None
+        """Close every connection opened by this analyzer."""
+        with self._lock:
+            for conn in self._conns:
+                conn.close()
+            self._conns.clear()
+        self._local = threading.local()
+        self._tables = None
 
     def __enter__(self) -> PathwayAnalyzer:
         return self
@@ -209,18 +395,50 @@ class PathwayAnalyzer:
     def __exit__(self, *_: object) -> None:
         self.close()
 
+    @property
+    def tables(self) -> _GraphTables:
+        """Node attributes and per-relation degrees, loaded once per analyzer."""
+        if self._tables is None:
+            with self._tables_lock:
+                if self._tables is None:
+                    self._tables = self._load_tables()
+        return self._tables
+
+    def _load_tables(self) -> _GraphTables:
+        nodes = {
+            r["id"]: r
+            for r in self.conn.execute("SELECT id, kind, name, formula, xrefs FROM meta_nodes")
+        }
+        out_degree: dict[str, dict[str, int]] = defaultdict(dict)
+        in_degree: dict[str, dict[str, int]] = defaultdict(dict)
+        if node_degrees_current(self.conn):
+            # One scan of the trigger-maintained degree table
+            for nid, rel, d_in, d_out in self.conn.execute(
+                "SELECT node_id, rel, in_degree, out_degree FROM node_degrees"
+            ):
+                if d_out:
+                    out_degree[rel][nid] = d_out
+                if d_in:
+                    in_degree[rel][nid] = d_in
+        else:
+            for src, rel, cnt in self.conn.execute(
+                "SELECT src, rel, COUNT(*) FROM meta_edges GROUP BY src, rel"
+            ):
+                out_degree[rel][src] = cnt
+            for dst, rel, cnt in self.conn.execute(
+                "SELECT dst, rel, COUNT(*) FROM meta_edges GROUP BY dst, rel"
+            ):
+                in_degree[rel][dst] = cnt
+        return _GraphTables(nodes, dict(out_degree), dict(in_degree))
+
     # ------------------------------------------------------------------
     # Phase 1: baseline stats
     # ------------------------------------------------------------------
 
     def _phase1_stats(self) -> tuple[int, int, dict[str, int], dict[str, int]]:
-        cur = self.conn.cursor()
-
-        cur.execute("SELECT kind, COUNT(*) FROM meta_nodes GROUP BY kind")
-        node_counts = {r[0]: r[1] for r in cur.fetchall()}
-
-        cur.execute("SELECT rel, COUNT(*) FROM meta_edges GROUP BY rel")
-        edge_counts = {r[0]: r[1] for r in cur.fetchall()}
+        tables = self.tables
+        node_counts = dict(Counter(r["kind"] for r in tables.nodes.values()))
+        edge_counts = {rel: sum(degree.values()) for rel, degree in tables.out_degree.items()}
 
         return (
             sum(node_counts.values()),
@@ -235,15 +453,27 @@ class PathwayAnalyzer:
 
     def _compound_pathway_membership(self) -> dict[str, set[str]]:
         """
-        Build compound_id → {pathway_id, ...} mapping.
+        Build pathway_id → {compound_id, ...} mapping.
 
-        Membership is inferred three ways:
+        Read from the materialised ``pathway_members`` table when it is
+        current; otherwise membership is inferred three ways:
           1. Direct pathway CONTAINS compound edge.
           2. pathway CONTAINS reaction, compound SUBSTRATE_OF reaction.
           3. pathway CONTAINS reaction, reaction PRODUCT_OF compound.
         """
         membership: dict[str, set[str]] = defaultdict(set)
 
+        if pathway_members_current(self.conn):
+            cur = self.conn.execute(
+                """
+                SELECT pathway_id, node_id FROM pathway_members
+                WHERE  kind = 'compound' AND via IN ('contains', 'substrate', 'product')
+            """
+            )
+            for row in cur:
+                membership[row[0]].add(row[1])
+            return dict(membership)
+
         # 1. Direct
         cur = self.conn.execute(
             """
@@ -294,27 +524,8 @@ class PathwayAnalyzer:
         Find compounds that participate in the most reactions.
         Analogous to 'most-called functions' (fan-in) in code analysis.
         """
-        # Substrate count per compound
-        cur = self.conn.execute(
-            """
-            SELECT src AS cpd_id, COUNT(*) AS cnt
-            FROM   meta_edges
-            WHERE  rel = 'SUBSTRATE_OF'
-            GROUP  BY src
-        """
-        )
-        substrate_of: dict[str, int] = {r[0]: r[1] for r in cur.fetchall()}
-
-        # Product count per compound
-        cur = self.conn.execute(
-            """
-            SELECT dst AS cpd_id, COUNT(*) AS cnt
-            FROM   meta_edges
-            WHERE  rel = 'PRODUCT_OF'
-            GROUP  BY dst
-        """
-        )
-        product_of: dict[str, int] = {r[0]: r[1] for r in cur.fetchall()}
+        substrate_of = self.tables.out_degree.get("SUBSTRATE_OF", {})
+        product_of = self.tables.in_degree.get("PRODUCT_OF", {})
 
         # Combine
         all_cpd_ids = set(substrate_of) | set(product_of)
@@ -334,10 +545,7 @@ class PathwayAnalyzer:
 
         results: list[HubMetabolite] = []
         for _, cid in ranked[: self.top_n]:
-            cur2 = self.conn.execute(
-                "SELECT name, formula, xrefs FROM meta_nodes WHERE id=?", (cid,)
-            )
-            row = cur2.fetchone()
+            row = self.tables.nodes.get(cid)
             if not row:
                 continue
             results.append(
@@ -364,48 +572,28 @@ class PathwayAnalyzer:
         Find reactions with the most substrates/products/enzymes.
         Analogous to 'most-calling functions' (fan-out) in code analysis.
         """
-        cur = self.conn.execute(
-            """
-            SELECT r.id, r.name,
-                   SUM(CASE WHEN e.rel='SUBSTRATE_OF' AND e.dst=r.id THEN 1 ELSE 0 END) AS sub_cnt,
-                   SUM(CASE WHEN e.rel='PRODUCT_OF'   AND e.src=r.id THEN 1 ELSE 0 END) AS prd_cnt,
-                   SUM(CASE WHEN e.rel='CATALYZES'    AND e.dst=r.id THEN 1 ELSE 0 END) AS enz_cnt
-            FROM   meta_nodes r
-            LEFT JOIN meta_edges e
-                   ON (e.dst = r.id AND e.rel IN ('SUBSTRATE_OF','CATALYZES'))
-                   OR (e.src = r.id AND e.rel = 'PRODUCT_OF')
-            WHERE  r.kind = 'reaction'
-            GROUP  BY r.id
-            ORDER  BY (sub_cnt + prd_cnt) DESC
-            LIMIT  ?
-        """,
-            (self.top_n,),
-        )
-
-        rows = cur.fetchall()
-
-        # Count pathways per reaction
-        cur2 = self.conn.execute(
-            """
-            SELECT dst AS rxn_id, COUNT(*) AS pwy_cnt
-            FROM   meta_edges
-            WHERE  rel = 'CONTAINS'
-            GROUP  BY dst
-        """
+        tables = self.tables
+        sub_cnt = tables.in_degree.get("SUBSTRATE_OF", {})
+        prd_cnt = tables.out_degree.get("PRODUCT_OF", {})
+        enz_cnt = tables.in_degree.get("CATALYZES", {})
+        rxn_to_pwy = tables.in_degree.get("CONTAINS", {})
+
+        reactions = [r for r in tables.nodes.values() if r["kind"] == "reaction"]
+        reactions.sort(
+            key=lambda r: sub_cnt.get(r["id"], 0) + prd_cnt.get(r["id"], 0), reverse=True
         )
-        rxn_to_pwy: dict[str, int] = {r[0]: r[1] for r in cur2.fetchall()}
 
         return [
             ComplexReaction(
                 node_id=r["id"],
                 name=r["name"],
-                substrate_count=r["sub_cnt"] or 0,
-                product_count=r["prd_cnt"] or 0,
-                enzyme_count=r["enz_cnt"] or 0,
-                complexity=(r["sub_cnt"] or 0) + (r["prd_cnt"] or 0),
+                substrate_count=sub_cnt.get(r["id"], 0),
+                product_count=prd_cnt.get(r["id"], 0),
+                enzyme_count=enz_cnt.get(r["id"], 0),
+                complexity=sub_cnt.get(r["id"], 0) + prd_cnt.get(r["id"], 0),
                 pathway_count=rxn_to_pwy.get(r["id"], 0),
             )
-            for r in rows
+            for r in reactions[: self.top_n]
         ]
 
     # ------------------------------------------------------------------
@@ -427,25 +615,12 @@ class PathwayAnalyzer:
         multi_pwy = {cid: pwys for cid, pwys in cpd_to_pathways.items() if len(pwys) >= 2}
 
         # Reaction count per compound
-        cur = self.conn.execute(
-            """
-            SELECT src AS cpd, COUNT(*) AS cnt FROM meta_edges WHERE rel='SUBSTRATE_OF' GROUP BY src
-            UNION ALL
-            SELECT dst AS cpd, COUNT(*) AS cnt FROM meta_edges WHERE rel='PRODUCT_OF'   GROUP BY dst
-        """
-        )
-        rxn_cnt: dict[str, int] = defaultdict(int)
-        for row in cur:
-            rxn_cnt[row[0]] += row[1]
-
-        # Pathway name lookup
-        cur2 = self.conn.execute("SELECT id, name FROM meta_nodes WHERE kind='pathway'")
-        pwy_names: dict[str, str] = {r[0]: r[1] for r in cur2.fetchall()}
+        substrate_of = self.tables.out_degree.get("SUBSTRATE_OF", {})
+        product_of = self.tables.in_degree.get("PRODUCT_OF", {})
 
         results: list[CrossPathwayHub] = []
         for cid, pwy_ids in sorted(multi_pwy.items(), key=lambda x: -len(x[1])):
-            cur3 = self.conn.execute("SELECT name, formula FROM meta_nodes WHERE id=?", (cid,))
-            row = cur3.fetchone()
+            row = self.tables.nodes.get(cid)
             if not row:
                 continue
             results.append(
@@ -454,12 +629,14 @@ class PathwayAnalyzer:
                     name=row["name"],
                     formula=row["formula"],
                     pathway_count=len(pwy_ids),
-                    pathway_names=sorted(pwy_names.get(p, p) for p in pwy_ids),
-                    reaction_count=rxn_cnt.get(cid, 0),
+                    pathway_names=sorted(self.tables.name(p) for p in pwy_ids),
+                    reaction_count=substrate_of.get(cid, 0) + product_of.get(cid, 0),
                 )
             )
+            if len(results) == self.top_n:
+                break
 
-        return results[: self.top_n]
+        return results
 
     # ------------------------------------------------------------------
     # Phase 5: pathway coupling
@@ -469,44 +646,49 @@ class PathwayAnalyzer:
         """
         Find pairs of pathways that share the most compounds.
         Analogous to module-level dependency coupling in code analysis.
-        """
-        pwy_names_cur = self.conn.execute("SELECT id, name FROM meta_nodes WHERE kind='pathway'")
-        pwy_names: dict[str, str] = {r[0]: r[1] for r in pwy_names_cur.fetchall()}
-
-        pwy_ids = list(membership.keys())
-        pairs: list[tuple[int, str, str, list[str]]] = []
 
-        for i, a in enumerate(pwy_ids):
-            for j in range(i + 1, len(pwy_ids)):
-                b = pwy_ids[j]
-                shared_cpd_ids = membership[a] & membership[b]
-                if not shared_cpd_ids:
-                    continue
-
-                # Resolve compound names (limit to top 5 for the report)
-                shared_names: list[str] = []
-                for cid in list(shared_cpd_ids)[:5]:
-                    cur = self.conn.execute("SELECT name FROM meta_nodes WHERE id=?", (cid,))
-                    row = cur.fetchone()
-                    if row:
-                        shared_names.append(row[0])
-
-                pairs.append((len(shared_cpd_ids), a, b, shared_names))
-
-        pairs.sort(reverse=True)
+        Shared counts for all pairs are the off-diagonal entries of ``M·Mᵀ``
+        over the pathway × compound incidence matrix ``M``; only the top
+        pairs are then expanded to compound lists and named.
+        """
+        pwy_ids = sorted(membership)
+        pairs = self._coupling_pairs(membership, pwy_ids)
 
+        shared: list[list[str]] = [
+            sorted(membership[pwy_ids[i]] & membership[pwy_ids[j]])[:5] for _, i, j in pairs
+        ]
+        names = self.tables
         return [
             PathwayCoupling(
-                pathway_a_id=a,
-                pathway_a_name=pwy_names.get(a, a),
-                pathway_b_id=b,
-                pathway_b_name=pwy_names.get(b, b),
+                pathway_a_id=pwy_ids[i],
+                pathway_a_name=names.name(pwy_ids[i]),
+                pathway_b_id=pwy_ids[j],
+                pathway_b_name=names.name(pwy_ids[j]),
                 shared_count=cnt,
-                shared_names=names,
+                shared_names=[names.name(c) for c in cids if c in names.nodes],
             )
-            for cnt, a, b, names in pairs[: self.top_n]
+            for (cnt, i, j), cids in zip(pairs, shared, strict=True)
         ]
 
+    def _coupling_pairs(
+        self, membership: dict[str, set[str]], pwy_ids: list[str]
+    ) -> list[tuple[int, int, int]]:
+        """Top coupled pairs, patching the cached coupling matrix when there is one."""
+        if self.cache is not None:
+            entry = self.cache.get("coupling")
+            try:
+                matrix, n_changed = _CouplingMatrix.update(
+                    entry[1] if entry else None, membership, max_pairs=MAX_CACHED_PAIRS
+                )
+            except ImportError:
+                matrix, n_changed = None, len(pwy_ids)
+            self._cache_info.update(coupling_recomputed=n_changed, pathways=len(pwy_ids))
+            if matrix is not None:
+                if n_changed or entry is None:
+                    self.cache.put("coupling", self._version, matrix)
+                return matrix.top_pairs(self.top_n)
+        return _top_shared_pairs([membership[p] for p in pwy_ids], self.top_n)
+
     # ------------------------------------------------------------------
     # Phase 6: topological patterns
     # ------------------------------------------------------------------
@@ -518,24 +700,10 @@ class PathwayAnalyzer:
         Dead-ends: compounds with only 1 reaction connection.
         Isolated:  nodes (any kind) with zero edges at all.
         """
-        # Count substrate-of edges per compound
-        cur = self.conn.execute(
-            """
-            SELECT src, COUNT(*) FROM meta_edges WHERE rel='SUBSTRATE_OF' GROUP BY src
-        """
-        )
-        as_sub: dict[str, int] = {r[0]: r[1] for r in cur.fetchall()}
-
-        # Count product-of edges per compound
-        cur = self.conn.execute(
-            """
-            SELECT dst, COUNT(*) FROM meta_edges WHERE rel='PRODUCT_OF' GROUP BY dst
-        """
-        )
-        as_prod: dict[str, int] = {r[0]: r[1] for r in cur.fetchall()}
-
-        cur = self.conn.execute("SELECT id, name, formula FROM meta_nodes WHERE kind='compound'")
-        compound_rows = cur.fetchall()
+        tables = self.tables
+        as_sub = tables.out_degree.get("SUBSTRATE_OF", {})
+        as_prod = tables.in_degree.get("PRODUCT_OF", {})
+        compound_rows = [r for r in tables.nodes.values() if r["kind"] == "compound"]
 
         dead_ends: list[DeadEndMetabolite] = []
         for row in compound_rows:
@@ -563,15 +731,13 @@ class PathwayAnalyzer:
                 )
 
         # Isolated nodes (no edges at all)
-        cur = self.conn.execute(
-            """
-            SELECT n.id, n.name, n.kind
-            FROM   meta_nodes n
-            WHERE  n.id NOT IN (SELECT src FROM meta_edges)
-              AND  n.id NOT IN (SELECT dst FROM meta_edges)
-        """
-        )
-        isolated: list[dict] = [dict(r) for r in cur.fetchall()]
+        connected = {n for degree in tables.out_degree.values() for n in degree}
+        connected.update(n for degree in tables.in_degree.values() for n in degree)
+        isolated: list[dict] = [
+            {"id": r["id"], "name": r["name"], "kind": r["kind"]}
+            for r in tables.nodes.values()
+            if r["id"] not in connected
+        ]
 
         return dead_ends, isolated
 
@@ -599,125 +765,516 @@ class PathwayAnalyzer:
         return [dict(r) for r in cur.fetchall()]
 
     # ------------------------------------------------------------------
-    # Pathway profiles
+    # Phase 8: centrality
     # ------------------------------------------------------------------
 
-    def _pathway_profiles(self) -> list[PathwayProfile]:
-        """Return per-pathway summary statistics."""
-        cur = self.conn.execute("SELECT id, name FROM meta_nodes WHERE kind='pathway'")
-        pathways = cur.fetchall()
-
-        profiles: list[PathwayProfile] = []
-        for pwy in pathways:
-            pid = pwy["id"]
+    def _phase8_centrality(self) -> dict[str, Any]:
+        """
+        PageRank, approximate betweenness and k-core numbers on the directed
+        compound–reaction graph.  Skipped (empty) without SciPy.
+        """
+        from metakg.centrality import (
+            betweenness,
+            compound_graph,
+            core_numbers,
+            is_currency,
+            pagerank,
+        )
 
-            rxn_cur = self.conn.execute(
-                """
-                SELECT COUNT(*) FROM meta_edges e
-                JOIN meta_nodes r ON r.id = e.dst AND r.kind = 'reaction'
-                WHERE e.src = ? AND e.rel = 'CONTAINS'
-            """,
-                (pid,),
+        edges = self.conn.execute(
+            "SELECT src, dst FROM meta_edges WHERE rel IN ('SUBSTRATE_OF', 'PRODUCT_OF')"
+        ).fetchall()
+        exclude = (
+            {n for e in edges for n in e if is_currency(n)} if self.exclude_currency else set()
+        )
+        try:
+            graph = compound_graph(edges, exclude=exclude)
+        except ImportError:
+            return {}
+        n = len(graph.node_ids)
+        samples = self.betweenness_samples or None
+        pr = pagerank(graph.adjacency)
+        bc = betweenness(graph.adjacency, samples=samples, workers=self.workers)
+        core = core_numbers(graph.adjacency)
+
+        def central(i: int) -> CentralNode:
+            row = self.tables.nodes.get(graph.node_ids[i])
+            return CentralNode(
+                node_id=graph.node_ids[i],
+                name=row["name"] if row else graph.node_ids[i],
+                kind=row["kind"] if row else "",
+                pagerank=float(pr[i]),
+                betweenness=float(bc[i]),
+                core=int(core[i]),
             )
-            rxn_cnt = rxn_cur.fetchone()[0]
 
-            # Count distinct compounds reachable via reactions in this pathway
-            # (KGML only creates CONTAINS→reaction edges, not CONTAINS→compound)
-            cpd_cur = self.conn.execute(
-                """
-                SELECT COUNT(DISTINCT cpd_id) FROM (
-                    SELECT cs.src AS cpd_id
-                    FROM   meta_edges pc
-                    JOIN   meta_edges cs ON cs.dst = pc.dst AND cs.rel = 'SUBSTRATE_OF'
-                    WHERE  pc.src = ? AND pc.rel = 'CONTAINS'
-                    UNION
-                    SELECT rp.dst AS cpd_id
-                    FROM   meta_edges pc
-                    JOIN   meta_edges rp ON rp.src = pc.dst AND rp.rel = 'PRODUCT_OF'
-                    WHERE  pc.src = ? AND pc.rel = 'CONTAINS'
+        compounds = [
+            i
+            for i, nid in enumerate(graph.node_ids)
+            if nid in self.tables.nodes and self.tables.nodes[nid]["kind"] == "compound"
+        ]
+        by_rank = sorted(compounds, key=lambda i: (-pr[i], graph.node_ids[i]))
+        by_between = sorted(
+            (i for i in range(n) if bc[i] > 0), key=lambda i: (-bc[i], graph.node_ids[i])
+        )
+        return {
+            "pagerank_hubs": [central(i) for i in by_rank[: self.top_n]],
+            "bottlenecks": [central(i) for i in by_between[: self.top_n]],
+            "core_sizes": dict(sorted(Counter(int(k) for k in core).items())),
+            "centrality_samples": min(samples or n, n),
+            "currency_excluded": graph.excluded,
+        }
+
+    # ------------------------------------------------------------------
+    # Phase 9: metabolic modules
+    # ------------------------------------------------------------------
+
+    def _phase9_modules(self, membership: dict[str, set[str]]) -> dict[str, Any]:
+        """
+        Summarise data-driven modules and their best-matching pathways.
+
+        Uses the ``node_modules`` table when it reflects the current edges
+        and was computed with this analyzer's ``exclude_currency`` and
+        :data:`MODULE_RESOLUTION`; otherwise runs Louvain in memory.
+        Skipped (empty) without SciPy.
+        """
+        from metakg.modules import louvain, modularity, module_graph
+
+        try:
+            graph = module_graph(self.conn, exclude_currency=self.exclude_currency)
+        except ImportError:
+            return {}
+        stored: dict[str, int] = {}
+        if self._stored_modules_match():
+            stored = dict(self.conn.execute("SELECT node_id, module FROM node_modules").fetchall())
+        if stored:
+            # Nodes without a stored module count as singletons
+            fresh = max(stored.values()) + 1
+            labels = np.empty(len(graph.node_ids), dtype=np.int64)
+            for i, nid in enumerate(graph.node_ids):
+                if nid not in stored:
+                    stored[nid], fresh = fresh, fresh + 1
+                labels[i] = stored[nid]
+        else:
+            labels = louvain(graph.adjacency, resolution=MODULE_RESOLUTION)
+
+        cpd_to_pathways: dict[str, set[str]] = defaultdict(set)
+        for pwy_id, cpd_set in membership.items():
+            for cid in cpd_set:
+                cpd_to_pathways[cid].add(pwy_id)
+
+        by_module: dict[int, list[str]] = defaultdict(list)
+        for nid, m in zip(graph.node_ids, labels.tolist(), strict=True):
+            by_module[m].append(nid)
+        ranked = sorted(by_module.items(), key=lambda kv: (-len(kv[1]), kv[0]))
+
+        summaries: list[MetabolicModule] = []
+        for m, members in ranked[: self.top_n]:
+            rows = [self.tables.nodes[n] for n in members if n in self.tables.nodes]
+            kinds = Counter(r["kind"] for r in rows)
+            compounds = [r["id"] for r in rows if r["kind"] == "compound"]
+            shared: Counter[str] = Counter(p for c in compounds for p in cpd_to_pathways.get(c, ()))
+            best, best_j, best_n = None, 0.0, 0
+            for pwy_id, n_shared in sorted(shared.items()):
+                j = n_shared / (len(compounds) + len(membership[pwy_id]) - n_shared)
+                if j > best_j:
+                    best, best_j, best_n = pwy_id, j, n_shared
+            summaries.append(
+                MetabolicModule(
+                    module=m,
+                    size=len(members),
+                    compound_count=kinds.get("compound", 0),
+                    reaction_count=kinds.get("reaction", 0),
+                    enzyme_count=kinds.get("enzyme", 0),
+                    pathway_count=len(shared),
+                    best_pathway_id=best,
+                    best_pathway_name=self.tables.name(best) if best else None,
+                    shared_compounds=best_n,
+                    jaccard=best_j,
                 )
-            """,
-                (pid, pid),
             )
-            cpd_cnt = cpd_cur.fetchone()[0]
+        return {
+            "modules": summaries,
+            "module_count": len(by_module),
+            "modularity": modularity(graph.adjacency, labels),
+            "modules_source": "stored" if stored else "computed",
+        }
 
-            enz_cur = self.conn.execute(
-                """
-                SELECT COUNT(DISTINCT enz.id)
+    # ------------------------------------------------------------------
+    # Pathway profiles
+    # ------------------------------------------------------------------
+
+    def _pathway_profiles(self) -> list[PathwayProfile]:
+        """Return per-pathway summary statistics from three grouped queries."""
+        rxn_cnt = self._count_by_pathway(
+            """
+            SELECT e.src, COUNT(*) FROM meta_edges e
+            JOIN meta_nodes r ON r.id = e.dst AND r.kind = 'reaction'
+            WHERE e.rel = 'CONTAINS'
+            GROUP BY e.src
+        """
+        )
+
+        # Count distinct compounds reachable via reactions in each pathway
+        # (KGML only creates CONTAINS→reaction edges, not CONTAINS→compound)
+        cpd_cnt = self._count_by_pathway(
+            """
+            SELECT pwy_id, COUNT(DISTINCT cpd_id) FROM (
+                SELECT pc.src AS pwy_id, cs.src AS cpd_id
                 FROM   meta_edges pc
-                JOIN   meta_nodes r ON r.id = pc.dst AND r.kind = 'reaction'
-                JOIN   meta_edges ec ON ec.dst = r.id AND ec.rel = 'CATALYZES'
-                JOIN   meta_nodes enz ON enz.id = ec.src AND enz.kind = 'enzyme'
-                WHERE  pc.src = ? AND pc.rel = 'CONTAINS'
-            """,
-                (pid,),
-            )
-            enz_cnt = enz_cur.fetchone()[0]
-
-            profiles.append(
-                PathwayProfile(
-                    node_id=pid,
-                    name=pwy["name"],
-                    reaction_count=rxn_cnt,
-                    compound_count=cpd_cnt,
-                    enzyme_count=enz_cnt,
-                )
+                JOIN   meta_edges cs ON cs.dst = pc.dst AND cs.rel = 'SUBSTRATE_OF'
+                WHERE  pc.rel = 'CONTAINS'
+                UNION
+                SELECT pc.src AS pwy_id, rp.dst AS cpd_id
+                FROM   meta_edges pc
+                JOIN   meta_edges rp ON rp.src = pc.dst AND rp.rel = 'PRODUCT_OF'
+                WHERE  pc.rel = 'CONTAINS'
             )
+            GROUP BY pwy_id
+        """
+        )
 
+        enz_cnt = self._count_by_pathway(
+            """
+            SELECT pc.src, COUNT(DISTINCT enz.id)
+            FROM   meta_edges pc
+            JOIN   meta_nodes r ON r.id = pc.dst AND r.kind = 'reaction'
+            JOIN   meta_edges ec ON ec.dst = r.id AND ec.rel = 'CATALYZES'
+            JOIN   meta_nodes enz ON enz.id = ec.src AND enz.kind = 'enzyme'
+            WHERE  pc.rel = 'CONTAINS'
+            GROUP  BY pc.src
+        """
+        )
+
+        profiles = [
+            PathwayProfile(
+                node_id=pid,
+                name=row["name"],
+                reaction_count=rxn_cnt.get(pid, 0),
+                compound_count=cpd_cnt.get(pid, 0),
+                enzyme_count=enz_cnt.get(pid, 0),
+            )
+            for pid, row in self.tables.nodes.items()
+            if row["kind"] == "pathway"
+        ]
         profiles.sort(key=lambda p: p.reaction_count, reverse=True)
         return profiles
 
+    def _stored_modules_match(self) -> bool:
+        """Whether ``node_modules`` is current and was computed with our options."""
+        if not node_modules_current(self.conn):
+            return False
+        settings = node_modules_settings(self.conn) or {}
+        return (
+            settings.get("exclude_currency") == self.exclude_currency
+            and settings.get("resolution") == MODULE_RESOLUTION
+        )
+
+    def _count_by_pathway(self, sql: str) -> dict[str, int]:
+        return {r[0]: r[1] for r in self.conn.execute(sql)}
+
     # ------------------------------------------------------------------
     # Main entry point
     # ------------------------------------------------------------------
 
-    def run(self) -> PathwayAnalysisReport:
+    @property
+    def _settings(self) -> tuple[Any, ...]:
+        """Options a cached report must have been computed with."""
+        return (self.top_n, self.exclude_currency, self.betweenness_samples)
+
+    def run(
+        self, *, on_phase: Callable[[str, dict[str, Any]], None] | None = None
+    ) -> PathwayAnalysisReport:
         """
         Execute all analysis phases and return a :class:`PathwayAnalysisReport`.
+
+        :param on_phase: Called as ``on_phase(name, fields)`` as soon as each
+            phase finishes, with the report fields it produced (see
+            :data:`PHASE_FIELDS`) — e.g.
+            :meth:`~metakg.analysis_export.AnalysisExporter.write_fields` to
+            stream sections to disk.  With ``workers > 1`` it is called from
+            worker threads.  Not called when a cached report is reused.
         """
-        # Phase 1
-        total_nodes, total_edges, node_counts, edge_counts = self._phase1_stats()
+        t_start = time.perf_counter()
+        timings: dict[str, float] = {}
+        self._cache_info = {}
+        if self.cache is not None:
+            # Phase 9 may read node_modules: key on the assignment it would use
+            modules = node_modules_settings(self.conn) if self._stored_modules_match() else None
+            self._version = (
+                f"{read_content_version(self.conn, ANALYSIS_TABLES)}"
+                f"|node_modules={json.dumps(modules, sort_keys=True)}"
+            )
+            entry = self.cache.get("report")
+            if entry is not None and entry[0] == self._version and entry[1][0] == self._settings:
+                return replace(
+                    entry[1][1],
+                    db_path=str(self.db_path),
+                    generated_at=datetime.now(UTC).strftime("%Y-%m-%d %H:%M UTC"),
+                    timings={"total": time.perf_counter() - t_start},
+                    cache_info={"report": "reused"},
+                )
+            self._cache_info["report"] = "computed"
+
+        def timed(name: str, phase: Callable[..., Any], *args: Any) -> Any:
+            t0 = time.perf_counter()
+            result = phase(*args)
+            timings[name] = time.perf_counter() - t0
+            if on_phase is not None and name in PHASE_FIELDS:
+                on_phase(name, _report_fields(name, result))
+            return result
+
+        if self.workers > 1:
+            results = self._run_concurrent(timed)
+        else:
+            # Node attributes and degree tables shared by all phases
+            timed("load", lambda: self.tables)
+            # Shared computation used by phases 2, 4, 5
+            membership = timed("membership", self._compound_pathway_membership)
+            results = {
+                name: timed(name, phase, *args) for name, phase, args in self._phases(membership)
+            }
+        timings["total"] = time.perf_counter() - t_start
+        fields: dict[str, Any] = {}
+        for name in PHASE_FIELDS:
+            fields.update(_report_fields(name, results[name]))
+
+        report = PathwayAnalysisReport(
+            db_path=str(self.db_path),
+            generated_at=datetime.now(UTC).strftime("%Y-%m-%d %H:%M UTC"),
+            **fields,
+            timings=timings,
+            cache_info=dict(self._cache_info),
+        )
+        if self.cache is not None:
+            self.cache.put("report", self._version, (self._settings, report))
+        return report
+
+    def _phases(
+        self, membership: dict[str, set[str]]
+    ) -> list[tuple[str, Callable[..., Any], tuple[Any, ...]]]:
+        """Return ``(name, method, args)`` for every phase after the shared inputs."""
+        return [
+            ("phase1", self._phase1_stats, ()),
+            ("phase2", self._phase2_hub_metabolites, (membership,)),
+            ("phase3", self._phase3_complex_reactions, ()),
+            ("phase4", self._phase4_cross_pathway_hubs, (membership,)),
+            ("phase5", self._phase5_pathway_coupling, (membership,)),
+            ("phase6", self._phase6_topology, ()),
+            ("phase7", self._phase7_top_enzymes, ()),
+            ("phase8", self._phase8_centrality, ()),
+            ("phase9", self._phase9_modules, (membership,)),
+            ("profiles", self._pathway_profiles, ()),
+        ]
 
-        # Shared computation used by phases 2, 4, 5
-        membership = self._compound_pathway_membership()
+    def _run_concurrent(self, timed: Callable[..., Any]) -> dict[str, Any]:
+        """Run the phases in a thread pool, each thread on its own connection."""
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            load = pool.submit(timed, "load", lambda: self.tables)
+            membership = pool.submit(timed, "membership", self._compound_pathway_membership)
+            load.result()
+            futures = {
+                name: pool.submit(timed, name, phase, *args)
+                for name, phase, args in self._phases(membership.result())
+            }
+            return {name: future.result() for name, future in futures.items()}
+
+
+def _report_fields(name: str, result: Any) -> dict[str, Any]:
+    """Map a phase's return value onto its :data:`PHASE_FIELDS` report fields."""
+    names = PHASE_FIELDS[name]
+    if isinstance(result, dict):
+        # Optional phases return {} when skipped; the report keeps its defaults
+        return {f: result[f] for f in names if f in result}
+    if len(names) > 1:
+        return dict(zip(names, result, strict=True))
+    return {names[0]: result}
 
-        # Phase 2
-        hub_metabolites = self._phase2_hub_metabolites(membership)
 
-        # Phase 3
-        complex_reactions = self._phase3_complex_reactions()
+# ---------------------------------------------------------------------------
+# Pathway coupling kernel
+# ---------------------------------------------------------------------------
 
-        # Phase 4
-        cross_pathway_hubs = self._phase4_cross_pathway_hubs(membership)
 
-        # Phase 5
-        pathway_couplings = self._phase5_pathway_coupling(membership)
+def _top_shared_pairs(
+    members: list[set[str]], top_n: int, *, block: int = COUPLING_BLOCK
+) -> list[tuple[int, int, int]]:
+    """
+    Return the *top_n* index pairs ``(count, i, j)``, ``i < j``, with the most
+    shared members, ordered by count descending then ``(i, j)``.
 
-        # Phase 6
-        dead_ends, isolated = self._phase6_topology()
+    Computes ``M·Mᵀ`` in row blocks of *block* pathways so memory stays at
+    ``block × P`` however many pathway pairs share a compound, and keeps a
+    running top-N with :func:`numpy.argpartition`.  Falls back to counting
+    over an inverted index when SciPy is not installed.
+    """
+    try:
+        M, Mt = _incidence(members)
+    except ImportError:
+        return _top_shared_pairs_python(members, top_n)
+
+    n = len(members)
+    if n < 2 or top_n <= 0:
+        return []
+    counts = np.zeros(0, dtype=np.int64)
+    flat_ids = np.zeros(0, dtype=np.int64)
+    for start in range(0, n, block):
+        C = np.triu((M[start : start + block] @ Mt).toarray(), k=start + 1).ravel()
+        nz = np.flatnonzero(C)
+        if not nz.size:
+            continue
+        counts = np.concatenate([counts, C[nz]])
+        flat_ids = np.concatenate([flat_ids, nz + start * n])
+        counts, flat_ids = _keep_top(counts, flat_ids, n, top_n)
+    return _decode_pairs(counts, flat_ids, n)
+
+
+def _incidence(members: list[set[str]]) -> tuple[Any, Any]:
+    """Return the sparse pathway × compound incidence matrix and its transpose."""
+    from scipy.sparse import csr_matrix
+
+    index: dict[str, int] = {}
+    rows: list[int] = []
+    cols: list[int] = []
+    for i, cpds in enumerate(members):
+        for c in cpds:
+            rows.append(i)
+            cols.append(index.setdefault(c, len(index)))
+    M = csr_matrix(
+        (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+        shape=(len(members), max(len(index), 1)),
+    )
+    return M, M.T.tocsr()
 
-        # Phase 7
-        top_enzymes = self._phase7_top_enzymes()
 
-        # Profiles
-        profiles = self._pathway_profiles()
+def _keep_top(
+    counts: np.ndarray, flat_ids: np.ndarray, n: int, top_n: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Trim to the *top_n* pairs by count, breaking ties by pair position."""
+    if len(counts) <= top_n:
+        return counts, flat_ids
+    keys = counts.astype(np.int64) * (np.int64(n) * n) - flat_ids
+    keep = np.argpartition(keys, -top_n)[-top_n:]
+    return counts[keep], flat_ids[keep]
 
-        return PathwayAnalysisReport(
-            db_path=str(self.db_path),
-            generated_at=datetime.now(UTC).strftime("%Y-%m-%d %H:%M UTC"),
-            total_nodes=total_nodes,
-            total_edges=total_edges,
-            node_counts=node_counts,
-            edge_counts=edge_counts,
-            hub_metabolites=hub_metabolites,
-            complex_reactions=complex_reactions,
-            cross_pathway_hubs=cross_pathway_hubs,
-            pathway_couplings=pathway_couplings,
-            dead_end_metabolites=dead_ends,
-            isolated_nodes=isolated,
-            top_enzymes=top_enzymes,
-            pathway_profiles=profiles,
+
+def _decode_pairs(counts: np.ndarray, flat_ids: np.ndarray, n: int) -> list[tuple[int, int, int]]:
+    """Order pairs by count descending then position; return ``(count, i, j)``."""
+    order = np.lexsort((flat_ids, -counts.astype(np.int64)))
+    return [(int(counts[o]), int(flat_ids[o] // n), int(flat_ids[o] % n)) for o in order]
+
+
+@dataclass
+class _CouplingMatrix:
+    """
+    Upper triangle of ``M·Mᵀ`` for all pathway pairs, with the membership it
+    reflects, so it can be patched when only some pathways change.
+
+    :param pathway_ids: Sorted pathway IDs (matrix order).
+    :param members: Compound set per pathway.
+    :param rows: Row index of each non-zero pair (``rows < cols``).
+    :param cols: Column index of each non-zero pair.
+    :param counts: Shared-compound count of each pair.
+    """
+
+    pathway_ids: list[str]
+    members: dict[str, frozenset[str]]
+    rows: np.ndarray
+    cols: np.ndarray
+    counts: np.ndarray
+
+    @classmethod
+    def update(
+        cls,
+        previous: _CouplingMatrix | None,
+        membership: dict[str, set[str]],
+        *,
+        max_pairs: int,
+        block: int = COUPLING_BLOCK,
+    ) -> tuple[_CouplingMatrix | None, int]:
+        """
+        Bring *previous* up to date with *membership*.
+
+        Pairs between unchanged pathways are carried over; rows of pathways
+        whose compound set changed (or that are new) are recomputed.
+
+        :param previous: Matrix from an earlier run, or ``None``.
+        :param membership: Current ``pathway → compounds`` map.
+        :param max_pairs: Give up (return ``None``) beyond this many non-zero pairs.
+        :param block: Changed rows multiplied at a time.
+        :return: ``(matrix or None, number of pathways recomputed)``.
+        :raises ImportError: If SciPy is not installed.
+        """
+        pwy_ids = sorted(membership)
+        n = len(pwy_ids)
+        index = {p: i for i, p in enumerate(pwy_ids)}
+        members = {p: frozenset(membership[p]) for p in pwy_ids}
+        old_members = previous.members if previous is not None else {}
+        changed = np.array(
+            [index[p] for p in pwy_ids if old_members.get(p) != members[p]], dtype=np.int64
         )
+        is_changed = np.zeros(n, dtype=bool)
+        is_changed[changed] = True
+
+        parts: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        if previous is not None and len(previous.counts):
+            # IDs stay sorted, so surviving pairs keep rows < cols
+            remap = np.array(
+                [
+                    -1 if p not in index or is_changed[index[p]] else index[p]
+                    for p in previous.pathway_ids
+                ],
+                dtype=np.int64,
+            )
+            r, c = remap[previous.rows], remap[previous.cols]
+            keep = (r >= 0) & (c >= 0)
+            parts.append((r[keep], c[keep], previous.counts[keep]))
+
+        if len(changed):
+            M, Mt = _incidence([membership[p] for p in pwy_ids])
+            n_pairs = sum(len(part[2]) for part in parts)
+            for start in range(0, len(changed), block):
+                rows_block = changed[start : start + block]
+                C = (M[rows_block] @ Mt).tocoo()
+                i, j = rows_block[C.row], C.col.astype(np.int64)
+                # Each changed pair once: from the changed side, or from the smaller index
+                keep = (i != j) & (~is_changed[j] | (i < j))
+                i, j, v = i[keep], j[keep], C.data[keep]
+                parts.append((np.minimum(i, j), np.maximum(i, j), v))
+                n_pairs += len(v)
+                if n_pairs > max_pairs:
+                    return None, len(changed)
+
+        empty = np.zeros(0, dtype=np.int64)
+        rows = np.concatenate([p[0] for p in parts]) if parts else empty
+        cols = np.concatenate([p[1] for p in parts]) if parts else empty
+        counts = np.concatenate([p[2] for p in parts]).astype(np.int32) if parts else empty
+        return cls(pwy_ids, members, rows, cols, counts), len(changed)
+
+    def top_pairs(self, top_n: int) -> list[tuple[int, int, int]]:
+        """Return the *top_n* pairs as ``(count, i, j)`` like :func:`_top_shared_pairs`."""
+        if top_n <= 0:
+            return []
+        n = len(self.pathway_ids)
+        flat_ids = self.rows * n + self.cols
+        counts, flat_ids = _keep_top(self.counts, flat_ids, n, top_n)
+        return _decode_pairs(counts, flat_ids, n)
+
+
+def _top_shared_pairs_python(members: list[set[str]], top_n: int) -> list[tuple[int, int, int]]:
+    """Pure-Python :func:`_top_shared_pairs` over a compound → pathways index."""
+    by_cpd: dict[str, list[int]] = defaultdict(list)
+    for i, cpds in enumerate(members):
+        for c in cpds:
+            by_cpd[c].append(i)
+    pair_counts: Counter[tuple[int, int]] = Counter()
+    for pwys in by_cpd.values():
+        pair_counts.update(combinations(pwys, 2))
+    return heapq.nsmallest(
+        top_n,
+        ((cnt, i, j) for (i, j), cnt in pair_counts.items()),
+        key=lambda t: (-t[0], t[1], t[2]),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -738,6 +1295,96 @@ def _risk(n: int) -> str:
     return "🔴 HIGH"
 
 
+def _render_centrality(
+    report: PathwayAnalysisReport,
+    lines: list[str],
+    h: Callable[[int, str], None],
+    row: Callable[..., str],
+    th: Callable[..., list[str]],
+    *,
+    title: str = "Phase 8 — Network Centrality",
+) -> None:
+    """Append the phase 8 centrality section using the caller's formatting helpers."""
+    h(2, title)
+    lines.append(
+        "_Position rather than raw degree: PageRank finds compounds that flux-like random "
+        "walks keep returning to, betweenness finds the bottlenecks on shortest "
+        "compound–reaction routes, and the k-core is the densely interlinked centre._\n"
+    )
+    if not report.core_sizes:
+        lines.append("_Centrality not computed (requires SciPy: `pip install metakg[simulate]`)._")
+        return
+    notes = [f"Betweenness from **{report.centrality_samples:,}** BFS sources"]
+    if report.currency_excluded:
+        notes.append(f"**{report.currency_excluded}** currency metabolites excluded")
+    max_core = max(report.core_sizes)
+    notes.append(f"innermost **{max_core}-core** holds {report.core_sizes[max_core]:,} nodes")
+    lines.append("; ".join(notes) + ".\n")
+
+    if report.pagerank_hubs:
+        h(3, "Top Compounds by PageRank")
+        lines.extend(th("Rank", "Compound", "PageRank", "Betweenness", "Core"))
+        for i, c in enumerate(report.pagerank_hubs, 1):
+            lines.append(row(i, c.name, f"{c.pagerank:.5f}", f"{c.betweenness:.4f}", c.core))
+    if report.bottlenecks:
+        h(3, "Bottlenecks by Betweenness")
+        lines.extend(th("Rank", "Node", "Kind", "Betweenness", "PageRank", "Core"))
+        for i, c in enumerate(report.bottlenecks, 1):
+            lines.append(
+                row(i, c.name, c.kind, f"{c.betweenness:.4f}", f"{c.pagerank:.5f}", c.core)
+            )
+
+
+def _render_modules(
+    report: PathwayAnalysisReport,
+    lines: list[str],
+    h: Callable[[int, str], None],
+    row: Callable[..., str],
+    th: Callable[..., list[str]],
+    *,
+    title: str = "Phase 9 — Metabolic Modules",
+) -> None:
+    """Append the phase 9 module section using the caller's formatting helpers."""
+    h(2, title)
+    lines.append(
+        "_Communities found by Louvain modularity optimisation on the compound–reaction–"
+        "enzyme graph, set against the curated pathway boundaries. Low overlap marks "
+        "modules that cut across pathways._\n"
+    )
+    if not report.modules:
+        lines.append("_Modules not computed (requires SciPy: `pip install metakg[simulate]`)._")
+        return
+    lines.append(
+        f"**{report.module_count:,}** modules, modularity **{report.modularity:.3f}** "
+        f"({report.modules_source}).\n"
+    )
+    lines.extend(
+        th(
+            "Module",
+            "Nodes",
+            "Compounds",
+            "Reactions",
+            "Enzymes",
+            "Pathways",
+            "Best match",
+            "Jaccard",
+        )
+    )
+    for mod in report.modules:
+        lines.append(
+            row(
+                mod.module,
+                mod.size,
+                mod.compound_count,
+                mod.reaction_count,
+                mod.enzyme_count,
+                mod.pathway_count,
+                mod.best_pathway_name or "—",
+                f"{mod.jaccard:.2f}",
+            )
+        )
+
+
 def render_report(report: PathwayAnalysisReport, *, markdown: bool = True) -> str:
     """
     Render a :class:`PathwayAnalysisReport` as a Markdown or plain-text string.
@@ -964,6 +1611,12 @@ def render_report(report: PathwayAnalysisReport, *, markdown: bool = True) -> st
     else:
         lines.append("_No enzyme–reaction relationships found._")
 
+    # ---- Phase 8: Centrality ----
+    _render_centrality(report, lines, h, row, th)
+
+    # ---- Phase 9: Modules ----
+    _render_modules(report, lines, h, row, th)
+
     # ---- Insights ----
     h(2, "Biological Insights & Recommendations")
 
@@ -1046,10 +1699,29 @@ def render_report(report: PathwayAnalysisReport, *, markdown: bool = True) -> st
             "steps and prime drug targets."
         )
 
+    if report.bottlenecks:
+        top_bn = report.bottlenecks[0]
+        insights.append(
+            f"**Main bottleneck**: {top_bn.name} lies on the largest share of shortest "
+            f"compound–reaction paths (betweenness {top_bn.betweenness:.4f}). Routes between "
+            "otherwise distant parts of the network depend on it."
+        )
+
+    cross_cutting = [m for m in report.modules if m.compound_count >= 3 and m.jaccard < 0.25]
+    if cross_cutting:
+        insights.append(
+            f"**{len(cross_cutting)} cross-cutting modules**: tightly wired groups of compounds "
+            "and reactions that no single pathway covers (best Jaccard < 0.25). They suggest "
+            "functional units spanning the curated pathway boundaries."
+        )
+
     for insight in insights:
         lines.append(f"\n- {insight}")
 
     # ---- Footer ----
     lines.append(f"\n\n---\n*Generated by MetaKG pathway analyzer · {report.generated_at}*\n")
+    if report.timings:
+        spent = " · ".join(f"{k} {v:.3f}s" for k, v in report.timings.items())
+        lines.append(f"*Phase timings: {spent}*\n")
 
     return "\n".join(lines)
@@ -29,6 +29,7 @@ import streamlit as st
 import streamlit.components.v1 as components
 from pyvis.network import Network
 
+from metakg.simcache import SimulationCache
 from metakg.simulate import FBAResult, MetabolicSimulator, ODEResult, SimulationConfig
 from metakg.store import GraphStore
 
@@ -149,6 +150,21 @@ def _load_store(db_path: str) -> GraphStore | None:
     return GraphStore(db_path)
 
 
+@st.cache_resource(show_spinner=False)
+def _load_simulator(db_path: str, _store: GraphStore) -> MetabolicSimulator:
+    """
+    Load and cache a MetabolicSimulator with a persistent result cache.
+
+    Reruns with identical parameters are served from the cache until the
+    database content changes.
+
+    :param db_path: Filesystem path to the SQLite database file (cache key).
+    :param _store: Opened store for *db_path* (not hashed by Streamlit).
+    :return: Simulator bound to *_store*.
+    """
+    return MetabolicSimulator(_store, cache=SimulationCache.for_store(_store))
+
+
 def _get_store() -> GraphStore | None:
     """Retrieve the current GraphStore, loading it if the database path has changed."""
     current_path = str(st.session_state.get("db_path", _DEFAULT_DB))
@@ -678,7 +694,7 @@ def _tab_simulation(cfg: dict[str, Any]) -> None:
         st.session_state["sim_running"] = True
         st.session_state["sim_type"] = sim_type
 
-        sim = MetabolicSimulator(store)
+        sim = _load_simulator(str(store.db_path), store)
         config = SimulationConfig(
             pathway_id=pathway_id,
             t_end=float(t_end),
@@ -706,7 +722,7 @@ def _tab_simulation(cfg: dict[str, Any]) -> None:
             st.error(f"ODE failed: {result.message}")
             return
 
-        cpd_ids = sorted(result.concentrations.keys())
+        cpd_ids = sorted(result.compound_ids)
         selected_cpds = st.multiselect(
             "Variables (compounds)",
             options=cpd_ids,
@@ -727,7 +743,7 @@ def _tab_simulation(cfg: dict[str, Any]) -> None:
         fig, ax = plt.subplots(figsize=(10, 5))
         for cpd_id in selected_cpds:
             label = cpd_names[cpd_id]
-            ax.plot(result.t, result.concentrations[cpd_id], label=label)
+            ax.plot(result.time, result.series(cpd_id), label=label)
 
         ax.set_title("ODE Simulation Result")
         ax.set_xlabel("Time")
@@ -736,11 +752,12 @@ def _tab_simulation(cfg: dict[str, Any]) -> None:
         ax.legend(loc="best", fontsize=8)
         st.pyplot(fig, clear_figure=True)
 
+        final_concs = result.final_concentrations()
         final_df = pd.DataFrame(
             {
                 "Compound": [cpd_names[c] for c in selected_cpds],
                 "Compound ID": selected_cpds,
-                "Final concentration [mM]": [result.concentrations[c][-1] for c in selected_cpds],
+                "Final concentration [mM]": [final_concs[c] for c in selected_cpds],
             }
         ).sort_values("Final concentration [mM]", ascending=False)
         st.dataframe(final_df, use_container_width=True, hide_index=True)
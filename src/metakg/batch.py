@@ -0,0 +1,289 @@
+"""
+batch.py — Batch what-if screens over many scenarios.
+
+Reads :class:`~metakg.simulate.WhatIfScenario` objects from JSON Lines (one
+scenario object per line, the same shape ``simulate_whatif`` accepts) and
+runs them against a single baseline:
+
+  **Shared setup** — the baseline is solved once; the stoichiometric matrix,
+    stored kinetics and enzyme→reaction index are built once per simulator
+    and reused by every scenario.
+
+  **Worker pool** — with ``workers > 1`` scenarios run in a process pool.
+    Each worker opens its own connection to the database and warms its
+    scope once in the pool initializer.
+
+  **Streaming** — results are yielded in input order as soon as they are
+    ready, with a bounded number in flight, so arbitrarily long scenario
+    streams run in constant memory and output can be written incrementally.
+
+A scenario that fails produces a record with ``status="error"`` instead of
+aborting the screen.
+
+Usage::
+
+    from metakg.batch import read_scenarios, run_whatif_batch, write_jsonl
+
+    config = SimulationConfig(pathway_id="pwy:kegg:hsa00010")
+    records = run_whatif_batch(sim, config, read_scenarios("screen.jsonl"), workers=4)
+    write_jsonl(records, "screen.results.jsonl")
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import IO, Any
+
+from metakg.parallel import pool_context
+from metakg.simulate import (
+    FBAResult,
+    MetabolicSimulator,
+    ODEResult,
+    SimulationConfig,
+    WhatIfResult,
+    WhatIfScenario,
+)
+
+#: Deltas with a smaller magnitude are left out of result records.
+DELTA_TOL: float = 1e-9
+
+# ---------------------------------------------------------------------------
+# Scenario input
+# ---------------------------------------------------------------------------
+
+
+def scenario_from_dict(data: Mapping[str, Any], *, default_name: str = "whatif") -> WhatIfScenario:
+    """
+    Build a :class:`WhatIfScenario` from a decoded scenario object.
+
+    :param data: Mapping with optional ``name``, ``enzyme_knockouts``,
+        ``enzyme_factors`` and ``initial_conc_overrides`` keys.
+    :param default_name: Label used when *data* has no ``name``.
+    :return: :class:`WhatIfScenario`.
+    :raises ValueError: If *data* is not a JSON object.
+    """
+    if not isinstance(data, Mapping):
+        raise ValueError(f"scenario must be a JSON object, got {type(data).__name__}")
+    return WhatIfScenario(
+        name=str(data.get("name", default_name)),
+        enzyme_knockouts=list(data.get("enzyme_knockouts", [])),
+        enzyme_factors={k: float(v) for k, v in data.get("enzyme_factors", {}).items()},
+        initial_conc_overrides={
+            k: float(v) for k, v in data.get("initial_conc_overrides", {}).items()
+        },
+    )
+
+
+def read_scenarios(source: str | Path | IO[str] | Iterable[str]) -> Iterator[WhatIfScenario]:
+    """
+    Lazily parse scenarios from JSON Lines.
+
+    Blank lines and lines starting with ``#`` are skipped.  Scenarios without
+    a ``name`` are labelled ``scenario_<line>``.
+
+    :param source: Path to a ``.jsonl`` file, ``"-"`` for stdin, an open text
+        stream, or any iterable of lines.
+    :return: Iterator of :class:`WhatIfScenario`.
+    :raises ValueError: On a line that is not a valid scenario object.
+    """
+    if isinstance(source, (str, Path)):
+        if str(source) == "-":
+            yield from read_scenarios(sys.stdin)
+            return
+        with open(source, encoding="utf-8") as fh:
+            yield from read_scenarios(fh)
+        return
+
+    for lineno, line in enumerate(source, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            data = json.loads(line)
+            yield scenario_from_dict(data, default_name=f"scenario_{lineno}")
+        except (json.JSONDecodeError, ValueError, TypeError, AttributeError) as exc:
+            raise ValueError(f"line {lineno}: invalid scenario: {exc}") from exc
+
+
+# ---------------------------------------------------------------------------
+# Result records
+# ---------------------------------------------------------------------------
+
+
+def _nonzero(deltas: Mapping[str, float]) -> dict[str, float]:
+    return {k: v for k, v in sorted(deltas.items()) if abs(v) > DELTA_TOL}
+
+
+def whatif_record(index: int, result: WhatIfResult, elapsed: float = 0.0) -> dict[str, Any]:
+    """
+    Summarise a :class:`WhatIfResult` as a JSON-serialisable record.
+
+    Only non-negligible deltas (``|Δ| > DELTA_TOL``) are kept.
+
+    :param index: Zero-based position of the scenario in the input.
+    :param result: Completed what-if result.
+    :param elapsed: Wall time spent on the perturbed run (seconds).
+    :return: Dict with ``index``, ``name``, ``mode``, ``status``, objective or
+        ``t_steady`` fields, the delta map and ``elapsed_s``.
+    """
+    record: dict[str, Any] = {
+        "index": index,
+        "name": result.scenario_name,
+        "mode": result.mode,
+        "status": result.perturbed.status,
+        "baseline_status": result.baseline.status,
+    }
+    if isinstance(result.perturbed, FBAResult) and isinstance(result.baseline, FBAResult):
+        record["baseline_objective"] = result.baseline.objective_value
+        record["objective_value"] = result.perturbed.objective_value
+        record["delta_fluxes"] = _nonzero(result.delta_fluxes)
+    elif isinstance(result.perturbed, ODEResult):
+        record["t_steady"] = result.perturbed.t_steady
+        record["delta_final_conc"] = _nonzero(result.delta_final_conc)
+    record["message"] = result.perturbed.message
+    record["elapsed_s"] = round(elapsed, 6)
+    return record
+
+
+def _error_record(index: int, scenario: WhatIfScenario, mode: str, exc: BaseException) -> dict:
+    return {
+        "index": index,
+        "name": scenario.name,
+        "mode": mode,
+        "status": "error",
+        "error": f"{type(exc).__name__}: {exc}",
+    }
+
+
+def write_jsonl(records: Iterable[Mapping[str, Any]], dest: str | Path | IO[str]) -> int:
+    """
+    Write *records* as JSON Lines, flushing after each one.
+
+    :param records: Records to write (consumed lazily).
+    :param dest: Output path, ``"-"`` for stdout, or an open text stream.
+    :return: Number of records written.
+    """
+    if isinstance(dest, (str, Path)):
+        if str(dest) == "-":
+            return write_jsonl(records, sys.stdout)
+        with open(dest, "w", encoding="utf-8") as fh:
+            return write_jsonl(records, fh)
+    n = 0
+    for record in records:
+        dest.write(json.dumps(record, default=str) + "\n")
+        dest.flush()
+        n += 1
+    return n
+
+
+# ---------------------------------------------------------------------------
+# Worker processes
+# ---------------------------------------------------------------------------
+
+_WORKER: dict[str, Any] = {}
+
+
+def _init_worker(db_path: str, config: SimulationConfig, mode: str) -> None:
+    """Open the store in a worker process and warm the shared scope."""
+    from metakg.store import MetaStore
+
+    sim = MetabolicSimulator(MetaStore(db_path))
+    sim._build_stoich_matrix(config)
+    _WORKER.update(sim=sim, config=config, mode=mode)
+
+
+def _run_in_worker(scenario: WhatIfScenario) -> tuple[FBAResult | ODEResult, float]:
+    t0 = time.perf_counter()
+    sim: MetabolicSimulator = _WORKER["sim"]
+    result = sim.run_perturbed(_WORKER["config"], scenario, _WORKER["mode"])
+    return result, time.perf_counter() - t0
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+
+def run_whatif_batch(
+    simulator: MetabolicSimulator,
+    config: SimulationConfig,
+    scenarios: Iterable[WhatIfScenario],
+    *,
+    mode: str = "fba",
+    workers: int = 1,
+    max_pending: int | None = None,
+    progress: Callable[[int, dict[str, Any]], None] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Run many what-if scenarios against one baseline, yielding records in order.
+
+    :param simulator: Simulator for the baseline (and for every scenario when
+        *workers* ≤ 1, so its result cache is used).
+    :param config: Baseline simulation scope shared by all scenarios.
+    :param scenarios: Scenarios to run; consumed lazily.
+    :param mode: ``"fba"`` (default) or ``"ode"``.
+    :param workers: Number of worker processes; ``1`` runs in-process.
+    :param max_pending: Scenarios in flight at once (default ``4 × workers``).
+    :param progress: Called as ``progress(n_done, record)`` after each scenario.
+    :return: Iterator of records from :func:`whatif_record` (or error records).
+    :raises ValueError: If *mode* is not ``"fba"`` or ``"ode"``.
+    """
+    if mode not in ("fba", "ode"):
+        raise ValueError(f"mode must be 'fba' or 'ode', got {mode!r}")
+
+    baseline = simulator.run_fba(config) if mode == "fba" else simulator.run_ode(config)
+
+    def _finish(index: int, scenario: WhatIfScenario, outcome: Any) -> dict[str, Any]:
+        try:
+            perturbed, elapsed = outcome() if callable(outcome) else outcome.result()
+            result = simulator.compare(baseline, perturbed, scenario.name, mode)
+            return whatif_record(index, result, elapsed)
+        except Exception as exc:  # one bad scenario must not sink the screen
+            return _error_record(index, scenario, mode, exc)
+
+    def _local(scenario: WhatIfScenario) -> Callable[[], tuple[FBAResult | ODEResult, float]]:
+        def run() -> tuple[FBAResult | ODEResult, float]:
+            t0 = time.perf_counter()
+            result = simulator.run_perturbed(config, scenario, mode)
+            return result, time.perf_counter() - t0
+
+        return run
+
+    done = 0
+    if workers <= 1:
+        for index, scenario in enumerate(scenarios):
+            record = _finish(index, scenario, _local(scenario))
+            done += 1
+            if progress is not None:
+                progress(done, record)
+            yield record
+        return
+
+    window = max_pending or 4 * workers
+    pending: deque[tuple[int, WhatIfScenario, Future]] = deque()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=pool_context(),
+        initializer=_init_worker,
+        initargs=(str(simulator._store.db_path), config, mode),
+    ) as pool:
+        for index, scenario in enumerate(scenarios):
+            pending.append((index, scenario, pool.submit(_run_in_worker, scenario)))
+            while len(pending) >= window:
+                record = _finish(*pending.popleft())
+                done += 1
+                if progress is not None:
+                    progress(done, record)
+                yield record
+        while pending:
+            record = _finish(*pending.popleft())
+            done += 1
+            if progress is not None:
+                progress(done, record)
+            yield record
@@ -12,7 +12,7 @@ Standalone entry-point aliases (referenced by pyproject.toml [tool.poetry.script
 are re-exported here so that e.g. ``metakg.cli:build_main`` resolves correctly.
 """
 
-from metakg.cli import (  # noqa: F401  — registers simulate (fba/ode/whatif/seed)
+from metakg.cli import (  # noqa: F401  — registers simulate (fba/ode/steady-state/whatif/seed)
     cmd_analyze,  # noqa: F401  — registers analyze, analyze-basic
     cmd_build,  # noqa: F401  — registers build, update, enrich
     cmd_mcp,  # noqa: F401  — registers mcp
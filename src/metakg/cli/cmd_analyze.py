@@ -4,6 +4,8 @@ cmd_analyze.py — analyze and analyze-basic subcommands.
 Registers:
   metakg analyze        — thorough pathway analysis report
   metakg analyze-basic  — basic structured analysis report
+  metakg modules        — detect data-driven metabolic modules and store them
+  metakg similar        — pathways most similar to a given pathway (MinHash LSH)
 """
 
 from __future__ import annotations
@@ -35,13 +37,107 @@ _TOP_OPTION = click.option(
 
 _PLAIN_OPTION = click.option("--plain", is_flag=True, help="Plain-text output instead of Markdown.")
 
+_WORKERS_OPTION = click.option(
+    "--workers",
+    "-j",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Threads for running independent analysis phases concurrently.",
+)
+
+_INCREMENTAL_OPTION = click.option(
+    "--incremental",
+    is_flag=True,
+    help="Reuse results cached in <db>.analysis.sqlite; recompute only what changed.",
+)
+
+_EXCLUDE_CURRENCY_OPTION = click.option(
+    "--exclude-currency",
+    is_flag=True,
+    help="Leave currency metabolites (water, ATP, NAD+, CoA, ...) out of centrality and modules.",
+)
+
+_SAMPLES_OPTION = click.option(
+    "--betweenness-samples",
+    default=256,
+    show_default=True,
+    type=click.IntRange(min=0),
+    metavar="N",
+    help="BFS sources for approximate betweenness (0 = exact).",
+)
+
+
+def _run_analyzer(
+    db_path: Path,
+    top: int,
+    workers: int,
+    incremental: bool,
+    export: str | None = None,
+    export_format: str = "arrow",
+    **options,
+):
+    """Run :class:`~metakg.analyze.PathwayAnalyzer`, optionally with the sidecar cache."""
+    from metakg.analysis_cache import AnalysisCache
+    from metakg.analysis_export import AnalysisExporter
+    from metakg.analyze import PathwayAnalyzer
+
+    exporter = AnalysisExporter(export, fmt=export_format) if export else None
+    cache = AnalysisCache.for_db(db_path) if incremental else None
+    try:
+        with PathwayAnalyzer(
+            db_path, top_n=top, workers=workers, cache=cache, **options
+        ) as analyzer:
+            report = analyzer.run(on_phase=exporter.write_fields if exporter else None)
+    finally:
+        if cache is not None:
+            cache.close()
+    if report.cache_info:
+        click.echo(f"Cache: {report.cache_info}", err=True)
+    if exporter is not None:
+        click.echo(f"Tables written to {exporter.finish(report)}", err=True)
+    return report
+
+
+_EXPORT_OPTION = click.option(
+    "--export",
+    default=None,
+    metavar="DIR",
+    help="Also write every report section as a table to DIR, plus manifest.json.",
+)
+
+_EXPORT_FORMAT_OPTION = click.option(
+    "--export-format",
+    type=click.Choice(["arrow", "parquet"]),
+    default="arrow",
+    show_default=True,
+    help="Table format for --export (arrow = memory-mappable IPC file).",
+)
+
 
 @cli.command("analyze")
 @db_option
 @_OUTPUT_OPTION
 @_TOP_OPTION
 @_PLAIN_OPTION
-def analyze(db: str, output: str | None, top: int, plain: bool) -> None:
+@_WORKERS_OPTION
+@_INCREMENTAL_OPTION
+@_EXCLUDE_CURRENCY_OPTION
+@_SAMPLES_OPTION
+@_EXPORT_OPTION
+@_EXPORT_FORMAT_OPTION
+def analyze(
+    db: str,
+    output: str | None,
+    top: int,
+    plain: bool,
+    workers: int,
+    incremental: bool,
+    exclude_currency: bool,
+    betweenness_samples: int,
+    export: str | None,
+    export_format: str,
+) -> None:
     """Thorough metabolic pathway analysis report.
 
     Identifies hub metabolites, complex reactions, cross-pathway connections,
@@ -52,12 +148,19 @@ def analyze(db: str, output: str | None, top: int, plain: bool) -> None:
     if not db_path.exists():
         raise click.ClickException(f"database not found: {db_path}\nRun 'metakg build' first.")
 
-    from metakg.analyze import PathwayAnalyzer
     from metakg.thorough_analysis import render_thorough_report
 
     click.echo(f"Analysing {db_path} ...", err=True)
-    with PathwayAnalyzer(db_path, top_n=top) as analyzer:
-        report = analyzer.run()
+    report = _run_analyzer(
+        db_path,
+        top,
+        workers,
+        incremental,
+        exclude_currency=exclude_currency,
+        betweenness_samples=betweenness_samples,
+        export=export,
+        export_format=export_format,
+    )
 
     text = render_thorough_report(report, markdown=not plain)
 
@@ -71,7 +174,24 @@ def analyze(db: str, output: str | None, top: int, plain: bool) -> None:
 @_OUTPUT_OPTION
 @_TOP_OPTION
 @_PLAIN_OPTION
-def analyze_basic(db: str, output: str | None, top: int, plain: bool) -> None:
+@_WORKERS_OPTION
+@_INCREMENTAL_OPTION
+@_EXCLUDE_CURRENCY_OPTION
+@_SAMPLES_OPTION
+@_EXPORT_OPTION
+@_EXPORT_FORMAT_OPTION
+def analyze_basic(
+    db: str,
+    output: str | None,
+    top: int,
+    plain: bool,
+    workers: int,
+    incremental: bool,
+    exclude_currency: bool,
+    betweenness_samples: int,
+    export: str | None,
+    export_format: str,
+) -> None:
     """Basic structured analysis report: facts, ranked lists, minimal narrative.
 
     Writes to a timestamped file by default (e.g. metakg-analysis-basic-2026-03-01-143022.md).
@@ -80,11 +200,19 @@ def analyze_basic(db: str, output: str | None, top: int, plain: bool) -> None:
     if not db_path.exists():
         raise click.ClickException(f"database not found: {db_path}\nRun 'metakg build' first.")
 
-    from metakg.analyze import PathwayAnalyzer, render_report
+    from metakg.analyze import render_report
 
     click.echo(f"Analysing {db_path} ...", err=True)
-    with PathwayAnalyzer(db_path, top_n=top) as analyzer:
-        report = analyzer.run()
+    report = _run_analyzer(
+        db_path,
+        top,
+        workers,
+        incremental,
+        exclude_currency=exclude_currency,
+        betweenness_samples=betweenness_samples,
+        export=export,
+        export_format=export_format,
+    )
 
     text = render_report(report, markdown=not plain)
 
@@ -93,6 +221,82 @@ def analyze_basic(db: str, output: str | None, top: int, plain: bool) -> None:
     click.echo(f"Report written to {out_path}", err=True)
 
 
+@cli.command("modules")
+@db_option
+@click.option(
+    "--resolution",
+    default=1.0,
+    show_default=True,
+    type=click.FloatRange(min=0.0, min_open=True),
+    help="Louvain resolution; larger values give more, smaller modules.",
+)
+@click.option(
+    "--keep-currency",
+    is_flag=True,
+    help="Keep currency metabolites (water, ATP, NAD+, ...) in the module graph.",
+)
+@click.option("--seed", default=0, show_default=True, type=int, help="Random seed.")
+def modules(db: str, resolution: float, keep_currency: bool, seed: int) -> None:
+    """Detect metabolic modules (Louvain) and store the assignment per node.
+
+    The analyze reports use the stored modules until the graph changes.
+    """
+    db_path = Path(db)
+    if not db_path.exists():
+        raise click.ClickException(f"database not found: {db_path}\nRun 'metakg build' first.")
+
+    from metakg.orchestrator import MetaKG
+
+    with MetaKG(db_path=db_path) as kg:
+        result = kg.detect_modules(
+            resolution=resolution, exclude_currency=not keep_currency, seed=seed
+        )
+    click.echo(
+        f"{result['n_modules']:,} modules over {result['n_nodes']:,} nodes, "
+        f"modularity {result['modularity']:.3f} ({result['elapsed_s']:.1f}s)"
+    )
+    click.echo(f"Largest: {', '.join(str(n) for n in result['sizes'][:10])}")
+
+
+@cli.command("similar")
+@db_option
+@click.argument("pathway_id")
+@click.option(
+    "-k", default=10, show_default=True, type=int, help="Number of similar pathways to list."
+)
+@click.option(
+    "--min-jaccard",
+    default=0.0,
+    show_default=True,
+    type=click.FloatRange(0.0, 1.0),
+    help="Hide pathways with a lower estimated Jaccard similarity.",
+)
+def similar(db: str, pathway_id: str, k: int, min_jaccard: float) -> None:
+    """List pathways sharing the most compounds and reactions with PATHWAY_ID.
+
+    Similarity is estimated from MinHash signatures via an LSH index stored
+    in the database; the index is rebuilt on first use after the graph changes.
+    """
+    db_path = Path(db)
+    if not db_path.exists():
+        raise click.ClickException(f"database not found: {db_path}\nRun 'metakg build' first.")
+
+    from metakg.orchestrator import MetaKG
+
+    with MetaKG(db_path=db_path) as kg:
+        result = kg.similar_pathways(pathway_id, k, min_jaccard=min_jaccard)
+    if "error" in result:
+        raise click.ClickException(result["error"])
+    if not result["similar"]:
+        click.echo(f"No similar pathways found for {result['pathway_id']}.")
+        return
+    for hit in result["similar"]:
+        click.echo(
+            f"{hit['jaccard']:.3f}  {hit['pathway_id']:<28} {hit['name']}  ({hit['members']} members)"
+        )
+    click.echo(f"Lookup: {result['elapsed_ms']:.3f} ms", err=True)
+
+
 # ---------------------------------------------------------------------------
 # Standalone entry-point aliases
 # ---------------------------------------------------------------------------
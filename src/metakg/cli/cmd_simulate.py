@@ -1,11 +1,17 @@
 """
-cmd_simulate.py — simulate subcommand group with fba / ode / whatif / seed sub-subcommands.
+cmd_simulate.py — simulate subcommand group with fba / ode / steady-state / mca / sample /
+mcs / whatif / seed sub-subcommands.
 
 Registers:
-  metakg simulate fba     — Flux Balance Analysis
-  metakg simulate ode     — ODE kinetic simulation
-  metakg simulate whatif  — perturbation / what-if analysis
-  metakg simulate seed    — seed kinetic parameters from literature
+  metakg simulate fba           — Flux Balance Analysis (one scope, or --all-pathways)
+  metakg simulate ode           — ODE kinetic simulation
+  metakg simulate steady-state  — direct kinetic steady-state solve
+  metakg simulate mca           — metabolic control analysis at steady state
+  metakg simulate sample        — hit-and-run sampling of the feasible flux space
+  metakg simulate mcs           — minimal knockout (cut) sets blocking a reaction
+  metakg simulate whatif        — perturbation / what-if analysis
+  metakg simulate whatif-batch  — screen a JSON Lines file of what-if scenarios
+  metakg simulate seed          — seed kinetic parameters from literature
 """
 
 from __future__ import annotations
@@ -58,16 +64,71 @@ def simulate(ctx: click.Context, db: str, output: str | None, plain: bool, top:
     help="Reaction ID to optimise (default: maximise total forward flux).",
 )
 @click.option("--minimize", is_flag=True, help="Minimise rather than maximise the objective.")
+@click.option(
+    "--all-pathways",
+    is_flag=True,
+    help="Run FBA separately on every pathway and write a summary table.",
+)
+@click.option(
+    "--workers",
+    "-j",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Worker processes for --all-pathways.",
+)
+@click.option(
+    "--table",
+    default=None,
+    metavar="FILE",
+    help="Summary table for --all-pathways: .parquet or .csv (default: timestamped CSV).",
+)
 @click.pass_obj
-def fba(obj: dict, pathway: str | None, objective: str | None, minimize: bool) -> None:
+def fba(
+    obj: dict,
+    pathway: str | None,
+    objective: str | None,
+    minimize: bool,
+    all_pathways: bool,
+    workers: int,
+    table: str | None,
+) -> None:
     """Flux Balance Analysis — steady-state optimal flux distribution."""
     db_path = Path(obj["db"])
     if not db_path.exists():
         raise click.ClickException(f"database not found: {db_path}\nRun 'metakg build' first.")
+    if all_pathways and pathway:
+        raise click.UsageError("--all-pathways and --pathway are mutually exclusive.")
 
     from metakg import MetaKG
     from metakg.simulate import SimulationConfig, render_fba_result
 
+    if all_pathways:
+        from metakg.cli._utils import _timestamped_filename
+
+        out = table or _timestamped_filename("metakg-simulate-fba-pathways", ".csv")
+
+        def _progress(n_done: int, n_total: int, row: dict) -> None:
+            click.echo(f"[{n_done}/{n_total}] {row['pathway_id']}: {row['status']}", err=True)
+
+        click.echo(f"Running FBA on all pathways ({workers} worker(s))...", err=True)
+        with MetaKG(db_path=db_path) as kg:
+            try:
+                summary = kg.simulate_fba_all_pathways(
+                    objective_reaction=objective,
+                    maximize=not minimize,
+                    workers=workers,
+                    output=out,
+                    progress=_progress,
+                )
+            except ImportError as exc:
+                raise click.ClickException(str(exc)) from exc
+        counts = ", ".join(f"{k}: {v}" for k, v in sorted(summary["status_counts"].items()))
+        click.echo(
+            f"Done. {summary['n_pathways']} pathway(s) ({counts}); table written to {out}", err=True
+        )
+        return
+
     with MetaKG(db_path=db_path) as kg:
         store = kg.store
         pathway_id = store.resolve_id(pathway) if pathway else None
@@ -114,6 +175,28 @@ def fba(obj: dict, pathway: str | None, objective: str | None, minimize: bool) -
     metavar="MM",
     help="Default initial concentration in mM for all compounds.",
 )
+@click.option(
+    "--stop-at-steady",
+    "steady_rtol",
+    default=None,
+    type=float,
+    metavar="RTOL",
+    help="Stop once max|dy/dt|/max|y| stays below RTOL (e.g. 1e-6).",
+)
+@click.option(
+    "--sampling",
+    default="uniform",
+    show_default=True,
+    type=click.Choice(["uniform", "adaptive"]),
+    help="Output sampling: evenly spaced, or dense where concentrations change quickly.",
+)
+@click.option(
+    "--method",
+    default="BDF",
+    show_default=True,
+    type=click.Choice(["auto", "BDF", "Radau", "LSODA", "RK45", "RK23", "DOP853"]),
+    help="ODE solver; 'auto' picks one from the system's stiffness.",
+)
 @click.pass_obj
 def ode(
     obj: dict,
@@ -122,6 +205,9 @@ def ode(
     points: int,
     conc: tuple[str, ...],
     default_conc: float,
+    steady_rtol: float | None,
+    sampling: str,
+    method: str,
 ) -> None:
     """ODE kinetic simulation — concentration time-courses via Michaelis-Menten."""
     db_path = Path(obj["db"])
@@ -140,6 +226,9 @@ def ode(
             t_points=points,
             initial_concentrations=_parse_conc_args(conc),
             default_concentration=default_conc,
+            steady_state_rtol=steady_rtol,
+            output_sampling=sampling,
+            ode_method=method,
         )
         click.echo(f"Running ODE (t=0..{time}, {points} pts)...", err=True)
         result = kg.simulator.run_ode(config)
@@ -148,6 +237,322 @@ def ode(
     _write_output(text, obj["output"], "metakg-simulate-ode")
 
 
+@simulate.command("steady-state")
+@click.option("--pathway", "-p", default=None, help="Pathway node ID or name.")
+@click.option(
+    "--conc",
+    multiple=True,
+    metavar="ID:VALUE",
+    help="Set starting concentration for a compound: e.g. --conc cpd:kegg:C00031:5.0  (repeatable).",
+)
+@click.option(
+    "--default-conc",
+    default=1.0,
+    show_default=True,
+    type=float,
+    metavar="MM",
+    help="Default starting concentration in mM for all compounds.",
+)
+@click.option(
+    "--tol",
+    default=1e-8,
+    show_default=True,
+    type=float,
+    help="Convergence threshold on max|dy/dt|.",
+)
+@click.option(
+    "--max-iter",
+    default=100,
+    show_default=True,
+    type=int,
+    help="Newton iterations before falling back to integration.",
+)
+@click.pass_obj
+def steady_state(
+    obj: dict,
+    pathway: str | None,
+    conc: tuple[str, ...],
+    default_conc: float,
+    tol: float,
+    max_iter: int,
+) -> None:
+    """Kinetic steady state — settled concentrations without a time-course."""
+    db_path = Path(obj["db"])
+    if not db_path.exists():
+        raise click.ClickException(f"database not found: {db_path}\nRun 'metakg build' first.")
+
+    from metakg import MetaKG
+    from metakg.simulate import SimulationConfig, render_steady_state_result
+
+    with MetaKG(db_path=db_path) as kg:
+        store = kg.store
+        pathway_id = store.resolve_id(pathway) if pathway else None
+        config = SimulationConfig(
+            pathway_id=pathway_id,
+            initial_concentrations=_parse_conc_args(conc),
+            default_concentration=default_conc,
+        )
+        click.echo("Solving for steady state...", err=True)
+        result = kg.simulator.run_steady_state(config, tol=tol, max_iter=max_iter)
+        text = render_steady_state_result(
+            result, store, top_n=obj["top"], markdown=not obj["plain"]
+        )
+
+    _write_output(text, obj["output"], "metakg-simulate-steady-state")
+
+
+@simulate.command("mca")
+@click.option("--pathway", "-p", default=None, help="Pathway node ID or name.")
+@click.option(
+    "--conc",
+    multiple=True,
+    metavar="ID:VALUE",
+    help="Set starting (or fixed) concentration for a compound: ID:mM (repeatable).",
+)
+@click.option(
+    "--default-conc",
+    default=1.0,
+    show_default=True,
+    type=float,
+    metavar="MM",
+    help="Default starting concentration in mM for all compounds.",
+)
+@click.option(
+    "--fixed",
+    multiple=True,
+    metavar="CPD_ID",
+    help="Hold a source/sink compound at its starting concentration (repeatable).",
+)
+@click.option(
+    "--method",
+    default="auto",
+    show_default=True,
+    type=click.Choice(["auto", "analytic", "finite_difference"]),
+    help="Analytic control coefficients, or finite differences of perturbed steady states.",
+)
+@click.option(
+    "--workers",
+    "-j",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Worker processes for finite differences.",
+)
+@click.option(
+    "--target",
+    default=None,
+    metavar="RXN_ID",
+    help="Reaction whose flux control is listed (default: the largest flux).",
+)
+@click.pass_obj
+def mca(
+    obj: dict,
+    pathway: str | None,
+    conc: tuple[str, ...],
+    default_conc: float,
+    fixed: tuple[str, ...],
+    method: str,
+    workers: int,
+    target: str | None,
+) -> None:
+    """Metabolic control analysis — flux and concentration control coefficients."""
+    db_path = Path(obj["db"])
+    if not db_path.exists():
+        raise click.ClickException(f"database not found: {db_path}\nRun 'metakg build' first.")
+
+    from metakg import MetaKG
+    from metakg.mca import control_analysis, render_mca_result
+    from metakg.simulate import SimulationConfig
+
+    with MetaKG(db_path=db_path) as kg:
+        store = kg.store
+        pathway_id = store.resolve_id(pathway) if pathway else None
+        config = SimulationConfig(
+            pathway_id=pathway_id,
+            initial_concentrations=_parse_conc_args(conc),
+            default_concentration=default_conc,
+            fixed_compounds=[store.resolve_id(c) or c for c in fixed],
+        )
+        click.echo("Running metabolic control analysis...", err=True)
+        result = control_analysis(kg.simulator, config, method=method, workers=workers)
+        text = render_mca_result(
+            result,
+            store,
+            target=store.resolve_id(target) or target if target else None,
+            top_n=obj["top"],
+            markdown=not obj["plain"],
+        )
+
+    _write_output(text, obj["output"], "metakg-simulate-mca")
+
+
+@simulate.command("sample")
+@click.option("--pathway", "-p", default=None, help="Pathway node ID or name.")
+@click.option(
+    "--samples",
+    "n_samples",
+    default=1000,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of flux samples to draw.",
+)
+@click.option(
+    "--chains",
+    default=4,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Independent hit-and-run chains.",
+)
+@click.option(
+    "--thin",
+    "thinning",
+    default=100,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Hit-and-run steps per kept sample.",
+)
+@click.option(
+    "--workers",
+    "-j",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Worker processes (chains are split between them).",
+)
+@click.option("--seed", default=None, type=int, help="Random seed for reproducible samples.")
+@click.option(
+    "--npy",
+    "npy_path",
+    default=None,
+    metavar="FILE",
+    help="Write all samples to FILE (.npy, memory-mapped) plus a .json sidecar.",
+)
+@click.pass_obj
+def sample(
+    obj: dict,
+    pathway: str | None,
+    n_samples: int,
+    chains: int,
+    thinning: int,
+    workers: int,
+    seed: int | None,
+    npy_path: str | None,
+) -> None:
+    """Flux sampling — distribution of fluxes over the feasible flux space."""
+    db_path = Path(obj["db"])
+    if not db_path.exists():
+        raise click.ClickException(f"database not found: {db_path}\nRun 'metakg build' first.")
+
+    from metakg import MetaKG
+    from metakg.sampling import render_flux_samples, sample_fluxes
+    from metakg.simulate import SimulationConfig
+
+    with MetaKG(db_path=db_path) as kg:
+        store = kg.store
+        pathway_id = store.resolve_id(pathway) if pathway else None
+        config = SimulationConfig(pathway_id=pathway_id)
+        click.echo(f"Sampling {n_samples} flux vectors ({chains} chains)...", err=True)
+        try:
+            samples = sample_fluxes(
+                kg.simulator,
+                config,
+                n_samples=n_samples,
+                chains=chains,
+                thinning=thinning,
+                workers=workers,
+                seed=seed,
+                output=npy_path,
+            )
+        except ValueError as exc:
+            raise click.ClickException(str(exc)) from exc
+        text = render_flux_samples(samples, store, top_n=obj["top"], markdown=not obj["plain"])
+
+    _write_output(text, obj["output"], "metakg-simulate-sample")
+
+
+@simulate.command("mcs")
+@click.option("--target", "-t", required=True, help="Reaction node ID or name to block.")
+@click.option("--pathway", "-p", default=None, help="Pathway node ID or name.")
+@click.option(
+    "--by",
+    type=click.Choice(["enzyme", "reaction"]),
+    default="enzyme",
+    show_default=True,
+    help="Knock out enzymes (via CATALYZES edges) or reactions.",
+)
+@click.option(
+    "--max-size",
+    "max_cardinality",
+    default=3,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Largest cut set to search for.",
+)
+@click.option(
+    "--max-sets",
+    default=100,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Stop after this many cut sets.",
+)
+@click.option(
+    "--time-limit",
+    default=60.0,
+    show_default=True,
+    type=click.FloatRange(min=0.0),
+    help="Wall-clock budget in seconds.",
+)
+@click.option(
+    "--workers",
+    "-j",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Worker processes (the search is split by first knockout).",
+)
+@click.pass_obj
+def mcs(
+    obj: dict,
+    target: str,
+    pathway: str | None,
+    by: str,
+    max_cardinality: int,
+    max_sets: int,
+    time_limit: float,
+    workers: int,
+) -> None:
+    """Minimal cut sets — smallest knockouts that block flux through a reaction."""
+    db_path = Path(obj["db"])
+    if not db_path.exists():
+        raise click.ClickException(f"database not found: {db_path}\nRun 'metakg build' first.")
+
+    from metakg import MetaKG
+    from metakg.mcs import minimal_cut_sets, render_mcs_result
+    from metakg.simulate import SimulationConfig
+
+    with MetaKG(db_path=db_path) as kg:
+        store = kg.store
+        pathway_id = store.resolve_id(pathway) if pathway else None
+        config = SimulationConfig(pathway_id=pathway_id)
+        click.echo(f"Enumerating cut sets up to size {max_cardinality}...", err=True)
+        try:
+            result = minimal_cut_sets(
+                kg.simulator,
+                config,
+                store.resolve_id(target) or target,
+                by=by,
+                max_cardinality=max_cardinality,
+                max_sets=max_sets,
+                time_limit=time_limit,
+                workers=workers,
+            )
+        except ValueError as exc:
+            raise click.ClickException(str(exc)) from exc
+        text = render_mcs_result(result, store, top_n=obj["top"], markdown=not obj["plain"])
+
+    _write_output(text, obj["output"], "metakg-simulate-mcs")
+
+
 @simulate.command("whatif")
 @click.option("--pathway", "-p", default=None, help="Pathway node ID or name.")
 @click.option(
@@ -225,6 +630,90 @@ def whatif(
     _write_output(text, obj["output"], "metakg-simulate-whatif")
 
 
+@simulate.command("whatif-batch")
+@click.argument("scenarios", metavar="SCENARIOS.jsonl")
+@click.option("--pathway", "-p", default=None, help="Pathway node ID or name.")
+@click.option(
+    "--mode",
+    default="fba",
+    show_default=True,
+    type=click.Choice(["fba", "ode"]),
+    help="Simulation mode.",
+)
+@click.option(
+    "--time",
+    "-t",
+    default=100.0,
+    show_default=True,
+    type=float,
+    help="ODE end time (ignored for FBA).",
+)
+@click.option(
+    "--workers",
+    "-j",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Worker processes.",
+)
+@click.option(
+    "--results",
+    "-r",
+    default=None,
+    metavar="FILE",
+    help="JSON Lines output, one record per scenario ('-' for stdout; "
+    "default: timestamped filename).",
+)
+@click.pass_obj
+def whatif_batch(
+    obj: dict,
+    scenarios: str,
+    pathway: str | None,
+    mode: str,
+    time: float,
+    workers: int,
+    results: str | None,
+) -> None:
+    """Run every scenario in SCENARIOS.jsonl ('-' for stdin) against one baseline.
+
+    Each line is a scenario object as accepted by the simulate_whatif MCP tool,
+    e.g. {"name": "hk_ko", "enzyme_knockouts": ["enz:kegg:hsa:2538"]}.
+    """
+    db_path = Path(obj["db"])
+    if not db_path.exists():
+        raise click.ClickException(f"database not found: {db_path}\nRun 'metakg build' first.")
+
+    from metakg import MetaKG
+    from metakg.cli._utils import _timestamped_filename
+
+    out = results or _timestamped_filename("metakg-simulate-whatif-batch", ".jsonl")
+
+    def _progress(n_done: int, record: dict) -> None:
+        detail = record.get("error") or record["status"]
+        click.echo(f"[{n_done}] {record['name']}: {detail}", err=True)
+
+    click.echo(f"Running what-if batch ({mode.upper()}, {workers} worker(s))...", err=True)
+    with MetaKG(db_path=db_path) as kg:
+        try:
+            summary = kg.simulate_whatif_batch(
+                scenarios,
+                pathway,
+                mode=mode,
+                output=out,
+                workers=workers,
+                t_end=time,
+                progress=_progress,
+            )
+        except ValueError as exc:
+            raise click.ClickException(str(exc)) from exc
+
+    click.echo(
+        f"Done. {summary['n_scenarios']} scenario(s), {summary['n_errors']} error(s)"
+        + ("" if out == "-" else f"; results written to {out}"),
+        err=True,
+    )
+
+
 @simulate.command("seed")
 @click.option("--force", is_flag=True, help="Overwrite existing kinetic parameter rows.")
 @click.pass_obj
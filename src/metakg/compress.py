@@ -0,0 +1,403 @@
+"""
+compress.py — Stoichiometric model compression for MetaKG simulations.
+
+Shrinks a constraint-based model before it reaches the LP solver by
+removing everything that provably cannot carry steady-state flux:
+
+  **Dead ends** — compounds that can only be produced or only consumed
+    given reaction bounds.  Every reaction touching them is blocked;
+    removal is repeated until no new dead ends appear.
+
+  **Blocked reactions** — reactions that cannot carry non-zero flux in
+    any solution of ``S·v = 0, lb ≤ v ≤ ub``.  Detected with FASTCC-style
+    LP7 problems (Vlassis et al., 2014): one LP maximises the number of
+    reactions above a small threshold *ε* for a whole batch at once, so
+    most reactions are certified consistent without an LP of their own.
+
+  **Duplicate columns** — parallel reactions with identical stoichiometry
+    and objective weight are merged into a single column whose bounds are
+    the sums of the originals.
+
+:class:`CompressedNetwork` maps solutions of the reduced problem back to
+the original reaction order (blocked reactions carry zero flux; merged
+flux is split across duplicates in proportion to their bound ranges).
+
+Usage::
+
+    from metakg.compress import compress_network
+
+    net = compress_network(S, lb, ub, c=c)
+    if net is not None:
+        sol = linprog(net.c, A_eq=net.S, b_eq=0, bounds=net.bounds())
+        v = net.expand_fluxes(sol.x)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import numpy as np
+from scipy.optimize import linprog
+from scipy.sparse import csr_matrix, hstack
+from scipy.sparse import eye as sparse_eye
+
+#: Flux threshold above which a reaction counts as carrying flux.
+DEFAULT_EPSILON: float = 1e-4
+
+# A singleton max-flux LP above this optimum proves a reaction unblocked
+_FLUX_TOL = 1e-9
+
+# Coefficients closer than this are treated as equal when grouping columns
+_COL_DECIMALS = 9
+
+
+@dataclass
+class CompressedNetwork:
+    """
+    A reduced stoichiometric model and the mapping back to the original one.
+
+    :param S: Reduced stoichiometric matrix, shape ``(len(kept_cpds), n_cols)``.
+    :param lb: Lower flux bounds of the reduced columns.
+    :param ub: Upper flux bounds of the reduced columns.
+    :param c: Objective coefficients of the reduced columns.
+    :param groups: ``groups[k]`` lists the original reaction indices merged into column *k*.
+    :param kept_cpds: Original row indices that survive compression.
+    :param blocked: Original reaction indices that cannot carry flux.
+    :param dead_ends: Original compound indices removed as dead ends (or left
+        without reactions).
+    :param n_rxn: Number of reactions in the original model.
+    :param n_cpd: Number of compounds in the original model.
+    """
+
+    S: np.ndarray
+    lb: np.ndarray
+    ub: np.ndarray
+    c: np.ndarray
+    groups: list[list[int]]
+    kept_cpds: np.ndarray
+    blocked: list[int] = field(default_factory=list)
+    dead_ends: list[int] = field(default_factory=list)
+    n_rxn: int = 0
+    n_cpd: int = 0
+    _orig_lb: np.ndarray = field(default_factory=lambda: np.zeros(0), repr=False)
+    _orig_ub: np.ndarray = field(default_factory=lambda: np.zeros(0), repr=False)
+
+    @property
+    def n_merged(self) -> int:
+        """Number of original reactions absorbed into another column."""
+        return sum(len(g) - 1 for g in self.groups)
+
+    @property
+    def is_empty(self) -> bool:
+        """``True`` when every reaction is blocked."""
+        return not self.groups
+
+    def bounds(self) -> list[tuple[float, float]]:
+        """Reduced bounds as ``linprog``-style ``(lb, ub)`` pairs."""
+        return list(zip(self.lb.tolist(), self.ub.tolist()))
+
+    def expand_fluxes(self, v: np.ndarray) -> np.ndarray:
+        """
+        Map reduced fluxes back to the original reactions.
+
+        Blocked reactions get zero flux.  The flux of a merged column is
+        distributed over its members as ``lb_i + (v − Σlb)·(ub_i − lb_i)/Σ(ub − lb)``,
+        which stays within every member's bounds.  When a member is unbounded
+        the shares are undefined, so the members start from the point of
+        their bounds nearest zero and the remainder goes, in equal parts, to
+        the members with unlimited room in its direction (or in proportion to
+        the finite room when none has).
+
+        :param v: Reduced flux vector, one entry per column.
+        :return: Flux vector of length :attr:`n_rxn`.
+        """
+        out = np.zeros(self.n_rxn)
+        for k, members in enumerate(self.groups):
+            if len(members) == 1:
+                out[members[0]] = v[k]
+                continue
+            lbs = self._orig_lb[members]
+            ubs = self._orig_ub[members]
+            span = ubs - lbs
+            if not np.isfinite(span).all():
+                out[members] = _split_unbounded(v[k], lbs, ubs)
+                continue
+            total = float(span.sum())
+            share = span / total if total > 0 else np.full(len(members), 1.0 / len(members))
+            out[members] = lbs + (v[k] - lbs.sum()) * share
+        return out
+
+    def expand_compounds(self, values: np.ndarray, fill: float = 0.0) -> np.ndarray:
+        """
+        Map per-compound values of the reduced model (e.g. shadow prices) back.
+
+        :param values: One value per kept compound.
+        :param fill: Value used for removed compounds.
+        :return: Array of length :attr:`n_cpd`.
+        """
+        out = np.full(self.n_cpd, fill)
+        out[self.kept_cpds] = values
+        return out
+
+
+def _split_unbounded(v: float, lbs: np.ndarray, ubs: np.ndarray) -> np.ndarray:
+    """
+    Split the flux *v* of a merged column whose members have infinite bounds.
+
+    :param v: Flux of the merged column.
+    :param lbs: Member lower bounds.
+    :param ubs: Member upper bounds (at least one bound is infinite).
+    :return: Member fluxes summing to *v*, each within its bounds.
+    """
+    base = np.clip(0.0, lbs, ubs)
+    rest = v - float(base.sum())
+    room = ubs - base if rest >= 0 else base - lbs
+    unlimited = np.isinf(room)
+    if unlimited.any():
+        share = unlimited / unlimited.sum()
+    else:
+        total = float(room.sum())
+        share = room / total if total > 0 else np.full(len(lbs), 1.0 / len(lbs))
+    return base + rest * share
+
+
+# ---------------------------------------------------------------------------
+# Dead ends
+# ---------------------------------------------------------------------------
+
+
+def _remove_dead_ends(
+    S: np.ndarray, lb: np.ndarray, ub: np.ndarray, active: np.ndarray
+) -> np.ndarray:
+    """
+    Iteratively block reactions that touch compounds which cannot be balanced.
+
+    :param active: Boolean mask of reactions still considered.
+    :return: Updated *active* mask after reaching a fixed point.
+    """
+    fwd = ub > 0
+    bwd = lb < 0
+    seen = np.zeros(S.shape[0], dtype=bool)
+    while True:
+        sub = S[:, active]
+        pos = sub > 0
+        neg = sub < 0
+        f = fwd[active]
+        b = bwd[active]
+        produced = (pos & f).any(axis=1) | (neg & b).any(axis=1)
+        consumed = (neg & f).any(axis=1) | (pos & b).any(axis=1)
+        touched = (pos | neg).any(axis=1)
+        rows = np.flatnonzero(touched & ~(produced & consumed) & ~seen)
+        if not len(rows):
+            return active
+        seen[rows] = True
+        active = active & ~(S[rows] != 0).any(axis=0)
+
+
+# ---------------------------------------------------------------------------
+# FASTCC-style consistency
+# ---------------------------------------------------------------------------
+
+
+def _lp7(
+    S: csr_matrix,
+    lb: np.ndarray,
+    ub: np.ndarray,
+    targets: np.ndarray,
+    sign: np.ndarray,
+    eps: float,
+) -> np.ndarray | None:
+    """
+    Maximise the number of *targets* carrying at least *eps* flux.
+
+    Solves ``max Σ z  s.t.  S·v = 0, lb ≤ v ≤ ub, 0 ≤ z ≤ ε, z_k ≤ sign_k·v_{targets_k}``.
+
+    :return: Optimal flux vector, or ``None`` if the LP failed.
+    """
+    n_rxn = S.shape[1]
+    k = len(targets)
+    pick = csr_matrix((-sign, (np.arange(k), targets)), shape=(k, n_rxn))
+    a_ub = hstack([pick, sparse_eye(k, format="csr")], format="csr")
+    a_eq = hstack([S, csr_matrix((S.shape[0], k))], format="csr")
+    c = np.concatenate([np.zeros(n_rxn), -np.ones(k)])
+    bounds = np.vstack([np.column_stack([lb, ub]), np.column_stack([np.zeros(k), np.full(k, eps)])])
+    res = linprog(
+        c,
+        A_ub=a_ub,
+        b_ub=np.zeros(k),
+        A_eq=a_eq,
+        b_eq=np.zeros(S.shape[0]),
+        bounds=bounds,
+        method="highs",
+    )
+    return res.x[:n_rxn] if res.status == 0 else None
+
+
+def _max_flux(S: csr_matrix, lb: np.ndarray, ub: np.ndarray, j: int, sign: float) -> float | None:
+    """
+    Solve ``max sign·v_j  s.t.  S·v = 0, lb ≤ v ≤ ub`` exactly.
+
+    :return: The optimum (``inf`` if unbounded), or ``None`` if the LP failed.
+    """
+    c = np.zeros(S.shape[1])
+    c[j] = -sign
+    res = linprog(
+        c,
+        A_eq=S,
+        b_eq=np.zeros(S.shape[0]),
+        bounds=np.column_stack([lb, ub]),
+        method="highs",
+    )
+    if res.status == 3:
+        return float("inf")
+    return -float(res.fun) if res.status == 0 else None
+
+
+def consistent_reactions(
+    S: np.ndarray,
+    lb: np.ndarray,
+    ub: np.ndarray,
+    *,
+    candidates: np.ndarray | None = None,
+    eps: float = DEFAULT_EPSILON,
+) -> np.ndarray | None:
+    """
+    Find the reactions that can carry non-zero steady-state flux.
+
+    Batches of candidates are tested with one LP7 each (forward, then
+    backward for reversible reactions); whatever a batch fails to activate
+    is checked with an exact max-flux LP before being declared blocked, so
+    a reaction confined below *eps* by its bounds or stoichiometry is kept.
+    *eps* is also lowered to half the smallest non-zero bound, so batches
+    still activate such reactions.
+
+    :param S: Stoichiometric matrix.
+    :param lb: Lower flux bounds.
+    :param ub: Upper flux bounds.
+    :param candidates: Boolean mask of reactions to test (default: all).
+    :param eps: Flux threshold for "carries flux" in the batch LPs.
+    :return: Boolean mask of consistent reactions, or ``None`` if an LP failed
+        (typically because the bounds themselves are infeasible).
+    """
+    n_rxn = S.shape[1]
+    todo = np.ones(n_rxn, dtype=bool) if candidates is None else candidates.copy()
+    consistent = np.zeros(n_rxn, dtype=bool)
+    if not todo.any():
+        return consistent
+    Ss = csr_matrix(S)
+    spans = np.abs(np.concatenate([lb[todo], ub[todo]]))
+    spans = spans[np.isfinite(spans) & (spans > 0)]
+    if len(spans):
+        eps = min(eps, 0.5 * float(spans.min()))
+    tol = eps * (1.0 - 1e-6)
+
+    def _batch(direction: float, mask: np.ndarray) -> bool:
+        targets = np.flatnonzero(mask)
+        if not len(targets):
+            return True
+        v = _lp7(Ss, lb, ub, targets, np.full(len(targets), direction), eps)
+        if v is None:
+            return False
+        hit = np.abs(v) >= tol
+        consistent[hit] = True
+        todo[hit] = False
+        return True
+
+    for direction, can_move in ((1.0, ub > 0), (-1.0, lb < 0)):
+        while True:
+            before = int(todo.sum())
+            if not _batch(direction, todo & can_move):
+                return None
+            if int(todo.sum()) == before:
+                break
+
+    for j in np.flatnonzero(todo):
+        for direction, can_move in ((1.0, ub[j] > 0), (-1.0, lb[j] < 0)):
+            if can_move and not consistent[j]:
+                best = _max_flux(Ss, lb, ub, j, direction)
+                if best is None:
+                    return None
+                consistent[j] = best > _FLUX_TOL
+    return consistent
+
+
+# ---------------------------------------------------------------------------
+# Duplicate columns
+# ---------------------------------------------------------------------------
+
+
+def _group_duplicates(S: np.ndarray, c: np.ndarray, cols: np.ndarray) -> list[list[int]]:
+    """Group original column indices *cols* with identical stoichiometry and weight."""
+    groups: dict[bytes, list[int]] = {}
+    keyed = np.round(np.vstack([S[:, cols], c[cols]]), _COL_DECIMALS) + 0.0
+    for pos, j in enumerate(cols.tolist()):
+        groups.setdefault(keyed[:, pos].tobytes(), []).append(j)
+    return list(groups.values())
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+
+def compress_network(
+    S: np.ndarray,
+    lb: np.ndarray,
+    ub: np.ndarray,
+    *,
+    c: np.ndarray | None = None,
+    eps: float = DEFAULT_EPSILON,
+    merge_duplicates: bool = True,
+) -> CompressedNetwork | None:
+    """
+    Remove dead ends, blocked reactions and duplicate columns from a model.
+
+    The optimum of any linear objective over ``S·v = 0, lb ≤ v ≤ ub`` is
+    unchanged, provided duplicates are merged only when their objective
+    weights agree (which *c* guarantees).
+
+    :param S: Stoichiometric matrix, shape ``(n_cpd, n_rxn)``.
+    :param lb: Lower flux bounds, length ``n_rxn``.
+    :param ub: Upper flux bounds, length ``n_rxn``.
+    :param c: Objective coefficients (default zeros); columns are merged only
+        when their coefficients are equal.
+    :param eps: Flux threshold for the consistency LPs.
+    :param merge_duplicates: Merge parallel reactions (default ``True``).
+    :return: :class:`CompressedNetwork`, or ``None`` when the bounds force flux
+        through a blocked reaction (the model is infeasible as given and should
+        be solved uncompressed so the solver reports it).
+    """
+    n_cpd, n_rxn = S.shape
+    lb = np.asarray(lb, dtype=float)
+    ub = np.asarray(ub, dtype=float)
+    c = np.zeros(n_rxn) if c is None else np.asarray(c, dtype=float)
+
+    active = (ub > 0) | (lb < 0)
+    active = _remove_dead_ends(S, lb, ub, active)
+    consistent = consistent_reactions(S, lb, ub, candidates=active, eps=eps)
+    if consistent is None:
+        return None
+    blocked = np.flatnonzero(~consistent)
+    if ((lb[blocked] > 0) | (ub[blocked] < 0)).any():
+        return None
+
+    cols = np.flatnonzero(consistent)
+    groups = _group_duplicates(S, c, cols) if merge_duplicates else [[j] for j in cols]
+    kept_cpds = np.flatnonzero((S[:, cols] != 0).any(axis=1))
+    dead_ends = sorted(set(range(n_cpd)) - set(kept_cpds.tolist()))
+
+    reps = [g[0] for g in groups]
+    return CompressedNetwork(
+        S=S[np.ix_(kept_cpds, reps)],
+        lb=np.array([lb[g].sum() for g in groups]),
+        ub=np.array([ub[g].sum() for g in groups]),
+        c=c[reps],
+        groups=groups,
+        kept_cpds=kept_cpds,
+        blocked=blocked.tolist(),
+        dead_ends=dead_ends,
+        n_rxn=n_rxn,
+        n_cpd=n_cpd,
+        _orig_lb=lb,
+        _orig_ub=ub,
+    )
@@ -0,0 +1,501 @@
+"""
+mca.py — Metabolic control analysis at the kinetic steady state.
+
+Computes, for every reaction (and enzyme) in a kinetic scope, how strongly it
+controls each steady-state flux and concentration:
+
+  **Elasticities** — ``ε = ∂v/∂y``, taken analytically from the compiled
+    Michaelis-Menten rate laws (:meth:`~metakg.simulate.KineticModel.rate_jacobian`).
+
+  **Control coefficients** — from the steady-state Jacobian with conserved
+    moieties factored out (link matrix ``L``, independent stoichiometry
+    ``N_R``)::
+
+        C^S = −L (N_R ε L)⁻¹ N_R        C^J = I + ε C^S
+
+    One linear solve yields the full matrices; column *j* is the response of
+    every flux and concentration to the activity of reaction *j*.  Both are
+    reported scaled (``∂ln J / ∂ln e``), so each flux row of ``C^J`` sums to 1
+    and each concentration row of ``C^S`` to 0 (summation theorems).
+
+  **Finite differences** — used when the reduced Jacobian is singular, or on
+    request: each reaction's Vmax is stepped up and down in log space and the
+    steady state re-solved from the unperturbed one, with the ``2N`` solves
+    spread over a process pool.
+
+Enzyme coefficients add up the columns of the reactions each enzyme
+CATALYZES, since changing the amount of an enzyme scales all of them at once.
+
+Closed networks relax to equilibrium, where every flux is zero and scaled
+flux coefficients are undefined; hold source and sink metabolites fixed with
+``SimulationConfig.fixed_compounds`` to analyse a pathway carrying flux.
+
+Usage::
+
+    from metakg.mca import control_analysis
+
+    config = SimulationConfig(
+        pathway_id="pwy:kegg:hsa00010",
+        fixed_compounds=["cpd:kegg:C00031", "cpd:kegg:C00022"],
+    )
+    mca = control_analysis(sim, config)
+    mca.flux_control          # (n_rxn, n_rxn), rows = fluxes, columns = reactions
+    mca.enzyme_flux_control   # (n_rxn, n_enz)
+"""
+
+from __future__ import annotations
+
+import time
+from collections import ChainMap
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from metakg.parallel import pool_context
+from metakg.simulate import (
+    ConservationLaws,
+    KineticModel,
+    MetabolicSimulator,
+    SimulationConfig,
+    SteadyStateResult,
+    _display_name,
+)
+
+if TYPE_CHECKING:
+    from metakg.store import MetaStore
+
+#: Reduced Jacobians with a larger condition number are treated as singular.
+SINGULAR_COND: float = 1e12
+
+#: Fluxes and concentrations below this magnitude leave scaled coefficients undefined.
+SCALE_TOL: float = 1e-12
+
+# ---------------------------------------------------------------------------
+# Result type
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class MCAResult:
+    """
+    Scaled elasticities and control coefficients at one steady state.
+
+    Undefined entries (zero reference flux or concentration) are ``NaN``.
+
+    :param status: ``"ok"``, ``"not_converged"`` (no steady state) or ``"error"``.
+    :param method: ``"analytic"`` or ``"finite_difference"``.
+    :param reaction_ids: Reactions in the kinetic model (pruned ones excluded).
+    :param compound_ids: Compounds in the kinetic model.
+    :param enzyme_ids: Enzymes catalysing at least one of *reaction_ids*.
+    :param fluxes: Steady-state rates, shape ``(n_rxn,)``.
+    :param concentrations: Steady-state concentrations, shape ``(n_cpd,)``.
+    :param elasticities: ``∂ln v_j / ∂ln y_i``, shape ``(n_rxn, n_cpd)``.
+    :param flux_control: ``∂ln J_k / ∂ln e_j``, shape ``(n_rxn, n_rxn)``.
+    :param conc_control: ``∂ln y_i / ∂ln e_j``, shape ``(n_cpd, n_rxn)``.
+    :param enzyme_flux_control: Flux control per enzyme, shape ``(n_rxn, n_enz)``.
+    :param enzyme_conc_control: Concentration control per enzyme, shape ``(n_cpd, n_enz)``.
+    :param message: Human-readable summary.
+    :param timings: Wall-clock seconds per phase (``steady_state``, ``control``, ``total``).
+    """
+
+    status: str
+    method: str
+    reaction_ids: list[str]
+    compound_ids: list[str]
+    enzyme_ids: list[str]
+    fluxes: np.ndarray
+    concentrations: np.ndarray
+    elasticities: np.ndarray
+    flux_control: np.ndarray
+    conc_control: np.ndarray
+    enzyme_flux_control: np.ndarray
+    enzyme_conc_control: np.ndarray
+    message: str = ""
+    timings: dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def empty(cls, status: str, message: str) -> MCAResult:
+        """Return a result with no reactions, for failures before the analysis starts."""
+        v, m = np.zeros(0), np.zeros((0, 0))
+        return cls(status, "", [], [], [], v, v, m, m, m, m, m, message)
+
+    def summation_error(self) -> float:
+        """
+        Largest deviation from the summation theorems over defined rows.
+
+        :return: ``max(|Σ_j C^J_kj − 1|, |Σ_j C^S_ij|)``, or ``0.0`` if nothing is defined.
+        """
+        dev = [
+            np.abs(self.flux_control.sum(axis=1) - 1.0),
+            np.abs(self.conc_control.sum(axis=1)),
+        ]
+        finite = np.concatenate([d[np.isfinite(d)] for d in dev])
+        return float(finite.max()) if finite.size else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serialise to JSON-compatible nested dicts.
+
+        Coefficient matrices become ``{row_id: {column_id: value}}`` with exact
+        zeros left out and undefined entries as ``None``.
+        """
+        return {
+            "status": self.status,
+            "method": self.method,
+            "message": self.message,
+            "summation_error": self.summation_error(),
+            "fluxes": dict(zip(self.reaction_ids, self.fluxes.tolist())),
+            "concentrations": dict(zip(self.compound_ids, self.concentrations.tolist())),
+            "elasticities": _nested(self.reaction_ids, self.compound_ids, self.elasticities),
+            "flux_control": _nested(self.reaction_ids, self.reaction_ids, self.flux_control),
+            "concentration_control": _nested(
+                self.compound_ids, self.reaction_ids, self.conc_control
+            ),
+            "enzyme_flux_control": _nested(
+                self.reaction_ids, self.enzyme_ids, self.enzyme_flux_control
+            ),
+            "enzyme_concentration_control": _nested(
+                self.compound_ids, self.enzyme_ids, self.enzyme_conc_control
+            ),
+            "timings": dict(self.timings),
+        }
+
+
+def _nested(rows: list[str], cols: list[str], m: np.ndarray) -> dict[str, dict[str, Any]]:
+    out: dict[str, dict[str, Any]] = {}
+    for i, row_id in enumerate(rows):
+        entries = {
+            cols[j]: (None if np.isnan(x) else float(x)) for j, x in enumerate(m[i]) if x != 0.0
+        }
+        if entries:
+            out[row_id] = entries
+    return out
+
+
+def _scaled(response: np.ndarray, reference: np.ndarray) -> np.ndarray:
+    """Divide row *i* of *response* by ``reference[i]``; ``NaN`` where it vanishes."""
+    out = np.full(response.shape, np.nan)
+    ok = np.abs(reference) > SCALE_TOL
+    out[ok] = response[ok] / reference[ok, None]
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Analytic control coefficients
+# ---------------------------------------------------------------------------
+
+
+def elasticities(model: KineticModel, y: np.ndarray) -> np.ndarray:
+    """
+    Scaled elasticities ``∂ln v_j / ∂ln y_i`` of *model* at *y*.
+
+    :param model: Compiled kinetic model.
+    :param y: Concentrations, shape ``(n_cpd,)``.
+    :return: Array of shape ``(n_rxn, n_cpd)``; rows of zero-rate reactions are ``NaN``.
+    """
+    return _scaled(model.rate_jacobian(y) * y[None, :], model.rates(y))
+
+
+def control_responses(model: KineticModel, y: np.ndarray) -> tuple[np.ndarray, np.ndarray] | None:
+    """
+    Unscaled responses of steady-state fluxes and concentrations to each reaction.
+
+    Entry ``[k, j]`` is ``∂J_k / ∂ln e_j`` (resp. ``∂y_k / ∂ln e_j``), i.e. the
+    unscaled control coefficient times the local rate ``v_j``.
+
+    :param model: Compiled kinetic model.
+    :param y: Steady-state concentrations.
+    :return: ``(flux_response, conc_response)`` of shapes ``(n_rxn, n_rxn)`` and
+        ``(n_cpd, n_rxn)``, or ``None`` if the reduced Jacobian is singular.
+    """
+    laws = ConservationLaws.from_stoichiometry(model.S)
+    L = laws.expansion_matrix()
+    N_R = model.S[laws.independent]
+    eps = model.rate_jacobian(y)
+    v = model.rates(y)
+
+    if len(laws.independent) == 0:
+        dy = np.zeros((len(model.cpd_ids), len(model.rxn_ids)))
+    else:
+        M = N_R @ eps @ L
+        if not np.all(np.isfinite(M)) or np.linalg.cond(M) > SINGULAR_COND:
+            return None
+        dy = -L @ np.linalg.solve(M, N_R)
+    dJ = np.eye(len(model.rxn_ids)) + eps @ dy
+    return dJ * v[None, :], dy * v[None, :]
+
+
+# ---------------------------------------------------------------------------
+# Finite-difference fallback
+# ---------------------------------------------------------------------------
+
+_WORKER: dict[str, Any] = {}
+
+
+def _init_worker(db_path: str) -> None:
+    """Open the store in a worker process."""
+    from metakg.store import MetaStore
+
+    _WORKER["sim"] = MetabolicSimulator(MetaStore(db_path))
+
+
+def _solve_in_worker(config: SimulationConfig, tol: float) -> SteadyStateResult:
+    return _WORKER["sim"].run_steady_state(config, tol=tol)
+
+
+def _stepped(config: SimulationConfig, rxn_id: str, factor: float) -> SimulationConfig:
+    base = config.vmax_factors.get(rxn_id, 1.0)
+    return replace(config, vmax_factors=ChainMap({rxn_id: base * factor}, config.vmax_factors))
+
+
+def finite_difference_responses(
+    simulator: MetabolicSimulator,
+    config: SimulationConfig,
+    model: KineticModel,
+    y: np.ndarray,
+    *,
+    rel_step: float = 1e-3,
+    workers: int = 1,
+    tol: float = 1e-10,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Estimate :func:`control_responses` by central differences in ``ln Vmax``.
+
+    Every perturbed solve starts from the unperturbed steady state *y*, so
+    conserved totals are unchanged and Newton converges in a few steps.
+
+    :param simulator: Simulator whose store provides the model.
+    :param config: Configuration the steady state *y* was solved for.
+    :param model: Kinetic model at that configuration.
+    :param y: Steady-state concentrations.
+    :param rel_step: Step in ``ln Vmax``.
+    :param workers: Worker processes; ``1`` solves in-process.
+    :param tol: Steady-state tolerance of the perturbed solves.
+    :return: ``(flux_response, conc_response)`` as for :func:`control_responses`.
+    """
+    start = replace(config, initial_concentrations=dict(zip(model.cpd_ids, y.tolist())))
+    jobs = [
+        _stepped(start, rxn_id, float(np.exp(sign * rel_step)))
+        for rxn_id in model.rxn_ids
+        for sign in (1.0, -1.0)
+    ]
+    if workers <= 1:
+        results = [simulator.run_steady_state(c, tol=tol) for c in jobs]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=pool_context(),
+            initializer=_init_worker,
+            initargs=(str(simulator._store.db_path),),
+        ) as pool:
+            results = list(pool.map(_solve_in_worker, jobs, [tol] * len(jobs)))
+
+    n_rxn, n_cpd = len(model.rxn_ids), len(model.cpd_ids)
+    dJ = np.full((n_rxn, n_rxn), np.nan)
+    dy = np.full((n_cpd, n_rxn), np.nan)
+    for j in range(n_rxn):
+        up, down = results[2 * j], results[2 * j + 1]
+        if up.status != "converged" or down.status != "converged":
+            continue
+        dJ[:, j] = [(up.fluxes[r] - down.fluxes[r]) / (2 * rel_step) for r in model.rxn_ids]
+        dy[:, j] = [
+            (up.concentrations[c] - down.concentrations[c]) / (2 * rel_step) for c in model.cpd_ids
+        ]
+    return dJ, dy
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+
+def control_analysis(
+    simulator: MetabolicSimulator,
+    config: SimulationConfig,
+    *,
+    method: str = "auto",
+    workers: int = 1,
+    rel_step: float = 1e-3,
+    tol: float = 1e-10,
+) -> MCAResult:
+    """
+    Elasticities and flux/concentration control coefficients for *config*.
+
+    :param simulator: Simulator providing the kinetic model and steady-state solver.
+    :param config: Kinetic scope, parameters, initial state and fixed compounds.
+    :param method: ``"auto"`` (analytic, finite differences if the Jacobian is
+        singular), ``"analytic"`` or ``"finite_difference"``.
+    :param workers: Worker processes for finite differences.
+    :param rel_step: Log-step in Vmax for finite differences.
+    :param tol: Steady-state convergence threshold on ``max|dy/dt|``.
+    :return: :class:`MCAResult`.
+    :raises ValueError: If *method* is not recognised.
+    """
+    if method not in ("auto", "analytic", "finite_difference"):
+        raise ValueError(
+            f"method must be 'auto', 'analytic' or 'finite_difference', got {method!r}"
+        )
+
+    t0 = time.perf_counter()
+    ss = simulator.run_steady_state(config, tol=tol)
+    if ss.status == "error":
+        return MCAResult.empty("error", ss.message)
+
+    rxn_ids, cpd_ids, S, rev_flags = simulator._build_stoich_matrix(config)
+    model = simulator._build_kinetic_model(rxn_ids, cpd_ids, S, rev_flags, config)
+    y = np.array([ss.concentrations[c] for c in model.cpd_ids])
+    v = model.rates(y)
+    t_ss = time.perf_counter()
+
+    responses = None
+    used = "analytic"
+    if method != "finite_difference":
+        responses = control_responses(model, y)
+    if responses is None:
+        if method == "analytic":
+            return MCAResult.empty("error", "Reduced Jacobian is singular at the steady state.")
+        used = "finite_difference"
+        responses = finite_difference_responses(
+            simulator, config, model, y, rel_step=rel_step, workers=workers, tol=tol
+        )
+    dJ, dy = responses
+
+    enzyme_ids, enzyme_cols = _enzyme_columns(simulator, model.rxn_ids)
+    dJ_enz = _by_enzyme(dJ, enzyme_cols)
+    dy_enz = _by_enzyme(dy, enzyme_cols)
+    t_end = time.perf_counter()
+
+    result = MCAResult(
+        status="ok" if ss.status == "converged" else "not_converged",
+        method=used,
+        reaction_ids=list(model.rxn_ids),
+        compound_ids=list(model.cpd_ids),
+        enzyme_ids=enzyme_ids,
+        fluxes=v,
+        concentrations=y,
+        elasticities=elasticities(model, y),
+        flux_control=_scaled(dJ, v),
+        conc_control=_scaled(dy, y),
+        enzyme_flux_control=_scaled(dJ_enz, v),
+        enzyme_conc_control=_scaled(dy_enz, y),
+        timings={
+            "steady_state": t_ss - t0,
+            "control": t_end - t_ss,
+            "total": t_end - t0,
+        },
+    )
+    if result.status == "ok":
+        result.message = (
+            f"{len(v)} reaction(s), {len(enzyme_ids)} enzyme(s) by {used} MCA; "
+            f"summation error {result.summation_error():.2g}."
+        )
+    else:
+        result.message = f"Coefficients at a state that is not steady: {ss.message}"
+    return result
+
+
+def _enzyme_columns(
+    simulator: MetabolicSimulator, rxn_ids: list[str]
+) -> tuple[list[str], list[list[int]]]:
+    """Return the enzymes catalysing any of *rxn_ids* and the columns of each."""
+    col = {r: j for j, r in enumerate(rxn_ids)}
+    enzyme_ids: list[str] = []
+    enzyme_cols: list[list[int]] = []
+    for enz_id, rxns in sorted(simulator._enzyme_reaction_index().items()):
+        cols = sorted({col[r] for r in rxns if r in col})
+        if cols:
+            enzyme_ids.append(enz_id)
+            enzyme_cols.append(cols)
+    return enzyme_ids, enzyme_cols
+
+
+def _by_enzyme(response: np.ndarray, enzyme_cols: list[list[int]]) -> np.ndarray:
+    """Sum the response columns of each enzyme's reactions."""
+    out = np.zeros((response.shape[0], len(enzyme_cols)))
+    for e, cols in enumerate(enzyme_cols):
+        out[:, e] = response[:, cols].sum(axis=1)
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Rendering
+# ---------------------------------------------------------------------------
+
+
+def render_mca_result(
+    result: MCAResult,
+    store: MetaStore | None = None,
+    *,
+    target: str | None = None,
+    top_n: int = 20,
+    markdown: bool = True,
+) -> str:
+    """
+    Format an :class:`MCAResult` as a human-readable report.
+
+    Lists the enzymes (or, without CATALYZES edges, the reactions) with the
+    largest control over one flux, then the largest concentration control
+    coefficients.
+
+    :param result: MCA result to render.
+    :param store: Optional MetaStore for resolving names.
+    :param target: Reaction whose flux control is listed (default: the largest flux).
+    :param top_n: Maximum rows per table.
+    :param markdown: Emit Markdown (default) or plain text.
+    :return: Formatted string.
+    """
+    h2 = "## " if markdown else ""
+    h3 = "### " if markdown else "--- "
+    bold = ("**", "**") if markdown else ("", "")
+    lines: list[str] = []
+
+    lines.append(f"{h2}Metabolic Control Analysis")
+    lines.append(f"{bold[0]}Status:{bold[1]} {result.status}")
+    if result.method:
+        lines.append(f"{bold[0]}Method:{bold[1]} {result.method}")
+    lines.append(f"{bold[0]}Message:{bold[1]} {result.message}")
+    lines.append("")
+    if not result.reaction_ids:
+        return "\n".join(lines)
+
+    if target is None or target not in result.reaction_ids:
+        target = result.reaction_ids[int(np.argmax(np.abs(result.fluxes)))]
+    k = result.reaction_ids.index(target)
+    if result.enzyme_ids:
+        ids, row = result.enzyme_ids, result.enzyme_flux_control[k]
+    else:
+        ids, row = result.reaction_ids, result.flux_control[k]
+    order = [j for j in np.argsort(-np.abs(np.nan_to_num(row))) if row[j] != 0.0]
+
+    lines.append(
+        f"{h3}Flux Control over {_display_name(store, target)} (J = {result.fluxes[k]:.4g})"
+    )
+    if markdown:
+        lines.append("| Controller | ID | C^J |")
+        lines.append("|---|---|---:|")
+    for j in order[:top_n]:
+        if markdown:
+            lines.append(f"| {_display_name(store, ids[j])} | `{ids[j]}` | {row[j]:.4f} |")
+        else:
+            lines.append(f"  {_display_name(store, ids[j]):<40} {row[j]:>10.4f}")
+
+    cc = result.enzyme_conc_control if result.enzyme_ids else result.conc_control
+    flat = np.nan_to_num(cc)
+    entries = [tuple(ix) for ix in np.argwhere(np.abs(flat) > SCALE_TOL)]
+    entries.sort(key=lambda ix: -abs(flat[ix]))
+    if entries:
+        lines.append("")
+        lines.append(f"{h3}Largest Concentration Control Coefficients")
+        if markdown:
+            lines.append("| Compound | Controller | C^S |")
+            lines.append("|---|---|---:|")
+        for i, j in entries[:top_n]:
+            cpd, ctl = _display_name(store, result.compound_ids[i]), _display_name(store, ids[j])
+            if markdown:
+                lines.append(f"| {cpd} | {ctl} | {cc[i, j]:.4f} |")
+            else:
+                lines.append(f"  {cpd:<30} {ctl:<30} {cc[i, j]:>10.4f}")
+
+    return "\n".join(lines)
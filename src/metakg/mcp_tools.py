@@ -7,14 +7,22 @@ Exposes tools on a FastMCP instance:
     get_compound(id)                            — compound + connected reactions
     get_reaction(id)                            — full stoichiometric detail
     find_path(compound_a, compound_b, max_hops) — shortest metabolic path
+    similar_pathways(pathway_id, k)             — pathways with overlapping members
 
     simulate_fba(pathway_id, objective_reaction, maximize)
         — Flux Balance Analysis on a pathway
     simulate_ode(pathway_id, t_end, t_points, initial_concentrations_json,
                  default_concentration)
         — ODE kinetic simulation; returns concentration time-courses
+    simulate_steady_state(pathway_id, initial_concentrations_json,
+                          default_concentration, tol)
+        — Direct steady-state solve; returns settled concentrations and rates
+    simulate_mca(pathway_id, initial_concentrations_json, fixed_compounds, method, workers)
+        — Metabolic control analysis: elasticities and control coefficients
     simulate_whatif(pathway_id, scenario_json, mode)
         — Perturbation analysis: baseline vs. modified enzyme/substrate scenario
+    simulate_whatif_batch(pathway_id, scenarios_jsonl, mode, workers)
+        — Screen many scenarios (JSON Lines) against one shared baseline
     get_kinetic_params(reaction_id)
         — Retrieve stored kinetic parameters for a reaction
     seed_kinetics(force)
@@ -109,6 +117,22 @@ def _mcp_find_path(metakg: MetaKG, compound_a: str, compound_b: str, max_hops: i
     return json.dumps(result, indent=2, default=str)
 
 
+def _mcp_similar_pathways(metakg: MetaKG, pathway_id: str, k: int = 10) -> str:
+    """
+    Find the pathways most similar to a given pathway.
+
+    Similarity is the Jaccard overlap of the pathways' compounds and
+    reactions, estimated from MinHash signatures through an LSH index.
+
+    :param pathway_id: Pathway node ID (e.g. ``pwy:kegg:hsa00010``) or shorthand.
+    :param k: Maximum results to return (default 10).
+    :return: JSON with ``pathway_id`` and a ``similar`` list of
+        ``{pathway_id, name, jaccard, members}``, or ``{"error": ...}``.
+    """
+    result = metakg.similar_pathways(pathway_id, k=k)
+    return json.dumps(result, indent=2, default=str)
+
+
 def _mcp_simulate_fba(
     metakg: MetaKG,
     pathway_id: str,
@@ -130,7 +154,7 @@ def _mcp_simulate_fba(
     :return: JSON with ``status``, ``objective_value``, ``fluxes`` dict, and
         ``shadow_prices`` dict.
     """
-    from metakg.simulate import MetabolicSimulator, SimulationConfig
+    from metakg.simulate import SimulationConfig
 
     store = metakg.store
     pwy_id = store.resolve_id(pathway_id) if pathway_id else None
@@ -139,7 +163,7 @@ def _mcp_simulate_fba(
         objective_reaction=objective_reaction or None,
         maximize=maximize,
     )
-    sim = MetabolicSimulator(store)
+    sim = metakg.simulator
     result = sim.run_fba(config)
 
     # Enrich flux dict with reaction names
@@ -155,7 +179,7 @@ def _mcp_simulate_fba(
             "objective_value": result.objective_value,
             "message": result.message,
             "fluxes": enriched_fluxes,
-            "shadow_prices": result.shadow_prices,
+            "shadow_prices": dict(result.shadow_prices),
         },
         indent=2,
         default=str,
@@ -169,6 +193,9 @@ def _mcp_simulate_ode(
     t_points: int = 200,
     initial_concentrations_json: str = "{}",
     default_concentration: float = 1.0,
+    steady_state_rtol: float = 1e-6,
+    output_sampling: str = "adaptive",
+    ode_method: str = "auto",
 ) -> str:
     """
     Run a kinetic ODE simulation using Michaelis-Menten rate equations.
@@ -184,10 +211,19 @@ def _mcp_simulate_ode(
         initial concentrations in mM, e.g.
         ``'{"cpd:kegg:C00031": 5.0, "cpd:kegg:C00002": 3.0}'``.
     :param default_concentration: Fallback initial concentration in mM (default 1.0).
-    :return: JSON with ``status``, ``message``, ``t`` (time array), and
-        ``concentrations`` (compound_id → [mM, ...]).
+    :param steady_state_rtol: Stop once the relative derivative norm stays below this
+        threshold (default ``1e-6``); pass ``0`` to always integrate to *t_end*.
+    :param output_sampling: ``"adaptive"`` (default) concentrates the *t_points*
+        samples where concentrations change quickly; ``"uniform"`` spaces them evenly.
+    :param ode_method: Solver: ``"auto"`` (default) picks one from the Jacobian's
+        stiffness and switches if steps collapse; or ``"BDF"``, ``"Radau"``,
+        ``"LSODA"``, ``"RK45"``, ``"RK23"``, ``"DOP853"``.
+    :return: JSON with ``status``, ``message``, ``t`` (time array),
+        ``concentrations`` (compound_id → [mM, ...]), ``t_steady`` (stop time
+        if a steady state was detected, else null), ``method`` (solver(s) used)
+        and ``timings`` (seconds per phase).
     """
-    from metakg.simulate import MetabolicSimulator, SimulationConfig
+    from metakg.simulate import SimulationConfig
 
     try:
         init_concs: dict[str, float] = json.loads(initial_concentrations_json)
@@ -202,21 +238,27 @@ def _mcp_simulate_ode(
         t_points=t_points,
         initial_concentrations=init_concs,
         default_concentration=default_concentration,
+        steady_state_rtol=steady_state_rtol or None,
+        output_sampling=output_sampling,
+        ode_method=ode_method,
     )
-    sim = MetabolicSimulator(store)
+    sim = metakg.simulator
     result = sim.run_ode(config)
 
     # Enrich concentrations with compound names and summary stats
     summary: list[dict] = []
-    for cpd_id, concs in result.concentrations.items():
+    has_points = result.y.shape[1] > 0
+    initial = result.y[:, 0].tolist() if has_points else []
+    final = result.y[:, -1].tolist() if has_points else []
+    for i, cpd_id in enumerate(result.compound_ids):
         node = store.node(cpd_id)
         name = node["name"] if node else cpd_id
         summary.append(
             {
                 "id": cpd_id,
                 "name": name,
-                "initial_mM": concs[0] if concs else None,
-                "final_mM": concs[-1] if concs else None,
+                "initial_mM": initial[i] if has_points else None,
+                "final_mM": final[i] if has_points else None,
             }
         )
     summary.sort(key=lambda x: x["final_mM"] or 0.0, reverse=True)
@@ -226,7 +268,10 @@ def _mcp_simulate_ode(
             "status": result.status,
             "message": result.message,
             "t": result.t,
-            "concentrations": result.concentrations,
+            "t_steady": result.t_steady,
+            "method": result.method,
+            "timings": result.timings,
+            "concentrations": dict(result.concentrations),
             "summary": summary,
         },
         indent=2,
@@ -234,6 +279,126 @@ def _mcp_simulate_ode(
     )
 
 
+def _mcp_simulate_steady_state(
+    metakg: MetaKG,
+    pathway_id: str,
+    initial_concentrations_json: str = "{}",
+    default_concentration: float = 1.0,
+    tol: float = 1e-8,
+) -> str:
+    """
+    Find where compound concentrations settle, without integrating a time-course.
+
+    Solves ``dy/dt = 0`` for the Michaelis-Menten kinetic system directly
+    (damped Newton continuation), falling back to integration that stops as
+    soon as the system has settled.  Prefer this over ``simulate_ode`` with a
+    large ``t_end`` when only the end state matters.  Conserved pool totals
+    (e.g. ATP + ADP) are taken from the initial concentrations.
+
+    :param pathway_id: Pathway node ID or name.
+    :param initial_concentrations_json: JSON object mapping compound IDs to
+        starting concentrations in mM.
+    :param default_concentration: Fallback starting concentration in mM (default 1.0).
+    :param tol: Convergence threshold on ``max|dy/dt|`` (default ``1e-8``).
+    :return: JSON with ``status``, ``method``, ``residual``, ``message``, and
+        ``concentrations``/``fluxes`` lists enriched with names.
+    """
+    from metakg.simulate import SimulationConfig
+
+    try:
+        init_concs: dict[str, float] = json.loads(initial_concentrations_json)
+    except (json.JSONDecodeError, TypeError):
+        init_concs = {}
+
+    store = metakg.store
+    pwy_id = store.resolve_id(pathway_id) if pathway_id else None
+    config = SimulationConfig(
+        pathway_id=pwy_id,
+        initial_concentrations=init_concs,
+        default_concentration=default_concentration,
+    )
+    result = metakg.simulator.run_steady_state(config, tol=tol)
+
+    concentrations = sorted(
+        [
+            {"id": cpd_id, "name": (store.node(cpd_id) or {}).get("name", cpd_id), "mM": conc}
+            for cpd_id, conc in result.concentrations.items()
+        ],
+        key=lambda x: x["mM"],
+        reverse=True,
+    )
+    fluxes = sorted(
+        [
+            {"id": rxn_id, "name": (store.node(rxn_id) or {}).get("name", rxn_id), "rate": rate}
+            for rxn_id, rate in result.fluxes.items()
+        ],
+        key=lambda x: abs(x["rate"]),
+        reverse=True,
+    )
+
+    return json.dumps(
+        {
+            "status": result.status,
+            "method": result.method,
+            "residual": result.residual,
+            "iterations": result.iterations,
+            "message": result.message,
+            "concentrations": concentrations,
+            "fluxes": fluxes,
+        },
+        indent=2,
+        default=str,
+    )
+
+
+def _mcp_simulate_mca(
+    metakg: MetaKG,
+    pathway_id: str,
+    initial_concentrations_json: str = "{}",
+    fixed_compounds: str = "",
+    method: str = "auto",
+    workers: int = 1,
+) -> str:
+    """
+    Metabolic control analysis: which enzymes control each steady-state flux.
+
+    Returns the full matrices of scaled flux and concentration control
+    coefficients (``∂ln J / ∂ln e``) for every reaction and enzyme in the
+    pathway, plus the elasticities ``∂ln v / ∂ln [S]``, from a single
+    steady-state solve.  Flux control coefficients of a flux sum to 1 over
+    all enzymes.  A closed pathway settles at equilibrium with zero flux, so
+    name the source and sink metabolites in ``fixed_compounds``; they are held
+    at their initial concentration.
+
+    :param pathway_id: Pathway node ID or name.
+    :param initial_concentrations_json: JSON object mapping compound IDs to
+        starting concentrations in mM (levels of fixed compounds, pool totals).
+    :param fixed_compounds: Comma-separated compound IDs held constant.
+    :param method: ``"auto"`` (analytic, finite differences if the Jacobian is
+        singular), ``"analytic"`` or ``"finite_difference"``.
+    :param workers: Worker processes for finite differences (default 1).
+    :return: JSON with ``status``, ``method``, ``summation_error``, ``fluxes``,
+        ``enzyme_flux_control``, ``flux_control``, ``concentration_control``,
+        ``enzyme_concentration_control`` and ``elasticities`` (nested
+        ``{row_id: {column_id: value}}``, zeros omitted, undefined as null).
+    """
+    try:
+        init_concs: dict[str, float] = json.loads(initial_concentrations_json)
+    except (json.JSONDecodeError, TypeError):
+        init_concs = {}
+    try:
+        result = metakg.simulate_mca(
+            pathway_id or None,
+            initial_concentrations=init_concs,
+            fixed_compounds=[c.strip() for c in fixed_compounds.split(",") if c.strip()],
+            method=method,
+            workers=workers,
+        )
+    except ValueError as exc:
+        return json.dumps({"error": str(exc)})
+    return json.dumps(result, indent=2, default=str)
+
+
 def _mcp_simulate_whatif(
     metakg: MetaKG,
     pathway_id: str,
@@ -265,11 +430,7 @@ def _mcp_simulate_whatif(
     :return: JSON with baseline result, perturbed result, delta_fluxes (FBA)
         or delta_final_conc (ODE), and a ranked change summary.
     """
-    from metakg.simulate import (
-        MetabolicSimulator,
-        SimulationConfig,
-        WhatIfScenario,
-    )
+    from metakg.simulate import SimulationConfig, WhatIfScenario
 
     try:
         scenario_dict: dict = json.loads(scenario_json)
@@ -278,7 +439,7 @@ def _mcp_simulate_whatif(
 
     store = metakg.store
     pwy_id = store.resolve_id(pathway_id) if pathway_id else None
-    config = SimulationConfig(pathway_id=pwy_id)
+    config = SimulationConfig(pathway_id=pwy_id, steady_state_rtol=1e-6)
 
     # Resolve enzyme IDs in scenario
     knockouts = [store.resolve_id(e) or e for e in scenario_dict.get("enzyme_knockouts", [])]
@@ -297,7 +458,7 @@ def _mcp_simulate_whatif(
         },
     )
 
-    sim = MetabolicSimulator(store)
+    sim = metakg.simulator
     result = sim.run_whatif(config, scenario, mode=mode)
 
     # Build top-changes summary
@@ -318,17 +479,15 @@ def _mcp_simulate_whatif(
             reverse=True,
         )
     else:
+        b_final = result.baseline.final_concentrations()  # type: ignore[union-attr]
+        p_final = result.perturbed.final_concentrations()  # type: ignore[union-attr]
         changes = sorted(
             [
                 {
                     "id": cpd_id,
                     "name": (store.node(cpd_id) or {}).get("name", cpd_id),
-                    "baseline_final_mM": (
-                        (result.baseline.concentrations or {}).get(cpd_id, [0.0])[-1]  # type: ignore[union-attr]
-                    ),
-                    "perturbed_final_mM": (
-                        (result.perturbed.concentrations or {}).get(cpd_id, [0.0])[-1]  # type: ignore[union-attr]
-                    ),
+                    "baseline_final_mM": b_final.get(cpd_id, 0.0),
+                    "perturbed_final_mM": p_final.get(cpd_id, 0.0),
                     "delta_mM": delta,
                 }
                 for cpd_id, delta in result.delta_final_conc.items()
@@ -356,6 +515,46 @@ def _mcp_simulate_whatif(
     )
 
 
+def _mcp_simulate_whatif_batch(
+    metakg: MetaKG,
+    pathway_id: str,
+    scenarios_jsonl: str,
+    mode: str = "fba",
+    workers: int = 1,
+) -> str:
+    """
+    Screen many what-if scenarios against one shared baseline.
+
+    ``scenarios_jsonl`` holds one scenario object per line, each in the form
+    accepted by ``simulate_whatif``::
+
+        {"name": "hk_ko", "enzyme_knockouts": ["enz:kegg:hsa:2538"]}
+        {"name": "hk_half", "enzyme_factors": {"enz:kegg:hsa:2538": 0.5}}
+
+    The baseline and the stoichiometric model are built once for the whole
+    screen.  Scenarios that fail are reported with ``status: "error"``.
+
+    :param pathway_id: Pathway node ID or name.
+    :param scenarios_jsonl: Newline-separated JSON scenario objects.
+    :param mode: ``"fba"`` (default) or ``"ode"``.
+    :param workers: Worker processes (default 1 = in-process).
+    :return: JSON with ``n_scenarios``, ``n_errors`` and one record per
+        scenario (status, objective or ``t_steady``, non-zero deltas).
+    """
+    try:
+        summary = metakg.simulate_whatif_batch(
+            scenarios_jsonl.splitlines(),
+            pathway_id or None,
+            mode=mode,
+            workers=workers,
+            steady_state_rtol=1e-6,
+        )
+    except ValueError as exc:
+        return json.dumps({"error": str(exc)})
+    summary.pop("output", None)
+    return json.dumps(summary, indent=2, default=str)
+
+
 def _mcp_get_kinetic_params(metakg: MetaKG, reaction_id: str) -> str:
     """
     Retrieve stored kinetic parameters for a reaction.
@@ -467,6 +666,12 @@ def register_tools(mcp, metakg: MetaKG) -> None:
     find_path.__doc__ = _mcp_find_path.__doc__
     mcp.tool()(find_path)
 
+    def similar_pathways(pathway_id: str, k: int = 10) -> str:
+        return _mcp_similar_pathways(metakg, pathway_id, k)
+
+    similar_pathways.__doc__ = _mcp_similar_pathways.__doc__
+    mcp.tool()(similar_pathways)
+
     def simulate_fba(
         pathway_id: str,
         objective_reaction: str = "",
@@ -483,14 +688,52 @@ def register_tools(mcp, metakg: MetaKG) -> None:
         t_points: int = 200,
         initial_concentrations_json: str = "{}",
         default_concentration: float = 1.0,
+        steady_state_rtol: float = 1e-6,
+        output_sampling: str = "adaptive",
+        ode_method: str = "auto",
     ) -> str:
         return _mcp_simulate_ode(
-            metakg, pathway_id, t_end, t_points, initial_concentrations_json, default_concentration
+            metakg,
+            pathway_id,
+            t_end,
+            t_points,
+            initial_concentrations_json,
+            default_concentration,
+            steady_state_rtol,
+            output_sampling,
+            ode_method,
         )
 
     simulate_ode.__doc__ = _mcp_simulate_ode.__doc__
     mcp.tool()(simulate_ode)
 
+    def simulate_steady_state(
+        pathway_id: str,
+        initial_concentrations_json: str = "{}",
+        default_concentration: float = 1.0,
+        tol: float = 1e-8,
+    ) -> str:
+        return _mcp_simulate_steady_state(
+            metakg, pathway_id, initial_concentrations_json, default_concentration, tol
+        )
+
+    simulate_steady_state.__doc__ = _mcp_simulate_steady_state.__doc__
+    mcp.tool()(simulate_steady_state)
+
+    def simulate_mca(
+        pathway_id: str,
+        initial_concentrations_json: str = "{}",
+        fixed_compounds: str = "",
+        method: str = "auto",
+        workers: int = 1,
+    ) -> str:
+        return _mcp_simulate_mca(
+            metakg, pathway_id, initial_concentrations_json, fixed_compounds, method, workers
+        )
+
+    simulate_mca.__doc__ = _mcp_simulate_mca.__doc__
+    mcp.tool()(simulate_mca)
+
     def simulate_whatif(
         pathway_id: str,
         scenario_json: str,
@@ -501,6 +744,17 @@ def register_tools(mcp, metakg: MetaKG) -> None:
     simulate_whatif.__doc__ = _mcp_simulate_whatif.__doc__
     mcp.tool()(simulate_whatif)
 
+    def simulate_whatif_batch(
+        pathway_id: str,
+        scenarios_jsonl: str,
+        mode: str = "fba",
+        workers: int = 1,
+    ) -> str:
+        return _mcp_simulate_whatif_batch(metakg, pathway_id, scenarios_jsonl, mode, workers)
+
+    simulate_whatif_batch.__doc__ = _mcp_simulate_whatif_batch.__doc__
+    mcp.tool()(simulate_whatif_batch)
+
     def get_kinetic_params(reaction_id: str) -> str:
         return _mcp_get_kinetic_params(metakg, reaction_id)
 
@@ -529,11 +783,15 @@ def create_server(metakg: MetaKG, *, name: str = "metakg"):
         instructions=(
             "MetaKG gives you semantic access to a metabolic pathway knowledge graph. "
             "Use query_pathway to find pathways, get_compound/get_reaction for entity "
-            "detail, and find_path to trace biochemical routes between compounds. "
+            "detail, find_path to trace biochemical routes between compounds, and "
+            "similar_pathways to find pathways sharing many compounds and reactions. "
             "For simulation: call seed_kinetics once to populate kinetic parameters, "
             "then use simulate_fba for steady-state flux analysis, simulate_ode for "
-            "kinetic time-course simulation, and simulate_whatif for perturbation "
-            "analysis (enzyme knockouts, activity changes, substrate overrides). "
+            "kinetic time-course simulation, simulate_steady_state when only the settled "
+            "concentrations matter, simulate_mca for which enzymes control fluxes and "
+            "concentrations, and simulate_whatif for perturbation "
+            "analysis (enzyme knockouts, activity changes, substrate overrides); "
+            "use simulate_whatif_batch to screen many scenarios at once. "
             "Use get_kinetic_params to inspect stored Km/Vmax/kcat values."
         ),
     )
@@ -0,0 +1,438 @@
+"""
+mcs.py — Minimal cut sets: smallest knockouts that block a target reaction.
+
+A cut set is a set of enzymes (or reactions) whose removal makes forward flux
+through the target impossible at steady state.  Instead of trying knockout
+combinations, cut sets are read off the *dual network* (Farkas' lemma): a
+set ``K`` blocks the target iff there are multipliers ``u`` (one per
+compound) and ``w ≥ 1`` with ``x = Sᵀu − w·e_target`` such that, outside
+``K``, ``x_i = 0`` for reversible and ``x_i ≥ 0`` for irreversible
+reactions.  A mixed-integer programme over ``u``, ``w`` and one binary per
+knockout candidate, solved with SciPy's HiGHS :func:`~scipy.optimize.milp`,
+finds the smallest such ``K``:
+
+  **Increasing cardinality** — each solve returns a minimum-size cut set;
+    an exclusion constraint then forbids it and all its supersets, so the
+    next solve returns the next smallest.  Minimum-size solutions are
+    minimal by construction.
+
+  **Enzyme knockouts** — a reaction counts as knocked out only when every
+    enzyme that CATALYZES it is (isozymes are alternatives); reactions
+    without enzymes cannot be cut.
+
+  **Parallel search** — with ``workers > 1`` the space is split by the
+    first candidate in each set (subproblem *i* forces candidate *i* in and
+    candidates ``< i`` out) and subproblems run in a process pool; sets that
+    contain a set found by another subproblem are dropped afterwards.
+
+  **Budgets** — a cardinality limit, a cap on the number of sets and a
+    wall-clock limit shared by all solves.
+
+Only reversibility constrains the network, as usual for cut sets: finite
+flux bounds other than ``(0, 0)`` (which removes a reaction) are ignored.
+
+Usage::
+
+    from metakg.mcs import minimal_cut_sets
+
+    config = SimulationConfig(pathway_id="pwy:kegg:hsa00010")
+    result = minimal_cut_sets(sim, config, "rxn:kegg:R00200", max_cardinality=3)
+    result.cut_sets      # [("enz:..",), ("enz:..", "enz:.."), ...]
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+from scipy.optimize import Bounds, LinearConstraint, milp
+from scipy.sparse import coo_matrix, csr_matrix, vstack
+
+from metakg.parallel import pool_context
+from metakg.simulate import MetabolicSimulator, SimulationConfig, _display_name
+
+#: Bound on the dual multipliers (big-M).  Sets needing larger ones are missed.
+BIG_M: float = 1e3
+
+# ---------------------------------------------------------------------------
+# Result type
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class MCSResult:
+    """
+    Minimal cut sets for one target reaction.
+
+    :param status: ``"complete"`` (all sets up to *max_cardinality* found),
+        ``"max_sets"`` or ``"time_limit"`` (budget hit; list may be partial),
+        or ``"error"``.
+    :param target: Target reaction ID.
+    :param by: ``"enzyme"`` or ``"reaction"`` — what the sets contain.
+    :param cut_sets: Cut sets as sorted ID tuples, smallest first.
+    :param max_cardinality: Cardinality limit of the search.
+    :param n_candidates: Knockout candidates considered.
+    :param n_milp: MILP solves performed.
+    :param elapsed: Wall-clock seconds.
+    :param message: Human-readable summary.
+    """
+
+    status: str
+    target: str
+    by: str
+    cut_sets: list[tuple[str, ...]] = field(default_factory=list)
+    max_cardinality: int = 0
+    n_candidates: int = 0
+    n_milp: int = 0
+    elapsed: float = 0.0
+    message: str = ""
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialise to a plain dict."""
+        return {
+            "status": self.status,
+            "target": self.target,
+            "by": self.by,
+            "cut_sets": [list(c) for c in self.cut_sets],
+            "max_cardinality": self.max_cardinality,
+            "n_candidates": self.n_candidates,
+            "n_milp": self.n_milp,
+            "elapsed_s": round(self.elapsed, 6),
+            "message": self.message,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Dual-network MILP
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class DualMILP:
+    """
+    The cut-set MILP for one target, reusable across solves.
+
+    Variables are ``[u (n_cpd), w, y (n_rxn), z (n_cand)]``: ``y_i`` is the
+    (relaxed) knockout indicator of reaction *i* and ``z`` the binary
+    knockout choice per candidate.  The objective is ``Σ z``.
+
+    :param A: Core constraint matrix (all rows ``≤ 0``).
+    :param lo: Variable lower bounds.
+    :param hi: Variable upper bounds.
+    :param z0: Index of the first ``z`` variable.
+    :param n_cand: Number of candidates.
+    """
+
+    A: csr_matrix
+    lo: np.ndarray
+    hi: np.ndarray
+    z0: int
+    n_cand: int
+
+    @classmethod
+    def build(
+        cls,
+        S: np.ndarray,
+        reversible: np.ndarray,
+        target: int,
+        knocks: list[list[int]],
+        *,
+        big_m: float = BIG_M,
+    ) -> DualMILP:
+        """
+        Assemble the MILP.
+
+        :param S: Stoichiometric matrix ``(n_cpd, n_rxn)``.
+        :param reversible: Reversibility per reaction.
+        :param target: Column of the target reaction.
+        :param knocks: ``knocks[i]`` lists the candidates that must *all* be
+            knocked out to remove reaction *i* (empty: not removable).
+        :param big_m: Bound on dual multipliers.
+        :return: :class:`DualMILP`.
+        """
+        n_cpd, n_rxn = S.shape
+        n_cand = 1 + max((c for cs in knocks for c in cs), default=-1)
+        w0, y0 = n_cpd, n_cpd + 1
+        z0 = y0 + n_rxn
+        n_var = z0 + n_cand
+
+        # x = Sᵀu − w·e_target, one row per reaction
+        X = coo_matrix(S.T)
+        x_rows, x_cols, x_vals = list(X.row), list(X.col), list(X.data)
+        x_rows.append(target)
+        x_cols.append(w0)
+        x_vals.append(-1.0)
+        Xm = csr_matrix((x_vals, (x_rows, x_cols)), shape=(n_rxn, n_var))
+        My = csr_matrix(
+            (np.full(n_rxn, -big_m), (np.arange(n_rxn), y0 + np.arange(n_rxn))),
+            shape=(n_rxn, n_var),
+        )
+        rev = np.flatnonzero(reversible)
+        blocks = [-Xm + My, (Xm + My)[rev]]  # x ≥ −M·y for all;  x ≤ M·y for reversible
+
+        # y_i ≤ z_c for every candidate c that reaction i needs knocked out
+        link_r, link_c, link_v, n_link = [], [], [], 0
+        for i, cands in enumerate(knocks):
+            for c in cands:
+                link_r += [n_link, n_link]
+                link_c += [y0 + i, z0 + c]
+                link_v += [1.0, -1.0]
+                n_link += 1
+        if n_link:
+            blocks.append(csr_matrix((link_v, (link_r, link_c)), shape=(n_link, n_var)))
+
+        lo = np.concatenate([np.full(n_cpd, -big_m), [1.0], np.zeros(n_rxn + n_cand)])
+        hi = np.concatenate([np.full(n_cpd, big_m), [big_m], np.ones(n_rxn + n_cand)])
+        removable = np.array([bool(k) for k in knocks])
+        hi[y0 : y0 + n_rxn][~removable] = 0.0
+        return cls(csr_matrix(vstack(blocks)), lo, hi, z0, n_cand)
+
+    def enumerate(
+        self,
+        *,
+        max_cardinality: int,
+        max_sets: int,
+        deadline: float,
+        force_in: int | None = None,
+    ) -> tuple[list[tuple[int, ...]], int, str]:
+        """
+        Enumerate cut sets by increasing cardinality.
+
+        :param max_cardinality: Largest set size.
+        :param max_sets: Stop after this many sets.
+        :param deadline: ``time.monotonic()`` value at which to stop.
+        :param force_in: Restrict to sets whose smallest candidate is this one.
+        :return: ``(sets, n_solves, status)`` with candidate-index tuples.
+        """
+        n_var = self.A.shape[1]
+        c = np.zeros(n_var)
+        c[self.z0 :] = 1.0
+        integrality = np.zeros(n_var)
+        integrality[self.z0 :] = 1
+        lo, hi = self.lo.copy(), self.hi.copy()
+        if force_in is not None:
+            lo[self.z0 + force_in] = 1.0
+            hi[self.z0 : self.z0 + force_in] = 0.0
+
+        card = np.zeros(n_var)
+        card[self.z0 :] = 1.0
+        rows = [self.A, csr_matrix(card)]
+        upper = [np.zeros(self.A.shape[0]), [float(max_cardinality)]]
+        found: list[tuple[int, ...]] = []
+        n_solves = 0
+        while len(found) < max_sets:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return found, n_solves, "time_limit"
+            res = milp(
+                c,
+                constraints=LinearConstraint(vstack(rows), -np.inf, np.concatenate(upper)),
+                integrality=integrality,
+                bounds=Bounds(lo, hi),
+                options={"time_limit": remaining, "disp": False},
+            )
+            n_solves += 1
+            if res.status == 2:
+                return found, n_solves, "complete"
+            if res.status == 1:
+                return found, n_solves, "time_limit"
+            if res.status != 0 or res.x is None:
+                return found, n_solves, "error"
+            cut = tuple(int(i) for i in np.flatnonzero(res.x[self.z0 :] > 0.5))
+            found.append(cut)
+            # Forbid this set and every superset of it
+            row = np.zeros(n_var)
+            row[[self.z0 + i for i in cut]] = 1.0
+            rows.append(csr_matrix(row))
+            upper.append([len(cut) - 1.0])
+        return found, n_solves, "max_sets"
+
+
+def _minimal(sets: list[tuple[int, ...]]) -> list[tuple[int, ...]]:
+    """Drop duplicates and any set containing another; smallest first."""
+    kept: list[tuple[int, ...]] = []
+    for s in sorted(set(sets), key=lambda c: (len(c), c)):
+        if not any(set(k) <= set(s) for k in kept):
+            kept.append(s)
+    return kept
+
+
+# ---------------------------------------------------------------------------
+# Worker processes
+# ---------------------------------------------------------------------------
+
+_WORKER: dict[str, Any] = {}
+
+
+def _init_worker(problem: DualMILP) -> None:
+    """Keep the assembled MILP in the worker process."""
+    _WORKER["problem"] = problem
+
+
+def _enumerate_in_worker(
+    first: int, max_cardinality: int, max_sets: int, deadline: float
+) -> tuple[list[tuple[int, ...]], int, str]:
+    # deadline is an absolute time.monotonic() value: the clock is system-wide,
+    # so jobs that wait in the queue do not get a fresh budget when they start
+    return _WORKER["problem"].enumerate(
+        max_cardinality=max_cardinality, max_sets=max_sets, deadline=deadline, force_in=first
+    )
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+
+def minimal_cut_sets(
+    simulator: MetabolicSimulator,
+    config: SimulationConfig,
+    target: str,
+    *,
+    by: str = "enzyme",
+    max_cardinality: int = 3,
+    max_sets: int = 100,
+    time_limit: float = 60.0,
+    workers: int = 1,
+) -> MCSResult:
+    """
+    Enumerate minimal cut sets that block forward flux through *target*.
+
+    :param simulator: Simulator providing the stoichiometry and enzyme index.
+    :param config: Scope; reactions with ``flux_bounds`` of ``(0, 0)`` are removed.
+    :param target: Reaction to block.
+    :param by: ``"enzyme"`` (default) — sets of enzymes, following CATALYZES
+        edges — or ``"reaction"`` — sets of reactions other than *target*.
+    :param max_cardinality: Largest set size to search.
+    :param max_sets: Stop after this many sets.
+    :param time_limit: Wall-clock budget in seconds for all solves.
+    :param workers: Worker processes for the split search.
+    :return: :class:`MCSResult`.
+    :raises ValueError: If *by* is unknown or *target* is not in scope.
+    """
+    if by not in ("enzyme", "reaction"):
+        raise ValueError(f"by must be 'enzyme' or 'reaction', got {by!r}")
+    t0 = time.monotonic()
+    target = simulator._store.resolve_id(target) or target
+    rxn_ids, _cpd_ids, S, rev_flags = simulator._build_stoich_matrix(config)
+    keep = [j for j, r in enumerate(rxn_ids) if tuple(config.flux_bounds.get(r, ())) != (0, 0)]
+    rxn_ids = [rxn_ids[j] for j in keep]
+    if target not in rxn_ids:
+        raise ValueError(f"target reaction not in scope: {target}")
+    S = np.asarray(S, dtype=float)[:, keep]
+
+    candidates, knocks = _candidates(simulator, rxn_ids, target, by)
+    if not candidates:
+        return MCSResult(
+            "complete", target, by, max_cardinality=max_cardinality, message="No candidates."
+        )
+    problem = DualMILP.build(
+        S,
+        np.array([rev_flags.get(r, True) for r in rxn_ids]),
+        rxn_ids.index(target),
+        knocks,
+    )
+    deadline = t0 + time_limit
+
+    n_milp = 0
+    if workers <= 1:
+        sets, n_milp, status = problem.enumerate(
+            max_cardinality=max_cardinality, max_sets=max_sets, deadline=deadline
+        )
+    else:
+        sets, statuses = [], []
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=pool_context(),
+            initializer=_init_worker,
+            initargs=(problem,),
+        ) as pool:
+            futures = [
+                pool.submit(_enumerate_in_worker, i, max_cardinality, max_sets, deadline)
+                for i in range(len(candidates))
+            ]
+            for future in futures:
+                if time.monotonic() >= deadline:
+                    future.cancel()  # no-op for jobs already running; they stop at the deadline
+                if future.cancelled():
+                    statuses.append("time_limit")
+                    continue
+                found, n, sub_status = future.result()
+                sets += found
+                n_milp += n
+                statuses.append(sub_status)
+        status = next((s for s in ("error", "time_limit", "max_sets") if s in statuses), "complete")
+    sets = _minimal(sets)
+    if len(sets) > max_sets:
+        sets, status = sets[:max_sets], "max_sets"
+
+    cut_sets = [tuple(sorted(candidates[i] for i in s)) for s in sets]
+    elapsed = time.monotonic() - t0
+    return MCSResult(
+        status=status,
+        target=target,
+        by=by,
+        cut_sets=cut_sets,
+        max_cardinality=max_cardinality,
+        n_candidates=len(candidates),
+        n_milp=n_milp,
+        elapsed=elapsed,
+        message=(
+            f"{len(cut_sets)} minimal cut set(s) of size ≤ {max_cardinality} "
+            f"from {len(candidates)} {by} candidate(s), {n_milp} MILP solve(s): {status}."
+        ),
+    )
+
+
+def _candidates(
+    simulator: MetabolicSimulator, rxn_ids: list[str], target: str, by: str
+) -> tuple[list[str], list[list[int]]]:
+    """Return the knockout candidates and, per reaction, the candidates removing it."""
+    if by == "reaction":
+        candidates = [r for r in rxn_ids if r != target]
+        index = {r: i for i, r in enumerate(candidates)}
+        return candidates, [[index[r]] if r in index else [] for r in rxn_ids]
+
+    by_reaction: dict[str, list[str]] = {}
+    for enz_id, rxns in simulator._enzyme_reaction_index().items():
+        for r in rxns:
+            by_reaction.setdefault(r, []).append(enz_id)
+    candidates = sorted({e for r in rxn_ids for e in by_reaction.get(r, [])})
+    index = {e: i for i, e in enumerate(candidates)}
+    return candidates, [sorted(index[e] for e in by_reaction.get(r, [])) for r in rxn_ids]
+
+
+def render_mcs_result(
+    result: MCSResult, store: Any = None, *, top_n: int = 25, markdown: bool = True
+) -> str:
+    """
+    Format an :class:`MCSResult` as a human-readable report.
+
+    :param result: Cut-set result to render.
+    :param store: Optional MetaStore for resolving names.
+    :param top_n: Number of cut sets to list.
+    :param markdown: Emit Markdown (default) or plain text.
+    :return: Formatted string.
+    """
+    h2 = "## " if markdown else ""
+    bold = ("**", "**") if markdown else ("", "")
+
+    lines = [
+        f"{h2}Minimal Cut Sets for {_display_name(store, result.target)}",
+        f"{bold[0]}Status:{bold[1]} {result.status}",
+        f"{bold[0]}Message:{bold[1]} {result.message}",
+        "",
+    ]
+    if markdown and result.cut_sets:
+        lines.append("| # | Size | Knockouts |")
+        lines.append("|---:|---:|---|")
+    for n, cut in enumerate(result.cut_sets[:top_n], start=1):
+        names = ", ".join(
+            f"{_display_name(store, c)} (`{c}`)" if markdown else _display_name(store, c)
+            for c in cut
+        )
+        lines.append(f"| {n} | {len(cut)} | {names} |" if markdown else f"  {n:>3}. {names}")
+    return "\n".join(lines)
@@ -12,6 +12,8 @@ Last Revision: 2026-02-28 20:44:14
 from __future__ import annotations
 
 import json
+import time
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, cast
@@ -21,6 +23,7 @@ from metakg.enrich import enrich as _enrich
 from metakg.graph import MetabolicGraph
 from metakg.index import MetaIndex
 from metakg.kinetics_fetch import seed_kinetics as _seed_kinetics
+from metakg.similarity import PathwayLSH
 from metakg.simulate import (
     FBAResult,
     MetabolicSimulator,
@@ -203,6 +206,7 @@ class MetaKG:
         *,
         model: str | None = None,
         table: str = "metakg_nodes",
+        persist_sim_cache: bool = False,
     ) -> None:
         """
         Initialise MetaKG and resolve paths.
@@ -211,6 +215,9 @@ class MetaKG:
         :param lancedb_dir: LanceDB directory.  Defaults to ``.metakg/lancedb``.
         :param model: Sentence-transformer model name.
         :param table: LanceDB table name.
+        :param persist_sim_cache: Keep simulation results in a
+            ``<db>.simcache.sqlite`` file beside the database as well as in
+            memory, so they survive restarts.
         """
         from metakg.embed import DEFAULT_MODEL
 
@@ -219,10 +226,12 @@ class MetaKG:
         self.lancedb_dir = Path(lancedb_dir) if lancedb_dir else base / "lancedb"
         self.model_name = model or DEFAULT_MODEL
         self.table_name = table
+        self.persist_sim_cache = persist_sim_cache
 
         self._store: MetaStore | None = None
         self._index: MetaIndex | None = None
         self._simulator: MetabolicSimulator | None = None
+        self._lsh: PathwayLSH | None = None
 
     # ------------------------------------------------------------------
     # Layer accessors (lazy)
@@ -251,9 +260,16 @@ class MetaKG:
 
     @property
     def simulator(self) -> MetabolicSimulator:
-        """Metabolic simulation engine (lazy)."""
+        """Metabolic simulation engine (lazy), with an in-memory result cache."""
         if self._simulator is None:
-            self._simulator = MetabolicSimulator(self.store)
+            from metakg.simcache import SimulationCache
+
+            cache = (
+                SimulationCache.for_store(self.store)
+                if self.persist_sim_cache
+                else SimulationCache()
+            )
+            self._simulator = MetabolicSimulator(self.store, cache=cache)
         return self._simulator
 
     # ------------------------------------------------------------------
@@ -358,11 +374,7 @@ class MetaKG:
         for h in hits:
             node = self.store.node(h.id)
             if node and node["kind"] == "pathway":
-                cur = self.store._conn.execute(  # pylint: disable=protected-access
-                    "SELECT COUNT(*) FROM meta_edges WHERE src=? AND rel='CONTAINS'",
-                    (h.id,),
-                )
-                member_count = cur.fetchone()[0]
+                _, member_count = self.store.degrees(h.id).get("CONTAINS", (0, 0))
                 results.append({**node, "_distance": h.distance, "member_count": member_count})
         return MetabolicQueryResult(query=name, hits=results)
 
@@ -486,8 +498,8 @@ class MetaKG:
         return {
             "status": result.status,
             "objective_value": result.objective_value,
-            "fluxes": result.fluxes,
-            "shadow_prices": result.shadow_prices,
+            "fluxes": dict(result.fluxes),
+            "shadow_prices": dict(result.shadow_prices),
             "message": result.message,
         }
 
@@ -507,6 +519,9 @@ class MetaKG:
         ode_rtol: float = 1e-3,
         ode_atol: float = 1e-5,
         ode_max_step: float | None = None,
+        steady_state_rtol: float | None = None,
+        steady_state_window: float | None = None,
+        output_sampling: str = "uniform",
     ) -> dict:
         """
         Run kinetic ODE simulation using Michaelis-Menten rate equations.
@@ -522,12 +537,20 @@ class MetaKG:
         :param vmax_factors: Multiply stored (or default) Vmax by a factor.
         :param ode_method: ODE solver method (default ``"BDF"``). Use ``"RK45"`` for
             non-stiff systems (NOT recommended for metabolic pathways, which are stiff);
-            ``"Radau"`` as alternative for stiff systems.
+            ``"Radau"`` as alternative for stiff systems; ``"auto"`` to choose from the
+            Jacobian's stiffness and switch solvers if the step size collapses.
         :param ode_rtol: ODE relative tolerance (default ``1e-3``; relaxed for stiff systems).
         :param ode_atol: ODE absolute tolerance in mM (default ``1e-5``; relaxed for convergence).
         :param ode_max_step: Maximum internal step size for ODE solver. ``None`` (default)
             lets the solver choose adaptively (recommended for stiff systems).
-        :return: Dict with ``status``, ``t``, ``concentrations``, and ``message``.
+        :param steady_state_rtol: Stop early once ``max|dy/dt| / max|y|`` stays below this
+            threshold for *steady_state_window* time units (default ``None``: run to *t_end*).
+        :param steady_state_window: Confirmation window for the steady-state event
+            (default ``None`` → 5 % of *t_end*).
+        :param output_sampling: ``"uniform"`` (default) or ``"adaptive"`` (samples
+            placed by trajectory arc length).
+        :return: Dict with ``status``, ``t``, ``concentrations``, ``message``,
+            ``t_steady``, ``method``, ``stiffness_ratio`` and ``timings``.
         """
         # Parse JSON if provided
         if initial_concentrations_json:
@@ -546,15 +569,116 @@ class MetaKG:
             ode_rtol=ode_rtol,
             ode_atol=ode_atol,
             ode_max_step=ode_max_step,
+            steady_state_rtol=steady_state_rtol,
+            steady_state_window=steady_state_window,
+            output_sampling=output_sampling,
         )
         result = self.simulator.run_ode(config)
         return {
             "status": result.status,
             "t": result.t,
-            "concentrations": result.concentrations,
+            "concentrations": dict(result.concentrations),
             "message": result.message,
+            "t_steady": result.t_steady,
+            "method": result.method,
+            "stiffness_ratio": result.stiffness_ratio,
+            "timings": result.timings,
         }
 
+    def simulate_steady_state(
+        self,
+        pathway_id: str | None = None,
+        reaction_ids: list[str] | None = None,
+        *,
+        initial_concentrations: dict[str, float] | None = None,
+        default_concentration: float = 1.0,
+        vmax_overrides: dict[str, float] | None = None,
+        vmax_factors: dict[str, float] | None = None,
+        tol: float = 1e-8,
+        max_iter: int = 100,
+        ode_method: str = "BDF",
+    ) -> dict:
+        """
+        Solve directly for the kinetic steady state instead of integrating a time-course.
+
+        :param pathway_id: Pathway node ID to scope reactions.
+        :param reaction_ids: Explicit list of reaction node IDs to include.
+        :param initial_concentrations: Map of ``{compound_id: mM}`` used as the starting
+            point (conserved pool totals are taken from it).
+        :param default_concentration: Default initial concentration (mM) (default 1.0).
+        :param vmax_overrides: Override Vmax for specific reactions.
+        :param vmax_factors: Multiply stored (or default) Vmax by a factor.
+        :param tol: Convergence threshold on ``max|dy/dt|`` (default ``1e-8``).
+        :param max_iter: Maximum Newton iterations before the integration fallback.
+        :param ode_method: Solver used by the integration fallback (default ``"BDF"``).
+        :return: Dict with ``status``, ``concentrations``, ``fluxes``, ``residual``,
+            ``method``, ``iterations``, and ``message``.
+        """
+        config = SimulationConfig(
+            pathway_id=pathway_id,
+            reaction_ids=reaction_ids,
+            initial_concentrations=initial_concentrations or {},
+            default_concentration=default_concentration,
+            vmax_overrides=vmax_overrides or {},
+            vmax_factors=vmax_factors or {},
+            ode_method=ode_method,
+        )
+        result = self.simulator.run_steady_state(config, tol=tol, max_iter=max_iter)
+        return {
+            "status": result.status,
+            "concentrations": dict(result.concentrations),
+            "fluxes": dict(result.fluxes),
+            "residual": result.residual,
+            "method": result.method,
+            "iterations": result.iterations,
+            "message": result.message,
+        }
+
+    def simulate_mca(
+        self,
+        pathway_id: str | None = None,
+        reaction_ids: list[str] | None = None,
+        *,
+        initial_concentrations: dict[str, float] | None = None,
+        default_concentration: float = 1.0,
+        fixed_compounds: list[str] | None = None,
+        vmax_overrides: dict[str, float] | None = None,
+        vmax_factors: dict[str, float] | None = None,
+        method: str = "auto",
+        workers: int = 1,
+    ) -> dict:
+        """
+        Metabolic control analysis: elasticities and control coefficients at steady state.
+
+        See :mod:`metakg.mca`.
+
+        :param pathway_id: Pathway node ID to scope reactions.
+        :param reaction_ids: Explicit list of reaction node IDs to include.
+        :param initial_concentrations: Map of ``{compound_id: mM}``; sets the levels
+            of fixed compounds and the conserved pool totals.
+        :param default_concentration: Default initial concentration (mM) (default 1.0).
+        :param fixed_compounds: Source/sink compound IDs held at their initial level.
+        :param vmax_overrides: Override Vmax for specific reactions.
+        :param vmax_factors: Multiply stored (or default) Vmax by a factor.
+        :param method: ``"auto"`` (default), ``"analytic"`` or ``"finite_difference"``.
+        :param workers: Worker processes for finite differences.
+        :return: Dict from :meth:`~metakg.mca.MCAResult.to_dict`.
+        """
+        from metakg.mca import control_analysis
+
+        resolve = self.store.resolve_id
+        config = SimulationConfig(
+            pathway_id=resolve(pathway_id) if pathway_id else None,
+            reaction_ids=reaction_ids,
+            initial_concentrations=initial_concentrations or {},
+            default_concentration=default_concentration,
+            fixed_compounds=[resolve(c) or c for c in fixed_compounds or []],
+            vmax_overrides=vmax_overrides or {},
+            vmax_factors=vmax_factors or {},
+        )
+        result = control_analysis(self.simulator, config, method=method, workers=workers)
+        return result.to_dict()
+
     def simulate_whatif(
         self,
         scenario_json: str,
@@ -570,6 +694,7 @@ class MetaKG:
         ode_rtol: float = 1e-3,
         ode_atol: float = 1e-5,
         ode_max_step: float | None = None,
+        steady_state_rtol: float | None = None,
     ) -> dict:
         """
         Run baseline and perturbed simulations and return the difference.
@@ -595,6 +720,8 @@ class MetaKG:
         :param ode_atol: ODE absolute tolerance in mM (default ``1e-5``). Only used if ``mode="ode"``.
         :param ode_max_step: Maximum internal step size for ODE solver (default ``None``; let solver choose).
             Only used if ``mode="ode"``.
+        :param steady_state_rtol: Stop each ODE run early once it has settled (see
+            :meth:`simulate_ode`). Only used if ``mode="ode"``.
         :return: Dict with ``baseline``, ``perturbed``, ``delta_fluxes``, ``delta_final_conc``, and ``mode``.
         :raises ValueError: If *mode* is not ``"fba"`` or ``"ode"``.
         """
@@ -620,6 +747,7 @@ class MetaKG:
             ode_rtol=ode_rtol,
             ode_atol=ode_atol,
             ode_max_step=ode_max_step,
+            steady_state_rtol=steady_state_rtol,
         )
 
         result = self.simulator.run_whatif(config, scenario, mode=mode)
@@ -634,15 +762,15 @@ class MetaKG:
             baseline_dict = {
                 "status": baseline_fba.status,
                 "objective_value": baseline_fba.objective_value,
-                "fluxes": baseline_fba.fluxes,
-                "shadow_prices": baseline_fba.shadow_prices,
+                "fluxes": dict(baseline_fba.fluxes),
+                "shadow_prices": dict(baseline_fba.shadow_prices),
                 "message": baseline_fba.message,
             }
             perturbed_dict = {
                 "status": perturbed_fba.status,
                 "objective_value": perturbed_fba.objective_value,
-                "fluxes": perturbed_fba.fluxes,
-                "shadow_prices": perturbed_fba.shadow_prices,
+                "fluxes": dict(perturbed_fba.fluxes),
+                "shadow_prices": dict(perturbed_fba.shadow_prices),
                 "message": perturbed_fba.message,
             }
         else:  # mode == "ode"
@@ -651,14 +779,16 @@ class MetaKG:
             baseline_dict = {
                 "status": baseline_ode.status,
                 "t": baseline_ode.t,
-                "concentrations": baseline_ode.concentrations,
+                "concentrations": dict(baseline_ode.concentrations),
                 "message": baseline_ode.message,
+                "t_steady": baseline_ode.t_steady,
             }
             perturbed_dict = {
                 "status": perturbed_ode.status,
                 "t": perturbed_ode.t,
-                "concentrations": perturbed_ode.concentrations,
+                "concentrations": dict(perturbed_ode.concentrations),
                 "message": perturbed_ode.message,
+                "t_steady": perturbed_ode.t_steady,
             }
 
         return {
@@ -670,6 +800,299 @@ class MetaKG:
             "mode": result.mode,
         }
 
+    def simulate_fba_all_pathways(
+        self,
+        *,
+        objective_reaction: str | None = None,
+        maximize: bool = True,
+        pathway_ids: list[str] | None = None,
+        workers: int = 1,
+        output: str | Path | None = None,
+        progress: Callable[[int, int, dict[str, Any]], None] | None = None,
+    ) -> dict:
+        """
+        Run FBA separately on every pathway, sharing one assembled network.
+
+        See :mod:`metakg.sweep`.
+
+        :param objective_reaction: Reaction to optimise where a pathway contains
+            it; otherwise each pathway maximises its total forward flux.
+        :param maximize: Maximise (default) or minimise the objective.
+        :param pathway_ids: Restrict the sweep to these pathways (default: all).
+        :param workers: Worker processes (default 1 = in-process).
+        :param output: Write the summary table to this ``.parquet`` or ``.csv``
+            file instead of returning the rows.
+        :param progress: Called as ``progress(n_done, n_total, row)``.
+        :return: Dict with ``n_pathways``, ``status_counts``, ``output`` and, when
+            no *output* is given, the list of ``rows``.
+        """
+        from metakg.sweep import sweep_pathways_fba, write_table
+
+        config = SimulationConfig(objective_reaction=objective_reaction, maximize=maximize)
+        status_counts: dict[str, int] = {}
+
+        def _count(n_done: int, n_total: int, row: dict[str, Any]) -> None:
+            status_counts[row["status"]] = status_counts.get(row["status"], 0) + 1
+            if progress is not None:
+                progress(n_done, n_total, row)
+
+        rows = sweep_pathways_fba(
+            self.simulator, config, pathway_ids=pathway_ids, workers=workers, progress=_count
+        )
+        if output is not None:
+            n = write_table(rows, output)
+            return {"n_pathways": n, "status_counts": status_counts, "output": str(output)}
+        collected = list(rows)
+        return {
+            "n_pathways": len(collected),
+            "status_counts": status_counts,
+            "output": None,
+            "rows": collected,
+        }
+
+    def sample_fluxes(
+        self,
+        pathway_id: str | None = None,
+        reaction_ids: list[str] | None = None,
+        *,
+        flux_bounds: dict[str, tuple[float, float]] | None = None,
+        n_samples: int = 1000,
+        chains: int = 4,
+        thinning: int = 100,
+        workers: int = 1,
+        seed: int | None = None,
+        output: str | Path | None = None,
+    ) -> dict:
+        """
+        Sample the feasible flux space with artificial-centering hit-and-run.
+
+        See :mod:`metakg.sampling`.
+
+        :param pathway_id: Pathway node ID to scope reactions.
+        :param reaction_ids: Explicit list of reaction node IDs to include.
+        :param flux_bounds: Override reaction flux bounds ``{reaction_id: (lb, ub)}``.
+        :param n_samples: Samples to draw (rounded up to a multiple of *chains*).
+        :param chains: Independent chains.
+        :param thinning: Hit-and-run steps per kept sample.
+        :param workers: Worker processes.
+        :param seed: Seed for reproducible samples.
+        :param output: ``.npy`` file for the samples (memory-mapped; a ``.json``
+            sidecar records the reaction IDs).
+        :return: Dict with ``n_samples``, ``chains``, ``thinning``, ``output`` and
+            the per-reaction ``summary`` (mean, std, 5/50/95 % quantiles).
+        """
+        from metakg.sampling import sample_fluxes
+
+        config = SimulationConfig(
+            pathway_id=self.store.resolve_id(pathway_id) if pathway_id else None,
+            reaction_ids=reaction_ids,
+            flux_bounds=flux_bounds or {},
+        )
+        samples = sample_fluxes(
+            self.simulator,
+            config,
+            n_samples=n_samples,
+            chains=chains,
+            thinning=thinning,
+            workers=workers,
+            seed=seed,
+            output=output,
+        )
+        return {
+            "n_samples": samples.n_samples,
+            "chains": samples.chains,
+            "thinning": samples.thinning,
+            "output": str(samples.path) if samples.path else None,
+            "summary": samples.summary(),
+        }
+
+    def minimal_cut_sets(
+        self,
+        target_reaction: str,
+        pathway_id: str | None = None,
+        reaction_ids: list[str] | None = None,
+        *,
+        by: str = "enzyme",
+        max_cardinality: int = 3,
+        max_sets: int = 100,
+        time_limit: float = 60.0,
+        workers: int = 1,
+    ) -> dict:
+        """
+        Enumerate minimal knockout sets that block a target reaction.
+
+        See :mod:`metakg.mcs`.
+
+        :param target_reaction: Reaction node ID (or name) to block.
+        :param pathway_id: Pathway node ID to scope reactions.
+        :param reaction_ids: Explicit list of reaction node IDs to include.
+        :param by: ``"enzyme"`` (default) or ``"reaction"`` knockouts.
+        :param max_cardinality: Largest cut set to search for.
+        :param max_sets: Stop after this many cut sets.
+        :param time_limit: Wall-clock budget in seconds.
+        :param workers: Worker processes for the split search.
+        :return: Dict with ``status``, ``target``, ``cut_sets`` (smallest first),
+            ``n_milp``, ``elapsed_s`` and ``message``.
+        """
+        from metakg.mcs import minimal_cut_sets
+
+        config = SimulationConfig(
+            pathway_id=self.store.resolve_id(pathway_id) if pathway_id else None,
+            reaction_ids=reaction_ids,
+        )
+        result = minimal_cut_sets(
+            self.simulator,
+            config,
+            self.store.resolve_id(target_reaction) or target_reaction,
+            by=by,
+            max_cardinality=max_cardinality,
+            max_sets=max_sets,
+            time_limit=time_limit,
+            workers=workers,
+        )
+        return result.to_dict()
+
+    def detect_modules(
+        self,
+        *,
+        resolution: float = 1.0,
+        exclude_currency: bool = True,
+        seed: int = 0,
+    ) -> dict:
+        """
+        Partition the network into data-driven modules and store the assignment.
+
+        See :mod:`metakg.modules`.  The assignment is written to the
+        ``node_modules`` table, where :meth:`MetaStore.node_modules` and the
+        pathway analyzer pick it up.
+
+        :param resolution: Louvain resolution γ; larger values give smaller modules.
+        :param exclude_currency: Leave currency metabolites out of the graph.
+        :param seed: Seed for the node visiting order.
+        :return: Dict with ``n_nodes``, ``n_modules``, ``modularity``, ``sizes``,
+            ``excluded`` and ``elapsed_s``.
+        """
+        from metakg.modules import detect_modules
+
+        result = detect_modules(
+            self.store, resolution=resolution, exclude_currency=exclude_currency, seed=seed
+        )
+        return result.to_dict()
+
+    def similar_pathways(self, pathway_id: str, k: int = 10, *, min_jaccard: float = 0.0) -> dict:
+        """
+        Find pathways whose compounds and reactions overlap most with a pathway.
+
+        Approximate: Jaccard similarity is estimated from MinHash signatures
+        and candidates come from an LSH index (see :mod:`metakg.similarity`).
+        The index is stored in the database, rebuilt on the first lookup
+        after the graph changes, and kept in memory between calls.
+
+        :param pathway_id: Pathway node ID or shorthand external ID.
+        :param k: Maximum number of similar pathways.
+        :param min_jaccard: Drop hits with a lower estimated Jaccard.
+        :return: Dict with ``pathway_id``, ``similar`` (list of dicts with
+            ``pathway_id``, ``name``, ``jaccard`` and ``members``) and
+            ``elapsed_ms`` (including any index rebuild), or
+            ``{"error": ...}`` if *pathway_id* is not a pathway.
+        """
+        t0 = time.perf_counter()
+        nid = self.store.resolve_id(pathway_id)
+        node = self.store.node(nid) if nid else None
+        if node is None:
+            return {"error": f"pathway not found: {pathway_id!r}"}
+        if node["kind"] != "pathway":
+            return {"error": f"not a pathway: {pathway_id!r} is a {node['kind']}"}
+        if self._lsh is None or not self._lsh.current(self.store):
+            self._lsh = PathwayLSH.load(self.store)
+        hits = self._lsh.similar(nid, k=k, min_jaccard=min_jaccard)
+        return {
+            "pathway_id": nid,
+            "similar": hits,
+            "elapsed_ms": round((time.perf_counter() - t0) * 1000, 3),
+        }
+
+    def simulate_whatif_batch(
+        self,
+        scenarios: str | Path | Iterable[str],
+        pathway_id: str | None = None,
+        reaction_ids: list[str] | None = None,
+        *,
+        mode: str = "fba",
+        output: str | Path | None = None,
+        workers: int = 1,
+        initial_concentrations: dict[str, float] | None = None,
+        default_concentration: float = 1.0,
+        t_end: float = 100.0,
+        t_points: int = 500,
+        ode_method: str = "BDF",
+        steady_state_rtol: float | None = None,
+        progress: Callable[[int, dict[str, Any]], None] | None = None,
+    ) -> dict:
+        """
+        Run a screen of what-if scenarios against one shared baseline.
+
+        Each scenario is a JSON object of the form accepted by
+        :meth:`simulate_whatif`, one per line.  See :mod:`metakg.batch`.
+
+        :param scenarios: Path to a JSON Lines file, ``"-"`` for stdin, or an
+            iterable of JSON lines.
+        :param pathway_id: Pathway node ID to scope reactions.
+        :param reaction_ids: Explicit list of reaction node IDs to include.
+        :param mode: ``"fba"`` (default) or ``"ode"``.
+        :param output: Stream one JSON record per scenario to this file (``"-"``
+            for stdout) instead of returning the records.
+        :param workers: Worker processes (default 1 = in-process).
+        :param initial_concentrations: Map of ``{compound_id: mM}`` for ODE initial conditions.
+        :param default_concentration: Default initial concentration (mM) for ODE runs.
+        :param t_end: End time for ODE integration (default 100).
+        :param t_points: Number of time points to sample (default 500).
+        :param ode_method: ODE solver method (default ``"BDF"``).
+        :param steady_state_rtol: Stop each ODE run early once it has settled.
+        :param progress: Called as ``progress(n_done, record)`` after each scenario.
+        :return: Dict with ``n_scenarios``, ``n_errors``, ``output`` and, when no
+            *output* is given, the list of ``results``.
+        :raises ValueError: If *mode* is invalid or a scenario line cannot be parsed.
+        """
+        from metakg.batch import read_scenarios, run_whatif_batch, write_jsonl
+
+        config = SimulationConfig(
+            pathway_id=self.store.resolve_id(pathway_id) if pathway_id else None,
+            reaction_ids=reaction_ids,
+            t_end=t_end,
+            t_points=t_points,
+            initial_concentrations=initial_concentrations or {},
+            default_concentration=default_concentration,
+            ode_method=ode_method,
+            steady_state_rtol=steady_state_rtol,
+        )
+        n_errors = 0
+
+        def _count(n_done: int, record: dict[str, Any]) -> None:
+            nonlocal n_errors
+            n_errors += record["status"] == "error"
+            if progress is not None:
+                progress(n_done, record)
+
+        records = run_whatif_batch(
+            self.simulator,
+            config,
+            read_scenarios(scenarios),
+            mode=mode,
+            workers=workers,
+            progress=_count,
+        )
+        if output is not None:
+            n = write_jsonl(records, output)
+            return {"n_scenarios": n, "n_errors": n_errors, "output": str(output)}
+        results = list(records)
+        return {
+            "n_scenarios": len(results),
+            "n_errors": n_errors,
+            "output": None,
+            "results": results,
+        }
+
     def get_stats(self) -> MetabolicRuntimeStats:
         """
         Get current knowledge graph statistics.
@@ -704,7 +1127,9 @@ class MetaKG:
     # ------------------------------------------------------------------
 
     def close(self) -> None:
-        """Close the underlying SQLite connection."""
+        """Close the underlying SQLite connection and the simulation cache."""
+        if self._simulator is not None and self._simulator.cache is not None:
+            self._simulator.cache.close()
         if self._store is not None:
             self._store.close()
 
@@ -0,0 +1,52 @@
+"""
+parallel.py — Start method shared by MetaKG's worker process pools.
+
+Betweenness, what-if screens, MCA finite differences, sweeps, flux
+sampling and minimal cut sets all fan out over a
+:class:`~concurrent.futures.ProcessPoolExecutor` with ``workers > 1``, and
+all of them can be reached from a thread: the analyzer's phase pool or the
+MCP server.  Forking a multi-threaded process can copy locks held by other
+threads into the child, so every pool takes its context from
+:func:`pool_context` — a fork server, or spawning where there is none.
+
+The fork server imports the worker modules once (preloaded when this module
+is imported) so each worker forks with NumPy, SciPy and the simulator
+already loaded.
+
+Usage::
+
+    from metakg.parallel import pool_context
+
+    with ProcessPoolExecutor(max_workers=4, mp_context=pool_context()) as pool:
+        ...
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from multiprocessing.context import BaseContext
+
+#: Modules whose functions run in the pools, imported once by the fork server.
+WORKER_MODULES: tuple[str, ...] = (
+    "metakg.batch",
+    "metakg.centrality",
+    "metakg.mca",
+    "metakg.mcs",
+    "metakg.sampling",
+    "metakg.sweep",
+)
+
+_HAS_FORKSERVER = "forkserver" in multiprocessing.get_all_start_methods()
+if _HAS_FORKSERVER:
+    # The preload list is process-wide, so it is set once here rather than per pool
+    multiprocessing.get_context("forkserver").set_forkserver_preload(list(WORKER_MODULES))
+
+
+def pool_context() -> BaseContext:
+    """
+    Return the start method context for a worker pool.
+
+    :return: The fork-server context, or the spawn context on platforms
+        without one.
+    """
+    return multiprocessing.get_context("forkserver" if _HAS_FORKSERVER else "spawn")
@@ -0,0 +1,468 @@
+"""
+sampling.py — Uniform sampling of the feasible flux space.
+
+Draws flux vectors from the polytope ``S·v = 0, lb ≤ v ≤ ub`` of a simulation
+scope with artificial-centering hit-and-run (ACHR), to estimate flux
+distributions instead of a single FBA optimum:
+
+  **Warm-up** — each reaction is minimised and maximised once (``2N`` LPs);
+    the resulting vertices span the polytope and their mean is the starting
+    point of every chain.
+
+  **Null-space basis** — an orthonormal basis ``K`` of ``null(S)`` is
+    computed once; every step direction is projected onto it, so chains stay
+    on ``S·v = 0`` without solving anything per step.
+
+  **Vectorised chains** — a block of chains advances together as one
+    ``(chains, N)`` array: direction (random warm-up point minus the chain's
+    running centre), step interval from the bounds, and the update are all
+    array operations.  Blocks run in separate processes.
+
+  **Thinning and memory-mapped output** — only every *thinning*-th point is
+    kept, written straight into a ``.npy`` file opened with
+    :func:`numpy.lib.format.open_memmap`, so millions of samples never have
+    to sit in memory.  Chain *i* fills a contiguous block of rows.
+
+Usage::
+
+    from metakg.sampling import sample_fluxes
+
+    samples = sample_fluxes(sim, SimulationConfig(pathway_id="pwy:kegg:hsa00010"),
+                            n_samples=100_000, chains=8, workers=4,
+                            output="glycolysis.npy")
+    samples.summary()["rxn:kegg:R01786"]     # {"mean": ..., "std": ..., "q05": ...}
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import tempfile
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+from scipy.linalg import null_space
+from scipy.optimize import linprog
+
+from metakg.parallel import pool_context
+from metakg.simulate import MetabolicSimulator, SimulationConfig, _display_name
+
+if TYPE_CHECKING:
+    from metakg.store import MetaStore
+
+#: Direction components smaller than this do not limit the step length.
+DIRECTION_TOL: float = 1e-9
+
+#: Samples with ``max|S·v|`` above this are projected back onto the null space
+#: (and pulled towards the warm-up centre if the projection leaves the bounds).
+FEASIBILITY_TOL: float = 1e-7
+
+#: Reaction columns read at once when summarising memory-mapped samples.
+SUMMARY_BLOCK: int = 256
+
+# ---------------------------------------------------------------------------
+# Result type
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class FluxSamples:
+    """
+    Flux samples, one row per sample and one column per reaction.
+
+    :param reaction_ids: Reaction IDs labelling the columns.
+    :param samples: Array of shape ``(n_samples, n_reactions)``; a read-only
+        :class:`numpy.memmap` when written to disk.
+    :param chains: Number of chains; chain *i* owns rows
+        ``[i · n_samples/chains, (i+1) · n_samples/chains)``.
+    :param thinning: Hit-and-run steps between kept samples.
+    :param path: ``.npy`` file backing *samples*, or ``None`` if in memory.
+    :param n_warmup: Warm-up points used for centring and directions.
+    :param seed: Seed the chains were started from, if any.
+    """
+
+    reaction_ids: list[str]
+    samples: np.ndarray
+    chains: int
+    thinning: int
+    path: Path | None = None
+    n_warmup: int = 0
+    seed: int | None = None
+
+    @property
+    def n_samples(self) -> int:
+        """Number of samples (rows)."""
+        return int(self.samples.shape[0])
+
+    def chain(self, i: int) -> np.ndarray:
+        """Return the rows drawn by chain *i*."""
+        per = self.n_samples // self.chains
+        return self.samples[i * per : (i + 1) * per]
+
+    def summary(self, quantiles: Sequence[float] = (0.05, 0.5, 0.95)) -> dict[str, dict]:
+        """
+        Per-reaction mean, standard deviation and quantiles.
+
+        Columns are read in blocks of :data:`SUMMARY_BLOCK`, so memory stays
+        bounded by ``n_samples × SUMMARY_BLOCK`` however many reactions there are.
+
+        :param quantiles: Quantiles to report, keyed ``q05``, ``q50``, … .
+        :return: ``{reaction_id: {"mean", "std", "q..": ...}}``.
+        """
+        out: dict[str, dict] = {}
+        for start in range(0, len(self.reaction_ids), SUMMARY_BLOCK):
+            block = np.asarray(self.samples[:, start : start + SUMMARY_BLOCK], dtype=float)
+            mean, std = block.mean(axis=0), block.std(axis=0)
+            qs = np.quantile(block, quantiles, axis=0) if len(block) else None
+            for j in range(block.shape[1]):
+                row = {"mean": float(mean[j]), "std": float(std[j])}
+                for q_i, q in enumerate(quantiles):
+                    row[f"q{round(q * 100):02d}"] = float(qs[q_i, j]) if qs is not None else 0.0
+                out[self.reaction_ids[start + j]] = row
+        return out
+
+    @classmethod
+    def load(cls, path: str | Path) -> FluxSamples:
+        """
+        Open samples written by :func:`sample_fluxes` (memory-mapped, read-only).
+
+        :param path: The ``.npy`` file; its ``.json`` sidecar holds the reaction IDs.
+        :return: :class:`FluxSamples`.
+        """
+        path = Path(path)
+        meta = json.loads(path.with_suffix(".json").read_text(encoding="utf-8"))
+        return cls(
+            reaction_ids=meta["reaction_ids"],
+            samples=np.load(path, mmap_mode="r"),
+            chains=meta["chains"],
+            thinning=meta["thinning"],
+            path=path,
+            n_warmup=meta.get("n_warmup", 0),
+            seed=meta.get("seed"),
+        )
+
+
+# ---------------------------------------------------------------------------
+# Polytope setup
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class FluxPolytope:
+    """
+    The feasible flux set of one scope, prepared for hit-and-run.
+
+    :param reaction_ids: Reaction IDs labelling the columns.
+    :param S: Stoichiometric matrix.
+    :param lb: Lower flux bounds.
+    :param ub: Upper flux bounds.
+    :param basis: Orthonormal null-space basis of *S*, shape ``(n_rxn, dim)``.
+    :param warmup: Warm-up points (rows), all feasible.
+    """
+
+    reaction_ids: list[str]
+    S: np.ndarray
+    lb: np.ndarray
+    ub: np.ndarray
+    basis: np.ndarray
+    warmup: np.ndarray
+
+    @classmethod
+    def from_simulator(
+        cls, simulator: MetabolicSimulator, config: SimulationConfig
+    ) -> FluxPolytope:
+        """
+        Build the polytope for the scope and flux bounds of *config*.
+
+        :raises ValueError: If the scope is empty, a bound is infinite, or
+            ``S·v = 0`` has no solution within the bounds.
+        """
+        rxn_ids, _cpd_ids, S, rev_flags = simulator._build_stoich_matrix(config)
+        if not rxn_ids:
+            raise ValueError("No reactions found for the given configuration.")
+        bounds = np.array(simulator._flux_bounds(rxn_ids, rev_flags, config), dtype=float)
+        if not np.all(np.isfinite(bounds)):
+            raise ValueError("Flux sampling needs finite bounds on every reaction.")
+        S = np.asarray(S, dtype=float).reshape(-1, len(rxn_ids))
+        lb, ub = bounds[:, 0], bounds[:, 1]
+        basis = null_space(S) if S.shape[0] else np.eye(len(rxn_ids))
+        return cls(rxn_ids, S, lb, ub, basis, _warmup_points(S, lb, ub))
+
+    def project(self, X: np.ndarray) -> np.ndarray:
+        """Project the rows of *X* onto ``null(S)``."""
+        return (X @ self.basis) @ self.basis.T
+
+
+def _warmup_points(S: np.ndarray, lb: np.ndarray, ub: np.ndarray) -> np.ndarray:
+    """Minimise and maximise every flux; return the distinct optimal vertices."""
+    n = len(lb)
+    b_eq = np.zeros(S.shape[0])
+    bounds = list(zip(lb, ub))
+    points: list[np.ndarray] = []
+    c = np.zeros(n)
+    for j in range(n):
+        for sign in (1.0, -1.0):
+            c[j] = sign
+            res = linprog(c, A_eq=S, b_eq=b_eq, bounds=bounds, method="highs")
+            if res.status == 2:
+                raise ValueError("The flux space is empty: S·v = 0 is infeasible within bounds.")
+            if res.status == 0:
+                points.append(np.clip(res.x, lb, ub))
+        c[j] = 0.0
+    if not points:
+        raise ValueError("No warm-up point could be found for the flux space.")
+    return np.unique(np.round(np.array(points), 12), axis=0)
+
+
+# ---------------------------------------------------------------------------
+# Chains
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _ChainBlock:
+    """A block of chains advanced together in one process."""
+
+    polytope: FluxPolytope
+    first_row: int
+    n_chains: int
+    per_chain: int
+    thinning: int
+    seed: np.random.SeedSequence
+    path: str | None = None
+
+
+def _run_block(block: _ChainBlock, out: np.ndarray | None = None) -> int:
+    """
+    Advance ``block.n_chains`` ACHR chains in lock-step and write their samples.
+
+    Chain *c* of the block writes rows ``first_row + c·per_chain + k``.
+
+    :param block: Chain block description.
+    :param out: Destination array; opened from ``block.path`` when ``None``.
+    :return: Number of samples written.
+    """
+    poly = block.polytope
+    if out is None:
+        out = np.load(block.path, mmap_mode="r+")
+    rng = np.random.default_rng(block.seed)
+    W = poly.warmup
+    lb, ub = poly.lb, poly.ub
+    c = block.n_chains
+
+    anchor = poly.project(W.mean(axis=0, keepdims=True))
+    X = np.repeat(W.mean(axis=0, keepdims=True), c, axis=0)
+    center = X.copy()
+    n_seen = np.full(c, float(len(W)))
+    rows = block.first_row + np.arange(c) * block.per_chain
+
+    for k in range(block.per_chain):
+        for _ in range(block.thinning):
+            D = poly.project(W[rng.integers(len(W), size=c)] - center)
+            norm = np.linalg.norm(D, axis=1)
+            moving = norm > DIRECTION_TOL
+            D[moving] /= norm[moving, None]
+            D[~moving] = 0.0
+
+            small = np.abs(D) < DIRECTION_TOL
+            safe = np.where(small, 1.0, D)
+            lo, hi = (lb - X) / safe, (ub - X) / safe
+            t_min = np.where(small, -np.inf, np.minimum(lo, hi)).max(axis=1)
+            t_max = np.where(small, np.inf, np.maximum(lo, hi)).min(axis=1)
+            t_min = np.where(np.isfinite(t_min), np.minimum(t_min, 0.0), 0.0)
+            t_max = np.where(np.isfinite(t_max), np.maximum(t_max, 0.0), 0.0)
+
+            X += rng.uniform(t_min, t_max)[:, None] * D
+            np.clip(X, lb, ub, out=X)  # rounding only: the step stays within [t_min, t_max]
+            n_seen += 1.0
+            center += (X - center) / n_seen[:, None]
+
+        if poly.S.size and np.abs(X @ poly.S.T).max() > FEASIBILITY_TOL:
+            X = _pull_inside(poly.project(X), anchor, lb, ub)
+        out[rows + k] = X
+
+    if isinstance(out, np.memmap):
+        out.flush()
+    return c * block.per_chain
+
+
+def _pull_inside(P: np.ndarray, anchor: np.ndarray, lb: np.ndarray, ub: np.ndarray) -> np.ndarray:
+    """
+    Move each row of *P* towards *anchor* until it is within the bounds.
+
+    Both lie in ``null(S)``, so every point on the segment between them does
+    too; clipping coordinates instead would break ``S·v = 0``.
+
+    :param P: Projected samples, one per row.
+    :param anchor: Feasible point in ``null(S)``, shape ``(1, n)``.
+    :return: ``anchor + θ·(P − anchor)`` with the largest ``θ ≤ 1`` that
+        respects *lb* and *ub*.
+    """
+    D = P - anchor
+    small = np.abs(D) < DIRECTION_TOL
+    safe = np.where(small, 1.0, D)
+    limit = np.where(D > 0, (ub - anchor) / safe, (lb - anchor) / safe)
+    theta = np.where(small, 1.0, limit).min(axis=1, initial=1.0)
+    return anchor + np.clip(theta, 0.0, 1.0)[:, None] * D
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+
+def sample_fluxes(
+    simulator: MetabolicSimulator,
+    config: SimulationConfig | None = None,
+    *,
+    n_samples: int = 1000,
+    chains: int = 4,
+    thinning: int = 100,
+    workers: int = 1,
+    seed: int | None = None,
+    output: str | Path | None = None,
+    dtype: str = "float64",
+) -> FluxSamples:
+    """
+    Sample the feasible flux space of *config* with ACHR.
+
+    *n_samples* is rounded up to a multiple of *chains*.  With ``workers > 1``
+    the chains are split into one block per worker and run in a process pool;
+    samples then go through a memory-mapped file.  Without an *output* that
+    file is temporary: the samples are read back into memory and it is
+    deleted before returning.
+
+    :param simulator: Simulator providing the stoichiometry.
+    :param config: Scope and ``flux_bounds`` (default: whole store).
+    :param n_samples: Samples to draw in total.
+    :param chains: Independent chains.
+    :param thinning: Hit-and-run steps per kept sample.
+    :param workers: Worker processes.
+    :param seed: Seed for reproducible samples (same seed, chains and workers).
+    :param output: ``.npy`` file for the samples (plus a ``.json`` sidecar).
+    :param dtype: Storage dtype of the samples (``"float64"`` or ``"float32"``).
+    :return: :class:`FluxSamples`.
+    :raises ValueError: On an empty scope, infinite bounds or infeasible flux space.
+    """
+    if chains < 1 or thinning < 1 or n_samples < 1:
+        raise ValueError("n_samples, chains and thinning must be positive")
+    config = config or SimulationConfig()
+    poly = FluxPolytope.from_simulator(simulator, config)
+
+    per_chain = math.ceil(n_samples / chains)
+    shape = (per_chain * chains, len(poly.reaction_ids))
+    path: Path | None = Path(output) if output is not None else None
+    scratch: Path | None = None
+    if path is None and workers > 1:
+        fd, tmp = tempfile.mkstemp(suffix=".npy", prefix="metakg-samples-")
+        os.close(fd)
+        path = scratch = Path(tmp)
+    try:
+        if path is not None:
+            out: np.ndarray = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=shape)
+        else:
+            out = np.empty(shape, dtype=dtype)
+
+        n_blocks = max(1, min(workers, chains))
+        sizes = [len(a) for a in np.array_split(np.arange(chains), n_blocks)]
+        seeds = np.random.SeedSequence(seed).spawn(n_blocks)
+        blocks, first = [], 0
+        for size, ss in zip(sizes, seeds):
+            blocks.append(
+                _ChainBlock(poly, first, size, per_chain, thinning, ss, str(path) if path else None)
+            )
+            first += size * per_chain
+
+        if workers <= 1:
+            for block in blocks:
+                _run_block(block, out)
+        else:
+            if isinstance(out, np.memmap):
+                out.flush()
+            with ProcessPoolExecutor(max_workers=n_blocks, mp_context=pool_context()) as pool:
+                list(pool.map(_run_block, blocks))
+
+        if scratch is not None:
+            del out
+            out = np.load(scratch)  # read into memory before the file is deleted
+        elif path is not None:
+            del out
+            meta = {
+                "reaction_ids": poly.reaction_ids,
+                "chains": chains,
+                "thinning": thinning,
+                "n_warmup": len(poly.warmup),
+                "seed": seed,
+            }
+            path.with_suffix(".json").write_text(json.dumps(meta), encoding="utf-8")
+            return FluxSamples.load(path)
+        return FluxSamples(
+            reaction_ids=poly.reaction_ids,
+            samples=out,
+            chains=chains,
+            thinning=thinning,
+            n_warmup=len(poly.warmup),
+            seed=seed,
+        )
+    finally:
+        if scratch is not None:
+            scratch.unlink(missing_ok=True)
+            scratch.with_suffix(".json").unlink(missing_ok=True)
+
+
+# ---------------------------------------------------------------------------
+# Rendering
+# ---------------------------------------------------------------------------
+
+
+def render_flux_samples(
+    samples: FluxSamples,
+    store: MetaStore | None = None,
+    *,
+    top_n: int = 20,
+    markdown: bool = True,
+) -> str:
+    """
+    Format per-reaction flux distributions, widest first.
+
+    :param samples: Samples to summarise.
+    :param store: Optional MetaStore for resolving reaction names.
+    :param top_n: Maximum reactions to list.
+    :param markdown: Emit Markdown (default) or plain text.
+    :return: Formatted string.
+    """
+    h2 = "## " if markdown else ""
+    h3 = "### " if markdown else "--- "
+    bold = ("**", "**") if markdown else ("", "")
+    lines: list[str] = []
+
+    lines.append(f"{h2}Flux Sampling")
+    lines.append(
+        f"{bold[0]}Samples:{bold[1]} {samples.n_samples} "
+        f"({samples.chains} chains, thinning {samples.thinning}, "
+        f"{samples.n_warmup} warm-up points)"
+    )
+    if samples.path is not None:
+        lines.append(f"{bold[0]}File:{bold[1]} {samples.path}")
+    lines.append("")
+
+    stats = sorted(samples.summary().items(), key=lambda kv: kv[1]["std"], reverse=True)
+    lines.append(f"{h3}Flux Distributions (by spread)")
+    if markdown:
+        lines.append("| Reaction | ID | Mean | SD | 5% | 50% | 95% |")
+        lines.append("|---|---|---:|---:|---:|---:|---:|")
+    for rxn_id, st in stats[:top_n]:
+        vals = (st["mean"], st["std"], st["q05"], st["q50"], st["q95"])
+        if markdown:
+            cells = " | ".join(f"{v:.4g}" for v in vals)
+            lines.append(f"| {_display_name(store, rxn_id)} | `{rxn_id}` | {cells} |")
+        else:
+            cells = " ".join(f"{v:>10.4g}" for v in vals)
+            lines.append(f"  {_display_name(store, rxn_id):<40} {cells}")
+
+    return "\n".join(lines)
@@ -0,0 +1,242 @@
+"""
+simcache.py — Content-addressed cache for MetaKG simulation results.
+
+Results are keyed by a SHA-256 over a canonical JSON encoding of the
+request (run kind, :class:`~metakg.simulate.SimulationConfig`, optional
+:class:`~metakg.simulate.WhatIfScenario` and solver arguments) together
+with :meth:`MetaStore.content_version`.  Because the store version is
+bumped on every change to the graph or to ``kinetic_parameters`` /
+``regulatory_interactions``, stale entries can never be returned: a changed
+database simply produces different keys.
+
+Two tiers:
+
+  **Memory** — an LRU ``OrderedDict`` of result objects; hits cost one
+    hash plus one version lookup.
+
+  **Disk** — an optional SQLite sidecar (``<db>.simcache.sqlite`` by
+    default) holding pickled results, so repeated queries survive
+    process restarts (MCP server, Streamlit reruns, CLI).  Rows written
+    under an older store version are purged lazily.
+
+Every hit returns a private copy, so callers may modify what they get back
+without affecting the cache or each other.
+
+Usage::
+
+    from metakg.simcache import SimulationCache
+    from metakg.simulate import MetabolicSimulator
+
+    sim = MetabolicSimulator(store, cache=SimulationCache.for_store(store))
+    sim.run_fba(config)   # solves
+    sim.run_fba(config)   # served from memory
+"""
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import hashlib
+import json
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from metakg.store import MetaStore
+
+#: Bump when result classes change shape so old pickles are never loaded.
+CACHE_FORMAT: int = 2
+
+_SCHEMA_SQL = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+
+CREATE TABLE IF NOT EXISTS sim_results (
+    key      TEXT PRIMARY KEY,
+    kind     TEXT NOT NULL,
+    version  TEXT NOT NULL,
+    created  REAL NOT NULL,
+    payload  BLOB NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_sim_results_version ON sim_results(version);
+"""
+
+
+def _canonical(obj: Any) -> Any:
+    """Convert dataclasses, mappings, tuples and sets into JSON-stable structures."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: _canonical(getattr(obj, f.name)) for f in dataclasses.fields(obj)}
+    if isinstance(obj, Mapping):
+        return {str(k): _canonical(v) for k, v in sorted(obj.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(obj, (list, tuple)):
+        return [_canonical(v) for v in obj]
+    if isinstance(obj, (set, frozenset)):
+        return sorted(_canonical(v) for v in obj)
+    if isinstance(obj, float):
+        return repr(obj)  # distinguishes 1.0 from 1 and keeps full precision
+    return obj
+
+
+def request_key(kind: str, *parts: Any, version: str = "") -> str:
+    """
+    Return the canonical cache key for a simulation request.
+
+    :param kind: Run kind, e.g. ``"fba"``, ``"ode"``, ``"steady_state"``, ``"whatif"``.
+    :param parts: Request components (configs, scenarios, solver arguments).
+    :param version: Store content version the result depends on.
+    :return: Hex SHA-256 digest.
+    """
+    payload = json.dumps(
+        [CACHE_FORMAT, kind, version, _canonical(list(parts))],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class SimulationCache:
+    """
+    Two-tier (memory LRU + optional SQLite) cache of simulation results.
+
+    :param path: SQLite file for the persistent tier, or ``None`` for memory only.
+    :param max_entries: Maximum results kept in memory.
+    :param max_disk_entries: Maximum rows kept on disk; oldest rows are evicted.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        *,
+        max_entries: int = 256,
+        max_disk_entries: int = 10_000,
+    ) -> None:
+        self.path = Path(path) if path is not None else None
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.hits = 0
+        self.misses = 0
+        self._mem: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._purged_version: str | None = None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.executescript(_SCHEMA_SQL)
+            self._conn.commit()
+
+    @classmethod
+    def for_store(cls, store: MetaStore, **kwargs: Any) -> SimulationCache:
+        """
+        Create a cache whose disk tier sits next to *store*'s database file.
+
+        :param store: Store whose results will be cached.
+        :param kwargs: Passed to the constructor.
+        :return: :class:`SimulationCache` backed by ``<db>.simcache.sqlite``.
+        """
+        db = Path(store.db_path)
+        return cls(db.with_name(db.name + ".simcache.sqlite"), **kwargs)
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> Any | None:
+        """
+        Return the cached result for *key*, or ``None`` on a miss.
+
+        :param key: Key from :func:`request_key`.
+        :return: A copy of the cached result, or ``None``.
+        """
+        with self._lock:
+            if key in self._mem:
+                self._mem.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(self._mem[key])
+            row = None
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT payload FROM sim_results WHERE key = ?", (key,)
+                ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            try:
+                value = pickle.loads(row[0])
+            except Exception:  # corrupt or incompatible pickle — treat as a miss
+                self.misses += 1
+                return None
+            self._remember(key, copy.deepcopy(value))
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: Any, *, kind: str = "", version: str = "") -> None:
+        """
+        Store *value* under *key* in both tiers.
+
+        :param key: Key from :func:`request_key`.
+        :param value: Result object (must be picklable for the disk tier).
+        :param kind: Run kind, recorded for inspection.
+        :param version: Store content version; rows from other versions are purged.
+        """
+        with self._lock:
+            self._remember(key, copy.deepcopy(value))
+            if self._conn is None:
+                return
+            if version and version != self._purged_version:
+                self._conn.execute("DELETE FROM sim_results WHERE version != ?", (version,))
+                self._purged_version = version
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sim_results (key, kind, version, created, payload) "
+                "VALUES (?,?,?,?,?)",
+                (key, kind, version, time.time(), pickle.dumps(value, pickle.HIGHEST_PROTOCOL)),
+            )
+            self._conn.execute(
+                "DELETE FROM sim_results WHERE key IN ("
+                " SELECT key FROM sim_results ORDER BY created DESC LIMIT -1 OFFSET ?)",
+                (self.max_disk_entries,),
+            )
+            self._conn.commit()
+
+    def _remember(self, key: str, value: Any) -> None:
+        self._mem[key] = value
+        self._mem.move_to_end(key)
+        while len(self._mem) > self.max_entries:
+            self._mem.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def clear(self) -> None:
+        """Drop every cached result from both tiers."""
+        with self._lock:
+            self._mem.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM sim_results")
+                self._conn.commit()
+
+    def __len__(self) -> int:
+        return len(self._mem)
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and tier sizes."""
+        disk = 0
+        if self._conn is not None:
+            with self._lock:
+                disk = int(self._conn.execute("SELECT COUNT(*) FROM sim_results").fetchone()[0])
+        return {"hits": self.hits, "misses": self.misses, "memory": len(self._mem), "disk": disk}
+
+    def close(self) -> None:
+        """Close the disk tier."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
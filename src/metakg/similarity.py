@@ -0,0 +1,317 @@
+"""
+similarity.py — Approximate pathway similarity with MinHash and LSH.
+
+Exact pathway overlap needs the pairwise coupling pass of
+:mod:`metakg.analyze`.  For "which pathways look like this one?" a
+sketch is enough:
+
+  **MinHash** — each pathway's compound and reaction members are hashed
+    (CRC-32) and pushed through :data:`NUM_PERM` seeded universal hash
+    functions ``(a·x + b) mod (2⁶¹ − 1)``; the per-function minima form the
+    signature.  The fraction of positions where two signatures agree
+    estimates the Jaccard similarity of the member sets.
+
+  **LSH banding** — the signature is cut into :data:`BANDS` bands of
+    ``NUM_PERM / BANDS`` rows and each band is hashed to a bucket.  Pathways
+    sharing any bucket are candidates; with 32 bands of 4 rows a pair with
+    Jaccard ``s`` becomes a candidate with probability ``1 − (1 − s⁴)³²``
+    (about 50% at ``s = 0.42``, 98% at ``s = 0.6``).
+
+Signatures and buckets live in the ``pathway_minhash`` / ``pathway_lsh``
+tables, tagged with the ``meta_edges`` version they were built from, and are
+rebuilt on the first lookup after a graph change.  A lookup reads one
+signature, then one statement probes :data:`BANDS` primary-key ranges and
+returns the candidates' signatures for comparison, so its cost does not grow with the number of
+pathways in the database.  :class:`PathwayLSH` holds the index in memory
+for long-lived processes and answers without touching SQLite.
+
+Usage::
+
+    from metakg.similarity import similar_pathways
+
+    hits = similar_pathways(store, "pwy:kegg:hsa00010", k=5)
+    # [{"pathway_id": ..., "name": ..., "jaccard": 0.61, "members": 88}, ...]
+
+    lsh = PathwayLSH.load(store)          # repeated lookups
+    hits = lsh.similar("pwy:kegg:hsa00010", k=5)
+"""
+
+from __future__ import annotations
+
+import zlib
+from collections.abc import Iterable
+from typing import Any
+
+import numpy as np
+
+from metakg.store import MetaStore, pathway_minhash_current, read_content_version
+
+#: Hash functions per signature.
+NUM_PERM: int = 128
+
+#: LSH bands; each covers ``NUM_PERM // BANDS`` signature rows.
+BANDS: int = 32
+
+#: Member kinds a pathway's signature is built from.
+SIMILARITY_KINDS: tuple[str, ...] = ("compound", "reaction")
+
+# Versions that invalidate a loaded PathwayLSH (names come from meta_nodes)
+_INDEX_TABLES: tuple[str, ...] = ("meta_nodes", "meta_edges")
+
+_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64(0xFFFFFFFF)
+
+# Fixed seed: signatures stored in the database must stay comparable
+_rng = np.random.default_rng(0x5EED)
+# a, b < 2³¹ keep a·x + b (x < 2³²) inside uint64
+_A = _rng.integers(1, 1 << 31, size=NUM_PERM, dtype=np.uint64)
+_B = _rng.integers(0, 1 << 31, size=NUM_PERM, dtype=np.uint64)
+# Odd multipliers mixing the rows of a band into one 64-bit bucket key
+_BAND_MIX = _rng.integers(0, 1 << 63, size=NUM_PERM // BANDS, dtype=np.uint64) | np.uint64(1)
+# Per-band offsets separating the bands inside PathwayLSH
+_BAND_SALT = _rng.integers(0, 1 << 63, size=BANDS, dtype=np.uint64)
+
+
+# ---------------------------------------------------------------------------
+# Signatures
+# ---------------------------------------------------------------------------
+
+
+def minhash(members: Iterable[str]) -> np.ndarray:
+    """
+    MinHash signature of a set of node IDs.
+
+    :param members: Node IDs (duplicates are harmless).
+    :return: ``uint32`` array of length :data:`NUM_PERM`; all ``0xFFFFFFFF``
+        for an empty set.
+    """
+    x = np.fromiter((zlib.crc32(m.encode()) for m in members), dtype=np.uint64)
+    if not len(x):
+        return np.full(NUM_PERM, _MAX_HASH, dtype=np.uint32)
+    h = (_A[:, None] * x[None, :] + _B[:, None]) % _PRIME & _MAX_HASH
+    return h.min(axis=1).astype(np.uint32)
+
+
+def band_buckets(signature: np.ndarray) -> np.ndarray:
+    """
+    LSH bucket key of each band of *signature*.
+
+    :param signature: Array from :func:`minhash`, or a stack of them
+        (``(n, NUM_PERM)``).
+    :return: ``int64`` keys (SQLite-storable), shape ``(BANDS,)`` or ``(n, BANDS)``.
+    """
+    rows = signature.astype(np.uint64).reshape(*signature.shape[:-1], BANDS, NUM_PERM // BANDS)
+    return (rows * _BAND_MIX).sum(axis=-1, dtype=np.uint64).view(np.int64)
+
+
+def estimate_jaccard(a: np.ndarray, b: np.ndarray) -> float:
+    """
+    Estimate the Jaccard similarity of two sets from their signatures.
+
+    :param a: Signature from :func:`minhash`.
+    :param b: Signature from :func:`minhash`.
+    :return: Fraction of agreeing positions.
+    """
+    return float(np.count_nonzero(a == b)) / len(a)
+
+
+# ---------------------------------------------------------------------------
+# Store integration
+# ---------------------------------------------------------------------------
+
+
+def build_similarity_index(store: MetaStore) -> int:
+    """
+    Recompute every pathway signature and the LSH buckets, and store them.
+
+    Pathways without compound or reaction members are not indexed.
+
+    :param store: Open :class:`~metakg.store.MetaStore`.
+    :return: Number of pathways indexed.
+    """
+    members: dict[str, set[str]] = {}
+    for kind in SIMILARITY_KINDS:
+        for pwy_id, nodes in store.pathway_member_map(kind=kind).items():
+            members.setdefault(pwy_id, set()).update(nodes)
+
+    signatures: list[tuple[str, int, bytes]] = []
+    buckets: list[tuple[int, int, str]] = []
+    for pwy_id in sorted(members):
+        sig = minhash(members[pwy_id])
+        signatures.append((pwy_id, len(members[pwy_id]), sig.tobytes()))
+        buckets.extend((band, key, pwy_id) for band, key in enumerate(band_buckets(sig).tolist()))
+    store.write_pathway_minhash(signatures, buckets)
+    return len(signatures)
+
+
+def ensure_similarity_index(store: MetaStore) -> bool:
+    """
+    Rebuild the index if ``meta_edges`` changed since it was built.
+
+    :param store: Open :class:`~metakg.store.MetaStore`.
+    :return: ``True`` if the index was rebuilt.
+    """
+    if pathway_minhash_current(store._conn):
+        return False
+    build_similarity_index(store)
+    return True
+
+
+def similar_pathways(
+    store: MetaStore, pathway_id: str, *, k: int = 10, min_jaccard: float = 0.0
+) -> list[dict[str, Any]]:
+    """
+    Find the pathways whose members overlap most with *pathway_id*.
+
+    :param store: Open :class:`~metakg.store.MetaStore`.
+    :param pathway_id: Pathway node ID.
+    :param k: Maximum number of hits.
+    :param min_jaccard: Drop hits whose estimated Jaccard is below this.
+    :return: Up to *k* dicts with ``pathway_id``, ``name``, ``jaccard``
+        (estimate) and ``members``, most similar first; empty when the
+        pathway has no indexed members.
+    """
+    ensure_similarity_index(store)
+    stored = store.pathway_minhash([pathway_id]).get(pathway_id)
+    if stored is None:
+        return []
+    query = np.frombuffer(stored[1], dtype=np.uint32)
+    found = store.lsh_candidates(band_buckets(query).tolist())
+    found.pop(pathway_id, None)
+    if not found:
+        return []
+
+    ids = sorted(found)
+    sigs = _unpack([found[p][1] for p in ids])
+    scores = np.count_nonzero(sigs == query, axis=1) / NUM_PERM
+    order = sorted(range(len(ids)), key=lambda i: (-scores[i], ids[i]))
+    hits = [i for i in order if scores[i] >= min_jaccard][:k]
+
+    nodes = store.nodes([ids[i] for i in hits])
+    return [
+        _hit(ids[i], (nodes.get(ids[i]) or {}).get("name", ""), scores[i], found[ids[i]][0])
+        for i in hits
+    ]
+
+
+def _unpack(signatures: list[bytes]) -> np.ndarray:
+    """Stack packed signatures into a ``(n, NUM_PERM)`` array."""
+    return np.frombuffer(b"".join(signatures), dtype=np.uint32).reshape(-1, NUM_PERM)
+
+
+def _hit(pathway_id: str, name: str, score: float, members: int) -> dict[str, Any]:
+    """One result row of :func:`similar_pathways` / :meth:`PathwayLSH.similar`."""
+    return {
+        "pathway_id": pathway_id,
+        "name": name,
+        "jaccard": round(float(score), 4),
+        "members": int(members),
+    }
+
+
+# ---------------------------------------------------------------------------
+# In-memory index
+# ---------------------------------------------------------------------------
+
+
+class PathwayLSH:
+    """
+    In-memory copy of the stored similarity index for repeated lookups.
+
+    The bucket keys of all bands are held in one sorted array, so a lookup
+    is one vectorised binary search plus one signature comparison — no SQL.
+    Meant for long-lived processes (e.g. the MCP server); reload when
+    :meth:`current` turns false.
+
+    :param pathway_ids: Indexed pathway IDs, sorted.
+    :param names: Pathway name per ID.
+    :param n_members: Member count per pathway.
+    :param signatures: ``(n, NUM_PERM)`` signature matrix.
+    :param version: Content version token the index was loaded at.
+    """
+
+    def __init__(
+        self,
+        pathway_ids: list[str],
+        names: dict[str, str],
+        n_members: np.ndarray,
+        signatures: np.ndarray,
+        version: str,
+    ) -> None:
+        self.pathway_ids = pathway_ids
+        self.names = names
+        self.n_members = n_members
+        self.signatures = signatures
+        self.version = version
+        self._row = {p: i for i, p in enumerate(pathway_ids)}
+        # All bands in one sorted array; the salt keeps equal keys of
+        # different bands apart
+        keys = (band_buckets(signatures).view(np.uint64) + _BAND_SALT).ravel()
+        self._order = np.argsort(keys)
+        self._keys = keys[self._order]
+
+    @classmethod
+    def load(cls, store: MetaStore) -> PathwayLSH:
+        """
+        Load the index from *store*, rebuilding the stored index first if stale.
+
+        :param store: Open :class:`~metakg.store.MetaStore`.
+        :return: :class:`PathwayLSH`.
+        """
+        ensure_similarity_index(store)
+        version = read_content_version(store._conn, _INDEX_TABLES)
+        found = store.pathway_minhash()
+        ids = sorted(found)
+        nodes = store.nodes(ids)
+        return cls(
+            ids,
+            {p: (nodes.get(p) or {}).get("name", "") for p in ids},
+            np.array([found[p][0] for p in ids], dtype=np.int64),
+            _unpack([found[p][1] for p in ids]),
+            version,
+        )
+
+    def current(self, store: MetaStore) -> bool:
+        """
+        Return ``True`` if pathways and edges are unchanged since :meth:`load`.
+
+        :param store: The store the index was loaded from.
+        """
+        return read_content_version(store._conn, _INDEX_TABLES) == self.version
+
+    def similar(
+        self, pathway_id: str, *, k: int = 10, min_jaccard: float = 0.0
+    ) -> list[dict[str, Any]]:
+        """
+        Same result as :func:`similar_pathways`, answered from memory.
+
+        :param pathway_id: Pathway node ID.
+        :param k: Maximum number of hits.
+        :param min_jaccard: Drop hits whose estimated Jaccard is below this.
+        :return: Up to *k* hit dicts, most similar first.
+        """
+        i = self._row.get(pathway_id)
+        if i is None:
+            return []
+        query = self.signatures[i]
+        qkeys = band_buckets(query).view(np.uint64) + _BAND_SALT
+        lo = np.searchsorted(self._keys, qkeys, side="left").tolist()
+        hi = np.searchsorted(self._keys, qkeys, side="right").tolist()
+        # Flat positions are row * BANDS + band
+        rows = np.sort(np.concatenate([self._order[a:b] for a, b in zip(lo, hi, strict=True)]))
+        rows //= BANDS
+        rows = rows[np.r_[True, rows[1:] != rows[:-1]] & (rows != i)]
+        scores = np.count_nonzero(self.signatures[rows] == query, axis=1) / NUM_PERM
+        keep = scores >= min_jaccard
+        rows, scores = rows[keep], scores[keep]
+        # Rows follow the sorted IDs, so a stable sort breaks ties by ID
+        top = np.argsort(-scores, kind="stable")[:k]
+        return [
+            _hit(
+                self.pathway_ids[r],
+                self.names[self.pathway_ids[r]],
+                s,
+                self.n_members[r],
+            )
+            for r, s in zip(rows[top].tolist(), scores[top].tolist(), strict=True)
+        ]
@@ -1,7 +1,7 @@
 """
 simulate.py — Metabolic simulation engine for MetaKG.
 
-Provides three complementary simulation modes:
+Provides four complementary simulation modes:
 
   **FBA** — Flux Balance Analysis via a steady-state linear programme.
     Requires only the structural graph (stoichiometry + reaction bounds).
@@ -12,6 +12,12 @@ Provides three complementary simulation modes:
     Falls back to normalised defaults when parameters are absent.
     Returns compound concentration time-courses.
 
+  **Steady state** — Direct fixed-point solve of the kinetic ODE system.
+    Uses pseudo-transient (damped) Newton continuation on the vectorised
+    rate equations and their analytic Jacobian, falling back to integration
+    that terminates automatically once ``‖dy/dt‖`` drops below tolerance.
+    Returns the settled concentrations and reaction rates.
+
   **WhatIf** — Perturbation analysis: run baseline vs. a modified scenario.
     Supports enzyme knockouts, up/down-regulation factors, and substrate
     concentration changes.  Works with both FBA and ODE modes.
@@ -32,7 +38,12 @@ Typical usage::
     # --- ODE ---
     ode = sim.run_ode(config)
     # ode.t              → list of time points
-    # ode.concentrations → {compound_id: [conc, ...]}
+    # ode.concentrations → {compound_id: [conc, ...]} (lazy view over ode.y)
+    # ode.to_npz("run.npz")
+
+    # --- Steady state (no time-course) ---
+    ss = sim.run_steady_state(config)
+    # ss.concentrations  → {compound_id: conc}
 
     # --- What-if: knock out hexokinase ---
     scenario = WhatIfScenario(
@@ -49,18 +60,48 @@ Typical usage::
 
 from __future__ import annotations
 
-import copy
+import functools
+import hashlib
+import inspect
 import json
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from collections import ChainMap, OrderedDict
+from collections.abc import Callable, Iterator, Mapping, MutableMapping
+from dataclasses import dataclass, field, replace
+from functools import cached_property
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 import numpy as np
-from scipy.integrate import solve_ivp
+from scipy.integrate import OdeSolution, solve_ivp
+from scipy.linalg import lstsq, qr
 from scipy.optimize import linprog
+from scipy.sparse import csc_matrix, csr_matrix
+from scipy.sparse.csgraph import connected_components
+
+from metakg.compress import CompressedNetwork, compress_network
+from metakg.simcache import request_key
 
 if TYPE_CHECKING:
+    from metakg.simcache import SimulationCache
     from metakg.store import MetaStore
 
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+# solve_ivp methods that accept an analytic Jacobian
+_IMPLICIT_METHODS = frozenset({"BDF", "Radau", "LSODA"})
+_EXPLICIT_METHODS = frozenset({"RK23", "RK45", "DOP853"})
+
+#: Jacobian spectrum spread above which ``ode_method="auto"`` treats a system as stiff.
+STIFFNESS_RATIO: float = 1e3
+# Explicit solves switch to BDF once this many consecutive steps are shorter
+# than span / _EXPLICIT_STEP_BUDGET (the step size has collapsed to the
+# stability limit of a stiff mode).
+_EXPLICIT_STEP_BUDGET = 5000
+_COLLAPSE_STEPS = 25
+# Dense eigendecomposition up to this size; Gershgorin bound beyond it.
+_EIG_MAX_SIZE = 400
+
 
 # ---------------------------------------------------------------------------
 # Configuration dataclasses
@@ -90,27 +131,68 @@ class SimulationConfig:
     :param vmax_factors: Multiply stored (or default) Vmax by a factor ``{reaction_id: factor}``.
     :param ode_method: ODE solver method (default ``"BDF"``). ``"BDF"`` is for stiff systems;
         use ``"RK45"`` for non-stiff systems, ``"Radau"`` as alternative for stiff.
+        ``"auto"`` estimates stiffness from the Jacobian spectrum at the initial
+        state, picks an explicit or implicit solver (and initial step) accordingly,
+        and switches an explicit run to ``"BDF"`` if its step size collapses.
     :param ode_rtol: ODE relative tolerance (default ``1e-4``).
     :param ode_atol: ODE absolute tolerance in mM (default ``1e-6``).
     :param ode_max_step: Maximum internal step size for ODE solver. ``None`` (default)
         lets the solver choose; set to a small value for stricter control.
+    :param steady_state_rtol: Stop ODE integration early once the relative derivative norm
+        ``max|dy/dt| / max|y|`` stays below this threshold for *steady_state_window* time
+        units.  ``None`` (default) always integrates to *t_end*.
+    :param steady_state_window: Time the derivative norm must stay below
+        *steady_state_rtol* before stopping (default ``None`` → 5 % of *t_end*).
+    :param output_sampling: ``"uniform"`` (default) samples *t_points* evenly spaced times;
+        ``"adaptive"`` places up to *t_points* samples by trajectory arc length, so they
+        are dense where concentrations change quickly and sparse once they flatten.
+    :param output_dtype: NumPy dtype for result arrays (concentrations, fluxes, shadow
+        prices): ``"float64"`` (default) or ``"float32"`` to halve result memory.
+        Integration itself always runs in double precision.
+    :param reduce_conservation: Eliminate conserved moieties (left null space of ``S``)
+        before ODE and steady-state solves, integrating only the independent species
+        and reconstructing the rest (default ``True``).
+    :param prune_network: Remove blocked reactions, dead-end compounds and duplicate
+        columns before solving (default ``True``); see :mod:`metakg.compress`.  FBA uses
+        the full LP consistency check; ODE runs drop only reactions that can never
+        fire kinetically (zero Vmax or no substrates).
+    :param kinetic_aggregation: How multiple stored measurements per reaction are
+        combined: ``"mean"`` (default), ``"median"``, or ``"weighted"`` (by
+        ``confidence_score``).
+    :param fixed_compounds: Compound IDs held at their initial concentration in kinetic
+        runs (external or boundary metabolites).  They still enter the rate laws but are
+        not changed by them, so pathways fed from and drained into fixed pools reach a
+        steady state with non-zero flux instead of relaxing to equilibrium.
+
+    The per-reaction and per-compound maps may be any mutable mapping.  What-if
+    runs receive :class:`collections.ChainMap` overlays whose first layer holds
+    the scenario's changes and whose later layers are the untouched baseline
+    maps, so applying a scenario never copies the baseline.
     """
 
     pathway_id: str | None = None
     reaction_ids: list[str] | None = None
     t_end: float = 100.0
     t_points: int = 500
-    initial_concentrations: dict[str, float] = field(default_factory=dict)
+    initial_concentrations: MutableMapping[str, float] = field(default_factory=dict)
     default_concentration: float = 1.0
     objective_reaction: str | None = None
     maximize: bool = True
-    flux_bounds: dict[str, tuple[float, float]] = field(default_factory=dict)
-    vmax_overrides: dict[str, float] = field(default_factory=dict)
-    vmax_factors: dict[str, float] = field(default_factory=dict)
+    flux_bounds: MutableMapping[str, tuple[float, float]] = field(default_factory=dict)
+    vmax_overrides: MutableMapping[str, float] = field(default_factory=dict)
+    vmax_factors: MutableMapping[str, float] = field(default_factory=dict)
     ode_method: str = "BDF"
     ode_rtol: float = 1e-3
     ode_atol: float = 1e-5
     ode_max_step: float | None = None
+    steady_state_rtol: float | None = None
+    steady_state_window: float | None = None
+    output_sampling: str = "uniform"
+    output_dtype: str = "float64"
+    reduce_conservation: bool = True
+    prune_network: bool = True
+    kinetic_aggregation: str = "mean"
+    fixed_compounds: list[str] = field(default_factory=list)
 
 
 @dataclass
@@ -137,43 +219,501 @@ class WhatIfScenario:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+class ArrayView(Mapping[str, Any]):
+    """
+    Read-only ``{id: value}`` mapping over a NumPy array, materialised on access.
+
+    Keeps result objects compact while preserving the dict-style API
+    (``view[id]``, ``.get()``, ``.items()``, ``dict(view)``).  A 1-D array
+    yields ``float`` values; a 2-D array yields one row per key as a list.
+
+    :param ids: Key order; ``ids[i]`` labels row (or element) *i* of *values*.
+    :param values: Backing array.
+    :param index: Optional precomputed ``{id: position}`` map.
+    """
+
+    __slots__ = ("_ids", "_values", "_index")
+
+    def __init__(
+        self,
+        ids: tuple[str, ...],
+        values: np.ndarray,
+        index: dict[str, int] | None = None,
+    ) -> None:
+        self._ids = ids
+        self._values = values
+        self._index = index if index is not None else {k: i for i, k in enumerate(ids)}
+
+    def __getitem__(self, key: str) -> Any:
+        row = self._values[self._index[key]]
+        return float(row) if self._values.ndim == 1 else row.tolist()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __repr__(self) -> str:
+        return f"ArrayView({len(self._ids)} keys, shape={self._values.shape})"
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError as exc:
+        raise ImportError(
+            "Arrow export requires pyarrow. Install with: pip install pyarrow"
+        ) from exc
+    return pa
+
+
+#: Names :class:`ReusableLP` uses from a HiGHS bindings module and its solver class.
+_HIGHS_MODULE_API: tuple[str, ...] = ("HighsLp", "MatrixFormat", "HighsModelStatus")
+_HIGHS_SOLVER_API: tuple[str, ...] = (
+    "setOptionValue",
+    "passModel",
+    "changeColsBounds",
+    "run",
+    "getModelStatus",
+    "getSolution",
+)
+
+
+def _load_highs() -> tuple[Any, Any] | None:
+    """
+    Return ``(module, Highs class)`` for the HiGHS Python bindings.
+
+    Prefers ``highspy``.  SciPy ships the same bindings for its ``linprog``
+    backend, but as a private module (``scipy.optimize._highspy``) that may
+    move or change between releases; it is used only when ``highspy`` is not
+    installed and it still exposes every name :class:`ReusableLP` calls.
+    ``None`` if no usable bindings are found, in which case callers fall
+    back to :func:`~scipy.optimize.linprog`.
+    """
+    candidates: list[tuple[Any, Any]] = []
+    try:
+        import highspy
+
+        candidates.append((highspy, getattr(highspy, "Highs", None)))
+    except ImportError:
+        pass
+    try:
+        from scipy.optimize._highspy import _core
+
+        candidates.append((_core, getattr(_core, "_Highs", None)))
+    except (ImportError, AttributeError):
+        pass
+    for module, cls in candidates:
+        if (
+            cls is not None
+            and all(hasattr(module, name) for name in _HIGHS_MODULE_API)
+            and all(hasattr(cls, name) for name in _HIGHS_SOLVER_API)
+        ):
+            return module, cls
+    return None
+
+
+def _split_mapping(values: Mapping[str, float]) -> tuple[tuple[str, ...], np.ndarray]:
+    """Split ``{id: value}`` into an ID tuple and an aligned float array."""
+    return tuple(values), np.fromiter(values.values(), dtype=float, count=len(values))
+
+
+def _stack_series(
+    series: Mapping[str, list[float]], n_times: int
+) -> tuple[tuple[str, ...], np.ndarray]:
+    """Stack ``{id: [value, ...]}`` into an ID tuple and an ``(n_ids, n_times)`` array."""
+    if not series:
+        return (), np.zeros((0, n_times))
+    return tuple(series), np.array([list(v) for v in series.values()], dtype=float)
+
+
+@dataclass(init=False)
 class FBAResult:
     """
     Output of :meth:`MetabolicSimulator.run_fba`.
 
+    Fluxes and shadow prices are held as NumPy arrays aligned with
+    *reaction_ids* / *compound_ids*; :attr:`fluxes` and :attr:`shadow_prices`
+    expose them as lazy read-only dict views.  The pre-array keywords
+    ``fluxes=`` / ``shadow_prices=`` (dicts) are still accepted by the
+    constructor, and pickles of the old layout load.
+
     :param status: ``"optimal"``, ``"infeasible"``, or ``"error"``.
     :param objective_value: Value of the optimised flux (``None`` on failure).
-    :param fluxes: Map ``{reaction_id: flux}`` for all reactions in scope.
-    :param shadow_prices: Map ``{compound_id: dual_value}`` (opportunity cost per unit
-        of relaxing the steady-state constraint).
+    :param reaction_ids: Reaction IDs, one per entry of *flux_values*.
+    :param flux_values: Optimal flux per reaction.
+    :param compound_ids: Compound IDs, one per entry of *shadow_values*.
+    :param shadow_values: Dual value per compound (opportunity cost per unit
+        of relaxing the steady-state constraint); empty if unavailable.
     :param message: Human-readable solver message.
+    :param fluxes: Legacy ``{reaction_id: flux}``; replaces *reaction_ids* /
+        *flux_values*.
+    :param shadow_prices: Legacy ``{compound_id: dual_value}``; replaces
+        *compound_ids* / *shadow_values*.
     """
 
     status: str
     objective_value: float | None
-    fluxes: dict[str, float]
-    shadow_prices: dict[str, float]
-    message: str
+    reaction_ids: tuple[str, ...] = ()
+    flux_values: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    compound_ids: tuple[str, ...] = ()
+    shadow_values: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    message: str = ""
 
+    def __init__(
+        self,
+        status: str,
+        objective_value: float | None,
+        reaction_ids: tuple[str, ...] = (),
+        flux_values: np.ndarray | None = None,
+        compound_ids: tuple[str, ...] = (),
+        shadow_values: np.ndarray | None = None,
+        message: str = "",
+        *,
+        fluxes: Mapping[str, float] | None = None,
+        shadow_prices: Mapping[str, float] | None = None,
+    ) -> None:
+        if fluxes is not None:
+            reaction_ids, flux_values = _split_mapping(fluxes)
+        if shadow_prices is not None:
+            compound_ids, shadow_values = _split_mapping(shadow_prices)
+        self.status = status
+        self.objective_value = objective_value
+        self.reaction_ids = tuple(reaction_ids)
+        self.flux_values = np.zeros(0) if flux_values is None else flux_values
+        self.compound_ids = tuple(compound_ids)
+        self.shadow_values = np.zeros(0) if shadow_values is None else shadow_values
+        self.message = message
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # Pickles from before the array layout store the dicts themselves
+        if "fluxes" in state or "shadow_prices" in state:
+            state = dict(state)
+            reaction_ids, flux_values = _split_mapping(state.pop("fluxes", None) or {})
+            compound_ids, shadow_values = _split_mapping(state.pop("shadow_prices", None) or {})
+            state.update(
+                reaction_ids=reaction_ids,
+                flux_values=flux_values,
+                compound_ids=compound_ids,
+                shadow_values=shadow_values,
+            )
+        self.__dict__.update(state)
+
+    @classmethod
+    def empty(cls, status: str, message: str) -> FBAResult:
+        """Return a result with no fluxes, used for failed or empty runs."""
+        return cls(status=status, objective_value=None, message=message)
+
+    @property
+    def fluxes(self) -> ArrayView:
+        """Map ``{reaction_id: flux}`` for all reactions in scope."""
+        return ArrayView(self.reaction_ids, self.flux_values)
+
+    @property
+    def shadow_prices(self) -> ArrayView:
+        """Map ``{compound_id: dual_value}``; empty if the solver gave no duals."""
+        if len(self.shadow_values) != len(self.compound_ids):
+            return ArrayView((), self.shadow_values[:0])
+        return ArrayView(self.compound_ids, self.shadow_values)
+
+    def to_npz(self, path: str | Path, *, compressed: bool = False) -> None:
+        """
+        Write the result arrays and IDs to a NumPy ``.npz`` archive.
 
-@dataclass
+        :param path: Destination file.
+        :param compressed: Use :func:`numpy.savez_compressed` instead of plain ``savez``.
+        """
+        save = np.savez_compressed if compressed else np.savez
+        save(
+            path,
+            status=np.array(self.status),
+            objective_value=np.array(
+                np.nan if self.objective_value is None else self.objective_value
+            ),
+            reaction_ids=np.array(self.reaction_ids, dtype=str),
+            flux_values=self.flux_values,
+            compound_ids=np.array(self.compound_ids, dtype=str),
+            shadow_values=self.shadow_values,
+            message=np.array(self.message),
+        )
+
+    @classmethod
+    def from_npz(cls, path: str | Path) -> FBAResult:
+        """Load a result written by :meth:`to_npz`."""
+        with np.load(path) as data:
+            obj = float(data["objective_value"])
+            return cls(
+                status=str(data["status"]),
+                objective_value=None if np.isnan(obj) else obj,
+                reaction_ids=tuple(data["reaction_ids"].tolist()),
+                flux_values=data["flux_values"],
+                compound_ids=tuple(data["compound_ids"].tolist()),
+                shadow_values=data["shadow_values"],
+                message=str(data["message"]),
+            )
+
+    def to_arrow(self):
+        """
+        Return fluxes as a ``pyarrow.Table`` with ``reaction_id`` and ``flux`` columns.
+
+        The flux column wraps :attr:`flux_values` without copying.
+
+        :raises ImportError: If ``pyarrow`` is not installed.
+        """
+        pa = _require_pyarrow()
+        return pa.table(
+            {
+                "reaction_id": pa.array(self.reaction_ids, type=pa.string()),
+                "flux": pa.array(self.flux_values),
+            },
+            metadata={"status": self.status, "objective_value": str(self.objective_value)},
+        )
+
+
+@dataclass(init=False)
 class ODEResult:
     """
     Output of :meth:`MetabolicSimulator.run_ode`.
 
+    Trajectories are held as a single ``(n_compounds, n_times)`` array; the
+    list/dict accessors :attr:`t` and :attr:`concentrations` are built on
+    demand for backward compatibility.  The constructor also accepts the
+    pre-array keywords ``t=`` (list) and ``concentrations=`` (dict of lists),
+    and pickles of the old layout load.
+
     :param status: ``"ok"``, ``"failed"``, or ``"error"``.
-    :param t: List of time-point values.
-    :param concentrations: Map ``{compound_id: [concentration, ...]}``.
+    :param time: Time points, shape ``(n_times,)``.
+    :param y: Concentrations, shape ``(n_compounds, n_times)``; row *i* belongs
+        to ``compound_ids[i]``.
+    :param compound_ids: Compound IDs in row order.
+    :param message: Human-readable solver message.
+    :param t_steady: Time at which integration stopped on the steady-state event,
+        or ``None`` if it ran to ``t_end``.
+    :param method: Solver(s) used, in order, e.g. ``"BDF"`` or ``"RK45→BDF"``
+        after an automatic switch.
+    :param stiffness_ratio: Jacobian spectrum spread estimated by
+        ``ode_method="auto"`` (``None`` for fixed methods).
+    :param timings: Wall-clock seconds per phase: ``setup`` (model assembly),
+        ``stiffness`` (spectrum estimate), ``integrate`` and ``total``.
+    :param t: Legacy list of time points; replaces *time*.
+    :param concentrations: Legacy ``{compound_id: [concentration, ...]}``;
+        replaces *y* / *compound_ids*.
+    """
+
+    status: str
+    time: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    y: np.ndarray = field(default_factory=lambda: np.zeros((0, 0)))
+    compound_ids: tuple[str, ...] = ()
+    message: str = ""
+    t_steady: float | None = None
+    method: str = ""
+    stiffness_ratio: float | None = None
+    timings: dict[str, float] = field(default_factory=dict)
+
+    def __init__(
+        self,
+        status: str,
+        time: np.ndarray | None = None,
+        y: np.ndarray | None = None,
+        compound_ids: tuple[str, ...] = (),
+        message: str = "",
+        t_steady: float | None = None,
+        method: str = "",
+        stiffness_ratio: float | None = None,
+        timings: dict[str, float] | None = None,
+        *,
+        t: list[float] | None = None,
+        concentrations: Mapping[str, list[float]] | None = None,
+    ) -> None:
+        if t is not None:
+            time = np.asarray(t, dtype=float)
+        if concentrations is not None:
+            compound_ids, y = _stack_series(concentrations, 0 if time is None else len(time))
+        self.status = status
+        self.time = np.zeros(0) if time is None else time
+        self.y = np.zeros((0, len(self.time))) if y is None else y
+        self.compound_ids = tuple(compound_ids)
+        self.message = message
+        self.t_steady = t_steady
+        self.method = method
+        self.stiffness_ratio = stiffness_ratio
+        self.timings = {} if timings is None else timings
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # Pickles from before the array layout store the list and dict themselves
+        if "t" in state or "concentrations" in state:
+            state = dict(state)
+            time = np.asarray(state.pop("t", None) or [], dtype=float)
+            compound_ids, y = _stack_series(state.pop("concentrations", None) or {}, len(time))
+            state.update(time=time, y=y, compound_ids=compound_ids)
+            state.setdefault("method", "")
+            state.setdefault("stiffness_ratio", None)
+            state.setdefault("timings", {})
+        self.__dict__.update(state)
+
+    @classmethod
+    def empty(cls, status: str, message: str) -> ODEResult:
+        """Return a result with no trajectory, used for failed or empty runs."""
+        return cls(status=status, message=message)
+
+    @cached_property
+    def index(self) -> dict[str, int]:
+        """Map ``{compound_id: row}`` into :attr:`y`."""
+        return {cpd_id: i for i, cpd_id in enumerate(self.compound_ids)}
+
+    @property
+    def t(self) -> list[float]:
+        """Time points as a list."""
+        return self.time.tolist()
+
+    @property
+    def concentrations(self) -> ArrayView:
+        """Map ``{compound_id: [concentration, ...]}`` (rows converted on access)."""
+        return ArrayView(self.compound_ids, self.y, self.index)
+
+    def series(self, compound_id: str) -> np.ndarray:
+        """Return the concentration trajectory of *compound_id* as an array view."""
+        return self.y[self.index[compound_id]]
+
+    def final_concentrations(self) -> dict[str, float]:
+        """Map ``{compound_id: concentration}`` at the last time point."""
+        if self.y.shape[1] == 0:
+            return {}
+        return dict(zip(self.compound_ids, self.y[:, -1].tolist()))
+
+    def to_npz(self, path: str | Path, *, compressed: bool = False) -> None:
+        """
+        Write the trajectory arrays and IDs to a NumPy ``.npz`` archive.
+
+        :param path: Destination file.
+        :param compressed: Use :func:`numpy.savez_compressed` instead of plain ``savez``.
+        """
+        save = np.savez_compressed if compressed else np.savez
+        save(
+            path,
+            status=np.array(self.status),
+            time=self.time,
+            y=self.y,
+            compound_ids=np.array(self.compound_ids, dtype=str),
+            message=np.array(self.message),
+            t_steady=np.array(np.nan if self.t_steady is None else self.t_steady),
+            method=np.array(self.method),
+            stiffness_ratio=np.array(
+                np.nan if self.stiffness_ratio is None else self.stiffness_ratio
+            ),
+            timings=np.array(json.dumps(self.timings)),
+        )
+
+    @classmethod
+    def from_npz(cls, path: str | Path) -> ODEResult:
+        """Load a result written by :meth:`to_npz`."""
+        with np.load(path) as data:
+            t_steady = float(data["t_steady"])
+            ratio = float(data["stiffness_ratio"]) if "stiffness_ratio" in data else np.nan
+            return cls(
+                status=str(data["status"]),
+                time=data["time"],
+                y=data["y"],
+                compound_ids=tuple(data["compound_ids"].tolist()),
+                message=str(data["message"]),
+                t_steady=None if np.isnan(t_steady) else t_steady,
+                method=str(data["method"]) if "method" in data else "",
+                stiffness_ratio=None if np.isnan(ratio) else ratio,
+                timings=json.loads(str(data["timings"])) if "timings" in data else {},
+            )
+
+    def to_arrow(self):
+        """
+        Return the trajectory as a wide ``pyarrow.Table``: a ``t`` column plus one
+        column per compound.
+
+        Columns wrap rows of :attr:`y` without copying when the array is
+        C-contiguous.
+
+        :raises ImportError: If ``pyarrow`` is not installed.
+        """
+        pa = _require_pyarrow()
+        columns = {"t": pa.array(self.time)}
+        for i, cpd_id in enumerate(self.compound_ids):
+            columns[cpd_id] = pa.array(self.y[i])
+        return pa.table(columns, metadata={"status": self.status})
+
+
+@dataclass
+class SteadyStateResult:
+    """
+    Output of :meth:`MetabolicSimulator.run_steady_state`.
+
+    :param status: ``"converged"``, ``"not_converged"``, or ``"error"``.
+    :param concentrations: Map ``{compound_id: concentration}`` at the fixed point
+        (or at the last iterate when not converged).
+    :param fluxes: Map ``{reaction_id: rate}`` evaluated at *concentrations*.
+    :param residual: Max-norm of ``dy/dt`` at the returned state.
+    :param method: ``"newton"`` or ``"integration"`` — the stage that produced the state.
+    :param iterations: Newton iterations (or RHS evaluations for the integration fallback).
     :param message: Human-readable solver message.
     """
 
     status: str
-    t: list[float]
-    concentrations: dict[str, list[float]]
+    concentrations: dict[str, float]
+    fluxes: dict[str, float]
+    residual: float | None
+    method: str
+    iterations: int
     message: str
 
 
+@dataclass
+class DFBAResult:
+    """
+    Output of :meth:`MetabolicSimulator.run_dfba`.
+
+    Column *k* of *fluxes* is the FBA solution at ``time[k]``; it is held
+    constant over the step to ``time[k + 1]``.
+
+    :param status: ``"depleted"`` (every substrate used up), ``"completed"``
+        (reached ``t_end``), ``"stalled"`` (nothing left changes),
+        ``"infeasible"`` or ``"error"``.
+    :param time: Step times, shape ``(n_times,)``.
+    :param uptake_ids: Exchange reaction IDs, one per row of *substrates*.
+    :param substrates: External substrate concentrations, shape ``(n_uptake, n_times)``.
+    :param reaction_ids: Reaction IDs, one per row of *fluxes*.
+    :param fluxes: FBA fluxes, shape ``(n_reactions, n_times)``.
+    :param biomass: Biomass per time point, or ``None`` when fluxes are absolute rates.
+    :param n_lp: LP solves performed.
+    :param backend: ``"highs"`` (one hot-started HiGHS model) or ``"linprog"``.
+    :param message: Human-readable summary.
+    """
+
+    status: str
+    time: np.ndarray
+    uptake_ids: tuple[str, ...]
+    substrates: np.ndarray
+    reaction_ids: tuple[str, ...]
+    fluxes: np.ndarray
+    biomass: np.ndarray | None = None
+    n_lp: int = 0
+    backend: str = ""
+    message: str = ""
+
+    @classmethod
+    def empty(cls, status: str, message: str) -> DFBAResult:
+        """Return a result with no time points, for runs that fail before the first step."""
+        return cls(status, np.zeros(0), (), np.zeros((0, 0)), (), np.zeros((0, 0)), message=message)
+
+    def substrate(self, reaction_id: str) -> np.ndarray:
+        """Time-course of the substrate taken up by exchange *reaction_id*."""
+        return self.substrates[self.uptake_ids.index(reaction_id)]
+
+    def flux(self, reaction_id: str) -> np.ndarray:
+        """Time-course of the flux through *reaction_id*."""
+        return self.fluxes[self.reaction_ids.index(reaction_id)]
+
+
 @dataclass
 class WhatIfResult:
     """
@@ -195,30 +735,809 @@ class WhatIfResult:
     mode: str
 
 
+# ---------------------------------------------------------------------------
+# Vectorised kinetic model
+# ---------------------------------------------------------------------------
+
+
+def _saturation(conc: np.ndarray, km: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(conc / (km + conc), d/dconc)`` elementwise, zero where the denominator is not positive."""
+    denom = km + conc
+    ok = denom > 0
+    safe = np.where(ok, denom, 1.0)
+    sat = np.where(ok, conc / safe, 0.0)
+    dsat = np.where(ok, km / (safe * safe), 0.0)
+    return sat, dsat
+
+
+def _products(rxn: np.ndarray, sat: np.ndarray, base: np.ndarray) -> np.ndarray:
+    """Evaluate ``base_j · Π_k sat_k`` per reaction."""
+    prod = base.copy()
+    np.multiply.at(prod, rxn, sat)
+    return prod
+
+
+def _product_partials(
+    rxn: np.ndarray, sat: np.ndarray, dsat: np.ndarray, base: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Evaluate ``base_j · Π_k sat_k`` per reaction and its partial derivative per entry.
+
+    A factor's partial is the product of the *other* factors times its
+    derivative.  Zero factors are handled without division: a reaction with
+    one zero factor has a nonzero partial only at that entry, and a reaction
+    with two or more has none.
+
+    :param rxn: Reaction index of each saturation entry.
+    :param sat: Saturation factor of each entry.
+    :param dsat: Derivative of each saturation factor w.r.t. its concentration.
+    :param base: Per-reaction prefactor (Vmax or reverse Vmax).
+    :return: ``(products, partials)`` — per-reaction products and per-entry derivatives.
+    """
+    nz = sat > 0
+    n_zero = np.bincount(rxn[~nz], minlength=len(base))  # zero factors per reaction
+    zeros = n_zero[rxn]
+    nz_prod = _products(rxn[nz], sat[nz], base)  # product of the nonzero factors
+    partial = np.zeros_like(sat)
+    whole = nz & (zeros == 0)
+    partial[whole] = nz_prod[rxn[whole]] / sat[whole] * dsat[whole]
+    single = ~nz & (zeros == 1)
+    partial[single] = nz_prod[rxn[single]] * dsat[single]
+    prod = np.where(n_zero > 0, 0.0, nz_prod)
+    return prod, partial
+
+
+@dataclass
+class KineticModel:
+    """
+    Michaelis-Menten rate model compiled into flat NumPy arrays.
+
+    Substrate and product participations are stored as parallel index arrays
+    so that rates, ``dy/dt = S·v(y)`` and the analytic Jacobian are evaluated
+    without Python-level loops over reactions.
+
+    :param rxn_ids: Reaction IDs (columns of *S*).
+    :param cpd_ids: Compound IDs (rows of *S*).
+    :param S: Stoichiometric matrix ``(n_cpd, n_rxn)``.
+    :param vmax: Per-reaction Vmax.
+    :param keq: Per-reaction equilibrium constant (Haldane reverse term).
+    :param reversible: Per-reaction reversibility flags.
+    :param sub_rxn: Reaction index of each substrate participation.
+    :param sub_cpd: Compound index of each substrate participation.
+    :param sub_km: Km of each substrate participation.
+    :param prd_rxn: Reaction index of each product participation.
+    :param prd_cpd: Compound index of each product participation.
+    :param prd_km: Effective product Km (``Km · Keq``) of each participation.
+    """
+
+    rxn_ids: list[str]
+    cpd_ids: list[str]
+    S: np.ndarray
+    vmax: np.ndarray
+    keq: np.ndarray
+    reversible: np.ndarray
+    sub_rxn: np.ndarray
+    sub_cpd: np.ndarray
+    sub_km: np.ndarray
+    prd_rxn: np.ndarray
+    prd_cpd: np.ndarray
+    prd_km: np.ndarray
+
+    @classmethod
+    def from_matrix(
+        cls,
+        rxn_ids: list[str],
+        cpd_ids: list[str],
+        S: np.ndarray,
+        rev_flags: dict[str, bool],
+        kparams: dict[str, dict],
+        *,
+        default_vmax: float,
+        default_km: float,
+        default_keq: float,
+    ) -> KineticModel:
+        """
+        Compile a model from a stoichiometric matrix and per-reaction kinetic parameters.
+
+        :param rxn_ids: Reaction IDs (columns of *S*).
+        :param cpd_ids: Compound IDs (rows of *S*).
+        :param S: Stoichiometric matrix.
+        :param rev_flags: ``{reaction_id: reversible}``.
+        :param kparams: Output of :meth:`MetabolicSimulator._build_kinetic_params`.
+        :param default_vmax: Vmax used when none is stored.
+        :param default_km: Km used when none is stored.
+        :param default_keq: Keq used when none is stored.
+        :return: Compiled :class:`KineticModel`.
+        """
+        n_rxn = len(rxn_ids)
+        vmax = np.empty(n_rxn)
+        keq = np.empty(n_rxn)
+        reversible = np.empty(n_rxn, dtype=bool)
+        sub_rxn: list[int] = []
+        sub_cpd: list[int] = []
+        sub_km: list[float] = []
+        prd_rxn: list[int] = []
+        prd_cpd: list[int] = []
+        prd_km: list[float] = []
+
+        for j, rxn_id in enumerate(rxn_ids):
+            kp = kparams.get(rxn_id, {})
+            v = kp.get("vmax")
+            vmax[j] = default_vmax if v is None else v
+            km_default = kp.get("km") or default_km
+            km_by_sub = kp.get("km_by_substrate", {})
+            keq[j] = max(kp.get("equilibrium_constant") or default_keq, 1e-12)
+            reversible[j] = rev_flags.get(rxn_id, True)
+            col = S[:, j]
+            for i in np.flatnonzero(col < -1e-10):
+                sub_rxn.append(j)
+                sub_cpd.append(int(i))
+                sub_km.append(km_by_sub.get(cpd_ids[i], km_default))
+            for i in np.flatnonzero(col > 1e-10):
+                prd_rxn.append(j)
+                prd_cpd.append(int(i))
+                prd_km.append(km_by_sub.get(cpd_ids[i], km_default) * keq[j])
+
+        return cls(
+            rxn_ids=list(rxn_ids),
+            cpd_ids=list(cpd_ids),
+            S=S,
+            vmax=vmax,
+            keq=keq,
+            reversible=reversible,
+            sub_rxn=np.array(sub_rxn, dtype=np.intp),
+            sub_cpd=np.array(sub_cpd, dtype=np.intp),
+            sub_km=np.array(sub_km, dtype=float),
+            prd_rxn=np.array(prd_rxn, dtype=np.intp),
+            prd_cpd=np.array(prd_cpd, dtype=np.intp),
+            prd_km=np.array(prd_km, dtype=float),
+        )
+
+    @property
+    def _has_sub(self) -> np.ndarray:
+        mask = np.zeros(len(self.rxn_ids), dtype=bool)
+        mask[self.sub_rxn] = True
+        return mask
+
+    @property
+    def _rev_active(self) -> np.ndarray:
+        """Reactions whose Haldane reverse term contributes (reversible, with products)."""
+        mask = np.zeros(len(self.rxn_ids), dtype=bool)
+        mask[self.prd_rxn] = True
+        return mask & self.reversible & self._has_sub
+
+    def _terms(self, y: np.ndarray) -> tuple[np.ndarray, ...]:
+        yc = np.maximum(y, 0.0)
+        s_sat, s_dsat = _saturation(yc[self.sub_cpd], self.sub_km)
+        p_sat, p_dsat = _saturation(yc[self.prd_cpd], self.prd_km)
+        # Clamped region (y < 0) has zero derivative
+        s_dsat = s_dsat * (y[self.sub_cpd] >= 0)
+        p_dsat = p_dsat * (y[self.prd_cpd] >= 0)
+        fwd, d_fwd = _product_partials(self.sub_rxn, s_sat, s_dsat, self.vmax)
+        rev, d_rev = _product_partials(self.prd_rxn, p_sat, p_dsat, self.vmax / self.keq)
+        return fwd, d_fwd, rev, d_rev
+
+    def rates(self, y: np.ndarray) -> np.ndarray:
+        """
+        Reaction rates ``v(y)`` for concentration vector *y* (negatives clamped to zero).
+
+        :param y: Concentrations, shape ``(n_cpd,)``.
+        :return: Rates, shape ``(n_rxn,)``.
+        """
+        yc = np.maximum(y, 0.0)
+        fwd = _products(self.sub_rxn, _saturation(yc[self.sub_cpd], self.sub_km)[0], self.vmax)
+        rev = _products(
+            self.prd_rxn, _saturation(yc[self.prd_cpd], self.prd_km)[0], self.vmax / self.keq
+        )
+        v = np.where(self._rev_active, fwd - rev, fwd)
+        return np.where(self._has_sub, v, 0.0)
+
+    def rhs(self, y: np.ndarray) -> np.ndarray:
+        """Return ``dy/dt = S·v(y)``."""
+        return self.S @ self.rates(y)
+
+    def rate_jacobian(self, y: np.ndarray) -> np.ndarray:
+        """
+        Unscaled elasticity matrix ``∂v/∂y``.
+
+        :param y: Concentrations, shape ``(n_cpd,)``.
+        :return: Array of shape ``(n_rxn, n_cpd)``.
+        """
+        _, d_fwd, _, d_rev = self._terms(y)
+        jv = np.zeros((len(self.rxn_ids), len(self.cpd_ids)))
+        np.add.at(jv, (self.sub_rxn, self.sub_cpd), d_fwd)
+        rev_entries = self._rev_active[self.prd_rxn]
+        np.add.at(jv, (self.prd_rxn[rev_entries], self.prd_cpd[rev_entries]), -d_rev[rev_entries])
+        return jv
+
+    def jacobian(self, y: np.ndarray) -> np.ndarray:
+        """Return ``∂(dy/dt)/∂y = S·∂v/∂y``, shape ``(n_cpd, n_cpd)``."""
+        return self.S @ self.rate_jacobian(y)
+
+
+# ---------------------------------------------------------------------------
+# Conservation moieties
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ConservationLaws:
+    """
+    Linear conservation relations of a stoichiometric matrix.
+
+    Species are split into an independent set, whose rows of ``S`` are
+    linearly independent, and a dependent set satisfying
+    ``S[dependent] = link · S[independent]``.  Each dependent species is then
+    fixed by the independent ones and a conserved total::
+
+        y[dependent] = totals + link · y[independent]
+
+    so ATP/ADP/AMP, NAD⁺/NADH and similar pools drop out of the ODE system.
+    The rows of :meth:`left_null_space` are the conserved moieties.
+
+    :param n_species: Number of species (rows of ``S``).
+    :param independent: Row indices of the independent species.
+    :param dependent: Row indices of the dependent species.
+    :param link: Link matrix, shape ``(len(dependent), len(independent))``.
+    """
+
+    n_species: int
+    independent: np.ndarray
+    dependent: np.ndarray
+    link: np.ndarray
+
+    @classmethod
+    def from_stoichiometry(cls, S: np.ndarray, *, tol: float = 1e-9) -> ConservationLaws:
+        """
+        Detect conservation relations in *S*.
+
+        Species are first grouped into connected components of the
+        species–reaction graph (a sparse operation); a rank-revealing QR of
+        each component's block then picks its independent rows.  Cost is
+        dominated by the largest component instead of the full network.
+
+        :param S: Stoichiometric matrix, shape ``(n_cpd, n_rxn)``.
+        :param tol: Relative threshold on the QR diagonal for rank decisions.
+        :return: :class:`ConservationLaws` for *S*.
+        """
+        n_cpd = S.shape[0]
+        pattern = csr_matrix(S != 0, dtype=np.int8)
+        n_comp, labels = connected_components(pattern @ pattern.T, directed=False)
+
+        independent: list[int] = []
+        dependent: list[int] = []
+        blocks: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        for comp in range(n_comp):
+            rows = np.flatnonzero(labels == comp)
+            block = S[rows]
+            if not block.any():
+                dependent.extend(rows.tolist())  # isolated, constant species
+                continue
+            _, r, piv = qr(block.T, mode="economic", pivoting=True)
+            diag = np.abs(np.diag(r))
+            rank = int(np.sum(diag > tol * diag[0]))
+            ind_rows = np.sort(rows[piv[:rank]])
+            dep_rows = np.sort(rows[piv[rank:]])
+            independent.extend(ind_rows.tolist())
+            dependent.extend(dep_rows.tolist())
+            if len(dep_rows):
+                coeffs = lstsq(S[ind_rows].T, S[dep_rows].T)[0].T
+                coeffs[np.abs(coeffs) < tol] = 0.0
+                blocks.append((dep_rows, ind_rows, coeffs))
+
+        ind = np.array(sorted(independent), dtype=np.intp)
+        dep = np.array(sorted(dependent), dtype=np.intp)
+        link = np.zeros((len(dep), len(ind)))
+        ind_pos = {int(c): k for k, c in enumerate(ind)}
+        dep_pos = {int(c): k for k, c in enumerate(dep)}
+        for dep_rows, ind_rows, coeffs in blocks:
+            link[
+                np.ix_([dep_pos[int(c)] for c in dep_rows], [ind_pos[int(c)] for c in ind_rows])
+            ] = coeffs
+        return cls(n_species=n_cpd, independent=ind, dependent=dep, link=link)
+
+    @property
+    def n_conserved(self) -> int:
+        """Number of conserved moieties (eliminated species)."""
+        return len(self.dependent)
+
+    def left_null_space(self) -> np.ndarray:
+        """
+        Return a basis ``G`` of the left null space of ``S`` (``G·S = 0``).
+
+        :return: Array of shape ``(n_conserved, n_species)``; row *k* gives the
+            coefficients of the *k*-th conserved moiety.
+        """
+        g = np.zeros((self.n_conserved, self.n_species))
+        g[np.arange(self.n_conserved), self.dependent] = 1.0
+        g[:, self.independent] = -self.link
+        return g
+
+    def totals(self, y: np.ndarray) -> np.ndarray:
+        """Conserved totals implied by the full state *y*."""
+        return y[self.dependent] - self.link @ y[self.independent]
+
+    def reduce(self, y: np.ndarray) -> np.ndarray:
+        """Project the full state *y* onto the independent species."""
+        return y[self.independent]
+
+    def expand(self, x: np.ndarray, totals: np.ndarray) -> np.ndarray:
+        """
+        Reconstruct full concentrations from independent species.
+
+        :param x: Independent concentrations, shape ``(n_ind,)`` or ``(n_ind, n_t)``.
+        :param totals: Conserved totals from :meth:`totals`.
+        :return: Full concentrations, shape ``(n_species,)`` or ``(n_species, n_t)``.
+        """
+        y = np.empty((self.n_species,) + x.shape[1:])
+        y[self.independent] = x
+        dep = self.link @ x
+        y[self.dependent] = dep + (totals if x.ndim == 1 else totals[:, None])
+        return y
+
+    def expansion_matrix(self) -> np.ndarray:
+        """Return ``∂y/∂x``, shape ``(n_species, n_ind)``."""
+        m = np.zeros((self.n_species, len(self.independent)))
+        m[self.independent, np.arange(len(self.independent))] = 1.0
+        m[self.dependent] = self.link
+        return m
+
+
+@dataclass
+class ReducedKineticModel:
+    """
+    A :class:`KineticModel` restricted to its independent species.
+
+    Exposes the same ``rhs`` / ``jacobian`` interface over the reduced state
+    ``x`` so it can be handed to the integrators unchanged; the Jacobian is
+    ``S[independent] · ∂v/∂y · ∂y/∂x`` and, unlike the full one, is not
+    singular because of conserved pools.
+
+    :param model: Full kinetic model.
+    :param laws: Conservation relations of ``model.S``.
+    :param totals: Conserved totals fixed by the initial state.
+    """
+
+    model: KineticModel
+    laws: ConservationLaws
+    totals: np.ndarray
+    _S_ind: np.ndarray = field(init=False, repr=False)
+    _dy_dx: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._S_ind = self.model.S[self.laws.independent]
+        self._dy_dx = self.laws.expansion_matrix()
+
+    def expand(self, x: np.ndarray) -> np.ndarray:
+        """Full concentrations for reduced state *x* (1-D or ``(n_ind, n_t)``)."""
+        return self.laws.expand(x, self.totals)
+
+    def rhs(self, x: np.ndarray) -> np.ndarray:
+        """Return ``dx/dt`` for the independent species."""
+        return self._S_ind @ self.model.rates(self.expand(x))
+
+    def jacobian(self, x: np.ndarray) -> np.ndarray:
+        """Return ``∂(dx/dt)/∂x``, shape ``(n_ind, n_ind)``."""
+        return self._S_ind @ self.model.rate_jacobian(self.expand(x)) @ self._dy_dx
+
+
+# ---------------------------------------------------------------------------
+# Solver selection
+# ---------------------------------------------------------------------------
+
+
+def stiffness_ratio(jac: np.ndarray, span: float) -> tuple[float, float]:
+    """
+    Estimate the stiffness of ``dy/dt = f(y)`` from its Jacobian.
+
+    The ratio compares the fastest mode (spectral radius) with the slowest
+    decaying one, floored at ``1 / span`` so modes slower than the integration
+    window do not inflate it.  Above :data:`_EIG_MAX_SIZE` species the
+    spectral radius is bounded by Gershgorin discs instead of a dense
+    eigendecomposition, which can only overestimate stiffness.
+
+    :param jac: Jacobian ``∂f/∂y`` at a representative state.
+    :param span: Length of the integration window.
+    :return: ``(ratio, fastest_rate)``.
+    """
+    n = jac.shape[0]
+    floor = 1.0 / span if span > 0 else 1.0
+    if n == 0:
+        return 1.0, 0.0
+    if n > _EIG_MAX_SIZE:
+        fast = float(np.max(np.abs(jac).sum(axis=1)))
+        return max(fast, floor) / floor, fast
+    eig = np.linalg.eigvals(jac)
+    fast = float(np.max(np.abs(eig)))
+    decay = np.abs(eig.real)
+    decay = decay[decay > max(fast * 1e-9, 1e-300)]
+    slow = max(float(decay.min()) if decay.size else floor, floor)
+    return max(fast, slow) / slow, fast
+
+
+def choose_ode_method(ratio: float, n_species: int, rtol: float) -> str:
+    """
+    Pick a ``solve_ivp`` method for a system with the given stiffness ratio.
+
+    Non-stiff systems use ``"RK45"`` (``"DOP853"`` for tight tolerances);
+    stiff systems use ``"BDF"``, or ``"Radau"`` for small systems at tight
+    tolerances where its higher order pays off.
+    """
+    if ratio <= STIFFNESS_RATIO:
+        return "DOP853" if rtol < 1e-6 else "RK45"
+    return "Radau" if rtol < 1e-6 and n_species <= 50 else "BDF"
+
+
+def _collapse_event(span: float) -> Callable[[float, np.ndarray], float]:
+    """
+    Terminal event that fires once an explicit solver's steps stay tiny.
+
+    ``solve_ivp`` evaluates events once per accepted step, so successive
+    calls give the step sizes.
+    """
+    h_crit = span / _EXPLICIT_STEP_BUDGET
+    state: dict[str, Any] = {"t": None, "small": 0, "hit": False}
+
+    def collapsed(t: float, _y: np.ndarray) -> float:
+        if state["hit"]:  # root finding between the last good step and now
+            return 1.0 if t <= state["t"] else -1.0
+        prev = state["t"]
+        if prev is not None and t > prev:
+            state["small"] = state["small"] + 1 if t - prev < h_crit else 0
+            if state["small"] >= _COLLAPSE_STEPS:
+                state["hit"] = True
+                return -1.0
+            state["t"] = t
+        elif prev is None:
+            state["t"] = t
+        return 1.0
+
+    collapsed.terminal, collapsed.direction = True, -1  # type: ignore[attr-defined]
+    return collapsed
+
+
+@dataclass
+class _Solution:
+    """``solve_ivp``-shaped result stitched from runs with different methods."""
+
+    t: np.ndarray
+    y: np.ndarray
+    sol: OdeSolution | None
+    status: int
+    message: str
+    t_events: list
+    y_events: list
+
+    @property
+    def success(self) -> bool:
+        return self.status >= 0
+
+
+class _SwitchingSolver:
+    """
+    Drop-in for :func:`scipy.integrate.solve_ivp` that changes method mid-run.
+
+    Explicit runs carry a step-collapse event and continue with ``"BDF"`` from
+    the collapse point; an implicit run that fails is retried from its last
+    state with the other implicit method.  The current method persists across
+    calls, so later segments of the same simulation keep the stiff solver.
+
+    :param method: Initial method.
+    :param jac: Analytic Jacobian ``jac(t, y)`` for implicit methods.
+    """
+
+    def __init__(self, method: str, jac: Callable[[float, np.ndarray], np.ndarray]) -> None:
+        self.method = method
+        self.jac = jac
+        self.methods: list[str] = [method]
+
+    @property
+    def label(self) -> str:
+        """Methods used so far, joined with ``→``."""
+        return "→".join(self.methods)
+
+    def _switch(self, method: str) -> None:
+        self.method = method
+        self.methods.append(method)
+
+    def __call__(
+        self,
+        fun: Callable,
+        t_span: tuple[float, float],
+        y0: np.ndarray,
+        *,
+        events: Any = None,
+        **kwargs: Any,
+    ) -> _Solution:
+        if events is None:
+            user_events = []
+        else:
+            user_events = list(events) if isinstance(events, (list, tuple)) else [events]
+        kwargs.pop("method", None)
+        kwargs["dense_output"] = True
+        t0, t1 = t_span
+        pieces: list = []
+        retried = False
+        while True:
+            kw = _fit_first_step(dict(kwargs), t0, t1)
+            evs = list(user_events)
+            if self.method in _IMPLICIT_METHODS:
+                kw["jac"] = self.jac
+            if self.method in _EXPLICIT_METHODS:
+                evs.append(_collapse_event(t1 - t0))
+            sol = solve_ivp(fun, (t0, t1), y0, method=self.method, events=evs or None, **kw)
+            pieces.append(sol)
+            user_hit = sol.status == 1 and any(
+                len(te) for te in (sol.t_events or [])[: len(user_events)]
+            )
+            t_last = float(sol.t[-1])
+            if sol.status == 1 and not user_hit and t_last < t1:
+                self._switch("BDF")  # explicit step size collapsed
+            elif sol.status == -1 and not retried:
+                retried = True
+                self._switch("Radau" if self.method == "BDF" else "BDF")
+            else:
+                return self._stitch(pieces, len(user_events))
+            t0, y0 = t_last, sol.y[:, -1]
+
+    @staticmethod
+    def _stitch(pieces: list, n_events: int) -> _Solution:
+        last = pieces[-1]
+        t_events = list(last.t_events[:n_events]) if last.t_events is not None else []
+        y_events = list(last.y_events[:n_events]) if last.y_events is not None else []
+        if len(pieces) == 1:
+            return _Solution(
+                last.t, last.y, last.sol, last.status, last.message, t_events, y_events
+            )
+        dense = [p.sol for p in pieces if p.sol is not None and len(p.t) > 1]
+        ts = np.concatenate([dense[0].ts] + [d.ts[1:] for d in dense[1:]])
+        interpolants = [ip for d in dense for ip in d.interpolants]
+        return _Solution(
+            t=np.concatenate([pieces[0].t] + [p.t[1:] for p in pieces[1:]]),
+            y=np.hstack([pieces[0].y] + [p.y[:, 1:] for p in pieces[1:]]),
+            sol=OdeSolution(ts, interpolants),
+            status=last.status,
+            message=last.message,
+            t_events=t_events,
+            y_events=y_events,
+        )
+
+
+def _fit_first_step(kwargs: dict, t0: float, t1: float) -> dict:
+    """
+    Return *kwargs* with ``first_step`` no longer than the span ``t0 → t1``.
+
+    :func:`~scipy.integrate.solve_ivp` rejects a first step that exceeds the
+    integration interval, which happens for short segments and windows.
+    """
+    first = kwargs.get("first_step")
+    span = abs(t1 - t0)
+    if first is None or first <= span:
+        return kwargs
+    clamped = dict(kwargs)
+    if span > 0:
+        clamped["first_step"] = span
+    else:
+        del clamped["first_step"]
+    return clamped
+
+
+def _evaluate_segments(segments: list, times: np.ndarray) -> np.ndarray:
+    """
+    Evaluate a piecewise dense-output solution at *times*.
+
+    :param segments: ``solve_ivp`` results (with ``dense_output=True``) in time order.
+    :param times: Sorted sample times within the integrated span.
+    :return: Array ``(n_cpd, len(times))``.
+    """
+    n = segments[0].y.shape[0]
+    out = np.empty((n, len(times)))
+    filled = np.zeros(len(times), dtype=bool)
+    for seg in segments:
+        lo, hi = seg.t[0], seg.t[-1]
+        mask = (times >= lo) & (times <= hi) & ~filled
+        if mask.any():
+            out[:, mask] = seg.sol(times[mask]) if seg.sol is not None else seg.y[:, [-1]]
+            filled |= mask
+    if not filled.all():
+        out[:, ~filled] = segments[-1].y[:, [-1]]
+    return out
+
+
+def _adaptive_times(segments: list, n_points: int, atol: float) -> np.ndarray:
+    """
+    Choose up to *n_points* sample times equally spaced in trajectory arc length.
+
+    Arc length combines per-species changes (scaled by each species' range)
+    with elapsed time, so samples crowd into fast transients while flat
+    stretches still receive a few points.
+
+    :param segments: ``solve_ivp`` results in time order.
+    :param n_points: Maximum number of samples.
+    :param atol: Absolute tolerance used as a floor for species scaling.
+    :return: Sorted, unique sample times including both end points.
+    """
+    t = np.concatenate([seg.t for seg in segments])
+    y = np.concatenate([seg.y for seg in segments], axis=1)
+    t, idx = np.unique(t, return_index=True)
+    y = y[:, idx]
+    if len(t) < 2 or n_points < 2:
+        return t[-1:] if n_points < 2 else t
+    scale = np.maximum(np.ptp(y, axis=1), atol)[:, None]
+    dy = np.diff(y, axis=1) / scale
+    dt = np.diff(t) / (t[-1] - t[0])
+    ds = np.sqrt(np.sum(dy * dy, axis=0) + dt * dt)
+    s = np.concatenate([[0.0], np.cumsum(ds)])
+    targets = np.linspace(0.0, s[-1], n_points)
+    return np.unique(np.interp(targets, s, t))
+
+
+# ---------------------------------------------------------------------------
+# Reusable LP
+# ---------------------------------------------------------------------------
+
+
+class ReusableLP:
+    """
+    The FBA programme ``min c·v  s.t.  S·v = 0, lb ≤ v ≤ ub`` kept alive across solves.
+
+    Only column bounds change between solves.  With the HiGHS bindings (see
+    :func:`_load_highs`) the model is passed to the solver once and each
+    :meth:`solve` is hot-started from the previous optimal basis; otherwise
+    the assembled :func:`~scipy.optimize.linprog` inputs are reused and only
+    the bound array is updated.
+
+    :param S: Stoichiometric matrix ``(n_cpd, n_rxn)``.
+    :param c: Objective (minimised).
+    :param lb: Lower bounds.
+    :param ub: Upper bounds.
+    """
+
+    def __init__(self, S: Any, c: np.ndarray, lb: np.ndarray, ub: np.ndarray) -> None:
+        self.c = np.asarray(c, dtype=float)
+        self.bounds = np.column_stack([lb, ub]).astype(float)
+        self.A = csc_matrix(S, dtype=float)
+        self.b = np.zeros(self.A.shape[0])
+        self.n_solves = 0
+        self._hs, self._h = None, None
+        highs = _load_highs()
+        if highs is not None:
+            try:
+                self._hs, cls = highs
+                self._h = cls()
+                self._h.setOptionValue("output_flag", False)
+                self._h.passModel(self._highs_lp())
+            except (AttributeError, TypeError):  # bindings with a different signature
+                self._hs, self._h = None, None
+        self.backend = "highs" if self._h is not None else "linprog"
+
+    def _highs_lp(self) -> Any:
+        hs = self._hs
+        lp = hs.HighsLp()
+        n_row, n_col = self.A.shape
+        lp.num_col_, lp.num_row_ = n_col, n_row
+        lp.col_cost_ = self.c
+        lp.col_lower_ = self.bounds[:, 0].copy()
+        lp.col_upper_ = self.bounds[:, 1].copy()
+        lp.row_lower_ = self.b
+        lp.row_upper_ = self.b
+        lp.a_matrix_.format_ = hs.MatrixFormat.kColwise
+        lp.a_matrix_.num_col_, lp.a_matrix_.num_row_ = n_col, n_row
+        lp.a_matrix_.start_ = self.A.indptr.astype(np.int32)
+        lp.a_matrix_.index_ = self.A.indices.astype(np.int32)
+        lp.a_matrix_.value_ = self.A.data
+        return lp
+
+    def set_bounds(self, cols: np.ndarray, lb: np.ndarray, ub: np.ndarray) -> None:
+        """Replace the bounds of columns *cols*."""
+        self.bounds[cols, 0] = lb
+        self.bounds[cols, 1] = ub
+        if self._h is not None:
+            idx = np.asarray(cols, dtype=np.int32)
+            self._h.changeColsBounds(
+                len(idx), idx, np.asarray(lb, dtype=float), np.asarray(ub, dtype=float)
+            )
+
+    def solve(self) -> tuple[str, np.ndarray | None]:
+        """
+        Solve with the current bounds.
+
+        :return: ``(status, x)`` with status ``"optimal"``, ``"infeasible"``,
+            ``"unbounded"`` or ``"error"``; *x* is ``None`` unless optimal.
+        """
+        self.n_solves += 1
+        if self._h is not None:
+            self._h.run()
+            status = self._h.getModelStatus()
+            ms = self._hs.HighsModelStatus
+            if status == ms.kOptimal:
+                return "optimal", np.array(self._h.getSolution().col_value)
+            if status == ms.kInfeasible:
+                return "infeasible", None
+            if status in (ms.kUnbounded, ms.kUnboundedOrInfeasible):
+                return "unbounded", None
+            return "error", None
+        res = linprog(self.c, A_eq=self.A, b_eq=self.b, bounds=self.bounds, method="highs")
+        if res.status == 0:
+            return "optimal", np.asarray(res.x)
+        return {2: "infeasible", 3: "unbounded"}.get(res.status, "error"), None
+
+
 # ---------------------------------------------------------------------------
 # Simulator
 # ---------------------------------------------------------------------------
 
 
+def _empty_triplets() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """COO ``(rows, cols, coeffs)`` of a matrix with no entries."""
+    return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp), np.zeros(0)
+
+
+def _cached_run(kind: str) -> Callable[[_F], _F]:
+    """
+    Serve a :class:`MetabolicSimulator` run from its result cache when possible.
+
+    The key covers the call arguments, bound to *fn*'s signature with
+    defaults applied (so positional, keyword and omitted-default spellings of
+    one call share an entry), and the store content version, so a change to
+    the graph or kinetic tables forces a fresh solve.
+    """
+
+    def decorator(fn: _F) -> _F:
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(self: MetabolicSimulator, *args: Any, **kwargs: Any) -> Any:
+            cache = self.cache
+            if cache is None:
+                return fn(self, *args, **kwargs)
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            del arguments["self"]
+            version = self._store.content_version()
+            key = request_key(kind, arguments, version=version)
+            hit = cache.get(key)
+            if hit is not None:
+                return hit
+            result = fn(self, *args, **kwargs)
+            cache.put(key, result, kind=kind, version=version)
+            return result
+
+        return cast(_F, wrapper)
+
+    return decorator
+
+
 class MetabolicSimulator:
     """
     Metabolic simulation engine backed by a :class:`~metakg.store.MetaStore`.
 
     :param store: Opened MetaStore instance with pathway data loaded.
+    :param cache: Optional :class:`~metakg.simcache.SimulationCache`; identical
+        runs against an unchanged store are then returned from the cache.
     """
 
     # Defaults used when no kinetic parameters are stored
     DEFAULT_VMAX: float = 1.0  # mM/s (normalised)
     DEFAULT_KM: float = 0.5  # mM
     DEFAULT_KEQ: float = 1.0  # dimensionless
+    COMPRESS_CACHE_SIZE: int = 32  # compressed FBA models kept per simulator
+    SCOPE_CACHE_SIZE: int = 8  # stoichiometric scopes / kinetic tables kept per simulator
 
-    def __init__(self, store: MetaStore) -> None:
+    def __init__(self, store: MetaStore, *, cache: SimulationCache | None = None) -> None:
         self._store = store
+        self.cache = cache
+        self._compress_cache: OrderedDict[tuple, CompressedNetwork | None] = OrderedDict()
+        self._scope_cache: OrderedDict[tuple, Any] = OrderedDict()
+        self._enzyme_index: dict[str, list[str]] = {}
+        self._enzyme_index_version: str | None = None
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
+    @_cached_run("fba")
     def run_fba(self, config: SimulationConfig) -> FBAResult:
         """
         Run Flux Balance Analysis on the reactions in *config*.
@@ -233,76 +1552,104 @@ class MetabolicSimulator:
         :return: :class:`FBAResult` with optimal fluxes and shadow prices.
         """
         rxn_ids, cpd_ids, S, rev_flags = self._build_stoich_matrix(config)
+        return self.solve_fba(rxn_ids, cpd_ids, S, rev_flags, config)
+
+    def solve_fba(
+        self,
+        rxn_ids: list[str],
+        cpd_ids: list[str],
+        S: np.ndarray,
+        rev_flags: Mapping[str, bool],
+        config: SimulationConfig,
+    ) -> FBAResult:
+        """
+        Solve the FBA linear programme for an already assembled model.
+
+        Used by :meth:`run_fba` and by sweeps that slice many sub-models out of
+        one shared matrix; the scope fields of *config* are ignored.
 
+        :param rxn_ids: Reaction IDs labelling the columns of *S*.
+        :param cpd_ids: Compound IDs labelling the rows of *S*.
+        :param S: Stoichiometric matrix ``(n_cpd, n_rxn)``.
+        :param rev_flags: Reversibility per reaction (default reversible).
+        :param config: Bounds, objective and solver options.
+        :return: :class:`FBAResult` with optimal fluxes and shadow prices.
+        """
         if not rxn_ids:
-            return FBAResult(
-                status="error",
-                objective_value=None,
-                fluxes={},
-                shadow_prices={},
-                message="No reactions found for the given configuration.",
+            return FBAResult.empty(
+                "error",
+                "No reactions found for the given configuration.",
             )
 
         n_rxn = len(rxn_ids)
         n_cpd = len(cpd_ids)
 
-        # Reaction flux bounds
-        bounds: list[tuple[float, float]] = []
-        for rxn_id in rxn_ids:
-            if rxn_id in config.flux_bounds:
-                bounds.append(config.flux_bounds[rxn_id])
-            elif rev_flags.get(rxn_id, True):
-                bounds.append((-1000.0, 1000.0))
-            else:
-                bounds.append((0.0, 1000.0))
+        bounds = self._flux_bounds(rxn_ids, rev_flags, config)
 
-        # Objective vector (linprog minimises → negate to maximise)
-        c = np.zeros(n_rxn)
-        if config.objective_reaction and config.objective_reaction in rxn_ids:
-            j = rxn_ids.index(config.objective_reaction)
-            c[j] = -1.0 if config.maximize else 1.0
-        else:
-            # Maximise sum of all forward fluxes as surrogate
-            sign = -1.0 if config.maximize else 1.0
-            for j, rxn_id in enumerate(rxn_ids):
-                lb, _ = bounds[j]
-                if lb >= 0:  # irreversible
-                    c[j] = sign / n_rxn
+        c = self._objective_vector(rxn_ids, bounds, config)
+        net = self._compress(rxn_ids, cpd_ids, S, bounds, c) if config.prune_network else None
+        dtype = np.dtype(config.output_dtype)
+        sign = -1.0 if config.maximize else 1.0
 
-        result = linprog(
-            c,
-            A_eq=S,
-            b_eq=np.zeros(n_cpd),
-            bounds=bounds,
-            method="highs",
-        )
+        if net is not None and net.is_empty:
+            return FBAResult(
+                status="optimal",
+                objective_value=0.0,
+                reaction_ids=tuple(rxn_ids),
+                flux_values=np.zeros(n_rxn, dtype=dtype),
+                compound_ids=tuple(cpd_ids),
+                shadow_values=np.zeros(n_cpd, dtype=dtype),
+                message=f"Optimal. Objective = 0 (all {n_rxn} reactions blocked)",
+            )
+
+        if net is not None:
+            result = linprog(
+                net.c,
+                A_eq=net.S,
+                b_eq=np.zeros(net.S.shape[0]),
+                bounds=net.bounds(),
+                method="highs",
+            )
+        else:
+            result = linprog(
+                c,
+                A_eq=S,
+                b_eq=np.zeros(n_cpd),
+                bounds=bounds,
+                method="highs",
+            )
 
         if result.status == 0:
-            fluxes = {rxn_ids[j]: float(result.x[j]) for j in range(n_rxn)}
             obj_val = float(-result.fun) if config.maximize else float(result.fun)
-            shadow: dict[str, float] = {}
+            x = net.expand_fluxes(result.x) if net is not None else np.asarray(result.x)
+            shadow = np.zeros(0, dtype=dtype)
             if result.eqlin is not None and hasattr(result.eqlin, "marginals"):
                 marg = result.eqlin.marginals
-                if marg is not None and len(marg) == n_cpd:
-                    sign = -1.0 if config.maximize else 1.0
-                    shadow = {cpd_ids[i]: float(sign * marg[i]) for i in range(n_cpd)}
+                if marg is not None and len(marg) == len(result.eqlin.residual):
+                    marg = sign * np.asarray(marg)
+                    if net is not None:
+                        marg = net.expand_compounds(marg)
+                    shadow = marg.astype(dtype, copy=False)
+            note = ""
+            if net is not None and (net.blocked or net.n_merged):
+                note = f" ({len(net.blocked)} blocked, {net.n_merged} merged reactions pruned)"
             return FBAResult(
                 status="optimal",
                 objective_value=obj_val,
-                fluxes=fluxes,
-                shadow_prices=shadow,
-                message=f"Optimal. Objective = {obj_val:.6g}",
+                reaction_ids=tuple(rxn_ids),
+                flux_values=x.astype(dtype, copy=False),
+                compound_ids=tuple(cpd_ids),
+                shadow_values=shadow,
+                message=f"Optimal. Objective = {obj_val:.6g}{note}",
             )
 
         status_map = {2: "infeasible", 3: "unbounded"}
-        return FBAResult(
-            status=status_map.get(result.status, "error"),
-            objective_value=None,
-            fluxes={},
-            shadow_prices={},
-            message=result.message,
+        return FBAResult.empty(
+            status_map.get(result.status, "error"),
+            result.message,
         )
 
+    @_cached_run("ode")
     def run_ode(self, config: SimulationConfig) -> ODEResult:
         """
         Run a kinetic ODE simulation using Michaelis-Menten rate equations.
@@ -316,137 +1663,379 @@ class MetabolicSimulator:
         :param config: Simulation scope and parameters.
         :return: :class:`ODEResult` with concentration time-courses.
         """
+        clock = perf_counter()
         rxn_ids, cpd_ids, S, rev_flags = self._build_stoich_matrix(config)
 
         if not rxn_ids:
-            return ODEResult(
-                status="error",
-                t=[],
-                concentrations={},
-                message="No reactions found for the given configuration.",
+            return ODEResult.empty(
+                "error",
+                "No reactions found for the given configuration.",
             )
 
-        kparams = self._build_kinetic_params(rxn_ids, config)
-
-        # Pre-build reaction specs (avoid repeated dict lookups in hot loop)
+        model = self._build_kinetic_model(rxn_ids, cpd_ids, S, rev_flags, config)
         n_cpd = len(cpd_ids)
-        rxn_specs = []
-        for j, rxn_id in enumerate(rxn_ids):
-            substrates = [(i, float(-S[i, j])) for i in range(n_cpd) if S[i, j] < -1e-10]
-            products = [(i, float(S[i, j])) for i in range(n_cpd) if S[i, j] > 1e-10]
-            kp = kparams.get(rxn_id, {})
-            vmax = kp.get("vmax") or self.DEFAULT_VMAX
-            km_default = kp.get("km") or self.DEFAULT_KM
-            km_by_sub = kp.get("km_by_substrate", {})
-            keq = kp.get("equilibrium_constant") or self.DEFAULT_KEQ
-            rxn_specs.append(
-                {
-                    "substrates": substrates,
-                    "products": products,
-                    "vmax": vmax,
-                    "km_default": km_default,
-                    "km_by_sub": km_by_sub,
-                    "reversible": rev_flags.get(rxn_id, True),
-                    "keq": keq,
-                }
-            )
-
-        y0 = np.array(
-            [config.initial_concentrations.get(c, config.default_concentration) for c in cpd_ids]
-        )
+        y0 = self._initial_state(cpd_ids, config)
+        reduced = self._reduce_conservation(model, y0, config)
+        system: KineticModel | ReducedKineticModel = reduced or model
+        x0 = reduced.laws.reduce(y0) if reduced else y0
 
         def _dydt(_t: float, y: np.ndarray) -> np.ndarray:
-            yc = np.maximum(y, 0.0)  # clamp negatives
-            dy = np.zeros(n_cpd)
-            for spec in rxn_specs:
-                v = _mm_rate(spec, yc, cpd_ids)
-                for idx, stoich in spec["substrates"]:
-                    dy[idx] -= stoich * v
-                for idx, stoich in spec["products"]:
-                    dy[idx] += stoich * v
-            return dy
-
-        def _mm_rate(spec: dict, y: np.ndarray, cpd_ids: list[str]) -> float:
-            substrates = spec["substrates"]
-            if not substrates:
-                return 0.0
-            vmax = spec["vmax"]
-            km_default = spec["km_default"]
-            km_by_sub = spec["km_by_sub"]
-
-            v_fwd = vmax
-            for idx, _stoich in substrates:
-                conc = float(y[idx])
-                km = km_by_sub.get(cpd_ids[idx], km_default)
-                denom = km + conc
-                v_fwd *= conc / denom if denom > 0 else 0.0
-
-            if not spec["reversible"]:
-                return max(0.0, v_fwd)
-
-            products = spec["products"]
-            if not products:
-                return v_fwd
-
-            # Reversible: use Haldane relationship to estimate reverse rate
-            keq = max(spec["keq"], 1e-12)
-            v_rev = vmax / keq
-            for idx, _stoich in products:
-                conc = float(y[idx])
-                km_p = km_by_sub.get(cpd_ids[idx], km_default) * keq
-                denom = km_p + conc
-                v_rev *= conc / denom if denom > 0 else 0.0
-
-            return v_fwd - v_rev
+            return system.rhs(y)
+
+        def _jac(_t: float, y: np.ndarray) -> np.ndarray:
+            return system.jacobian(y)
 
         t_span = (0.0, config.t_end)
         t_eval = [config.t_end * i / (config.t_points - 1) for i in range(config.t_points)]
-
+        timings = {"setup": perf_counter() - clock}
+
+        method = config.ode_method
+        first_step = 1e-3  # Small initial step for stiff systems
+        ratio: float | None = None
+        solve: Callable[..., Any] = solve_ivp
+        if method == "auto":
+            t_probe = perf_counter()
+            ratio, fast = self._estimate_stiffness(system, x0, config.t_end)
+            method = choose_ode_method(ratio, len(x0), config.ode_rtol)
+            if fast > 0:
+                first_step = min(first_step, 0.1 / fast)
+            solve = _SwitchingSolver(method, _jac)
+            timings["stiffness"] = perf_counter() - t_probe
+
+        # Build solve_ivp kwargs, excluding max_step if None (let solver choose)
+        solve_kwargs: dict = {
+            "method": method,
+            "rtol": config.ode_rtol,
+            "atol": config.ode_atol,
+            "first_step": first_step,
+        }
+        if config.ode_max_step is not None:
+            solve_kwargs["max_step"] = config.ode_max_step
+        if method in _IMPLICIT_METHODS and solve is solve_ivp:
+            solve_kwargs["jac"] = _jac
+
+        t_steady: float | None = None
+        t_integrate = perf_counter()
         try:
-            # Build solve_ivp kwargs, excluding max_step if None (let solver choose)
-            solve_kwargs = {
-                "method": config.ode_method,
-                "rtol": config.ode_rtol,
-                "atol": config.ode_atol,
-                "first_step": 1e-3,  # Small initial step for stiff systems
-            }
-            if config.ode_max_step is not None:
-                solve_kwargs["max_step"] = config.ode_max_step
-
-            sol = solve_ivp(
-                _dydt,
-                t_span,
-                y0,
-                t_eval=t_eval,
-                **solve_kwargs,
-            )
+            if (
+                config.steady_state_rtol is None
+                and config.output_sampling == "uniform"
+                and solve is solve_ivp
+            ):
+                sol = solve_ivp(
+                    _dydt,
+                    t_span,
+                    x0,
+                    t_eval=t_eval,
+                    **_fit_first_step(solve_kwargs, *t_span),
+                )
+                if not sol.success:
+                    return ODEResult.empty(
+                        "failed",
+                        f"ODE solver did not converge: {sol.message}",
+                    )
+                t_out, y_out = sol.t, sol.y
+            else:
+                segments, t_stop, t_steady = self._integrate_segments(
+                    system, x0, config, solve_kwargs, solve=solve
+                )
+                if segments and not segments[-1].success:
+                    return ODEResult.empty(
+                        "failed",
+                        f"ODE solver did not converge: {segments[-1].message}",
+                    )
+                if config.output_sampling == "adaptive":
+                    t_out = _adaptive_times(segments, config.t_points, config.ode_atol)
+                else:
+                    t_out = np.array([t for t in t_eval if t < t_stop] + [t_stop])
+                y_out = _evaluate_segments(segments, t_out)
         except (ValueError, RuntimeError) as exc:
-            return ODEResult(
-                status="error",
-                t=[],
-                concentrations={},
-                message=f"ODE solver raised: {exc}",
-            )
-
-        if not sol.success:
-            return ODEResult(
-                status="failed",
-                t=[],
-                concentrations={},
-                message=f"ODE solver did not converge: {sol.message}",
+            return ODEResult.empty(
+                "error",
+                f"ODE solver raised: {exc}",
             )
 
-        concs = {cpd_ids[i]: sol.y[i].tolist() for i in range(n_cpd)}
+        timings["integrate"] = perf_counter() - t_integrate
+        if reduced is not None:
+            y_out = reduced.expand(y_out)
+        dtype = np.dtype(config.output_dtype)
+        t_final = float(t_out[-1]) if len(t_out) else config.t_end
+        steady_note = f" Steady state reached at t={t_steady:.4g}." if t_steady is not None else ""
+        if reduced is not None:
+            steady_note += f" {reduced.laws.n_conserved} conserved moieties eliminated."
+        label = solve.label if isinstance(solve, _SwitchingSolver) else method
+        if ratio is not None:
+            steady_note += f" Solver: auto → {label} (stiffness ratio {ratio:.3g})."
+        timings["total"] = perf_counter() - clock
         return ODEResult(
             status="ok",
-            t=sol.t.tolist(),
-            concentrations=concs,
+            time=np.asarray(t_out, dtype=np.float64),
+            y=np.ascontiguousarray(y_out, dtype=dtype),
+            compound_ids=tuple(cpd_ids),
             message=(
-                f"Integration OK. t=[0, {config.t_end}], "
-                f"{len(sol.t)} time points, {n_cpd} compounds, {len(rxn_ids)} reactions."
+                f"Integration OK. t=[0, {t_final:g}], "
+                f"{len(t_out)} time points, {n_cpd} compounds, {len(rxn_ids)} reactions."
+                f"{steady_note}"
             ),
+            t_steady=t_steady,
+            method=label,
+            stiffness_ratio=ratio,
+            timings=timings,
+        )
+
+    @_cached_run("steady_state")
+    def run_steady_state(
+        self,
+        config: SimulationConfig,
+        *,
+        tol: float = 1e-8,
+        max_iter: int = 100,
+        t_max: float | None = None,
+    ) -> SteadyStateResult:
+        """
+        Find the kinetic steady state directly, without sampling a time-course.
+
+        Starts from the initial concentrations in *config* and runs a
+        pseudo-transient Newton continuation on ``S·v(y) = 0`` using the
+        analytic Jacobian.  If that does not reach ``max|dy/dt| ≤ tol``, the
+        system is integrated with ``config.ode_method`` and a terminal event
+        stops the run as soon as the residual drops below *tol*.
+
+        :param config: Simulation scope, kinetic overrides and initial conditions.
+        :param tol: Convergence threshold on ``max|dy/dt|`` (mM per time unit).
+        :param max_iter: Maximum Newton iterations before falling back to integration.
+        :param t_max: Integration horizon for the fallback (default ``1000 · config.t_end``).
+        :return: :class:`SteadyStateResult` with fixed-point concentrations and rates.
+        """
+        rxn_ids, cpd_ids, S, rev_flags = self._build_stoich_matrix(config)
+
+        if not rxn_ids or not cpd_ids:
+            return SteadyStateResult(
+                status="error",
+                concentrations={},
+                fluxes={},
+                residual=None,
+                method="",
+                iterations=0,
+                message="No reactions found for the given configuration.",
+            )
+
+        model = self._build_kinetic_model(rxn_ids, cpd_ids, S, rev_flags, config)
+        y0 = self._initial_state(cpd_ids, config)
+        reduced = self._reduce_conservation(model, y0, config)
+        system: KineticModel | ReducedKineticModel = reduced or model
+        x0 = reduced.laws.reduce(y0) if reduced else y0
+
+        x, res, iters, converged = self._newton_steady_state(system, x0, tol=tol, max_iter=max_iter)
+        method = "newton"
+
+        if not converged:
+            horizon = t_max if t_max is not None else 1000.0 * config.t_end
+
+            def _settled(_t: float, yy: np.ndarray) -> float:
+                return float(np.max(np.abs(system.rhs(yy)))) - tol
+
+            _settled.terminal = True  # type: ignore[attr-defined]
+            _settled.direction = -1  # type: ignore[attr-defined]
+
+            # Settling to steady state is the stiff regime: "auto" means BDF here
+            ode_method = "BDF" if config.ode_method == "auto" else config.ode_method
+            solve_kwargs: dict = {
+                "method": ode_method,
+                "rtol": config.ode_rtol,
+                "atol": config.ode_atol,
+                "events": _settled,
+            }
+            if ode_method in _IMPLICIT_METHODS:
+                solve_kwargs["jac"] = lambda _t, yy: system.jacobian(yy)
+            try:
+                sol = solve_ivp(lambda _t, yy: system.rhs(yy), (0.0, horizon), x0, **solve_kwargs)
+            except (ValueError, RuntimeError) as exc:
+                return SteadyStateResult(
+                    status="error",
+                    concentrations={},
+                    fluxes={},
+                    residual=None,
+                    method="integration",
+                    iterations=0,
+                    message=f"ODE solver raised: {exc}",
+                )
+            x = sol.y[:, -1]
+            res = float(np.max(np.abs(system.rhs(x))))
+            iters = int(sol.nfev)
+            converged = res <= tol
+            method = "integration"
+
+        y = reduced.expand(x) if reduced else x
+        rates = dict(zip(model.rxn_ids, model.rates(y).tolist()))
+        if converged:
+            message = f"Converged by {method}: max|dy/dt| = {res:.3g} after {iters} iteration(s)."
+        else:
+            message = f"Did not converge: max|dy/dt| = {res:.3g} (tol {tol:.3g})."
+        return SteadyStateResult(
+            status="converged" if converged else "not_converged",
+            concentrations={cpd_ids[i]: float(y[i]) for i in range(len(cpd_ids))},
+            fluxes={rxn_id: rates.get(rxn_id, 0.0) for rxn_id in rxn_ids},
+            residual=res,
+            method=method,
+            iterations=iters,
+            message=message,
+        )
+
+    def run_dfba(
+        self,
+        config: SimulationConfig,
+        uptake: Mapping[str, float],
+        *,
+        uptake_vmax: float | Mapping[str, float] = 10.0,
+        uptake_km: float | Mapping[str, float] = 0.5,
+        biomass: float | None = None,
+        dt: float | None = None,
+        dt_min: float | None = None,
+        dt_max: float | None = None,
+        max_depletion: float = 0.05,
+        depletion_tol: float = 1e-6,
+    ) -> DFBAResult:
+        """
+        Dynamic FBA: alternate FBA solves with substrate depletion over time.
+
+        Each exchange reaction in *uptake* draws on an external substrate
+        pool whose concentration ``s`` caps its flux at the Michaelis-Menten
+        rate ``Vmax · s / (Km + s)``.  One :class:`ReusableLP` is assembled
+        for the whole run; between steps only the exchange bounds change, so
+        each solve is a hot start from the previous basis.  Pools are drawn
+        down by the uptake fluxes (scaled by biomass, which grows at the
+        objective flux, when *biomass* is given).
+
+        The step size adapts: no step consumes more than *max_depletion* of a
+        pool that is being taken up, steps double while that limit is slack,
+        and a pool about to run out is finished in one step instead of being
+        approached in ever smaller ones.  The run ends at ``config.t_end``,
+        once every pool is empty, or when nothing is taken up any more.
+
+        Network compression is not applied, since the bounds change every step.
+
+        :param config: Scope, objective, flux bounds and ``t_end``.
+        :param uptake: ``{exchange_reaction_id: initial substrate mM}``.
+        :param uptake_vmax: Maximum uptake rate, per reaction or for all.
+        :param uptake_km: Uptake half-saturation constant (mM), per reaction or for all.
+        :param biomass: Initial biomass.  ``None`` treats fluxes as absolute rates;
+            otherwise fluxes are per unit biomass and the objective flux is the
+            specific growth rate.
+        :param dt: Initial step (default ``t_end / 100``).
+        :param dt_min: Smallest regular step (default ``t_end / 10⁶``).
+        :param dt_max: Largest step (default ``t_end / 10``).
+        :param max_depletion: Largest fraction of an active pool one step may use.
+        :param depletion_tol: Pools below this concentration count as empty.
+        :return: :class:`DFBAResult`.
+        :raises ValueError: If an exchange reaction is not in scope, or *biomass*
+            is given without an ``objective_reaction`` in scope.
+        """
+        rxn_ids, _cpd_ids, S, rev_flags = self._build_stoich_matrix(config)
+        if not rxn_ids:
+            return DFBAResult.empty("error", "No reactions found for the given configuration.")
+        index = {r: j for j, r in enumerate(rxn_ids)}
+        missing = [r for r in uptake if r not in index]
+        if missing:
+            raise ValueError(f"exchange reaction(s) not in scope: {', '.join(missing)}")
+        growth_col = index.get(config.objective_reaction or "")
+        if biomass is not None and growth_col is None:
+            raise ValueError("biomass needs an objective_reaction in scope (the growth flux)")
+
+        uptake_ids = tuple(uptake)
+        cols = np.array([index[r] for r in uptake_ids], dtype=np.intp)
+
+        def _per_reaction(value: float | Mapping[str, float]) -> np.ndarray:
+            if isinstance(value, Mapping):
+                return np.array([float(value[r]) for r in uptake_ids])
+            return np.full(len(uptake_ids), float(value))
+
+        vmax, km = _per_reaction(uptake_vmax), _per_reaction(uptake_km)
+        bounds = self._flux_bounds(rxn_ids, rev_flags, config)
+        base = np.array(bounds, dtype=float)
+        lp = ReusableLP(
+            np.asarray(S).reshape(-1, len(rxn_ids)),
+            self._objective_vector(rxn_ids, bounds, config),
+            base[:, 0],
+            base[:, 1],
         )
 
+        t_end = config.t_end
+        step = dt if dt is not None else t_end / 100.0
+        dt_min = dt_min if dt_min is not None else t_end * 1e-6
+        dt_max = dt_max if dt_max is not None else t_end / 10.0
+
+        conc = np.array([float(uptake[r]) for r in uptake_ids])
+        mass = 1.0 if biomass is None else float(biomass)
+        t = 0.0
+        times: list[float] = []
+        pools: list[np.ndarray] = []
+        masses: list[float] = []
+        flux_cols: list[np.ndarray] = []
+        status = "completed"
+
+        while True:
+            cap = vmax * conc / (km + conc)
+            lp.set_bounds(cols, base[cols, 0], np.minimum(base[cols, 1], cap))
+            lp_status, x = lp.solve()
+            if x is None:
+                status = lp_status
+                break
+            times.append(t)
+            pools.append(conc.copy())
+            masses.append(mass)
+            flux_cols.append(x)
+
+            if np.all(conc <= depletion_tol):
+                status = "depleted"
+                break
+            if t >= t_end * (1.0 - 1e-12):
+                break
+            mu = float(x[growth_col]) if biomass is not None and growth_col is not None else 0.0
+            rate = x[cols] * mass
+            active = rate > depletion_tol
+            if not active.any() and mu <= 0.0:
+                status = "stalled"
+                break
+
+            h = min(step, dt_max)
+            if active.any():
+                limit = max_depletion * conc[active] / rate[active]
+                if limit.min() < dt_min:
+                    h = min(dt_min, float((conc[active] / rate[active]).min()))
+                elif limit.min() < h:
+                    h = float(limit.min())
+            h = min(h, t_end - t)
+
+            # Fluxes are per unit biomass; integrate the exponential growth exactly
+            growth = np.expm1(mu * h) / mu if mu > 1e-12 else h
+            conc = np.maximum(conc - x[cols] * mass * growth, 0.0)
+            conc[conc <= depletion_tol] = 0.0
+            mass *= float(np.exp(mu * h))
+            t += h
+            step = min(2.0 * h, dt_max) if h >= step else step
+
+        if not times:
+            return DFBAResult.empty(status, f"FBA at t = 0 is {status}.")
+        time_arr = np.array(times)
+        message = (
+            f"{status.capitalize()} at t = {time_arr[-1]:.4g} after {len(times)} step(s), "
+            f"{lp.n_solves} LP solve(s) ({lp.backend})."
+        )
+        return DFBAResult(
+            status=status,
+            time=time_arr,
+            uptake_ids=uptake_ids,
+            substrates=np.array(pools).T,
+            reaction_ids=tuple(rxn_ids),
+            fluxes=np.array(flux_cols).T,
+            biomass=np.array(masses) if biomass is not None else None,
+            n_lp=lp.n_solves,
+            backend=lp.backend,
+            message=message,
+        )
+
+    @_cached_run("whatif")
     def run_whatif(
         self,
         config: SimulationConfig,
@@ -467,9 +2056,48 @@ class MetabolicSimulator:
 
         run = self.run_fba if mode == "fba" else self.run_ode
         baseline = run(config)
-        perturbed_cfg = self._apply_scenario(config, scenario, mode)
-        perturbed = run(perturbed_cfg)
+        perturbed = self.run_perturbed(config, scenario, mode)
+        return self.compare(baseline, perturbed, scenario.name, mode)
+
+    def run_perturbed(
+        self,
+        config: SimulationConfig,
+        scenario: WhatIfScenario,
+        mode: str = "fba",
+    ) -> FBAResult | ODEResult:
+        """
+        Run only the perturbed half of a what-if analysis.
+
+        :param config: Baseline simulation scope.
+        :param scenario: Perturbation descriptor.
+        :param mode: ``"fba"`` (default) or ``"ode"``.
+        :return: :class:`FBAResult` or :class:`ODEResult` for the scenario.
+        :raises ValueError: If *mode* is not ``"fba"`` or ``"ode"``.
+        """
+        if mode not in ("fba", "ode"):
+            raise ValueError(f"mode must be 'fba' or 'ode', got {mode!r}")
+        run = self.run_fba if mode == "fba" else self.run_ode
+        return run(self._apply_scenario(config, scenario, mode))
+
+    @staticmethod
+    def compare(
+        baseline: FBAResult | ODEResult,
+        perturbed: FBAResult | ODEResult,
+        scenario_name: str,
+        mode: str,
+    ) -> WhatIfResult:
+        """
+        Build a :class:`WhatIfResult` from an existing baseline and perturbed run.
 
+        Lets batch screens solve the baseline once and compare many perturbed
+        runs against it.
+
+        :param baseline: Unperturbed result.
+        :param perturbed: Result for the scenario.
+        :param scenario_name: Scenario label.
+        :param mode: ``"fba"`` or ``"ode"``.
+        :return: :class:`WhatIfResult` with delta maps.
+        """
         delta_fluxes: dict[str, float] = {}
         delta_final_conc: dict[str, float] = {}
 
@@ -482,14 +2110,13 @@ class MetabolicSimulator:
                 delta_fluxes[rxn_id] = p - b
         else:
             assert isinstance(baseline, ODEResult) and isinstance(perturbed, ODEResult)
-            all_cpds = set(baseline.concentrations) | set(perturbed.concentrations)
-            for cpd_id in all_cpds:
-                b_concs = baseline.concentrations.get(cpd_id, [0.0])
-                p_concs = perturbed.concentrations.get(cpd_id, [0.0])
-                delta_final_conc[cpd_id] = p_concs[-1] - b_concs[-1]
+            b_final = baseline.final_concentrations()
+            p_final = perturbed.final_concentrations()
+            for cpd_id in set(b_final) | set(p_final):
+                delta_final_conc[cpd_id] = p_final.get(cpd_id, 0.0) - b_final.get(cpd_id, 0.0)
 
         return WhatIfResult(
-            scenario_name=scenario.name,
+            scenario_name=scenario_name,
             baseline=baseline,
             perturbed=perturbed,
             delta_fluxes=delta_fluxes,
@@ -501,18 +2128,96 @@ class MetabolicSimulator:
     # Helpers
     # ------------------------------------------------------------------
 
+    def _scoped(self, key: tuple, tables: tuple[str, ...], build: Callable[[], Any]) -> Any:
+        """
+        Memoise *build()* under *key* until any of *tables* changes.
+
+        Scope data (stoichiometry, stored kinetics) only depends on the store,
+        not on per-run overrides, so repeated runs over the same scope — what-if
+        batches in particular — share one copy.
+        """
+        key = (*key, self._store.content_version(tables))
+        if key in self._scope_cache:
+            self._scope_cache.move_to_end(key)
+            return self._scope_cache[key]
+        value = build()
+        self._scope_cache[key] = value
+        while len(self._scope_cache) > self.SCOPE_CACHE_SIZE:
+            self._scope_cache.popitem(last=False)
+        return value
+
     def _build_stoich_matrix(
         self,
         config: SimulationConfig,
     ) -> tuple[list[str], list[str], np.ndarray, dict[str, bool]]:
         """
-        Build the stoichiometric matrix S from the store.
+        Return the stoichiometric matrix S for the scope of *config*.
 
         S[i, j] = net stoichiometric coefficient of compound *i* in reaction *j*
-        (negative = consumed, positive = produced).
+        (negative = consumed, positive = produced).  The matrix is built once
+        per scope and store version and returned read-only.
+
+        :return: ``(rxn_ids, cpd_ids, S, rev_flags)``
+        """
+        scope = tuple(config.reaction_ids) if config.reaction_ids else None
+        rxn_ids, cpd_ids, S, rev_flags = self._scoped(
+            ("stoich", scope, None if scope else config.pathway_id),
+            ("meta_nodes", "meta_edges"),
+            lambda: self._load_stoich_matrix(config),
+        )
+        return list(rxn_ids), list(cpd_ids), S, rev_flags
+
+    def _build_stoich_sparse(
+        self,
+        config: SimulationConfig,
+    ) -> tuple[list[str], list[str], csc_matrix, dict[str, bool]]:
+        """
+        Return S for the scope of *config* as a CSC matrix, never densified.
+
+        Same rows, columns and coefficients as :meth:`_build_stoich_matrix`;
+        meant for genome-scale scopes where the dense matrix would not fit.
 
         :return: ``(rxn_ids, cpd_ids, S, rev_flags)``
         """
+        scope = tuple(config.reaction_ids) if config.reaction_ids else None
+        rxn_ids, cpd_ids, S, rev_flags = self._scoped(
+            ("stoich_sparse", scope, None if scope else config.pathway_id),
+            ("meta_nodes", "meta_edges"),
+            lambda: self._load_stoich_sparse(config),
+        )
+        return list(rxn_ids), list(cpd_ids), S, rev_flags
+
+    def _load_stoich_matrix(
+        self,
+        config: SimulationConfig,
+    ) -> tuple[list[str], list[str], np.ndarray, dict[str, bool]]:
+        """Build the stoichiometric matrix S from the store (uncached)."""
+        rxn_ids, cpd_ids, (rows, cols, coeffs), rev_flags = self._load_stoich_triplets(config)
+        S = np.zeros((len(cpd_ids), len(rxn_ids)))
+        S[rows, cols] = coeffs
+        S.setflags(write=False)
+        return rxn_ids, cpd_ids, S, rev_flags
+
+    def _load_stoich_sparse(
+        self,
+        config: SimulationConfig,
+    ) -> tuple[list[str], list[str], csc_matrix, dict[str, bool]]:
+        """Build S from the store as a CSC matrix (uncached)."""
+        rxn_ids, cpd_ids, (rows, cols, coeffs), rev_flags = self._load_stoich_triplets(config)
+        S = csc_matrix((coeffs, (rows, cols)), shape=(len(cpd_ids), len(rxn_ids)))
+        S.eliminate_zeros()  # net coefficients that cancel, as in the dense matrix
+        return rxn_ids, cpd_ids, S, rev_flags
+
+    def _load_stoich_triplets(
+        self,
+        config: SimulationConfig,
+    ) -> tuple[list[str], list[str], tuple[np.ndarray, np.ndarray, np.ndarray], dict[str, bool]]:
+        """
+        Read the stoichiometry of *config*'s scope as COO triplets.
+
+        :return: ``(rxn_ids, cpd_ids, (rows, cols, coeffs), rev_flags)`` with
+            one triplet per (compound, reaction) pair.
+        """
         # Determine which reactions to include
         if config.reaction_ids:
             rxn_ids = list(config.reaction_ids)
@@ -522,7 +2227,7 @@ class MetabolicSimulator:
             rxn_ids = [r["id"] for r in self._store.all_nodes(kind="reaction")]
 
         if not rxn_ids:
-            return [], [], np.zeros((0, 0)), {}
+            return [], [], _empty_triplets(), {}
 
         # Accumulate stoichiometry and reversibility from edges
         stoich_map: dict[str, dict[str, float]] = {}  # cpd_id → {rxn_id: net_coeff}
@@ -564,47 +2269,111 @@ class MetabolicSimulator:
                     )
 
         if not stoich_map:
-            return rxn_ids, [], np.zeros((0, len(rxn_ids))), rev_flags
+            return rxn_ids, [], _empty_triplets(), rev_flags
 
         cpd_ids = sorted(stoich_map.keys())
-        n_cpd = len(cpd_ids)
-        n_rxn = len(rxn_ids)
-        S = np.zeros((n_cpd, n_rxn))
-
-        cpd_index = {c: i for i, c in enumerate(cpd_ids)}
         rxn_index = {r: j for j, r in enumerate(rxn_ids)}
-
-        for cpd_id, rxn_coeffs in stoich_map.items():
-            i = cpd_index[cpd_id]
-            for rxn_id, coeff in rxn_coeffs.items():
+        rows: list[int] = []
+        cols: list[int] = []
+        coeffs: list[float] = []
+        for i, cpd_id in enumerate(cpd_ids):
+            for rxn_id, coeff in stoich_map[cpd_id].items():
                 if rxn_id in rxn_index:
-                    S[i, rxn_index[rxn_id]] = coeff
+                    rows.append(i)
+                    cols.append(rxn_index[rxn_id])
+                    coeffs.append(coeff)
+
+        triplets = (
+            np.asarray(rows, dtype=np.intp),
+            np.asarray(cols, dtype=np.intp),
+            np.asarray(coeffs, dtype=float),
+        )
+        return rxn_ids, cpd_ids, triplets, rev_flags
 
-        return rxn_ids, cpd_ids, S, rev_flags
+    @staticmethod
+    def _objective_vector(
+        rxn_ids: list[str],
+        bounds: list[tuple[float, float]],
+        config: SimulationConfig,
+    ) -> np.ndarray:
+        """
+        Return the LP cost vector (``linprog`` minimises, so maximised terms are negated).
+
+        Optimises ``config.objective_reaction`` if it is in scope, else the
+        sum of all irreversible fluxes as a surrogate.
+        """
+        n_rxn = len(rxn_ids)
+        c = np.zeros(n_rxn)
+        if config.objective_reaction and config.objective_reaction in rxn_ids:
+            j = rxn_ids.index(config.objective_reaction)
+            c[j] = -1.0 if config.maximize else 1.0
+        else:
+            sign = -1.0 if config.maximize else 1.0
+            for j in range(n_rxn):
+                if bounds[j][0] >= 0:  # irreversible
+                    c[j] = sign / n_rxn
+        return c
+
+    @staticmethod
+    def _flux_bounds(
+        rxn_ids: list[str],
+        rev_flags: Mapping[str, bool],
+        config: SimulationConfig,
+    ) -> list[tuple[float, float]]:
+        """
+        Return ``(lb, ub)`` per reaction: ``config.flux_bounds`` where given,
+        else ``(-1000, 1000)`` for reversible and ``(0, 1000)`` for irreversible ones.
+        """
+        bounds: list[tuple[float, float]] = []
+        for rxn_id in rxn_ids:
+            if rxn_id in config.flux_bounds:
+                bounds.append(config.flux_bounds[rxn_id])
+            elif rev_flags.get(rxn_id, True):
+                bounds.append((-1000.0, 1000.0))
+            else:
+                bounds.append((0.0, 1000.0))
+        return bounds
 
     def _reactions_for_pathway(self, pathway_id: str) -> list[str]:
-        """Return reaction node IDs contained in a pathway."""
+        """Return reaction node IDs contained in a pathway (``pathway_members`` lookup)."""
         pwy_id = self._store.resolve_id(pathway_id)
         if pwy_id is None:
             return []
-        rxn_ids = []
-        for edge in self._store.edges_of(pwy_id):
-            if edge["rel"] == "CONTAINS" and edge["src"] == pwy_id:
-                node = self._store.node(edge["dst"])
-                if node and node["kind"] == "reaction":
-                    rxn_ids.append(node["id"])
-        return rxn_ids
-
-    def _reactions_for_enzyme(self, enzyme_id: str) -> list[str]:
-        """Return reaction node IDs catalysed by an enzyme."""
+        return self._store.pathway_members(pwy_id, kind="reaction", via=("contains",))
+
+    def _enzyme_reaction_index(self) -> dict[str, list[str]]:
+        """
+        Return the ``{enzyme_id: [reaction_id, ...]}`` map of CATALYZES edges.
+
+        Built with one query and rebuilt only when the store content version
+        changes, so scenario screens resolve enzymes by dictionary lookup.
+        """
+        version = self._store.content_version(("meta_edges",))
+        if version != self._enzyme_index_version:
+            index: dict[str, list[str]] = {}
+            for src, dst in self._store.edge_pairs("CATALYZES"):
+                index.setdefault(src, []).append(dst)
+            self._enzyme_index = index
+            self._enzyme_index_version = version
+        return self._enzyme_index
+
+    def _reactions_for_enzyme(
+        self, enzyme_id: str, index: dict[str, list[str]] | None = None
+    ) -> list[str]:
+        """
+        Return reaction node IDs catalysed by an enzyme.
+
+        :param index: Enzyme index already fetched by the caller, which saves
+            a content-version query per enzyme in loops.
+        """
+        if index is None:
+            index = self._enzyme_reaction_index()
+        if enzyme_id in index:
+            return index[enzyme_id]
         enz_id = self._store.resolve_id(enzyme_id)
         if enz_id is None:
             return []
-        return [
-            e["dst"]
-            for e in self._store.edges_of(enz_id)
-            if e["rel"] == "CATALYZES" and e["src"] == enz_id
-        ]
+        return index.get(enz_id, [])
 
     def _build_kinetic_params(
         self,
@@ -617,27 +2386,17 @@ class MetabolicSimulator:
 
         :return: Map ``{reaction_id: {vmax, km, km_by_substrate, equilibrium_constant}}``.
         """
+        stored = self._scoped(
+            ("kinetics", tuple(rxn_ids), config.kinetic_aggregation),
+            ("kinetic_parameters",),
+            lambda: self._store.kinetic_params_for_reactions(
+                rxn_ids, agg=config.kinetic_aggregation
+            ),
+        )
         result: dict[str, dict] = {}
         for rxn_id in rxn_ids:
-            rows = self._store.kinetic_params_for_reaction(rxn_id)
-            if rows:
-                km_by_sub: dict[str, float] = {}
-                vmaxs, kms, keqs = [], [], []
-                for row in rows:
-                    if row.get("vmax") is not None:
-                        vmaxs.append(row["vmax"])
-                    if row.get("km") is not None:
-                        kms.append(row["km"])
-                    if row.get("equilibrium_constant") is not None:
-                        keqs.append(row["equilibrium_constant"])
-                    if row.get("substrate_id") and row.get("km") is not None:
-                        km_by_sub[row["substrate_id"]] = row["km"]
-                result[rxn_id] = {
-                    "vmax": float(np.mean(vmaxs)) if vmaxs else None,
-                    "km": float(np.mean(kms)) if kms else None,
-                    "equilibrium_constant": float(np.mean(keqs)) if keqs else None,
-                    "km_by_substrate": km_by_sub,
-                }
+            if rxn_id in stored:
+                result[rxn_id] = dict(stored[rxn_id])
             else:
                 result[rxn_id] = {
                     "vmax": self.DEFAULT_VMAX,
@@ -653,41 +2412,330 @@ class MetabolicSimulator:
 
         for rxn_id, factor in config.vmax_factors.items():
             if rxn_id in result:
-                base = result[rxn_id].get("vmax") or self.DEFAULT_VMAX
+                base = result[rxn_id].get("vmax")
+                if base is None:
+                    base = self.DEFAULT_VMAX
                 result[rxn_id]["vmax"] = base * factor
 
         return result
 
+    @staticmethod
+    def _integrate_segments(
+        model: KineticModel | ReducedKineticModel,
+        y0: np.ndarray,
+        config: SimulationConfig,
+        solve_kwargs: dict,
+        *,
+        solve: Callable[..., Any] = solve_ivp,
+    ) -> tuple[list, float, float | None]:
+        """
+        Integrate with dense output, optionally stopping on a steady-state event.
+
+        A terminal event fires when the relative derivative norm falls below
+        ``config.steady_state_rtol``; integration then continues for the
+        confirmation window with the opposite event armed.  If the norm stays
+        below for the whole window the run stops, otherwise the search resumes
+        from the crossing point.
+
+        *solve* is :func:`~scipy.integrate.solve_ivp` or a drop-in such as the
+        method-switching solver used by ``ode_method="auto"``.
+
+        :return: ``(segments, t_stop, t_steady)`` — solver results in time order,
+            the final time reached, and the stop time if the steady-state event ended the run.
+        """
+        t_end = config.t_end
+        thr = config.steady_state_rtol
+        window = (
+            config.steady_state_window if config.steady_state_window is not None else 0.05 * t_end
+        )
+        floor = max(config.ode_atol, 1e-12)
+
+        def _rel_norm(_t: float, y: np.ndarray) -> float:
+            return float(np.max(np.abs(model.rhs(y)))) / max(float(np.max(np.abs(y))), floor)
+
+        def _settles(t: float, y: np.ndarray) -> float:
+            return _rel_norm(t, y) - thr  # type: ignore[operator]
+
+        def _wakes(t: float, y: np.ndarray) -> float:
+            return _rel_norm(t, y) - thr  # type: ignore[operator]
+
+        _settles.terminal, _settles.direction = True, -1  # type: ignore[attr-defined]
+        _wakes.terminal, _wakes.direction = True, 1  # type: ignore[attr-defined]
+
+        def _rhs(_t: float, y: np.ndarray) -> np.ndarray:
+            return model.rhs(y)
+
+        segments: list = []
+        t0, y_start = 0.0, y0
+        if thr is None:
+            sol = solve(
+                _rhs,
+                (0.0, t_end),
+                y0,
+                dense_output=True,
+                **_fit_first_step(solve_kwargs, 0.0, t_end),
+            )
+            return [sol], float(sol.t[-1]), None
+
+        quiet = _rel_norm(0.0, y0) < thr
+        while t0 < t_end:
+            if not quiet:
+                sol = solve(
+                    _rhs,
+                    (t0, t_end),
+                    y_start,
+                    dense_output=True,
+                    events=_settles,
+                    **_fit_first_step(solve_kwargs, t0, t_end),
+                )
+                segments.append(sol)
+                if sol.status != 1:
+                    return segments, float(sol.t[-1]), None
+                t0, y_start, quiet = float(sol.t_events[0][0]), sol.y_events[0][0], True
+            else:
+                t_win = min(t0 + window, t_end)
+                if t_win <= t0:
+                    break
+                sol = solve(
+                    _rhs,
+                    (t0, t_win),
+                    y_start,
+                    dense_output=True,
+                    events=_wakes,
+                    **_fit_first_step(solve_kwargs, t0, t_win),
+                )
+                segments.append(sol)
+                if sol.status == 1:
+                    t0, y_start, quiet = float(sol.t_events[0][0]), sol.y_events[0][0], False
+                    continue
+                if sol.status != 0:
+                    return segments, float(sol.t[-1]), None
+                return segments, t_win, (t_win if t_win < t_end else None)
+        return segments, t0, None
+
+    def _compress(
+        self,
+        rxn_ids: list[str],
+        cpd_ids: list[str],
+        S: np.ndarray,
+        bounds: list[tuple[float, float]],
+        c: np.ndarray,
+    ) -> CompressedNetwork | None:
+        """
+        Return the compressed FBA model for this scope, reusing a cached one when
+        the reactions, stoichiometry, bounds and objective are unchanged.
+        """
+        lb = np.array([b[0] for b in bounds], dtype=float)
+        ub = np.array([b[1] for b in bounds], dtype=float)
+        digest = hashlib.blake2b(digest_size=16)
+        for arr in (S, lb, ub, c):
+            digest.update(np.ascontiguousarray(arr).tobytes())
+        key = (tuple(rxn_ids), tuple(cpd_ids), S.shape, digest.digest())
+        if key in self._compress_cache:
+            self._compress_cache.move_to_end(key)
+            return self._compress_cache[key]
+        net = compress_network(S, lb, ub, c=c)
+        self._compress_cache[key] = net
+        if len(self._compress_cache) > self.COMPRESS_CACHE_SIZE:
+            self._compress_cache.popitem(last=False)
+        return net
+
+    def _build_kinetic_model(
+        self,
+        rxn_ids: list[str],
+        cpd_ids: list[str],
+        S: np.ndarray,
+        rev_flags: dict[str, bool],
+        config: SimulationConfig,
+    ) -> KineticModel:
+        """
+        Compile the vectorised rate model for the reactions in scope.
+
+        With ``config.prune_network`` set, reactions that can never fire
+        (zero Vmax, e.g. knocked-out enzymes, or no substrates) are left out of
+        the model; compounds they alone touched then become constant and are
+        eliminated by the conservation reduction.  Rows of ``config.fixed_compounds``
+        are zeroed in the model's ``S`` after the rate laws are compiled.
+        """
+        kparams = self._build_kinetic_params(rxn_ids, config)
+        if config.prune_network:
+            keep = [
+                j
+                for j, rxn_id in enumerate(rxn_ids)
+                if kparams[rxn_id].get("vmax") != 0 and (S[:, j] < 0).any()
+            ]
+            if len(keep) < len(rxn_ids):
+                rxn_ids = [rxn_ids[j] for j in keep]
+                S = S[:, keep]
+        model = KineticModel.from_matrix(
+            rxn_ids,
+            cpd_ids,
+            S,
+            rev_flags,
+            kparams,
+            default_vmax=self.DEFAULT_VMAX,
+            default_km=self.DEFAULT_KM,
+            default_keq=self.DEFAULT_KEQ,
+        )
+        if config.fixed_compounds:
+            fixed = set(config.fixed_compounds)
+            rows = [i for i, c in enumerate(cpd_ids) if c in fixed]
+            if rows:
+                S_free = np.array(model.S, dtype=float)
+                S_free[rows] = 0.0
+                model = replace(model, S=S_free)
+        return model
+
+    @staticmethod
+    def _reduce_conservation(
+        model: KineticModel,
+        y0: np.ndarray,
+        config: SimulationConfig,
+    ) -> ReducedKineticModel | None:
+        """
+        Eliminate conserved moieties from *model* when enabled in *config*.
+
+        :return: The reduced model with totals fixed by *y0*, or ``None`` when
+            reduction is disabled or the network has no conservation relations.
+        """
+        if not config.reduce_conservation:
+            return None
+        laws = ConservationLaws.from_stoichiometry(model.S)
+        if laws.n_conserved == 0 or len(laws.independent) == 0:
+            return None
+        return ReducedKineticModel(model, laws, laws.totals(y0))
+
+    @staticmethod
+    def _estimate_stiffness(
+        model: KineticModel | ReducedKineticModel,
+        y0: np.ndarray,
+        t_end: float,
+    ) -> tuple[float, float]:
+        """
+        Return ``(stiffness_ratio, fastest_rate)`` for an ``"auto"`` solve.
+
+        The Jacobian is sampled at *y0* and after a short explicit probe step
+        (``0.1 %`` of *t_end*), since systems starting near an empty pool often
+        only turn stiff once intermediates appear; the larger estimate wins.
+        """
+        ratio, fast = stiffness_ratio(model.jacobian(y0), t_end)
+        probe = np.maximum(y0 + 1e-3 * t_end * model.rhs(y0), 0.0)
+        if np.all(np.isfinite(probe)):
+            r2, f2 = stiffness_ratio(model.jacobian(probe), t_end)
+            ratio, fast = max(ratio, r2), max(fast, f2)
+        return ratio, fast
+
+    @staticmethod
+    def _initial_state(cpd_ids: list[str], config: SimulationConfig) -> np.ndarray:
+        """Return the initial concentration vector for *cpd_ids*."""
+        return np.array(
+            [config.initial_concentrations.get(c, config.default_concentration) for c in cpd_ids],
+            dtype=float,
+        )
+
+    @staticmethod
+    def _newton_steady_state(
+        model: KineticModel | ReducedKineticModel,
+        y0: np.ndarray,
+        *,
+        tol: float,
+        max_iter: int,
+    ) -> tuple[np.ndarray, float, int, bool]:
+        """
+        Pseudo-transient Newton continuation towards ``S·v(y) = 0``.
+
+        Each step solves ``(I/Δt − J)·Δy = f(y)``.  The identity shift keeps the
+        system non-singular despite conserved moieties and, because ``L·J = 0``
+        for any left null vector ``L`` of ``S``, every step preserves the
+        conserved totals exactly.  A step that would drive a concentration
+        negative (a dependent species too, on a reduced system) is shortened
+        to ``α·Δy`` with the largest feasible ``α ≤ 1``; being along ``Δy`` it
+        still preserves the totals.  ``Δt`` grows by switched evolution
+        relaxation as the residual falls, so the iteration approaches pure
+        Newton near the fixed point; a rejected step shrinks ``Δt`` instead.
+
+        :return: ``(y, residual, iterations, converged)``.
+        """
+        conc = model.expand if isinstance(model, ReducedKineticModel) else np.asarray
+        n = len(y0)
+        eye = np.eye(n)
+        y = y0.copy()
+        f = model.rhs(y)
+        res = float(np.max(np.abs(f))) if n else 0.0
+        dt = 1.0 / max(float(np.max(np.abs(model.jacobian(y)))) if n else 1.0, 1e-12)
+
+        for it in range(1, max_iter + 1):
+            if res <= tol:
+                return y, res, it - 1, True
+            try:
+                dy = np.linalg.solve(eye / dt - model.jacobian(y), f)
+            except np.linalg.LinAlgError:
+                dt *= 0.25
+                continue
+            # Concentrations are affine in the state: damp the step to stay feasible
+            c = np.maximum(conc(y), 0.0)
+            dc = conc(y + dy) - conc(y)
+            falling = dc < 0
+            alpha = min(1.0, float(np.min(c[falling] / -dc[falling]))) if falling.any() else 1.0
+            y_new = y + alpha * dy
+            f_new = model.rhs(y_new)
+            res_new = float(np.max(np.abs(f_new)))
+            if alpha <= 0.0 or not np.isfinite(res_new) or res_new > 10.0 * res:
+                dt *= 0.25
+                if dt < 1e-12:
+                    break
+                continue
+            dt = min(dt * max(res / max(res_new, 1e-300), 0.5), 1e12)
+            y, f, res = y_new, f_new, res_new
+
+        return y, res, max_iter, res <= tol
+
     def _apply_scenario(
         self,
         config: SimulationConfig,
         scenario: WhatIfScenario,
         mode: str,
     ) -> SimulationConfig:
-        """Return a new SimulationConfig with the scenario perturbations applied."""
-        new_cfg = copy.deepcopy(config)
+        """
+        Return a SimulationConfig with the scenario perturbations applied.
+
+        Only the touched entries are materialised: each overlaid map is a
+        :class:`~collections.ChainMap` of the scenario's changes over the
+        baseline map, so the cost scales with the perturbation size and
+        *config* itself is never modified.
+        """
+        bounds: dict[str, tuple[float, float]] = {}
+        overrides: dict[str, float] = {}
+        factors: dict[str, float] = {}
+        index = self._enzyme_reaction_index()
 
         for enz_id in scenario.enzyme_knockouts:
-            rxn_ids = self._reactions_for_enzyme(enz_id)
-            for rxn_id in rxn_ids:
+            for rxn_id in self._reactions_for_enzyme(enz_id, index):
                 if mode == "fba":
-                    new_cfg.flux_bounds[rxn_id] = (0.0, 0.0)
+                    bounds[rxn_id] = (0.0, 0.0)
                 else:
-                    new_cfg.vmax_overrides[rxn_id] = 0.0
+                    overrides[rxn_id] = 0.0
 
         for enz_id, factor in scenario.enzyme_factors.items():
-            rxn_ids = self._reactions_for_enzyme(enz_id)
-            for rxn_id in rxn_ids:
+            for rxn_id in self._reactions_for_enzyme(enz_id, index):
                 if mode == "fba":
-                    lb, ub = new_cfg.flux_bounds.get(rxn_id, (0.0, 1000.0))
-                    new_cfg.flux_bounds[rxn_id] = (lb, ub * factor)
+                    prev = bounds if rxn_id in bounds else config.flux_bounds
+                    lb, ub = prev.get(rxn_id, (0.0, 1000.0))
+                    bounds[rxn_id] = (lb, ub * factor)
                 else:
-                    new_cfg.vmax_factors[rxn_id] = new_cfg.vmax_factors.get(rxn_id, 1.0) * factor
+                    prev_f = factors if rxn_id in factors else config.vmax_factors
+                    factors[rxn_id] = prev_f.get(rxn_id, 1.0) * factor
 
-        for cpd_id, conc in scenario.initial_conc_overrides.items():
-            new_cfg.initial_concentrations[cpd_id] = conc
-
-        return new_cfg
+        changes: dict[str, Any] = {}
+        for name, delta in (
+            ("flux_bounds", bounds),
+            ("vmax_overrides", overrides),
+            ("vmax_factors", factors),
+            ("initial_concentrations", dict(scenario.initial_conc_overrides)),
+        ):
+            if delta:
+                changes[name] = ChainMap(delta, getattr(config, name))
+        return replace(config, **changes) if changes else replace(config)
 
 
 # ---------------------------------------------------------------------------
@@ -695,6 +2743,15 @@ class MetabolicSimulator:
 # ---------------------------------------------------------------------------
 
 
+def _display_name(store: MetaStore | None, node_id: str) -> str:
+    """Return the stored name of *node_id*, or the ID itself without a store or name."""
+    if store:
+        node = store.node(node_id)
+        if node:
+            return node.get("name", node_id)
+    return node_id
+
+
 def render_fba_result(
     result: FBAResult,
     store: MetaStore | None = None,
@@ -785,12 +2842,17 @@ def render_ode_result(
     lines.append(f"{h2}ODE Result")
     lines.append(f"{bold[0]}Status:{bold[1]} {result.status}")
     lines.append(f"{bold[0]}Message:{bold[1]} {result.message}")
+    if result.method:
+        timing = ", ".join(f"{k} {v:.3g}s" for k, v in result.timings.items())
+        lines.append(
+            f"{bold[0]}Solver:{bold[1]} {result.method}" + (f" ({timing})" if timing else "")
+        )
     lines.append("")
 
-    if result.concentrations:
-        final_concs = {c: vals[-1] for c, vals in result.concentrations.items() if vals}
+    final_concs = result.final_concentrations()
+    if final_concs:
         sorted_cpds = sorted(final_concs.items(), key=lambda x: x[1], reverse=True)
-        lines.append(f"{h3}Final Concentrations (t = {result.t[-1] if result.t else '?'})")
+        lines.append(f"{h3}Final Concentrations (t = {result.time[-1]:g})")
         if markdown:
             lines.append("| Compound | ID | Final [mM] |")
             lines.append("|---|---|---:|")
@@ -808,6 +2870,66 @@ def render_ode_result(
     return "\n".join(lines)
 
 
+def render_steady_state_result(
+    result: SteadyStateResult,
+    store: MetaStore | None = None,
+    *,
+    top_n: int = 20,
+    markdown: bool = True,
+) -> str:
+    """
+    Format a :class:`SteadyStateResult` showing fixed-point concentrations and rates.
+
+    :param result: Steady-state result to render.
+    :param store: Optional MetaStore for resolving compound and reaction names.
+    :param top_n: Maximum items to list per table.
+    :param markdown: Emit Markdown (default) or plain text.
+    :return: Formatted string.
+    """
+    h2 = "## " if markdown else ""
+    h3 = "### " if markdown else "--- "
+    bold = ("**", "**") if markdown else ("", "")
+    lines: list[str] = []
+
+    lines.append(f"{h2}Steady-State Result")
+    lines.append(f"{bold[0]}Status:{bold[1]} {result.status}")
+    if result.method:
+        lines.append(f"{bold[0]}Method:{bold[1]} {result.method}")
+    if result.residual is not None:
+        lines.append(f"{bold[0]}Residual max|dy/dt|:{bold[1]} {result.residual:.3g}")
+    lines.append(f"{bold[0]}Message:{bold[1]} {result.message}")
+    lines.append("")
+
+    if result.concentrations:
+        sorted_cpds = sorted(result.concentrations.items(), key=lambda x: x[1], reverse=True)
+        lines.append(f"{h3}Steady-State Concentrations")
+        if markdown:
+            lines.append("| Compound | ID | [mM] |")
+            lines.append("|---|---|---:|")
+        for cpd_id, conc in sorted_cpds[:top_n]:
+            name = _display_name(store, cpd_id)
+            if markdown:
+                lines.append(f"| {name} | `{cpd_id}` | {conc:.4f} |")
+            else:
+                lines.append(f"  {name:<40} {conc:>10.4f}")
+
+    if result.fluxes:
+        lines.append("")
+        sorted_rxns = sorted(result.fluxes.items(), key=lambda x: abs(x[1]), reverse=True)
+        lines.append(f"{h3}Steady-State Reaction Rates")
+        if markdown:
+            lines.append("| Reaction | ID | Rate |")
+            lines.append("|---|---|---:|")
+        for rxn_id, rate in sorted_rxns[:top_n]:
+            name = _display_name(store, rxn_id)
+            if markdown:
+                lines.append(f"| {name} | `{rxn_id}` | {rate:.4g} |")
+            else:
+                lines.append(f"  {name:<40} {rate:>10.4g}")
+
+    return "\n".join(lines)
+
+
 def render_whatif_result(
     result: WhatIfResult,
     store: MetaStore | None = None,
@@ -876,6 +2998,8 @@ def render_whatif_result(
     else:
         assert isinstance(result.baseline, ODEResult)
         assert isinstance(result.perturbed, ODEResult)
+        b_finals = result.baseline.final_concentrations()
+        p_finals = result.perturbed.final_concentrations()
         if result.delta_final_conc:
             sorted_deltas = sorted(
                 result.delta_final_conc.items(), key=lambda x: abs(x[1]), reverse=True
@@ -892,10 +3016,8 @@ def render_whatif_result(
                     node = store.node(cpd_id)
                     if node:
                         name = node.get("name", cpd_id)
-                b_concs = result.baseline.concentrations.get(cpd_id, [0.0])
-                p_concs = result.perturbed.concentrations.get(cpd_id, [0.0])
-                b_final = b_concs[-1] if b_concs else 0.0
-                p_final = p_concs[-1] if p_concs else 0.0
+                b_final = b_finals.get(cpd_id, 0.0)
+                p_final = p_finals.get(cpd_id, 0.0)
                 tag = "▲" if delta > 0 else "▼"
                 if markdown:
                     lines.append(
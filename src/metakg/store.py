@@ -5,6 +5,14 @@ Schema:
   meta_nodes   — all entity nodes (compound, reaction, enzyme, pathway)
   meta_edges   — all directed edges
   xref_index   — flattened cross-reference lookup (db_name, ext_id → node_id)
+  pathway_members — materialised pathway membership (pathway_id, node_id, kind, via)
+  node_modules — module assignment per node from :mod:`metakg.modules`
+  derived_settings — options each derived table was computed with
+  node_degrees — in/out edge counts per node and relation, kept by triggers
+  pathway_minhash / pathway_lsh — pathway MinHash signatures and LSH buckets
+                  from :mod:`metakg.similarity`
+  meta_version — per-table change counters, bumped once per bulk write and
+                 by triggers on changes made outside :class:`MetaStore`
 
 Follows the same WAL/NORMAL pragma pattern as code_kg.store.GraphStore.
 """
@@ -14,9 +22,12 @@ from __future__ import annotations
 import json
 import sqlite3
 from collections import deque
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import cast
+from typing import Any, cast
+
+import numpy as np
 
 from metakg.primitives import (
     DEFAULT_RELS,
@@ -101,19 +112,400 @@ CREATE TABLE IF NOT EXISTS regulatory_interactions (
     source_database  TEXT
 );
 
+-- Every node belonging to a pathway, maintained by MetaStore.write().
+-- via: 'contains'  — reached from the pathway through CONTAINS edges (transitively)
+--      'substrate' / 'product' — compound of a contained reaction
+--      'catalyzes' — enzyme of a contained reaction
+CREATE TABLE IF NOT EXISTS pathway_members (
+    pathway_id TEXT NOT NULL,
+    node_id    TEXT NOT NULL,
+    kind       TEXT NOT NULL,
+    via        TEXT NOT NULL,
+    PRIMARY KEY (pathway_id, via, node_id)
+);
+
+-- Data-driven module per node, written by metakg.modules.detect_modules().
+CREATE TABLE IF NOT EXISTS node_modules (
+    node_id TEXT PRIMARY KEY,
+    module  INTEGER NOT NULL
+);
+
+-- Options a derived table was computed with, as JSON (scope 'node_modules':
+-- resolution, exclude_currency, seed), so readers reuse it only when they match.
+CREATE TABLE IF NOT EXISTS derived_settings (
+    scope    TEXT PRIMARY KEY,
+    settings TEXT NOT NULL
+);
+
+-- MinHash signature per pathway and its LSH band buckets, written by
+-- metakg.similarity.build_similarity_index().
+CREATE TABLE IF NOT EXISTS pathway_minhash (
+    pathway_id TEXT PRIMARY KEY,
+    n_members  INTEGER NOT NULL,
+    signature  BLOB NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS pathway_lsh (
+    band       INTEGER NOT NULL,
+    bucket     INTEGER NOT NULL,
+    pathway_id TEXT NOT NULL,
+    PRIMARY KEY (band, bucket, pathway_id)
+) WITHOUT ROWID;
+
+-- In/out edge counts per (node, relation), maintained by the meta_edges
+-- triggers below.  A node without rows has no edges.
+CREATE TABLE IF NOT EXISTS node_degrees (
+    node_id    TEXT NOT NULL,
+    rel        TEXT NOT NULL,
+    in_degree  INTEGER NOT NULL DEFAULT 0,
+    out_degree INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (node_id, rel)
+) WITHOUT ROWID;
+
 CREATE INDEX IF NOT EXISTS idx_meta_nodes_kind  ON meta_nodes(kind);
 CREATE INDEX IF NOT EXISTS idx_meta_nodes_name  ON meta_nodes(name);
 CREATE INDEX IF NOT EXISTS idx_meta_nodes_ec    ON meta_nodes(ec_number);
 CREATE INDEX IF NOT EXISTS idx_meta_edges_src   ON meta_edges(src);
-CREATE INDEX IF NOT EXISTS idx_meta_edges_dst   ON meta_edges(dst);
+CREATE INDEX IF NOT EXISTS idx_meta_edges_dst_rel ON meta_edges(dst, rel);
 CREATE INDEX IF NOT EXISTS idx_meta_edges_rel   ON meta_edges(rel);
 CREATE INDEX IF NOT EXISTS idx_xref_node        ON xref_index(node_id);
 CREATE INDEX IF NOT EXISTS idx_kp_enzyme        ON kinetic_parameters(enzyme_id);
 CREATE INDEX IF NOT EXISTS idx_kp_reaction      ON kinetic_parameters(reaction_id);
 CREATE INDEX IF NOT EXISTS idx_ri_enzyme        ON regulatory_interactions(enzyme_id);
 CREATE INDEX IF NOT EXISTS idx_ri_compound      ON regulatory_interactions(compound_id);
+CREATE INDEX IF NOT EXISTS idx_pm_node          ON pathway_members(node_id);
+CREATE INDEX IF NOT EXISTS idx_pm_kind          ON pathway_members(kind, pathway_id);
+CREATE INDEX IF NOT EXISTS idx_nm_module        ON node_modules(module);
+CREATE INDEX IF NOT EXISTS idx_nd_rel           ON node_degrees(rel);
+
+-- Content version counters, bumped by triggers on every row change made
+-- outside MetaStore.  MetaStore's bulk writers insert a 'write_guard' row for
+-- the duration of the statement, which silences the per-row version and
+-- degree triggers, and bump each table's counter once and recount the
+-- degrees of the nodes they touched instead (see MetaStore._bulk_write).
+-- The 'epoch' row is random per database file so counters from a rebuilt
+-- database never collide with those of the file it replaced.  The
+-- 'pathway_members', 'node_modules' and 'pathway_minhash' rows hold the
+-- meta_edges version the derived table was last built at (-1: never built).
+-- 'node_degrees' is -1 until the table has been backfilled; triggers and
+-- MetaStore.write keep it exact afterwards.
+CREATE TABLE IF NOT EXISTS meta_version (
+    scope   TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+);
+
+INSERT OR IGNORE INTO meta_version (scope, version) VALUES ('epoch', abs(random()));
+INSERT OR IGNORE INTO meta_version (scope, version) VALUES ('meta_nodes', 0);
+INSERT OR IGNORE INTO meta_version (scope, version) VALUES ('meta_edges', 0);
+INSERT OR IGNORE INTO meta_version (scope, version) VALUES ('kinetic_parameters', 0);
+INSERT OR IGNORE INTO meta_version (scope, version) VALUES ('regulatory_interactions', 0);
+INSERT OR IGNORE INTO meta_version (scope, version) VALUES ('pathway_members', -1);
+INSERT OR IGNORE INTO meta_version (scope, version) VALUES ('node_modules', -1);
+INSERT OR IGNORE INTO meta_version (scope, version) VALUES ('node_degrees', -1);
+INSERT OR IGNORE INTO meta_version (scope, version) VALUES ('pathway_minhash', -1);
+
+CREATE TRIGGER IF NOT EXISTS trg_bump_meta_nodes_insert AFTER INSERT ON meta_nodes
+WHEN NOT EXISTS (SELECT 1 FROM meta_version WHERE scope = 'write_guard')
+BEGIN UPDATE meta_version SET version = version + 1 WHERE scope = 'meta_nodes'; END;
+CREATE TRIGGER IF NOT EXISTS trg_bump_meta_nodes_update AFTER UPDATE ON meta_nodes
+WHEN NOT EXISTS (SELECT 1 FROM meta_version WHERE scope = 'write_guard')
+BEGIN UPDATE meta_version SET version = version + 1 WHERE scope = 'meta_nodes'; END;
+CREATE TRIGGER IF NOT EXISTS trg_bump_meta_nodes_delete AFTER DELETE ON meta_nodes
+WHEN NOT EXISTS (SELECT 1 FROM meta_version WHERE scope = 'write_guard')
+BEGIN UPDATE meta_version SET version = version + 1 WHERE scope = 'meta_nodes'; END;
+CREATE TRIGGER IF NOT EXISTS trg_bump_meta_edges_insert AFTER INSERT ON meta_edges
+WHEN NOT EXISTS (SELECT 1 FROM meta_version WHERE scope = 'write_guard')
+BEGIN UPDATE meta_version SET version = version + 1 WHERE scope = 'meta_edges'; END;
+CREATE TRIGGER IF NOT EXISTS trg_bump_meta_edges_update AFTER UPDATE ON meta_edges
+WHEN NOT EXISTS (SELECT 1 FROM meta_version WHERE scope = 'write_guard')
+BEGIN UPDATE meta_version SET version = version + 1 WHERE scope = 'meta_edges'; END;
+CREATE TRIGGER IF NOT EXISTS trg_bump_meta_edges_delete AFTER DELETE ON meta_edges
+WHEN NOT EXISTS (SELECT 1 FROM meta_version WHERE scope = 'write_guard')
+BEGIN UPDATE meta_version SET version = version + 1 WHERE scope = 'meta_edges'; END;
+CREATE TRIGGER IF NOT EXISTS trg_bump_kinetic_parameters_insert AFTER INSERT ON kinetic_parameters
+WHEN NOT EXISTS (SELECT 1 FROM meta_version WHERE scope = 'write_guard')
+BEGIN UPDATE meta_version SET version = version + 1 WHERE scope = 'kinetic_parameters'; END;
+CREATE TRIGGER IF NOT EXISTS trg_bump_kinetic_parameters_update AFTER UPDATE ON kinetic_parameters
+WHEN NOT EXISTS (SELECT 1 FROM meta_version WHERE scope = 'write_guard')
+BEGIN UPDATE meta_version SET version = version + 1 WHERE scope = 'kinetic_parameters'; END;
+CREATE TRIGGER IF NOT EXISTS trg_bump_kinetic_parameters_delete AFTER DELETE ON kinetic_parameters
+WHEN NOT EXISTS (SELECT 1 FROM meta_version WHERE scope = 'write_guard')
+BEGIN UPDATE meta_version SET version = version + 1 WHERE scope = 'kinetic_parameters'; END;
+CREATE TRIGGER IF NOT EXISTS trg_bump_regulatory_interactions_insert AFTER INSERT ON regulatory_interactions
+WHEN NOT EXISTS (SELECT 1 FROM meta_version WHERE scope = 'write_guard')
+BEGIN UPDATE meta_version SET version = version + 1 WHERE scope = 'regulatory_interactions'; END;
+CREATE TRIGGER IF NOT EXISTS trg_bump_regulatory_interactions_update AFTER UPDATE ON regulatory_interactions
+WHEN NOT EXISTS (SELECT 1 FROM meta_version WHERE scope = 'write_guard')
+BEGIN UPDATE meta_version SET version = version + 1 WHERE scope = 'regulatory_interactions'; END;
+CREATE TRIGGER IF NOT EXISTS trg_bump_regulatory_interactions_delete AFTER DELETE ON regulatory_interactions
+WHEN NOT EXISTS (SELECT 1 FROM meta_version WHERE scope = 'write_guard')
+BEGIN UPDATE meta_version SET version = version + 1 WHERE scope = 'regulatory_interactions'; END;
+
+CREATE TRIGGER IF NOT EXISTS trg_degrees_insert AFTER INSERT ON meta_edges
+WHEN NOT EXISTS (SELECT 1 FROM meta_version WHERE scope = 'write_guard')
+BEGIN
+    INSERT INTO node_degrees (node_id, rel, out_degree) VALUES (NEW.src, NEW.rel, 1)
+    ON CONFLICT (node_id, rel) DO UPDATE SET out_degree = out_degree + 1;
+    INSERT INTO node_degrees (node_id, rel, in_degree) VALUES (NEW.dst, NEW.rel, 1)
+    ON CONFLICT (node_id, rel) DO UPDATE SET in_degree = in_degree + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_degrees_delete AFTER DELETE ON meta_edges
+WHEN NOT EXISTS (SELECT 1 FROM meta_version WHERE scope = 'write_guard')
+BEGIN
+    UPDATE node_degrees SET out_degree = out_degree - 1 WHERE node_id = OLD.src AND rel = OLD.rel;
+    UPDATE node_degrees SET in_degree = in_degree - 1 WHERE node_id = OLD.dst AND rel = OLD.rel;
+    DELETE FROM node_degrees
+    WHERE  node_id IN (OLD.src, OLD.dst) AND rel = OLD.rel AND in_degree = 0 AND out_degree = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_degrees_update AFTER UPDATE OF src, rel, dst ON meta_edges
+WHEN NOT EXISTS (SELECT 1 FROM meta_version WHERE scope = 'write_guard')
+BEGIN
+    UPDATE node_degrees SET out_degree = out_degree - 1 WHERE node_id = OLD.src AND rel = OLD.rel;
+    UPDATE node_degrees SET in_degree = in_degree - 1 WHERE node_id = OLD.dst AND rel = OLD.rel;
+    DELETE FROM node_degrees
+    WHERE  node_id IN (OLD.src, OLD.dst) AND rel = OLD.rel AND in_degree = 0 AND out_degree = 0;
+    INSERT INTO node_degrees (node_id, rel, out_degree) VALUES (NEW.src, NEW.rel, 1)
+    ON CONFLICT (node_id, rel) DO UPDATE SET out_degree = out_degree + 1;
+    INSERT INTO node_degrees (node_id, rel, in_degree) VALUES (NEW.dst, NEW.rel, 1)
+    ON CONFLICT (node_id, rel) DO UPDATE SET in_degree = in_degree + 1;
+END;
 """
 
+#: Tables whose content determines simulation results.
+VERSIONED_TABLES: tuple[str, ...] = (
+    "meta_nodes",
+    "meta_edges",
+    "kinetic_parameters",
+    "regulatory_interactions",
+)
+
+# Members of a set of pathways: CONTAINS closure, then compounds and enzymes
+# of every contained reaction.  {seed} yields the (pathway_id, node_id) pairs
+# of the pathways' own CONTAINS edges.  Every join is a CROSS JOIN so SQLite
+# keeps ``reach`` as the outer loop and probes meta_edges through its
+# (src, rel, dst) key or idx_meta_edges_dst_rel: refreshing a pathway costs time in its own
+# size, not in the size of meta_edges.
+_PATHWAY_MEMBERS_TEMPLATE = """
+WITH RECURSIVE reach(pathway_id, node_id) AS (
+    {seed}
+    UNION
+    SELECT r.pathway_id, e.dst
+    FROM   reach r
+    CROSS JOIN meta_edges e ON e.src = r.node_id AND e.rel = 'CONTAINS'
+)
+INSERT OR IGNORE INTO pathway_members (pathway_id, node_id, kind, via)
+SELECT r.pathway_id, r.node_id, n.kind, 'contains'
+FROM   reach r CROSS JOIN meta_nodes n ON n.id = r.node_id
+WHERE  r.node_id != r.pathway_id
+UNION ALL
+SELECT r.pathway_id, e.src, n.kind, 'substrate'
+FROM   reach r
+CROSS JOIN meta_edges e ON e.dst = r.node_id AND e.rel = 'SUBSTRATE_OF'
+CROSS JOIN meta_nodes n ON n.id = e.src
+UNION ALL
+SELECT r.pathway_id, e.dst, n.kind, 'product'
+FROM   reach r
+CROSS JOIN meta_edges e ON e.src = r.node_id AND e.rel = 'PRODUCT_OF'
+CROSS JOIN meta_nodes n ON n.id = e.dst
+UNION ALL
+SELECT r.pathway_id, e.src, n.kind, 'catalyzes'
+FROM   reach r
+CROSS JOIN meta_edges e ON e.dst = r.node_id AND e.rel = 'CATALYZES'
+CROSS JOIN meta_nodes n ON n.id = e.src
+"""
+
+# Every pathway node.
+_PATHWAY_MEMBERS_SQL = _PATHWAY_MEMBERS_TEMPLATE.format(
+    seed="""SELECT e.src, e.dst
+    FROM   meta_nodes p
+    CROSS JOIN meta_edges e ON e.src = p.id AND e.rel = 'CONTAINS'
+    WHERE  p.kind = 'pathway'"""
+)
+
+# The pathways listed in the JSON array bound to :ids.
+_PATHWAY_MEMBERS_IDS_SQL = _PATHWAY_MEMBERS_TEMPLATE.format(
+    seed="""SELECT e.src, e.dst
+    FROM   json_each(:ids) j
+    CROSS JOIN meta_nodes p ON p.id = j.value AND p.kind = 'pathway'
+    CROSS JOIN meta_edges e ON e.src = p.id AND e.rel = 'CONTAINS'"""
+)
+
+# Per-relation in/out degrees counted from meta_edges.  {src_edges} and
+# {dst_edges} yield the edges leaving and entering the nodes to count.
+_NODE_DEGREES_TEMPLATE = """
+INSERT INTO node_degrees (node_id, rel, in_degree, out_degree)
+SELECT node_id, rel, SUM(d_in), SUM(d_out) FROM (
+    SELECT e.src AS node_id, e.rel, 0 AS d_in, COUNT(*) AS d_out
+    FROM   {src_edges} GROUP BY e.src, e.rel
+    UNION ALL
+    SELECT e.dst, e.rel, COUNT(*), 0
+    FROM   {dst_edges} GROUP BY e.dst, e.rel
+)
+GROUP BY node_id, rel
+"""
+
+# Every node.
+_NODE_DEGREES_SQL = _NODE_DEGREES_TEMPLATE.format(
+    src_edges="meta_edges e", dst_edges="meta_edges e"
+)
+
+# The nodes listed in the JSON array bound to :ids, probed through the
+# (src, rel, dst) key and idx_meta_edges_dst_rel.
+_NODE_DEGREES_IDS_SQL = _NODE_DEGREES_TEMPLATE.format(
+    src_edges="json_each(:ids) j CROSS JOIN meta_edges e ON e.src = j.value",
+    dst_edges="json_each(:ids) j CROSS JOIN meta_edges e ON e.dst = j.value",
+)
+
+
+def read_content_version(conn: sqlite3.Connection, tables: Iterable[str] = VERSIONED_TABLES) -> str:
+    """
+    Return the :meth:`MetaStore.content_version` token using any connection.
+
+    :param conn: Open (possibly read-only) connection to a MetaKG database.
+    :param tables: Versioned table names to include.
+    :return: Token such as ``"7f3a…:meta_nodes=12,meta_edges=40"``.
+    """
+    versions = {r[0]: int(r[1]) for r in conn.execute("SELECT scope, version FROM meta_version")}
+    parts = ",".join(f"{t}={versions.get(t, 0)}" for t in tables)
+    return f"{versions.get('epoch', 0):x}:{parts}"
+
+
+def pathway_members_current(conn: sqlite3.Connection) -> bool:
+    """
+    Return ``True`` if ``pathway_members`` reflects the current ``meta_edges``.
+
+    Works on any connection (including read-only ones), so readers can fall
+    back to joining ``meta_edges`` when the table is missing or stale.
+
+    :param conn: Open connection to a MetaKG database.
+    :return: Whether the materialised membership can be used.
+    """
+    return _derived_current(conn, "pathway_members")
+
+
+def node_modules_current(conn: sqlite3.Connection) -> bool:
+    """
+    Return ``True`` if ``node_modules`` was computed from the current ``meta_edges``.
+
+    :param conn: Open connection to a MetaKG database.
+    :return: Whether the stored module assignment can be used.
+    """
+    return _derived_current(conn, "node_modules")
+
+
+def node_modules_settings(conn: sqlite3.Connection) -> dict[str, Any] | None:
+    """
+    Return the options the stored ``node_modules`` assignment was computed with.
+
+    :param conn: Open connection to a MetaKG database.
+    :return: Settings dict (``resolution``, ``exclude_currency``, ``seed``), or
+        ``None`` if no assignment was stored with its settings.
+    """
+    try:
+        row = conn.execute(
+            "SELECT settings FROM derived_settings WHERE scope = 'node_modules'"
+        ).fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return json.loads(row[0]) if row is not None else None
+
+
+def pathway_minhash_current(conn: sqlite3.Connection) -> bool:
+    """
+    Return ``True`` if the pathway MinHash/LSH index was built from the current ``meta_edges``.
+
+    :param conn: Open connection to a MetaKG database.
+    :return: Whether similarity lookups can use the stored index.
+    """
+    return _derived_current(conn, "pathway_minhash")
+
+
+def node_degrees_current(conn: sqlite3.Connection) -> bool:
+    """
+    Return ``True`` if ``node_degrees`` has been backfilled and can be read.
+
+    :param conn: Open connection to a MetaKG database.
+    :return: Whether the degree table is complete.
+    """
+    try:
+        row = conn.execute(
+            "SELECT version FROM meta_version WHERE scope = 'node_degrees'"
+        ).fetchone()
+    except sqlite3.OperationalError:
+        return False
+    return row is not None and row[0] >= 0
+
+
+def _derived_current(conn: sqlite3.Connection, scope: str) -> bool:
+    try:
+        rows = dict(
+            conn.execute(
+                "SELECT scope, version FROM meta_version WHERE scope IN ('meta_edges', ?)",
+                (scope,),
+            ).fetchall()
+        )
+    except sqlite3.OperationalError:
+        return False
+    return rows.get(scope, -1) == rows.get("meta_edges")
+
+
+# ---------------------------------------------------------------------------
+# Kinetic parameter aggregation
+# ---------------------------------------------------------------------------
+
+_KINETIC_AGGREGATIONS = frozenset({"mean", "median", "weighted"})
+
+
+def _nan_to_none(values: np.ndarray) -> list[float | None]:
+    return [None if v != v else v for v in values.tolist()]
+
+
+def _aggregate(
+    groups: np.ndarray,
+    values: np.ndarray,
+    weights: np.ndarray,
+    n_groups: int,
+    agg: str,
+) -> np.ndarray:
+    """
+    Aggregate *values* per group, skipping NaNs; empty groups yield NaN.
+
+    :param groups: Group index of each value (``0 … n_groups-1``).
+    :param values: Values, NaN where missing.
+    :param weights: Per-value weights (used by ``"weighted"``).
+    :param n_groups: Number of groups.
+    :param agg: ``"mean"``, ``"median"`` or ``"weighted"``.
+    :return: Array of length *n_groups*.
+    """
+    ok = ~np.isnan(values)
+    g, v, w = groups[ok], values[ok], weights[ok]
+    out = np.full(n_groups, np.nan)
+    if not len(v):
+        return out
+    if agg == "median":
+        order = np.lexsort((v, g))
+        g, v = g[order], v[order]
+        counts = np.bincount(g, minlength=n_groups)
+        present = counts > 0
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        lo = starts + (counts - 1) // 2
+        hi = starts + counts // 2
+        out[present] = 0.5 * (v[lo[present]] + v[hi[present]])
+        return out
+    if agg == "mean":
+        w = np.ones_like(v)
+    total = np.bincount(g, weights=w, minlength=n_groups)
+    weighted = np.bincount(g, weights=w * v, minlength=n_groups)
+    present = total > 0
+    out[present] = weighted[present] / total[present]
+    # Groups whose rows all carry zero weight fall back to the plain mean
+    unweighted = ~present & (np.bincount(g, minlength=n_groups) > 0)
+    if unweighted.any():
+        out[unweighted] = _aggregate(groups, values, np.ones_like(weights), n_groups, "mean")[
+            unweighted
+        ]
+    return out
+
 
 class MetaStore:
     """
@@ -146,11 +538,47 @@ class MetaStore:
         if "category" not in existing_cols:
             self._conn.execute("ALTER TABLE meta_nodes ADD COLUMN category TEXT")
             self._conn.commit()
+        # Superseded by idx_meta_edges_dst_rel
+        self._conn.execute("DROP INDEX IF EXISTS idx_meta_edges_dst")
+        # Per-row triggers from before the write guard existed
+        for op in ("insert", "update", "delete"):
+            for table in VERSIONED_TABLES:
+                self._conn.execute(f"DROP TRIGGER IF EXISTS trg_version_{table}_{op}")
+            self._conn.execute(f"DROP TRIGGER IF EXISTS trg_degrees_meta_edges_{op}")
+        self._conn.commit()
+        if not pathway_members_current(self._conn):
+            self.refresh_pathway_members()
+        if not node_degrees_current(self._conn):
+            self.rebuild_node_degrees()
 
     # ------------------------------------------------------------------
     # Write
     # ------------------------------------------------------------------
 
+    @contextmanager
+    def _bulk_write(self, *tables: str) -> Iterator[None]:
+        """
+        Silence the per-row version triggers and bump each of *tables* once.
+
+        The guard row is written inside the caller's transaction, so other
+        connections never see it.
+
+        :param tables: Versioned tables the block modifies.
+        """
+        self._conn.execute(
+            "INSERT OR IGNORE INTO meta_version (scope, version) VALUES ('write_guard', 1)"
+        )
+        try:
+            yield
+        finally:
+            self._conn.execute("DELETE FROM meta_version WHERE scope = 'write_guard'")
+        if tables:
+            self._conn.execute(
+                "UPDATE meta_version SET version = version + 1 "
+                "WHERE scope IN (SELECT value FROM json_each(?))",
+                (json.dumps(list(tables)),),
+            )
+
     def write(
         self,
         nodes: Iterable[MetaNode],
@@ -165,12 +593,6 @@ class MetaStore:
         :param edges: Iterable of :class:`~code_kg.metakg.primitives.MetaEdge`.
         :param wipe: If ``True``, truncate all tables before writing.
         """
-        cur = self._conn.cursor()
-        if wipe:
-            cur.execute("DELETE FROM meta_edges")
-            cur.execute("DELETE FROM xref_index")
-            cur.execute("DELETE FROM meta_nodes")
-
         node_rows = [
             (
                 n.id,
@@ -188,24 +610,329 @@ class MetaStore:
             )
             for n in nodes
         ]
-        cur.executemany(
+        edge_rows = [(e.src, e.rel, e.dst, e.evidence) for e in edges]
+        changed = [
+            table
+            for table, rows in (("meta_nodes", node_rows), ("meta_edges", edge_rows))
+            if rows or wipe
+        ]
+        cur = self._conn.cursor()
+        with self._bulk_write(*changed):
+            if wipe:
+                cur.execute("DELETE FROM meta_edges")
+                cur.execute("DELETE FROM xref_index")
+                cur.execute("DELETE FROM meta_nodes")
+                cur.execute("DELETE FROM pathway_members")
+                cur.execute("DELETE FROM node_modules")
+                cur.execute("DELETE FROM derived_settings")
+                cur.execute("DELETE FROM pathway_minhash")
+                cur.execute("DELETE FROM pathway_lsh")
+            cur.executemany(
+                """
+                INSERT OR REPLACE INTO meta_nodes
+                (id, kind, name, description, formula, charge, ec_number,
+                 stoichiometry, xrefs, source_format, source_file, category)
+                VALUES (?,?,?,?,?,?,?,?,?,?,?,?)
+                """,
+                node_rows,
+            )
+            cur.executemany(
+                "INSERT OR IGNORE INTO meta_edges (src, rel, dst, evidence) VALUES (?,?,?,?)",
+                edge_rows,
+            )
+            endpoints = {n for row in edge_rows for n in (row[0], row[2])}
+            if wipe or endpoints:
+                self._recount_node_degrees(None if wipe else endpoints)
+
+        touched = {row[0] for row in node_rows} | endpoints
+        self._refresh_pathway_members(None if wipe else self._affected_pathways(touched))
+        self._conn.commit()
+
+    # ------------------------------------------------------------------
+    # Pathway membership
+    # ------------------------------------------------------------------
+
+    def refresh_pathway_members(self, pathway_ids: Iterable[str] | None = None) -> int:
+        """
+        Rebuild ``pathway_members`` for *pathway_ids*, or for every pathway.
+
+        :meth:`write` keeps the table current by refreshing only the pathways
+        its nodes and edges touch; call this after changing ``meta_edges``
+        by other means.
+
+        :param pathway_ids: Pathways to refresh; ``None`` rebuilds the table.
+        :return: Number of membership rows written.
+        """
+        n = self._refresh_pathway_members(None if pathway_ids is None else set(pathway_ids))
+        self._conn.commit()
+        return n
+
+    def _refresh_pathway_members(self, pathway_ids: set[str] | None) -> int:
+        n = 0
+        if pathway_ids is None:
+            self._conn.execute("DELETE FROM pathway_members")
+            n = self._conn.execute(_PATHWAY_MEMBERS_SQL).rowcount
+        elif pathway_ids:
+            ids = json.dumps(sorted(pathway_ids))
+            self._conn.execute(
+                "DELETE FROM pathway_members WHERE pathway_id IN (SELECT value FROM json_each(?))",
+                (ids,),
+            )
+            n = self._conn.execute(_PATHWAY_MEMBERS_IDS_SQL, {"ids": ids}).rowcount
+        # Record the edge version this membership was derived from
+        self._conn.execute(
+            "UPDATE meta_version SET version = "
+            "(SELECT version FROM meta_version WHERE scope = 'meta_edges') "
+            "WHERE scope = 'pathway_members'"
+        )
+        return n
+
+    def _ensure_pathway_members(self) -> None:
+        """Rebuild the membership table if ``meta_edges`` changed outside :meth:`write`."""
+        if not pathway_members_current(self._conn):
+            self.refresh_pathway_members()
+
+    def _affected_pathways(self, touched: set[str]) -> set[str]:
+        """Pathways whose membership may change when *touched* nodes change."""
+        if not touched:
+            return set()
+        ids = json.dumps(sorted(touched))
+        cur = self._conn.execute(
             """
-            INSERT OR REPLACE INTO meta_nodes
-            (id, kind, name, description, formula, charge, ec_number,
-             stoichiometry, xrefs, source_format, source_file, category)
-            VALUES (?,?,?,?,?,?,?,?,?,?,?,?)
+            SELECT id FROM meta_nodes
+            WHERE  kind = 'pathway' AND id IN (SELECT value FROM json_each(:ids))
+            UNION
+            SELECT pathway_id FROM pathway_members
+            WHERE  node_id IN (SELECT value FROM json_each(:ids))
+               OR  pathway_id IN (SELECT value FROM json_each(:ids))
             """,
-            node_rows,
+            {"ids": ids},
         )
+        return {r[0] for r in cur.fetchall()}
 
-        edge_rows = [(e.src, e.rel, e.dst, e.evidence) for e in edges]
-        cur.executemany(
-            "INSERT OR IGNORE INTO meta_edges (src, rel, dst, evidence) VALUES (?,?,?,?)",
-            edge_rows,
+    def pathway_members(
+        self,
+        pathway_id: str,
+        *,
+        kind: str | None = None,
+        via: Iterable[str] | None = None,
+    ) -> list[str]:
+        """
+        Return the member node IDs of a pathway from the materialised table.
+
+        :param pathway_id: Pathway node ID.
+        :param kind: Restrict to one node kind (e.g. ``"reaction"``).
+        :param via: Restrict to membership routes (``"contains"``,
+            ``"substrate"``, ``"product"``, ``"catalyzes"``).
+        :return: Sorted, de-duplicated node IDs.
+        """
+        self._ensure_pathway_members()
+        sql = "SELECT DISTINCT node_id FROM pathway_members WHERE pathway_id = ?"
+        params: list[str] = [pathway_id]
+        if kind is not None:
+            sql += " AND kind = ?"
+            params.append(kind)
+        if via is not None:
+            vias = list(via)
+            sql += f" AND via IN ({','.join('?' * len(vias))})"
+            params += vias
+        cur = self._conn.execute(sql + " ORDER BY node_id", params)
+        return [r[0] for r in cur.fetchall()]
+
+    def pathway_member_map(self, *, kind: str | None = None) -> dict[str, set[str]]:
+        """
+        Return ``{pathway_id: {node_id, ...}}`` for every pathway in one query.
+
+        :param kind: Restrict members to one node kind.
+        :return: Membership map over all routes.
+        """
+        self._ensure_pathway_members()
+        if kind is None:
+            cur = self._conn.execute("SELECT pathway_id, node_id FROM pathway_members")
+        else:
+            cur = self._conn.execute(
+                "SELECT pathway_id, node_id FROM pathway_members WHERE kind = ?", (kind,)
+            )
+        members: dict[str, set[str]] = {}
+        for pwy_id, nid in cur:
+            members.setdefault(pwy_id, set()).add(nid)
+        return members
+
+    # ------------------------------------------------------------------
+    # Degrees and topology
+    # ------------------------------------------------------------------
+
+    def rebuild_node_degrees(self) -> int:
+        """
+        Recount ``node_degrees`` from ``meta_edges``.
+
+        The table is kept exact by triggers and :meth:`write`; this
+        backfills databases created before it existed.
+
+        :return: Number of degree rows written.
+        """
+        n = self._recount_node_degrees(None)
+        self._conn.execute("UPDATE meta_version SET version = 0 WHERE scope = 'node_degrees'")
+        self._conn.commit()
+        return n
+
+    def _recount_node_degrees(self, node_ids: set[str] | None) -> int:
+        """Recount the degree rows of *node_ids* (``None``: every node)."""
+        if node_ids is None:
+            self._conn.execute("DELETE FROM node_degrees")
+            return self._conn.execute(_NODE_DEGREES_SQL).rowcount
+        ids = json.dumps(sorted(node_ids))
+        self._conn.execute(
+            "DELETE FROM node_degrees WHERE node_id IN (SELECT value FROM json_each(?))", (ids,)
+        )
+        return self._conn.execute(_NODE_DEGREES_IDS_SQL, {"ids": ids}).rowcount
+
+    def degrees(self, node_id: str) -> dict[str, tuple[int, int]]:
+        """
+        Return ``{rel: (in_degree, out_degree)}`` for one node.
+
+        :param node_id: Node ID.
+        :return: Per-relation edge counts; empty for a node without edges.
+        """
+        cur = self._conn.execute(
+            "SELECT rel, in_degree, out_degree FROM node_degrees WHERE node_id = ?", (node_id,)
+        )
+        return {r[0]: (r[1], r[2]) for r in cur.fetchall()}
+
+    # ------------------------------------------------------------------
+    # Modules
+    # ------------------------------------------------------------------
+
+    def write_node_modules(
+        self, assignment: dict[str, int], *, settings: dict[str, Any] | None = None
+    ) -> int:
+        """
+        Replace the stored module assignment.
+
+        The assignment is tagged with the current ``meta_edges`` version;
+        :func:`node_modules_current` turns false after the next edge change.
+
+        :param assignment: ``{node_id: module}``.
+        :param settings: Options it was computed with (see
+            :func:`node_modules_settings`).
+        :return: Number of rows written.
+        """
+        self._conn.execute("DELETE FROM node_modules")
+        self._conn.executemany(
+            "INSERT INTO node_modules (node_id, module) VALUES (?,?)", assignment.items()
+        )
+        self._conn.execute(
+            "INSERT OR REPLACE INTO derived_settings (scope, settings) VALUES ('node_modules', ?)",
+            (json.dumps(settings or {}, sort_keys=True),),
+        )
+        self._conn.execute(
+            "UPDATE meta_version SET version = "
+            "(SELECT version FROM meta_version WHERE scope = 'meta_edges') "
+            "WHERE scope = 'node_modules'"
+        )
+        self._conn.commit()
+        return len(assignment)
+
+    def node_modules(self) -> dict[str, int]:
+        """
+        Return the stored ``{node_id: module}`` assignment (empty if never computed).
+
+        Check :func:`node_modules_current` to see whether it reflects the
+        current edges.
+        """
+        return {r[0]: r[1] for r in self._conn.execute("SELECT node_id, module FROM node_modules")}
+
+    def module_members(self, module: int) -> list[str]:
+        """
+        Return the node IDs assigned to *module*.
+
+        :param module: Module number (``0`` is the largest).
+        :return: Sorted node IDs.
+        """
+        cur = self._conn.execute(
+            "SELECT node_id FROM node_modules WHERE module = ? ORDER BY node_id", (module,)
         )
+        return [r[0] for r in cur.fetchall()]
+
+    # ------------------------------------------------------------------
+    # Pathway similarity index
+    # ------------------------------------------------------------------
+
+    def write_pathway_minhash(
+        self,
+        signatures: Iterable[tuple[str, int, bytes]],
+        buckets: Iterable[tuple[int, int, str]],
+    ) -> None:
+        """
+        Replace the stored pathway MinHash signatures and LSH buckets.
+
+        The index is tagged with the current ``meta_edges`` version;
+        :func:`pathway_minhash_current` turns false after the next edge change.
 
+        :param signatures: ``(pathway_id, n_members, signature)`` rows.
+        :param buckets: ``(band, bucket, pathway_id)`` rows.
+        """
+        self._conn.execute("DELETE FROM pathway_minhash")
+        self._conn.execute("DELETE FROM pathway_lsh")
+        self._conn.executemany(
+            "INSERT INTO pathway_minhash (pathway_id, n_members, signature) VALUES (?,?,?)",
+            signatures,
+        )
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO pathway_lsh (band, bucket, pathway_id) VALUES (?,?,?)",
+            buckets,
+        )
+        self._conn.execute(
+            "UPDATE meta_version SET version = "
+            "(SELECT version FROM meta_version WHERE scope = 'meta_edges') "
+            "WHERE scope = 'pathway_minhash'"
+        )
         self._conn.commit()
 
+    def pathway_minhash(
+        self, pathway_ids: Iterable[str] | None = None
+    ) -> dict[str, tuple[int, bytes]]:
+        """
+        Return ``{pathway_id: (n_members, signature)}`` for the given pathways.
+
+        :param pathway_ids: Pathway node IDs (unknown IDs are skipped);
+            ``None`` returns every indexed pathway.
+        :return: Stored member counts and packed signatures.
+        """
+        sql = "SELECT pathway_id, n_members, signature FROM pathway_minhash"
+        if pathway_ids is None:
+            cur = self._conn.execute(sql)
+        else:
+            cur = self._conn.execute(
+                sql + " WHERE pathway_id IN (SELECT value FROM json_each(?))",
+                (json.dumps(sorted(pathway_ids)),),
+            )
+        return {r[0]: (r[1], r[2]) for r in cur.fetchall()}
+
+    def lsh_candidates(self, buckets: Iterable[int]) -> dict[str, tuple[int, bytes]]:
+        """
+        Return the signatures of pathways sharing an LSH bucket with the query.
+
+        One indexed statement: each band probes its ``(band, bucket)``
+        primary-key range and the candidates' signatures are joined in.
+
+        :param buckets: Bucket key of each band of the query signature, in band order.
+        :return: ``{pathway_id: (n_members, signature)}``, including the query pathway.
+        """
+        cur = self._conn.execute(
+            """
+            SELECT m.pathway_id, m.n_members, m.signature
+            FROM   pathway_minhash m
+            WHERE  m.pathway_id IN (
+                SELECT l.pathway_id
+                FROM   json_each(?) j
+                JOIN   pathway_lsh l ON l.band = j.key AND l.bucket = j.value
+            )
+            """,
+            (json.dumps(list(buckets)),),
+        )
+        return {r[0]: (r[1], r[2]) for r in cur.fetchall()}
+
     def build_xref_index(self) -> int:
         """
         Expand the ``xrefs`` JSON blob on every node into ``xref_index`` rows.
@@ -385,6 +1112,16 @@ class MetaStore:
         )
         return [dict(r) for r in cur.fetchall()]
 
+    def edge_pairs(self, rel: str) -> list[tuple[str, str]]:
+        """
+        Return ``(src, dst)`` for every edge of relation *rel* in one query.
+
+        :param rel: Edge relation, e.g. ``"CATALYZES"``.
+        :return: List of ``(src, dst)`` tuples.
+        """
+        cur = self._conn.execute("SELECT src, dst FROM meta_edges WHERE rel = ?", (rel,))
+        return [(r[0], r[1]) for r in cur.fetchall()]
+
     def reaction_detail(self, rxn_id: str) -> dict | None:
         """
         Retrieve a reaction node with its full substrate, product, and enzyme context.
@@ -677,19 +1414,20 @@ class MetaStore:
             )
             for p in params
         ]
-        self._conn.executemany(
-            """
-            INSERT OR REPLACE INTO kinetic_parameters
-            (id, enzyme_id, reaction_id, substrate_id,
-             km, kcat, vmax, ki, hill_coefficient,
-             delta_g_prime, equilibrium_constant,
-             ph, temperature_celsius, ionic_strength,
-             source_database, literature_reference,
-             organism, tissue, confidence_score, measurement_error)
-            VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-            """,
-            rows,
-        )
+        with self._bulk_write(*(("kinetic_parameters",) if rows else ())):
+            self._conn.executemany(
+                """
+                INSERT OR REPLACE INTO kinetic_parameters
+                (id, enzyme_id, reaction_id, substrate_id,
+                 km, kcat, vmax, ki, hill_coefficient,
+                 delta_g_prime, equilibrium_constant,
+                 ph, temperature_celsius, ionic_strength,
+                 source_database, literature_reference,
+                 organism, tissue, confidence_score, measurement_error)
+                VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+                """,
+                rows,
+            )
         self._conn.commit()
         return len(rows)
 
@@ -705,6 +1443,75 @@ class MetaStore:
         )
         return [dict(r) for r in cur.fetchall()]
 
+    def kinetic_params_for_reactions(
+        self,
+        reaction_ids: Iterable[str],
+        *,
+        agg: str = "mean",
+    ) -> dict[str, dict]:
+        """
+        Fetch and aggregate kinetic parameters for many reactions in one query.
+
+        All rows for *reaction_ids* are read in a single round-trip; values are
+        then grouped per reaction (and per reaction/substrate for Km) and
+        aggregated with vectorised NumPy, ignoring ``NULL`` entries.
+
+        :param reaction_ids: Reaction node IDs.
+        :param agg: ``"mean"`` (default), ``"median"``, or ``"weighted"``
+            (mean weighted by ``confidence_score``; rows without a score get weight 1).
+        :return: Map ``{reaction_id: {vmax, km, equilibrium_constant, km_by_substrate}}``
+            for reactions that have at least one row; aggregates are ``None`` when
+            every row lacks that value.
+        :raises ValueError: If *agg* is not a supported aggregation.
+        """
+        if agg not in _KINETIC_AGGREGATIONS:
+            raise ValueError(f"agg must be one of {sorted(_KINETIC_AGGREGATIONS)}, got {agg!r}")
+        ids = list(dict.fromkeys(reaction_ids))
+        if not ids:
+            return {}
+        rows = self._conn.execute(
+            """
+            SELECT reaction_id, substrate_id, km, vmax, equilibrium_constant, confidence_score
+            FROM kinetic_parameters
+            WHERE reaction_id IN (SELECT value FROM json_each(?))
+            """,
+            (json.dumps(ids),),
+        ).fetchall()
+        if not rows:
+            return {}
+
+        rxn_col = [r[0] for r in rows]
+        values = np.array([[np.nan if v is None else v for v in r[2:6]] for r in rows], dtype=float)
+        km, vmax, keq, conf = values.T
+        weights = np.where(np.isnan(conf), 1.0, conf)
+
+        rxn_keys, rxn_group = np.unique(rxn_col, return_inverse=True)
+        n = len(rxn_keys)
+        vmax_agg = _aggregate(rxn_group, vmax, weights, n, agg)
+        km_agg = _aggregate(rxn_group, km, weights, n, agg)
+        keq_agg = _aggregate(rxn_group, keq, weights, n, agg)
+
+        result: dict[str, dict] = {
+            rxn_id: {"vmax": v, "km": k, "equilibrium_constant": q, "km_by_substrate": {}}
+            for rxn_id, v, k, q in zip(
+                rxn_keys.tolist(),
+                _nan_to_none(vmax_agg),
+                _nan_to_none(km_agg),
+                _nan_to_none(keq_agg),
+            )
+        }
+
+        has_sub = np.array([r[1] is not None for r in rows]) & ~np.isnan(km)
+        if has_sub.any():
+            idx = np.flatnonzero(has_sub)
+            pairs = [f"{rxn_col[i]}\x00{rows[i][1]}" for i in idx]
+            pair_keys, pair_group = np.unique(pairs, return_inverse=True)
+            pair_km = _aggregate(pair_group, km[idx], weights[idx], len(pair_keys), agg)
+            for key, value in zip(pair_keys, pair_km):
+                rxn_id, sub_id = str(key).split("\x00", 1)
+                result[rxn_id]["km_by_substrate"][sub_id] = float(value)
+        return result
+
     def kinetic_params_for_enzyme(self, enzyme_id: str) -> list[dict]:
         """
         Fetch all kinetic parameter rows for an enzyme node.
@@ -772,15 +1579,16 @@ class MetaStore:
             )
             for ri in interactions
         ]
-        self._conn.executemany(
-            """
-            INSERT OR REPLACE INTO regulatory_interactions
-            (id, enzyme_id, compound_id, interaction_type,
-             ki_allosteric, hill_coefficient, site, organism, source_database)
-            VALUES (?,?,?,?,?,?,?,?,?)
-            """,
-            rows,
-        )
+        with self._bulk_write(*(("regulatory_interactions",) if rows else ())):
+            self._conn.executemany(
+                """
+                INSERT OR REPLACE INTO regulatory_interactions
+                (id, enzyme_id, compound_id, interaction_type,
+                 ki_allosteric, hill_coefficient, site, organism, source_database)
+                VALUES (?,?,?,?,?,?,?,?,?)
+                """,
+                rows,
+            )
         self._conn.commit()
         return len(rows)
 
@@ -815,6 +1623,32 @@ class MetaStore:
         )
         return [dict(r) for r in cur.fetchall()]
 
+    # ------------------------------------------------------------------
+    # Content versioning
+    # ------------------------------------------------------------------
+
+    def table_versions(self) -> dict[str, int]:
+        """
+        Return the change counter of every versioned table plus the database epoch.
+
+        Counters increase once per bulk write through :class:`MetaStore` and,
+        via triggers, on every row changed by other means, so any two reads
+        returning equal values saw identical table contents.
+
+        :return: Map ``{scope: version}`` including ``"epoch"``.
+        """
+        cur = self._conn.execute("SELECT scope, version FROM meta_version")
+        return {row["scope"]: int(row["version"]) for row in cur.fetchall()}
+
+    def content_version(self, tables: Iterable[str] = VERSIONED_TABLES) -> str:
+        """
+        Return an opaque token that changes whenever any of *tables* changes.
+
+        :param tables: Versioned table names to include (default: all).
+        :return: Token such as ``"7f3a…:meta_nodes=12,meta_edges=40"``.
+        """
+        return read_content_version(self._conn, tables)
+
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
@@ -0,0 +1,306 @@
+"""
+sweep.py — FBA across every pathway in the store.
+
+Runs one flux balance analysis per pathway and reports a table row for each
+(objective, solver status, active reactions).  The network is assembled
+once: the genome-wide stoichiometric matrix is built a single time, straight
+from COO triplets into a sparse CSC matrix (never as a dense array), and each pathway's sub-model is sliced out of it by
+column (its reactions) and row (the compounds those reactions touch).  This
+matches what ``run_fba(SimulationConfig(pathway_id=...))`` would assemble
+from the database for that pathway.
+
+With ``workers > 1`` the sub-models are solved in a process pool; the shared
+matrix is shipped once to each worker through the pool initializer.
+
+Usage::
+
+    from metakg.sweep import sweep_pathways_fba, write_table
+
+    rows = sweep_pathways_fba(sim, workers=8)
+    write_table(rows, "pathway_fba.parquet")   # or .csv
+"""
+
+from __future__ import annotations
+
+import csv
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from scipy.sparse import csc_matrix
+
+from metakg.parallel import pool_context
+from metakg.simulate import MetabolicSimulator, SimulationConfig, _require_pyarrow
+
+#: Fluxes with a smaller magnitude count as inactive.
+ACTIVE_TOL: float = 1e-9
+
+#: Column order of sweep rows.
+SWEEP_COLUMNS: tuple[str, ...] = (
+    "pathway_id",
+    "name",
+    "n_reactions",
+    "n_compounds",
+    "status",
+    "objective_value",
+    "n_active",
+    "active_reactions",
+    "elapsed_s",
+    "message",
+)
+
+# ---------------------------------------------------------------------------
+# Shared model
+# ---------------------------------------------------------------------------
+
+
+class SharedModel:
+    """
+    Genome-wide stoichiometry with column slicing into pathway sub-models.
+
+    :param rxn_ids: Reaction IDs labelling the columns.
+    :param cpd_ids: Compound IDs labelling the rows.
+    :param S: Stoichiometric matrix (dense or sparse).
+    :param rev_flags: Reversibility per reaction.
+    """
+
+    def __init__(
+        self,
+        rxn_ids: list[str],
+        cpd_ids: list[str],
+        S: Any,
+        rev_flags: Mapping[str, bool],
+    ) -> None:
+        self.rxn_ids = rxn_ids
+        self.cpd_ids = cpd_ids
+        self.S = csc_matrix(S)
+        self.rev_flags = dict(rev_flags)
+        self.rxn_index = {r: j for j, r in enumerate(rxn_ids)}
+
+    def submodel(self, cols: list[int]) -> tuple[list[str], list[str], np.ndarray]:
+        """
+        Slice the sub-model spanned by *cols*.
+
+        :param cols: Column indices.
+        :return: ``(rxn_ids, cpd_ids, S_sub)`` with only the compounds the
+            selected reactions touch, in the shared (sorted) compound order.
+        """
+        sub = self.S[:, cols]
+        rows = np.unique(sub.indices)
+        return (
+            [self.rxn_ids[j] for j in cols],
+            [self.cpd_ids[i] for i in rows],
+            sub[rows].toarray(),
+        )
+
+
+def pathway_reactions(store: Any, model: SharedModel) -> dict[str, list[int]]:
+    """
+    Map every pathway to the model columns of the reactions it CONTAINS.
+
+    :param store: :class:`~metakg.store.MetaStore`.
+    :param model: Shared model whose column indices are returned.
+    :return: ``{pathway_id: [column, ...]}`` for every pathway node, sorted by ID.
+    """
+    contained = store.pathway_member_map(kind="reaction")
+    members: dict[str, list[int]] = {}
+    for p in store.all_nodes(kind="pathway"):
+        cols = (model.rxn_index.get(r) for r in contained.get(p["id"], ()))
+        members[p["id"]] = sorted(j for j in cols if j is not None)
+    return dict(sorted(members.items()))
+
+
+def _solve_row(
+    sim: MetabolicSimulator,
+    model: SharedModel,
+    config: SimulationConfig,
+    pathway_id: str,
+    cols: list[int],
+) -> dict[str, Any]:
+    t0 = time.perf_counter()
+    rxn_ids, cpd_ids, S = model.submodel(cols)
+    result = sim.solve_fba(rxn_ids, cpd_ids, S, model.rev_flags, config)
+    active = [r for r, v in zip(result.reaction_ids, result.flux_values) if abs(v) > ACTIVE_TOL]
+    return {
+        "pathway_id": pathway_id,
+        "n_reactions": len(rxn_ids),
+        "n_compounds": len(cpd_ids),
+        "status": result.status,
+        "objective_value": result.objective_value,
+        "n_active": len(active),
+        "active_reactions": " ".join(active),
+        "elapsed_s": round(time.perf_counter() - t0, 6),
+        "message": result.message,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Worker processes
+# ---------------------------------------------------------------------------
+
+_WORKER: dict[str, Any] = {}
+
+
+def _init_worker(db_path: str, model: SharedModel, config: SimulationConfig) -> None:
+    """Keep the shared model and a simulator (for its LP helpers) in the worker."""
+    from metakg.store import MetaStore
+
+    _WORKER.update(sim=MetabolicSimulator(MetaStore(db_path)), model=model, config=config)
+
+
+def _solve_in_worker(pathway_id: str, cols: list[int]) -> dict[str, Any]:
+    return _solve_row(_WORKER["sim"], _WORKER["model"], _WORKER["config"], pathway_id, cols)
+
+
+# ---------------------------------------------------------------------------
+# Sweep
+# ---------------------------------------------------------------------------
+
+
+def sweep_pathways_fba(
+    simulator: MetabolicSimulator,
+    config: SimulationConfig | None = None,
+    *,
+    pathway_ids: Iterable[str] | None = None,
+    workers: int = 1,
+    progress: Callable[[int, int, dict[str, Any]], None] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Run FBA on every pathway's sub-model, yielding one summary row each.
+
+    :param simulator: Simulator whose store provides the network.
+    :param config: Objective, bounds and solver options shared by all pathways
+        (its scope fields are ignored).  Defaults to :class:`SimulationConfig`.
+    :param pathway_ids: Restrict the sweep to these pathways (default: all).
+    :param workers: Worker processes; ``1`` solves in-process.
+    :param progress: Called as ``progress(n_done, n_total, row)``.
+    :return: Iterator of rows with the keys in :data:`SWEEP_COLUMNS`, in
+        pathway-ID order.  Pathways with no reactions get status ``"empty"``.
+    """
+    config = config or SimulationConfig()
+    store = simulator._store
+    rxn_ids, cpd_ids, S, rev_flags = simulator._build_stoich_sparse(
+        SimulationConfig(pathway_id=None, reaction_ids=None)
+    )
+    model = SharedModel(rxn_ids, cpd_ids, S, rev_flags)
+    members = pathway_reactions(store, model)
+    if pathway_ids is not None:
+        wanted = [store.resolve_id(p) or p for p in pathway_ids]
+        members = {p: members.get(p, []) for p in wanted}
+    names = {p["id"]: p["name"] for p in store.all_nodes(kind="pathway")}
+    total = len(members)
+
+    def _named(pathway_id: str, row: dict[str, Any]) -> dict[str, Any]:
+        return {"pathway_id": pathway_id, "name": names.get(pathway_id, pathway_id)} | row
+
+    def _empty() -> dict[str, Any]:
+        return {
+            "n_reactions": 0,
+            "n_compounds": 0,
+            "status": "empty",
+            "objective_value": None,
+            "n_active": 0,
+            "active_reactions": "",
+            "elapsed_s": 0.0,
+            "message": "Pathway contains no reactions.",
+        }
+
+    done = 0
+    if workers <= 1:
+        for pathway_id, cols in members.items():
+            row = _solve_row(simulator, model, config, pathway_id, cols) if cols else _empty()
+            row = _named(pathway_id, row)
+            done += 1
+            if progress is not None:
+                progress(done, total, row)
+            yield row
+        return
+
+    window = 4 * workers
+    pending: deque[tuple[str, Future | None]] = deque()
+
+    def _collect() -> dict[str, Any]:
+        pathway_id, future = pending.popleft()
+        row = future.result() if future is not None else _empty()
+        return _named(pathway_id, row)
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=pool_context(),
+        initializer=_init_worker,
+        initargs=(str(store.db_path), model, config),
+    ) as pool:
+        for pathway_id, cols in members.items():
+            future = pool.submit(_solve_in_worker, pathway_id, cols) if cols else None
+            pending.append((pathway_id, future))
+            while len(pending) >= window:
+                row = _collect()
+                done += 1
+                if progress is not None:
+                    progress(done, total, row)
+                yield row
+        while pending:
+            row = _collect()
+            done += 1
+            if progress is not None:
+                progress(done, total, row)
+            yield row
+
+
+# ---------------------------------------------------------------------------
+# Output
+# ---------------------------------------------------------------------------
+
+
+def write_table(rows: Iterable[Mapping[str, Any]], path: str | Path) -> int:
+    """
+    Write sweep rows to Parquet (``.parquet``) or CSV (any other suffix).
+
+    CSV rows are streamed to disk as they arrive; Parquet needs ``pyarrow``
+    and is written once all rows are in.
+
+    :param rows: Rows with the keys in :data:`SWEEP_COLUMNS`.
+    :param path: Output file.
+    :return: Number of rows written.
+    :raises ImportError: For Parquet output without ``pyarrow``.
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".parquet":
+        pa = _require_pyarrow()
+        import pyarrow.parquet as pq
+
+        data = [dict(r) for r in rows]
+        table = pa.Table.from_pylist(data, schema=_arrow_schema(pa))
+        pq.write_table(table, path)
+        return len(data)
+
+    n = 0
+    with open(path, "w", newline="", encoding="utf-8") as fh:
+        writer = csv.DictWriter(fh, fieldnames=SWEEP_COLUMNS, extrasaction="ignore")
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            fh.flush()
+            n += 1
+    return n
+
+
+def _arrow_schema(pa: Any) -> Any:
+    return pa.schema(
+        [
+            ("pathway_id", pa.string()),
+            ("name", pa.string()),
+            ("n_reactions", pa.int64()),
+            ("n_compounds", pa.int64()),
+            ("status", pa.string()),
+            ("objective_value", pa.float64()),
+            ("n_active", pa.int64()),
+            ("active_reactions", pa.string()),
+            ("elapsed_s", pa.float64()),
+            ("message", pa.string()),
+        ]
+    )
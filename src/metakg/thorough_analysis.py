@@ -23,7 +23,7 @@ Last Revision: 2026-02-28 21:15:00
 from __future__ import annotations
 
 from metakg import __version__
-from metakg.analyze import PathwayAnalysisReport
+from metakg.analyze import PathwayAnalysisReport, _render_centrality, _render_modules
 
 
 def _risk(n: int) -> str:
@@ -115,8 +115,14 @@ def render_thorough_report(report: PathwayAnalysisReport, *, markdown: bool = Tr
     )
     lines.append(
         f"- **Network health:** {100 - len(report.isolated_nodes) // max(1, report.total_nodes) * 100:.0f}% connected, "
-        f"{len(report.dead_end_metabolites)} dead-ends\n"
+        f"{len(report.dead_end_metabolites)} dead-ends"
     )
+    if report.bottlenecks:
+        lines.append(
+            f"- **Top bottleneck:** {report.bottlenecks[0].name} "
+            f"(betweenness {report.bottlenecks[0].betweenness:.4f})"
+        )
+    lines.append("")
 
     # ---- Baseline Metrics ----
     h(2, "📈 Baseline Metrics")
@@ -306,6 +312,12 @@ def render_thorough_report(report: PathwayAnalysisReport, *, markdown: bool = Tr
     else:
         lines.append("_No enzyme–reaction relationships found._")
 
+    # ---- Centrality ----
+    _render_centrality(report, lines, h, row, th, title="🎯 Network Centrality")
+
+    # ---- Modules ----
+    _render_modules(report, lines, h, row, th, title="🧩 Metabolic Modules")
+
     # ---- Network Health Issues ----
     h(2, "⚠️  Network Health Issues")
     health_issues: list[str] = []
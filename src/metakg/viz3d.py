@@ -69,6 +69,7 @@ def _build_qt_window(
     layout_name: str,
     width: int,
     height: int,
+    pathway_members: dict[str, set[str]] | None = None,
 ) -> None:
     """
     Build and show the Qt MainWindow containing the PyVista BackgroundPlotter.
@@ -81,6 +82,8 @@ def _build_qt_window(
     :param layout_name: Display name of the active layout (``"allium"`` or ``"cake"``).
     :param width: Total window width in pixels.
     :param height: Total window height in pixels.
+    :param pathway_members: ``{pathway_id: {member_id, ...}}`` from
+        :meth:`~metakg.store.MetaStore.pathway_member_map`.
     """
     import sys
 
@@ -121,28 +124,14 @@ def _build_qt_window(
     pathway_nodes = [n for n in layout_nodes if n.kind == KIND_PATHWAY]
     pathway_id_to_name: dict[str, str] = {n.id: n.name for n in pathway_nodes}
 
-    # Build CONTAINS adjacency for pathway subgraph filtering.
-    # pathway_id → set of all descendant node IDs (direct + transitive)
-    children_map: dict[str, list[str]] = {}
-    for e in layout_edges:
-        if e.rel == "CONTAINS":
-            children_map.setdefault(e.src, []).append(e.dst)
+    # Pathway subgraph filtering reads the materialised membership
+    # (CONTAINS closure plus compounds and enzymes of contained reactions).
+    members_map = pathway_members or {}
 
     # Filter pathways: only keep those with member nodes
-    pathways_with_nodes: dict[str, str] = {}
-    for pw_id, pw_name in pathway_id_to_name.items():
-        # Get all member nodes of this pathway (BFS via CONTAINS)
-        member_nodes = {pw_id}
-        queue = list(children_map.get(pw_id, []))
-        while queue:
-            nid = queue.pop()
-            if nid not in member_nodes:
-                member_nodes.add(nid)
-                queue.extend(children_map.get(nid, []))
-
-        # Only include if pathway has member nodes (more than just itself)
-        if len(member_nodes) > 1:
-            pathways_with_nodes[pw_id] = pw_name
+    pathways_with_nodes: dict[str, str] = {
+        pw_id: pw_name for pw_id, pw_name in pathway_id_to_name.items() if members_map.get(pw_id)
+    }
 
     pathway_id_to_name = pathways_with_nodes
     pathway_names_sorted = sorted(pathway_id_to_name.values())
@@ -176,15 +165,8 @@ def _build_qt_window(
     pos_holder: list[dict[str, Any]] = [positions]
 
     def _pathway_member_ids(pathway_id: str) -> set[str]:
-        """BFS to collect all nodes reachable from a pathway via CONTAINS."""
-        visited: set[str] = {pathway_id}
-        queue = list(children_map.get(pathway_id, []))
-        while queue:
-            nid = queue.pop()
-            if nid not in visited:
-                visited.add(nid)
-                queue.extend(children_map.get(nid, []))
-        return visited
+        """Return the pathway and all of its members."""
+        return {pathway_id, *members_map.get(pathway_id, ())}
 
     def _on_pick(picked_mesh: Any) -> None:
         """
@@ -342,16 +324,7 @@ def _build_qt_window(
         else:
             pw_id = name_to_id.get(selected)
             if pw_id:
-                # Get CONTAINS members first
-                pathway_members = _pathway_member_ids(pw_id)
-                # Also include compounds/enzymes connected to pathway nodes
-                connected_ids = set(pathway_members)
-                for e in layout_edges:
-                    if e.src in pathway_members and e.rel != "CONTAINS":
-                        connected_ids.add(e.dst)
-                    if e.dst in pathway_members and e.rel != "CONTAINS":
-                        connected_ids.add(e.src)
-                active_node_ids = connected_ids
+                active_node_ids = _pathway_member_ids(pw_id)
             else:
                 active_node_ids = None
 
@@ -802,6 +775,8 @@ def launch(
         edges_data = store.query_edges()
         print(f" {len(edges_data)} loaded")
 
+        pathway_members = store.pathway_member_map()
+
         if not nodes_data:
             print("WARNING: No nodes found in the database")
             store.close()
@@ -876,6 +851,7 @@ def launch(
             layout_name=layout_name,
             width=width,
             height=height,
+            pathway_members=pathway_members,
         )
 
     finally:
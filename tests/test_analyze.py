@@ -0,0 +1,346 @@
+"""
+Tests for metakg.analyze — the thorough pathway analyzer.
+"""
+
+import json
+import random
+import sqlite3
+from dataclasses import replace
+
+import pytest
+
+from metakg.analysis_cache import AnalysisCache
+from metakg.analysis_export import AnalysisExporter, export_report, read_table
+from metakg.analyze import (
+    PathwayAnalyzer,
+    _CouplingMatrix,
+    _top_shared_pairs,
+    _top_shared_pairs_python,
+    render_report,
+)
+from metakg.modules import detect_modules
+from metakg.primitives import (
+    KIND_COMPOUND,
+    KIND_ENZYME,
+    KIND_PATHWAY,
+    KIND_REACTION,
+    MetaEdge,
+    MetaNode,
+    node_id,
+)
+from metakg.store import MetaStore
+
+P1 = node_id(KIND_PATHWAY, "kegg", "map00010")
+P2 = node_id(KIND_PATHWAY, "kegg", "map00020")
+P3 = node_id(KIND_PATHWAY, "kegg", "map00030")
+CPDS = [node_id(KIND_COMPOUND, "kegg", f"C{n:05d}") for n in range(1, 7)]
+RXNS = [node_id(KIND_REACTION, "kegg", f"R{n:05d}") for n in range(1, 5)]
+ENZ = node_id(KIND_ENZYME, "ec", "2.7.1.1")
+LONE = node_id(KIND_COMPOUND, "kegg", "C09999")
+
+
+@pytest.fixture()
+def db(tmp_path):
+    """Three pathways: P1 and P2 share three compounds, P2 and P3 share one."""
+    c1, c2, c3, c4, c5, c6 = CPDS
+    r1, r2, r3, r4 = RXNS
+    path = tmp_path / "test.sqlite"
+    s = MetaStore(path)
+    s.write(
+        [
+            MetaNode(id=P1, kind=KIND_PATHWAY, name="Glycolysis"),
+            MetaNode(id=P2, kind=KIND_PATHWAY, name="TCA cycle"),
+            MetaNode(id=P3, kind=KIND_PATHWAY, name="Pentose phosphate"),
+            *(MetaNode(id=c, kind=KIND_COMPOUND, name=f"cpd{k}") for k, c in enumerate(CPDS, 1)),
+            *(MetaNode(id=r, kind=KIND_REACTION, name=r) for r in RXNS),
+            MetaNode(id=ENZ, kind=KIND_ENZYME, name="hexokinase", ec_number="2.7.1.1"),
+            MetaNode(id=LONE, kind=KIND_COMPOUND, name="lonely"),
+        ],
+        [
+            MetaEdge(src=c1, rel="SUBSTRATE_OF", dst=r1),
+            MetaEdge(src=r1, rel="PRODUCT_OF", dst=c2),
+            MetaEdge(src=c2, rel="SUBSTRATE_OF", dst=r2),
+            MetaEdge(src=c3, rel="SUBSTRATE_OF", dst=r2),
+            MetaEdge(src=r2, rel="PRODUCT_OF", dst=c4),
+            MetaEdge(src=c4, rel="SUBSTRATE_OF", dst=r3),
+            MetaEdge(src=r3, rel="PRODUCT_OF", dst=c5),
+            MetaEdge(src=c5, rel="SUBSTRATE_OF", dst=r4),
+            MetaEdge(src=r4, rel="PRODUCT_OF", dst=c6),
+            MetaEdge(src=ENZ, rel="CATALYZES", dst=r1),
+            MetaEdge(src=P1, rel="CONTAINS", dst=r1),
+            MetaEdge(src=P1, rel="CONTAINS", dst=r2),
+            MetaEdge(src=P2, rel="CONTAINS", dst=r2),
+            MetaEdge(src=P2, rel="CONTAINS", dst=r3),
+            MetaEdge(src=P3, rel="CONTAINS", dst=r4),
+        ],
+    )
+    s.close()
+    return path
+
+
+def _brute_force(members, top_n):
+    pairs = [
+        (len(members[i] & members[j]), i, j)
+        for i in range(len(members))
+        for j in range(i + 1, len(members))
+        if members[i] & members[j]
+    ]
+    return sorted(pairs, key=lambda t: (-t[0], t[1], t[2]))[:top_n]
+
+
+def test_pathway_coupling_counts_and_names(db):
+    """Coupling pairs are ranked by shared compounds and carry resolved names."""
+    with PathwayAnalyzer(db) as analyzer:
+        report = analyzer.run()
+
+    couplings = report.pathway_couplings
+    assert [(c.pathway_a_id, c.pathway_b_id, c.shared_count) for c in couplings] == [
+        (P1, P2, 3),
+        (P2, P3, 1),
+    ]
+    assert couplings[0].pathway_a_name == "Glycolysis"
+    assert couplings[0].shared_names == ["cpd2", "cpd3", "cpd4"]
+    assert "TCA cycle" in render_report(report)
+
+
+@pytest.mark.parametrize("block", [1, 7, 512])
+def test_top_shared_pairs_matches_brute_force(block):
+    """Blocked sparse M·Mᵀ and the pure-Python fallback agree with all-pairs counting."""
+    rng = random.Random(3)
+    members = [{f"c{rng.randrange(40)}" for _ in range(rng.randrange(12))} for _ in range(60)]
+    expected = _brute_force(members, 25)
+
+    assert _top_shared_pairs(members, 25, block=block) == expected
+    assert _top_shared_pairs_python(members, 25) == expected
+    assert _top_shared_pairs(members[:1], 25) == []
+
+
+def _count_statements(path):
+    statements = []
+    with PathwayAnalyzer(path) as analyzer:
+        analyzer.conn.set_trace_callback(statements.append)
+        report = analyzer.run()
+    return report, len(statements)
+
+
+def test_statement_count_is_independent_of_graph_size(db):
+    """The whole report runs a fixed number of SQL statements; phases are timed."""
+    report, small = _count_statements(db)
+
+    s = MetaStore(db)
+    extra = [node_id(KIND_PATHWAY, "kegg", f"map{n:05d}") for n in range(100, 140)]
+    s.write(
+        [MetaNode(id=p, kind=KIND_PATHWAY, name=p) for p in extra],
+        [MetaEdge(src=p, rel="CONTAINS", dst=RXNS[k % 4]) for k, p in enumerate(extra)],
+    )
+    s.close()
+    big_report, big = _count_statements(db)
+
+    assert big == small
+    assert len(big_report.pathway_couplings) == 20
+    assert {"load", "phase1", "phase5", "profiles"} <= set(report.timings)
+    assert "Phase timings" in render_report(report)
+
+
+def test_topology_and_profiles(db):
+    """Dead ends, isolated nodes and per-pathway counts come from the shared tables."""
+    with PathwayAnalyzer(db) as analyzer:
+        report = analyzer.run()
+
+    assert report.total_nodes == 15 and report.edge_counts["CONTAINS"] == 5
+    assert [n["id"] for n in report.isolated_nodes] == [LONE]
+    assert {d.node_id: d.role for d in report.dead_end_metabolites} == {
+        CPDS[0]: "substrate-only",
+        CPDS[2]: "substrate-only",
+        CPDS[5]: "product-only",
+    }
+    profiles = {p.node_id: p for p in report.pathway_profiles}
+    assert (profiles[P1].reaction_count, profiles[P1].compound_count) == (2, 4)
+    assert profiles[P1].enzyme_count == 1
+    assert report.hub_metabolites[0].reaction_count == 2
+    assert report.complex_reactions[0].node_id == RXNS[1]
+
+
+def test_concurrent_run_matches_sequential(db):
+    """Phases on per-thread connections assemble the same report."""
+    with PathwayAnalyzer(db) as analyzer:
+        serial = analyzer.run()
+    with PathwayAnalyzer(db, workers=4) as analyzer:
+        pooled = analyzer.run()
+        assert len(analyzer._conns) > 1
+
+    for name in ("node_counts", "hub_metabolites", "pathway_couplings", "pathway_profiles"):
+        assert getattr(pooled, name) == getattr(serial, name)
+    assert set(pooled.timings) == set(serial.timings)
+    assert pooled.timings["total"] >= max(pooled.timings["phase5"], pooled.timings["load"])
+
+
+def test_membership_table_matches_join_fallback(db):
+    """The materialised pathway_members table gives the same membership as the joins."""
+    with PathwayAnalyzer(db) as analyzer:
+        from_table = analyzer._compound_pathway_membership()
+
+    conn = sqlite3.connect(db)
+    conn.execute("UPDATE meta_version SET version = -1 WHERE scope = 'pathway_members'")
+    conn.commit()
+    conn.close()
+    with PathwayAnalyzer(db) as analyzer:
+        assert analyzer._compound_pathway_membership() == from_table
+    assert from_table[P1] == set(CPDS[:4])
+
+
+def test_cached_report_reused_until_graph_changes(db):
+    """A second run at the same store version reuses the report; a write invalidates it."""
+    cache = AnalysisCache.for_db(db)
+    with PathwayAnalyzer(db, cache=cache) as analyzer:
+        first = analyzer.run()
+        second = analyzer.run()
+    assert first.cache_info == {"report": "computed", "coupling_recomputed": 3, "pathways": 3}
+    assert second.cache_info == {"report": "reused"}
+    assert second.pathway_couplings == first.pathway_couplings
+
+    p4 = node_id(KIND_PATHWAY, "kegg", "map00040")
+    s = MetaStore(db)
+    s.write(
+        [MetaNode(id=p4, kind=KIND_PATHWAY, name="New")],
+        [MetaEdge(src=p4, rel="CONTAINS", dst=RXNS[3])],
+    )
+    s.close()
+    with PathwayAnalyzer(db, cache=cache) as analyzer:
+        patched = analyzer.run()
+    with PathwayAnalyzer(db) as analyzer:
+        fresh = analyzer.run()
+    cache.close()
+
+    assert patched.cache_info["coupling_recomputed"] == 1
+    assert patched.pathway_couplings == fresh.pathway_couplings
+    assert (p4, 2) in {(c.pathway_b_id, c.shared_count) for c in patched.pathway_couplings}
+
+
+def test_coupling_matrix_update_matches_brute_force():
+    """Patching changed rows of the cached matrix equals recomputing all pairs."""
+    rng = random.Random(5)
+    ids = [f"p{k:03d}" for k in range(50)]
+    membership = {p: {f"c{rng.randrange(30)}" for _ in range(rng.randrange(10))} for p in ids}
+    matrix, n = _CouplingMatrix.update(None, membership, max_pairs=10_000, block=7)
+    assert n == 50
+
+    for p in rng.sample(ids, 8):
+        membership[p] = {f"c{rng.randrange(30)}" for _ in range(rng.randrange(10))}
+    del membership[ids[0]]
+    membership["p999"] = {"c1", "c2"}
+    matrix, n = _CouplingMatrix.update(matrix, membership, max_pairs=10_000, block=3)
+
+    order = sorted(membership)
+    assert n <= 9
+    assert matrix.top_pairs(40) == _brute_force([membership[p] for p in order], 40)
+    assert _CouplingMatrix.update(None, membership, max_pairs=1)[0] is None
+
+
+def test_centrality_phase(db):
+    """Phase 8 ranks compounds by PageRank and finds the chain's bottlenecks."""
+    with PathwayAnalyzer(db, betweenness_samples=0) as analyzer:
+        report = analyzer.run()
+
+    assert report.centrality_samples == 10 and report.core_sizes == {1: 10}
+    assert report.pagerank_hubs[0].node_id == CPDS[5]
+    assert {c.kind for c in report.pagerank_hubs} == {"compound"}
+    assert report.bottlenecks[0].node_id in (CPDS[3], RXNS[2])
+    assert "Bottlenecks by Betweenness" in render_report(report)
+
+    with PathwayAnalyzer(db, exclude_currency=True) as analyzer:
+        assert analyzer.run().currency_excluded == 6
+
+
+def test_module_phase_uses_stored_assignment(db):
+    """Modules come from Louvain, or from node_modules once it is current."""
+    cache = AnalysisCache.for_db(db)
+    with PathwayAnalyzer(db, cache=cache) as analyzer:
+        computed = analyzer.run()
+
+    assert computed.modules_source == "computed"
+    assert sum(m.size for m in computed.modules) == 11  # compounds, reactions, enzyme
+    assert computed.module_count == len(computed.modules) and computed.modularity > 0
+    top = computed.modules[0]
+    assert top.best_pathway_id in (P1, P2, P3) and 0 < top.jaccard <= 1
+    assert "Metabolic Modules" in render_report(computed)
+
+    with MetaStore(db) as store:
+        detect_modules(store, exclude_currency=False)
+    with PathwayAnalyzer(db, cache=cache) as analyzer:
+        stored = analyzer.run()  # the cached report predates the assignment
+    assert stored.modules_source == "stored"
+    assert [m.size for m in stored.modules] == [m.size for m in computed.modules]
+
+    with PathwayAnalyzer(db, exclude_currency=True) as analyzer:
+        assert analyzer.run().modules_source == "computed"  # stored with other options
+    with MetaStore(db) as store:
+        detect_modules(store, exclude_currency=False, resolution=2.0)
+    with PathwayAnalyzer(db) as analyzer:
+        assert analyzer.run().modules_source == "computed"
+
+
+def test_degree_table_matches_edge_counts(db):
+    """Tables loaded from node_degrees equal the GROUP BY fallback over meta_edges."""
+    with PathwayAnalyzer(db) as analyzer:
+        from_table = analyzer.tables
+
+    conn = sqlite3.connect(db)
+    conn.execute("UPDATE meta_version SET version = -1 WHERE scope = 'node_degrees'")
+    conn.commit()
+    conn.close()
+    with PathwayAnalyzer(db) as analyzer:
+        counted = analyzer.tables
+    assert counted.out_degree == from_table.out_degree
+    assert counted.in_degree == from_table.in_degree
+
+
+@pytest.mark.parametrize("fmt", ["arrow", "parquet"])
+def test_export_round_trips_report(db, tmp_path, fmt):
+    pytest.importorskip("pyarrow")
+    with PathwayAnalyzer(db) as analyzer:
+        report = analyzer.run()
+    manifest_path = export_report(report, tmp_path / "out", fmt=fmt)
+    manifest = json.loads(manifest_path.read_text())
+
+    assert manifest["complete"] and manifest["format"] == fmt
+    assert manifest["scalars"]["total_nodes"] == report.total_nodes
+    assert manifest["tables"]["hub_metabolites"]["phase"] == "phase2"
+
+    couplings = read_table(manifest_path, "pathway_couplings").to_pylist()
+    assert couplings == [vars(c) for c in report.pathway_couplings]
+    node_counts = read_table(manifest_path, "node_counts").to_pylist()
+    assert {r["kind"]: r["count"] for r in node_counts} == report.node_counts
+    isolated = read_table(manifest_path, "isolated_nodes").to_pylist()
+    assert isolated == report.isolated_nodes
+
+    # Empty sections keep their schema
+    empty = export_report(replace(report, bottlenecks=[]), tmp_path / "empty", fmt=fmt)
+    bottlenecks = read_table(empty, "bottlenecks")
+    assert bottlenecks.num_rows == 0 and "betweenness" in bottlenecks.column_names
+
+
+def test_streaming_export_matches_post_hoc(db, tmp_path):
+    pytest.importorskip("pyarrow")
+    seen = []
+    exporter = AnalysisExporter(tmp_path / "stream")
+
+    def on_phase(phase, fields):
+        seen.append(phase)
+        exporter.write_fields(phase, fields)
+        # The manifest stays partial until finish()
+        assert json.loads(exporter.manifest_path.read_text())["complete"] is False
+
+    with PathwayAnalyzer(db, workers=3) as analyzer:
+        report = analyzer.run(on_phase=on_phase)
+    streamed = exporter.finish(report)
+    post_hoc = export_report(report, tmp_path / "post")
+
+    assert sorted(seen) == sorted(
+        ["phase1", "phase2", "phase3", "phase4", "phase5"]
+        + ["phase6", "phase7", "phase8", "phase9", "profiles"]
+    )
+    a, b = json.loads(streamed.read_text()), json.loads(post_hoc.read_text())
+    assert a["tables"] == b["tables"] and a["scalars"] == b["scalars"]
+    for name in a["tables"]:
+        assert read_table(streamed, name).equals(read_table(post_hoc, name))
@@ -0,0 +1,107 @@
+"""
+Tests for metakg.centrality — PageRank, batched Brandes betweenness and k-cores.
+"""
+
+from collections import deque
+
+import numpy as np
+import pytest
+from scipy.sparse import csr_matrix
+
+from metakg.centrality import betweenness, compound_graph, core_numbers, is_currency, pagerank
+
+
+@pytest.fixture()
+def dense():
+    """A sparse random digraph with a few cycles and dangling nodes."""
+    rng = np.random.default_rng(1)
+    A = (rng.random((35, 35)) < 0.07).astype(float)
+    np.fill_diagonal(A, 0)
+    return A
+
+
+def _bfs(A, s):
+    dist, sigma, queue = {s: 0}, {s: 1}, deque([s])
+    while queue:
+        v = queue.popleft()
+        for w in np.flatnonzero(A[v]):
+            if w not in dist:
+                dist[w], sigma[w] = dist[v] + 1, 0
+                queue.append(w)
+            if dist[w] == dist[v] + 1:
+                sigma[w] += sigma[v]
+    return dist, sigma
+
+
+def _betweenness_by_pairs(A):
+    """σ_st(v) = σ_sv·σ_vt whenever v lies on a shortest s→t path."""
+    n = len(A)
+    bfs = [_bfs(A, s) for s in range(n)]
+    bc = np.zeros(n)
+    for s in range(n):
+        d_s, sig_s = bfs[s]
+        for t in d_s:
+            for v in d_s:
+                if v in (s, t) or t not in bfs[v][0]:
+                    continue
+                if d_s[v] + bfs[v][0][t] == d_s[t]:
+                    bc[v] += sig_s[v] * bfs[v][1][t] / sig_s[t]
+    return bc / ((n - 1) * (n - 2))
+
+
+def test_pagerank_matches_google_matrix(dense):
+    """Power iteration converges to the dominant eigenvector of the Google matrix."""
+    n, d = len(dense), 0.85
+    out = dense.sum(axis=1)
+    P = np.where(out[:, None] > 0, dense / np.maximum(out, 1)[:, None], 1.0 / n)
+    w, v = np.linalg.eig(d * P.T + (1 - d) / n)
+    expected = np.real(v[:, np.argmax(np.real(w))])
+
+    assert np.allclose(pagerank(csr_matrix(dense)), expected / expected.sum(), atol=1e-8)
+
+
+@pytest.mark.parametrize("batch", [1, 8, 64])
+def test_exact_betweenness_matches_pair_counting(dense, batch):
+    """All sources in any batch size reproduce the definition; samples are seeded."""
+    A = csr_matrix(dense)
+    assert np.allclose(betweenness(A, batch=batch), _betweenness_by_pairs(dense))
+
+    sampled = betweenness(A, samples=10, seed=4, batch=batch)
+    assert np.allclose(sampled, betweenness(A, samples=10, seed=4, batch=3, workers=2))
+
+
+def test_betweenness_pool_from_threads(dense, monkeypatch):
+    """The process pool starts without fork, so analyzer threads can use it."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    import metakg.centrality as centrality
+
+    contexts = []
+    real = centrality.ProcessPoolExecutor
+
+    def spy(*args, **kwargs):
+        contexts.append(kwargs["mp_context"].get_start_method())
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(centrality, "ProcessPoolExecutor", spy)
+    A = csr_matrix(dense)
+    with ThreadPoolExecutor(max_workers=2) as threads:
+        futures = [threads.submit(betweenness, A, workers=2, batch=8) for _ in range(2)]
+        results = [f.result() for f in futures]
+
+    assert contexts and "fork" not in contexts
+    for bc in results:
+        assert np.allclose(bc, betweenness(A))
+
+
+def test_core_numbers_and_graph_assembly():
+    """K4 with a pendant path; currency compounds and duplicate edges drop out."""
+    edges = [(a, b) for a in "abcd" for b in "abcd" if a < b] + [("d", "e"), ("e", "f")]
+    graph = compound_graph(
+        edges + [("a", "b"), ("f", "cpd:kegg:C00002")], exclude=["cpd:kegg:C00002"]
+    )
+    cores = dict(zip(graph.node_ids, core_numbers(graph.adjacency), strict=True))
+
+    assert cores == {"a": 3, "b": 3, "c": 3, "d": 3, "e": 1, "f": 1}
+    assert graph.adjacency.nnz == 8 and graph.excluded == 1
+    assert is_currency("cpd:kegg:C00002") and not is_currency("rxn:kegg:C00002")
@@ -0,0 +1,106 @@
+"""
+Tests for metakg.compress — dead-end, blocked-reaction and duplicate-column pruning.
+"""
+
+import numpy as np
+import pytest
+from scipy.optimize import linprog
+
+from metakg.compress import compress_network, consistent_reactions
+
+# Columns: ex_A (→A), r1 (A→B), r1_dup (A→B), r2 (B→C), ex_C (C→), r3 (B⇌D), r4 (B→E)
+S = np.array(
+    [
+        [1, -1, -1, 0, 0, 0, 0],  # A
+        [0, 1, 1, -1, 0, -1, -1],  # B
+        [0, 0, 0, 1, -1, 0, 0],  # C
+        [0, 0, 0, 0, 0, 1, 0],  # D (dead end)
+        [0, 0, 0, 0, 0, 0, 1],  # E (dead end)
+    ],
+    dtype=float,
+)
+LB = np.array([0, 0, 0, 0, 0, -10, 0], dtype=float)
+UB = np.array([10, 5, 5, 10, 10, 10, 10], dtype=float)
+
+
+def _solve(c, A, lb, ub):
+    return linprog(c, A_eq=A, b_eq=np.zeros(A.shape[0]), bounds=list(zip(lb, ub)), method="highs")
+
+
+def test_consistent_reactions_flags_blocked():
+    """Reactions feeding dead ends are blocked; the linear route is consistent."""
+    mask = consistent_reactions(S, LB, UB)
+    assert mask.tolist() == [True, True, True, True, True, False, False]
+
+
+def test_compress_removes_dead_ends_and_merges_duplicates():
+    """Dead-end compounds drop out and parallel reactions share one column."""
+    c = np.zeros(7)
+    c[4] = -1.0
+    net = compress_network(S, LB, UB, c=c)
+
+    assert net is not None
+    assert net.blocked == [5, 6]
+    assert net.dead_ends == [3, 4]
+    assert [1, 2] in net.groups
+    assert net.S.shape == (3, 4)
+    assert net.n_merged == 1
+
+
+def test_compress_preserves_optimum_and_maps_back():
+    """The reduced LP has the same optimum; expanded fluxes are feasible."""
+    c = np.zeros(7)
+    c[4] = -1.0
+    net = compress_network(S, LB, UB, c=c)
+    reduced = _solve(net.c, net.S, net.lb, net.ub)
+    full = _solve(c, S, LB, UB)
+
+    assert reduced.fun == pytest.approx(full.fun)
+    v = net.expand_fluxes(reduced.x)
+    assert np.allclose(S @ v, 0.0)
+    assert (v >= LB - 1e-9).all() and (v <= UB + 1e-9).all()
+    assert v[5] == 0.0 and v[6] == 0.0
+
+
+def test_compress_maps_back_unbounded_merged_column():
+    """A merged column with an infinite member bound expands to finite, feasible fluxes."""
+    ub = UB.copy()
+    ub[[0, 2, 3]] = np.inf
+    c = np.zeros(7)
+    c[4] = -1.0
+    net = compress_network(S, LB, ub, c=c)
+    assert [1, 2] in net.groups
+
+    reduced = _solve(net.c, net.S, net.lb, net.ub)
+    v = net.expand_fluxes(reduced.x)
+    assert np.isfinite(v).all()
+    assert np.allclose(S @ v, 0.0)
+    assert (v >= LB - 1e-9).all() and (v <= ub + 1e-9).all()
+    assert v[1] + v[2] == pytest.approx(10.0)
+
+
+@pytest.mark.parametrize(
+    ("S_small", "ub"),
+    [
+        (np.array([[1.0, -1.0]]), np.array([5e-5, 1000.0])),  # bound below eps
+        (np.array([[1.0, -1e5]]), np.array([1.0, 1000.0])),  # stoichiometry caps flux
+    ],
+)
+def test_compress_keeps_reactions_confined_below_eps(S_small, ub):
+    """Reactions whose flux can only stay below eps are kept, not pruned as blocked."""
+    lb = np.zeros(2)
+    c = np.array([0.0, -1.0])
+    assert consistent_reactions(S_small, lb, ub).tolist() == [True, True]
+
+    net = compress_network(S_small, lb, ub, c=c)
+    full = _solve(c, S_small, lb, ub)
+    reduced = _solve(net.c, net.S, net.lb, net.ub)
+    assert not net.is_empty and full.fun < 0
+    assert reduced.fun == pytest.approx(full.fun)
+
+
+def test_compress_gives_up_on_forced_blocked_flux():
+    """Bounds that force flux through a blocked reaction leave the model uncompressed."""
+    lb = LB.copy()
+    lb[6] = 1.0
+    assert compress_network(S, lb, UB) is None
@@ -0,0 +1,118 @@
+"""
+Tests for MetabolicSimulator.run_dfba — dynamic FBA on one reusable LP.
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from metakg.primitives import KIND_COMPOUND, KIND_REACTION, MetaEdge, MetaNode, node_id
+from metakg.simulate import MetabolicSimulator, ReusableLP, SimulationConfig
+from metakg.store import MetaStore
+
+A = node_id(KIND_COMPOUND, "kegg", "C00031")
+B = node_id(KIND_COMPOUND, "kegg", "C00092")
+R_IN = node_id(KIND_REACTION, "kegg", "R00001")
+R1 = node_id(KIND_REACTION, "kegg", "R01786")
+R_OUT = node_id(KIND_REACTION, "kegg", "R00002")
+
+_IRREV = json.dumps({"direction": "irreversible"})
+
+
+@pytest.fixture()
+def sim(tmp_path):
+    """Uptake → A → B → export."""
+    s = MetaStore(tmp_path / "test.sqlite")
+    s.write(
+        [
+            MetaNode(id=A, kind=KIND_COMPOUND, name="A"),
+            MetaNode(id=B, kind=KIND_COMPOUND, name="B"),
+            *(
+                MetaNode(id=r, kind=KIND_REACTION, name=r, stoichiometry=_IRREV)
+                for r in (R_IN, R1, R_OUT)
+            ),
+        ],
+        [
+            MetaEdge(src=R_IN, rel="PRODUCT_OF", dst=A),
+            MetaEdge(src=A, rel="SUBSTRATE_OF", dst=R1),
+            MetaEdge(src=R1, rel="PRODUCT_OF", dst=B),
+            MetaEdge(src=B, rel="SUBSTRATE_OF", dst=R_OUT),
+        ],
+    )
+    yield MetabolicSimulator(s)
+    s.close()
+
+
+@pytest.fixture()
+def config():
+    return SimulationConfig(reaction_ids=[R_IN, R1, R_OUT], objective_reaction=R_OUT, t_end=50.0)
+
+
+def test_dfba_depletes_substrate_and_conserves_mass(sim, config):
+    """Uptake follows Michaelis-Menten depletion and the run stops once the pool is empty."""
+    result = sim.run_dfba(config, {R_IN: 5.0}, uptake_vmax=2.0, uptake_km=0.5)
+
+    assert result.status == "depleted"
+    assert result.time[-1] < config.t_end
+    s = result.substrate(R_IN)
+    assert s[0] == 5.0 and s[-1] == 0.0
+    assert np.all(np.diff(s) <= 0.0)
+    # Everything taken up is exported: ∫ v_in dt equals the depleted pool
+    taken = np.sum(result.flux(R_IN)[:-1] * np.diff(result.time))
+    assert taken == pytest.approx(5.0, abs=1e-5)
+    # Implicit solution of ds/dt = -V s / (K + s): K ln(s0/s) + s0 - s = V t
+    k = int(np.searchsorted(result.time, 1.0))
+    t_k, s_k = result.time[k], s[k]
+    assert 0.5 * np.log(5.0 / s_k) + 5.0 - s_k == pytest.approx(2.0 * t_k, rel=0.05)
+    assert result.n_lp == len(result.time)
+
+
+def test_dfba_biomass_growth(sim, config):
+    """With biomass, the objective flux is the growth rate and uptake scales with biomass."""
+    result = sim.run_dfba(config, {R_IN: 2.0}, uptake_vmax=1.0, biomass=0.1)
+
+    assert result.status == "depleted"
+    assert result.biomass is not None and result.biomass[-1] > result.biomass[0]
+    # Unit yield (v_out = v_in): biomass gained equals substrate consumed
+    assert result.biomass[-1] - 0.1 == pytest.approx(2.0, rel=1e-6)
+
+
+def test_dfba_rejects_unknown_exchange(sim, config):
+    """Exchange reactions must be part of the scope."""
+    with pytest.raises(ValueError, match="not in scope"):
+        sim.run_dfba(config, {"rxn:kegg:R99999": 1.0})
+
+
+def test_reusable_lp_updates_bounds_in_place():
+    """Changing one bound re-solves the same model; infeasible bounds are reported."""
+    S = np.array([[1.0, -1.0, 0.0], [0.0, 1.0, -1.0]])
+    lp = ReusableLP(S, np.array([0.0, 0.0, -1.0]), np.zeros(3), np.array([10.0, 1e3, 1e3]))
+
+    status, x = lp.solve()
+    assert status == "optimal" and x[2] == pytest.approx(10.0)
+    lp.set_bounds(np.array([0]), np.array([0.0]), np.array([4.0]))
+    assert lp.solve()[1][2] == pytest.approx(4.0)
+    lp.set_bounds(np.array([0]), np.array([5.0]), np.array([4.0]))
+    assert lp.solve() == ("infeasible", None)
+    assert lp.n_solves == 3
+
+
+def test_reusable_lp_falls_back_when_bindings_change(monkeypatch):
+    """HiGHS bindings missing part of the API are skipped in favour of linprog."""
+    import sys
+    import types
+
+    import metakg.simulate as simulate
+
+    bindings = pytest.importorskip("scipy.optimize._highspy")
+    stale = types.ModuleType("_core")
+    stale._Highs = type("_Highs", (), {"run": lambda self: None})  # no passModel etc.
+    monkeypatch.setitem(sys.modules, "highspy", None)
+    monkeypatch.setattr(bindings, "_core", stale)
+    assert simulate._load_highs() is None
+
+    S = np.array([[1.0, -1.0]])
+    lp = ReusableLP(S, np.array([0.0, -1.0]), np.zeros(2), np.array([3.0, 1e3]))
+    assert lp.backend == "linprog"
+    assert lp.solve()[1][1] == pytest.approx(3.0)
@@ -0,0 +1,128 @@
+"""
+Tests for metakg.mca — metabolic control analysis.
+"""
+
+import numpy as np
+import pytest
+
+from metakg.mca import control_analysis, render_mca_result
+from metakg.primitives import (
+    KIND_COMPOUND,
+    KIND_ENZYME,
+    KIND_REACTION,
+    MetaEdge,
+    MetaNode,
+    node_id,
+)
+from metakg.simulate import MetabolicSimulator, SimulationConfig
+from metakg.store import MetaStore
+
+X0 = node_id(KIND_COMPOUND, "kegg", "C00031")
+A = node_id(KIND_COMPOUND, "kegg", "C00092")
+B = node_id(KIND_COMPOUND, "kegg", "C00085")
+X1 = node_id(KIND_COMPOUND, "kegg", "C00022")
+ATP = node_id(KIND_COMPOUND, "kegg", "C00002")
+ADP = node_id(KIND_COMPOUND, "kegg", "C00008")
+R1 = node_id(KIND_REACTION, "kegg", "R00001")
+R2 = node_id(KIND_REACTION, "kegg", "R00002")
+R3 = node_id(KIND_REACTION, "kegg", "R00003")
+R4 = node_id(KIND_REACTION, "kegg", "R00004")
+E1 = node_id(KIND_ENZYME, "ec", "2.7.1.1")
+E2 = node_id(KIND_ENZYME, "ec", "5.3.1.9")
+
+
+@pytest.fixture()
+def sim(tmp_path):
+    """X0 → A; A + ATP → B + ADP; B → X1; ADP → ATP, with X0 and X1 held fixed."""
+    s = MetaStore(tmp_path / "test.sqlite")
+    s.write(
+        [
+            *(MetaNode(id=c, kind=KIND_COMPOUND, name=c) for c in (X0, A, B, X1, ATP, ADP)),
+            *(MetaNode(id=r, kind=KIND_REACTION, name=r) for r in (R1, R2, R3, R4)),
+            MetaNode(id=E1, kind=KIND_ENZYME, name="E1"),
+            MetaNode(id=E2, kind=KIND_ENZYME, name="E2"),
+        ],
+        [
+            MetaEdge(src=X0, rel="SUBSTRATE_OF", dst=R1),
+            MetaEdge(src=R1, rel="PRODUCT_OF", dst=A),
+            MetaEdge(src=A, rel="SUBSTRATE_OF", dst=R2),
+            MetaEdge(src=ATP, rel="SUBSTRATE_OF", dst=R2),
+            MetaEdge(src=R2, rel="PRODUCT_OF", dst=B),
+            MetaEdge(src=R2, rel="PRODUCT_OF", dst=ADP),
+            MetaEdge(src=B, rel="SUBSTRATE_OF", dst=R3),
+            MetaEdge(src=R3, rel="PRODUCT_OF", dst=X1),
+            MetaEdge(src=ADP, rel="SUBSTRATE_OF", dst=R4),
+            MetaEdge(src=R4, rel="PRODUCT_OF", dst=ATP),
+            MetaEdge(src=E1, rel="CATALYZES", dst=R1),
+            MetaEdge(src=E2, rel="CATALYZES", dst=R2),
+            MetaEdge(src=E2, rel="CATALYZES", dst=R3),
+        ],
+    )
+    yield MetabolicSimulator(s)
+    s.close()
+
+
+@pytest.fixture()
+def config():
+    return SimulationConfig(
+        reaction_ids=[R1, R2, R3, R4],
+        initial_concentrations={X0: 5.0, X1: 0.1, ATP: 2.0, ADP: 0.5},
+        fixed_compounds=[X0, X1],
+        vmax_factors={R3: 2.0},
+    )
+
+
+def test_fixed_compounds_carry_flux(sim, config):
+    """Fixed source and sink hold their level and drive a non-zero steady flux."""
+    ss = sim.run_steady_state(config)
+    assert ss.status == "converged"
+    assert ss.concentrations[X0] == pytest.approx(5.0)
+    assert ss.concentrations[X1] == pytest.approx(0.1)
+    assert ss.concentrations[ATP] + ss.concentrations[ADP] == pytest.approx(2.5)
+    assert ss.fluxes[R1] > 0.1
+    assert ss.fluxes[R1] == pytest.approx(ss.fluxes[R3], rel=1e-6)
+
+
+def test_analytic_control_obeys_summation_theorems(sim, config):
+    """Flux control rows sum to 1, concentration rows to 0; enzymes aggregate reactions."""
+    mca = control_analysis(sim, config)
+
+    assert mca.status == "ok" and mca.method == "analytic"
+    assert mca.summation_error() < 1e-8
+    k = mca.reaction_ids.index(R3)
+    assert mca.flux_control[k].sum() == pytest.approx(1.0)
+    e2 = mca.enzyme_ids.index(E2)
+    cols = [mca.reaction_ids.index(R2), mca.reaction_ids.index(R3)]
+    assert mca.enzyme_flux_control[k, e2] == pytest.approx(mca.flux_control[k, cols].sum())
+    # Fixed compounds are not controlled by anything
+    assert np.allclose(mca.conc_control[mca.compound_ids.index(X0)], 0.0)
+
+
+def test_analytic_matches_finite_differences(sim, config):
+    """The one-solve analytic matrices agree with 2N perturbed steady states."""
+    analytic = control_analysis(sim, config)
+    fd = control_analysis(sim, config, method="finite_difference", rel_step=1e-4)
+
+    assert fd.method == "finite_difference"
+    np.testing.assert_allclose(fd.flux_control, analytic.flux_control, atol=1e-4)
+    np.testing.assert_allclose(fd.conc_control, analytic.conc_control, atol=1e-4)
+
+
+def test_finite_differences_in_worker_pool(sim, config):
+    """Perturbed solves spread over processes give the serial result."""
+    serial = control_analysis(sim, config, method="finite_difference")
+    pooled = control_analysis(sim, config, method="finite_difference", workers=2)
+    np.testing.assert_allclose(pooled.flux_control, serial.flux_control, atol=1e-8)
+
+
+def test_render_and_to_dict(sim, config):
+    """The report names the target flux; to_dict is JSON-shaped."""
+    mca = control_analysis(sim, config)
+    text = render_mca_result(mca, sim._store, target=R3)
+    assert "Flux Control over" in text and E2 in text
+
+    data = mca.to_dict()
+    assert data["status"] == "ok"
+    assert data["enzyme_flux_control"][R3][E2] == pytest.approx(
+        mca.enzyme_flux_control[mca.reaction_ids.index(R3), mca.enzyme_ids.index(E2)]
+    )
@@ -0,0 +1,151 @@
+"""
+Tests for metakg.mcs — minimal cut sets via the dual-network MILP.
+"""
+
+import json
+
+import pytest
+
+from metakg.mcs import minimal_cut_sets, render_mcs_result
+from metakg.primitives import (
+    KIND_COMPOUND,
+    KIND_ENZYME,
+    KIND_REACTION,
+    MetaEdge,
+    MetaNode,
+    node_id,
+)
+from metakg.simulate import MetabolicSimulator, SimulationConfig
+from metakg.store import MetaStore
+
+A = node_id(KIND_COMPOUND, "kegg", "C00031")
+B = node_id(KIND_COMPOUND, "kegg", "C00092")
+C = node_id(KIND_COMPOUND, "kegg", "C00085")
+R_IN = node_id(KIND_REACTION, "kegg", "R00001")
+R1 = node_id(KIND_REACTION, "kegg", "R01786")
+R2 = node_id(KIND_REACTION, "kegg", "R01600")
+R3 = node_id(KIND_REACTION, "kegg", "R00771")
+R_OUT = node_id(KIND_REACTION, "kegg", "R00002")
+E0 = node_id(KIND_ENZYME, "ec", "2.7.1.1")
+E1 = node_id(KIND_ENZYME, "ec", "2.7.1.2")
+E1B = node_id(KIND_ENZYME, "ec", "2.7.1.3")
+E2 = node_id(KIND_ENZYME, "ec", "5.3.1.9")
+E3 = node_id(KIND_ENZYME, "ec", "2.7.1.11")
+
+_IRREV = json.dumps({"direction": "irreversible"})
+RXNS = [R_IN, R1, R2, R3, R_OUT]
+
+
+@pytest.fixture()
+def sim(tmp_path):
+    """Uptake → A; A → B (isozymes E1, E1B) or A → C ⇌ B; export of B."""
+    s = MetaStore(tmp_path / "test.sqlite")
+    s.write(
+        [
+            *(MetaNode(id=c, kind=KIND_COMPOUND, name=c) for c in (A, B, C)),
+            *(
+                MetaNode(id=r, kind=KIND_REACTION, name=r, stoichiometry=_IRREV)
+                for r in (R_IN, R1, R2, R_OUT)
+            ),
+            MetaNode(id=R3, kind=KIND_REACTION, name=R3),
+            *(MetaNode(id=e, kind=KIND_ENZYME, name=e) for e in (E0, E1, E1B, E2, E3)),
+        ],
+        [
+            MetaEdge(src=R_IN, rel="PRODUCT_OF", dst=A),
+            MetaEdge(src=A, rel="SUBSTRATE_OF", dst=R1),
+            MetaEdge(src=R1, rel="PRODUCT_OF", dst=B),
+            MetaEdge(src=A, rel="SUBSTRATE_OF", dst=R2),
+            MetaEdge(src=R2, rel="PRODUCT_OF", dst=C),
+            MetaEdge(src=C, rel="SUBSTRATE_OF", dst=R3),
+            MetaEdge(src=R3, rel="PRODUCT_OF", dst=B),
+            MetaEdge(src=B, rel="SUBSTRATE_OF", dst=R_OUT),
+            MetaEdge(src=E0, rel="CATALYZES", dst=R_IN),
+            MetaEdge(src=E1, rel="CATALYZES", dst=R1),
+            MetaEdge(src=E1B, rel="CATALYZES", dst=R1),
+            MetaEdge(src=E2, rel="CATALYZES", dst=R2),
+            MetaEdge(src=E3, rel="CATALYZES", dst=R3),
+        ],
+    )
+    yield MetabolicSimulator(s)
+    s.close()
+
+
+def _blocks(sim, knocked):
+    """FBA check: maximal export flux with *knocked* reactions closed."""
+    config = SimulationConfig(
+        reaction_ids=RXNS,
+        objective_reaction=R_OUT,
+        flux_bounds={r: (0.0, 0.0) for r in knocked},
+    )
+    return sim.run_fba(config).fluxes.get(R_OUT, 0.0) < 1e-9
+
+
+def test_reaction_cut_sets_by_cardinality(sim):
+    """Reaction-level sets come out smallest first and each blocks the target."""
+    result = minimal_cut_sets(sim, SimulationConfig(reaction_ids=RXNS), R_OUT, by="reaction")
+
+    assert result.status == "complete"
+    assert result.cut_sets[0] == (R_IN,)
+    assert {frozenset(c) for c in result.cut_sets[1:]} == {frozenset((R1, R2)), frozenset((R1, R3))}
+    assert all(_blocks(sim, cut) for cut in result.cut_sets)
+    assert not _blocks(sim, [R2, R3])
+
+
+def test_enzyme_cut_sets_respect_isozymes(sim):
+    """Isozymes must both go; the cardinality limit prunes the larger sets."""
+    config = SimulationConfig(reaction_ids=RXNS)
+    full = minimal_cut_sets(sim, config, R_OUT)
+    assert full.cut_sets[0] == (E0,)
+    assert {frozenset(c) for c in full.cut_sets[1:]} == {
+        frozenset((E1, E1B, E2)),
+        frozenset((E1, E1B, E3)),
+    }
+
+    small = minimal_cut_sets(sim, config, R_OUT, max_cardinality=2)
+    assert small.cut_sets == [(E0,)]
+    assert small.status == "complete"
+
+
+def test_parallel_search_matches_serial(sim):
+    """Splitting by first candidate over processes yields the same minimal sets."""
+    config = SimulationConfig(reaction_ids=RXNS)
+    serial = minimal_cut_sets(sim, config, R_OUT, by="reaction")
+    pooled = minimal_cut_sets(sim, config, R_OUT, by="reaction", workers=2)
+    assert pooled.cut_sets == serial.cut_sets
+
+
+def test_parallel_deadline_covers_queued_jobs(sim, monkeypatch):
+    """Jobs queued behind busy workers share the overall budget, not a fresh one."""
+    import multiprocessing
+    import time
+
+    from metakg import mcs
+    from metakg.mcs import DualMILP
+
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("patched solver must be inherited by the workers")
+    monkeypatch.setattr(mcs, "pool_context", lambda: multiprocessing.get_context("fork"))
+
+    def slow_enumerate(self, *, max_cardinality, max_sets, deadline, force_in=None):
+        time.sleep(0.3)
+        return [], 1, "time_limit" if time.monotonic() >= deadline else "complete"
+
+    monkeypatch.setattr(DualMILP, "enumerate", slow_enumerate)
+    config = SimulationConfig(reaction_ids=RXNS)
+    # 4 candidates on 2 workers: the second pair starts at ~0.3 s and ends past 0.45 s
+    result = minimal_cut_sets(sim, config, R_OUT, by="reaction", workers=2, time_limit=0.45)
+    assert result.n_candidates == 4
+    assert result.status == "time_limit"
+
+
+def test_budgets_and_errors(sim):
+    """max_sets truncates the enumeration; an out-of-scope target is rejected."""
+    config = SimulationConfig(reaction_ids=RXNS)
+    result = minimal_cut_sets(sim, config, R_OUT, by="reaction", max_sets=1)
+    assert result.status == "max_sets"
+    assert result.cut_sets == [(R_IN,)]
+    assert "Minimal Cut Sets" in render_mcs_result(result, sim._store)
+    assert result.to_dict()["cut_sets"] == [[R_IN]]
+
+    with pytest.raises(ValueError, match="not in scope"):
+        minimal_cut_sets(sim, SimulationConfig(reaction_ids=[R1, R2]), R_OUT)
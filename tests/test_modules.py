@@ -0,0 +1,78 @@
+"""
+Tests for metakg.modules — Louvain modules and their storage.
+"""
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from metakg.modules import detect_modules, louvain, modularity
+from metakg.primitives import KIND_COMPOUND, KIND_REACTION, MetaEdge, MetaNode, node_id
+from metakg.store import MetaStore, node_modules_current
+
+
+def _ring_of_cliques(n_cliques, size):
+    edges = []
+    for c in range(n_cliques):
+        nodes = range(c * size, (c + 1) * size)
+        edges += [(a, b) for a in nodes for b in nodes if a < b]
+        edges.append((c * size, ((c + 1) % n_cliques) * size + 1))
+    n = n_cliques * size
+    rows, cols = zip(*edges, strict=True)
+    return csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(n, n))
+
+
+def test_louvain_recovers_ring_of_cliques():
+    """Each clique is one module; modularity matches the closed form."""
+    A = _ring_of_cliques(10, 6)
+    labels = louvain(A)
+
+    assert all(len(set(labels[c * 6 : c * 6 + 6])) == 1 for c in range(10))
+    assert len(set(labels)) == 10
+    # 10 cliques × 15 internal edges + 10 ring edges
+    m = 160
+    degree_sum = 2 * 15 + 2
+    assert np.isclose(modularity(A, labels), 150 / m - 10 * (degree_sum / (2 * m)) ** 2)
+    assert modularity(A, np.zeros(60, dtype=int)) == 0.0
+    assert np.array_equal(louvain(A, seed=3), labels)
+
+
+def test_detect_modules_persists_until_edges_change(tmp_path):
+    """The assignment is stored per node and marked stale by the next edge write."""
+    cpds = [node_id(KIND_COMPOUND, "kegg", f"C1{k:04d}") for k in range(8)]
+    rxns = [node_id(KIND_REACTION, "kegg", f"R1{k:04d}") for k in range(4)]
+    # Two short chains, joined only through ATP
+    atp = node_id(KIND_COMPOUND, "kegg", "C00002")
+    edges = []
+    for k, r in enumerate(rxns):
+        edges += [
+            MetaEdge(src=cpds[2 * k], rel="SUBSTRATE_OF", dst=r),
+            MetaEdge(src=r, rel="PRODUCT_OF", dst=cpds[2 * k + 1]),
+            MetaEdge(src=atp, rel="SUBSTRATE_OF", dst=r),
+        ]
+    edges += [
+        MetaEdge(src=cpds[1], rel="SUBSTRATE_OF", dst=rxns[1]),
+        MetaEdge(src=cpds[5], rel="SUBSTRATE_OF", dst=rxns[3]),
+    ]
+    store = MetaStore(tmp_path / "m.sqlite")
+    store.write(
+        [MetaNode(id=n, kind=KIND_COMPOUND, name=n) for n in [*cpds, atp]]
+        + [MetaNode(id=r, kind=KIND_REACTION, name=r) for r in rxns],
+        edges,
+    )
+    assert not node_modules_current(store._conn)
+
+    result = detect_modules(store)
+    stored = store.node_modules()
+    assert result.excluded == 1 and atp not in stored
+    first = {stored[n] for n in [*cpds[:4], *rxns[:2]]}
+    second = {stored[n] for n in [*cpds[4:], *rxns[2:]]}
+    assert not first & second
+    assert sum(result.sizes) == 12 and result.to_dict()["n_modules"] == len(first | second)
+    assert result.modularity > 0.3
+    members = [n for m in sorted(second) for n in store.module_members(m)]
+    assert sorted(members) == sorted([*cpds[4:], *rxns[2:]])
+    assert node_modules_current(store._conn)
+
+    store.write([], [MetaEdge(src=cpds[3], rel="SUBSTRATE_OF", dst=rxns[2])])
+    assert not node_modules_current(store._conn)
+    store.close()
@@ -0,0 +1,126 @@
+"""
+Tests for metakg.sampling — hit-and-run flux sampling.
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from metakg.primitives import KIND_COMPOUND, KIND_REACTION, MetaEdge, MetaNode, node_id
+from metakg.sampling import (
+    FluxPolytope,
+    FluxSamples,
+    _pull_inside,
+    render_flux_samples,
+    sample_fluxes,
+)
+from metakg.simulate import MetabolicSimulator, SimulationConfig
+from metakg.store import MetaStore
+
+A = node_id(KIND_COMPOUND, "kegg", "C00031")
+B = node_id(KIND_COMPOUND, "kegg", "C00092")
+R_IN = node_id(KIND_REACTION, "kegg", "R00001")
+R1 = node_id(KIND_REACTION, "kegg", "R01786")
+R2 = node_id(KIND_REACTION, "kegg", "R01600")
+R_OUT = node_id(KIND_REACTION, "kegg", "R00002")
+
+_IRREV = json.dumps({"direction": "irreversible"})
+
+
+@pytest.fixture()
+def sim(tmp_path):
+    """Uptake → A, two parallel routes A → B, export of B."""
+    s = MetaStore(tmp_path / "test.sqlite")
+    s.write(
+        [
+            MetaNode(id=A, kind=KIND_COMPOUND, name="A"),
+            MetaNode(id=B, kind=KIND_COMPOUND, name="B"),
+            *(
+                MetaNode(id=r, kind=KIND_REACTION, name=r, stoichiometry=_IRREV)
+                for r in (R_IN, R1, R2, R_OUT)
+            ),
+        ],
+        [
+            MetaEdge(src=R_IN, rel="PRODUCT_OF", dst=A),
+            MetaEdge(src=A, rel="SUBSTRATE_OF", dst=R1),
+            MetaEdge(src=A, rel="SUBSTRATE_OF", dst=R2),
+            MetaEdge(src=R1, rel="PRODUCT_OF", dst=B),
+            MetaEdge(src=R2, rel="PRODUCT_OF", dst=B),
+            MetaEdge(src=B, rel="SUBSTRATE_OF", dst=R_OUT),
+        ],
+    )
+    yield MetabolicSimulator(s)
+    s.close()
+
+
+@pytest.fixture()
+def config():
+    return SimulationConfig(reaction_ids=[R_IN, R1, R2, R_OUT], flux_bounds={R_IN: (0.0, 10.0)})
+
+
+def test_samples_are_feasible_and_uniform(sim, config):
+    """Every sample satisfies S·v = 0 and the bounds; means match the uniform triangle."""
+    samples = sample_fluxes(sim, config, n_samples=4000, chains=4, thinning=10, seed=1)
+    _, _, S, _ = sim._build_stoich_matrix(config)
+    X = samples.samples
+
+    assert X.shape == (4000, 4)
+    assert np.abs(X @ S.T).max() < 1e-7
+    assert X.min() >= 0.0 and X[:, 0].max() <= 10.0
+    stats = samples.summary()
+    # v1, v2 ≥ 0 with v1 + v2 ≤ 10: uptake mean 20/3, each branch 10/3
+    assert stats[R_IN]["mean"] == pytest.approx(20 / 3, abs=0.5)
+    assert stats[R1]["mean"] == pytest.approx(10 / 3, abs=0.5)
+    assert stats[R1]["std"] > 1.0
+
+
+def test_memmap_output_with_workers(sim, config, tmp_path):
+    """Worker processes write into one .npy file that reloads with its reaction IDs."""
+    out = tmp_path / "samples.npy"
+    samples = sample_fluxes(
+        sim, config, n_samples=10, chains=3, thinning=5, workers=2, seed=7, output=out
+    )
+
+    assert samples.n_samples == 12  # rounded up to a multiple of the chains
+    loaded = FluxSamples.load(out)
+    assert loaded.reaction_ids == [R_IN, R1, R2, R_OUT]
+    assert isinstance(loaded.samples, np.memmap)
+    np.testing.assert_array_equal(loaded.samples, samples.samples)
+    assert not np.isnan(loaded.chain(2)).any()
+    assert "Flux Distributions" in render_flux_samples(loaded)
+
+
+def test_workers_without_output_leave_no_files(sim, config, tmp_path, monkeypatch):
+    """The scratch .npy used by worker processes is read into memory and deleted."""
+    import tempfile
+
+    scratch = tmp_path / "scratch"
+    scratch.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(scratch))
+    samples = sample_fluxes(sim, config, n_samples=8, chains=2, thinning=5, workers=2, seed=3)
+
+    assert samples.path is None and not isinstance(samples.samples, np.memmap)
+    assert samples.samples.shape == (8, 4) and not np.isnan(samples.samples).any()
+    assert list(scratch.iterdir()) == []
+
+
+def test_pull_inside_keeps_steady_state(sim, config):
+    """Drifted samples return within bounds along S·v = 0 rather than by clipping."""
+    poly = FluxPolytope.from_simulator(sim, config)
+    anchor = poly.project(poly.warmup.mean(axis=0, keepdims=True))
+    P = np.vstack([anchor[0] * 3.0, np.array([12.0, 12.0, 0.0, 12.0])])
+
+    X = _pull_inside(P, anchor, poly.lb, poly.ub)
+    assert np.abs(X @ poly.S.T).max() < 1e-9
+    assert (X >= poly.lb - 1e-12).all() and (X <= poly.ub + 1e-12).all()
+    assert np.abs(np.clip(P, poly.lb, poly.ub) @ poly.S.T).max() > 1.0
+
+
+def test_infeasible_space_raises(sim):
+    """Bounds that exclude S·v = 0 are reported, not sampled."""
+    config = SimulationConfig(
+        reaction_ids=[R_IN, R1, R2, R_OUT], flux_bounds={R_IN: (1.0, 2.0), R_OUT: (5.0, 6.0)}
+    )
+    with pytest.raises(ValueError, match="empty"):
+        sample_fluxes(sim, config, n_samples=4)
@@ -0,0 +1,122 @@
+"""
+Tests for metakg.simcache — content-addressed simulation result cache.
+"""
+
+import json
+
+import pytest
+
+from metakg.primitives import KIND_COMPOUND, KIND_REACTION, MetaEdge, MetaNode, node_id
+from metakg.simcache import SimulationCache, request_key
+from metakg.simulate import MetabolicSimulator, SimulationConfig
+from metakg.store import MetaStore
+
+GLC = node_id(KIND_COMPOUND, "kegg", "C00031")
+G6P = node_id(KIND_COMPOUND, "kegg", "C00092")
+RXN = node_id(KIND_REACTION, "kegg", "R01786")
+
+
+@pytest.fixture()
+def store(tmp_path):
+    s = MetaStore(tmp_path / "test.sqlite")
+    s.write(
+        [
+            MetaNode(id=GLC, kind=KIND_COMPOUND, name="D-Glucose"),
+            MetaNode(id=G6P, kind=KIND_COMPOUND, name="Glucose-6-phosphate"),
+            MetaNode(
+                id=RXN,
+                kind=KIND_REACTION,
+                name="Hexokinase",
+                stoichiometry=json.dumps(
+                    {
+                        "substrates": [{"id": GLC, "stoich": 1.0}],
+                        "products": [{"id": G6P, "stoich": 1.0}],
+                    }
+                ),
+            ),
+        ],
+        [
+            MetaEdge(src=GLC, rel="SUBSTRATE_OF", dst=RXN),
+            MetaEdge(src=RXN, rel="PRODUCT_OF", dst=G6P),
+        ],
+    )
+    yield s
+    s.close()
+
+
+def test_request_key_is_canonical():
+    """Equal requests hash equally; any parameter or version change alters the key."""
+    a = SimulationConfig(reaction_ids=[RXN], initial_concentrations={GLC: 5.0, G6P: 1.0})
+    b = SimulationConfig(reaction_ids=[RXN], initial_concentrations={G6P: 1.0, GLC: 5.0})
+    c = SimulationConfig(reaction_ids=[RXN], initial_concentrations={GLC: 5.0, G6P: 1.5})
+
+    assert request_key("ode", a, version="v1") == request_key("ode", b, version="v1")
+    assert request_key("ode", a, version="v1") != request_key("ode", c, version="v1")
+    assert request_key("ode", a, version="v1") != request_key("ode", a, version="v2")
+    assert request_key("ode", a, version="v1") != request_key("fba", a, version="v1")
+
+
+def test_memory_tier_returns_private_copies(store):
+    """A repeated run is served from memory; callers cannot corrupt the entry."""
+    sim = MetabolicSimulator(store, cache=SimulationCache())
+    config = SimulationConfig(reaction_ids=[RXN], t_end=5.0, t_points=10)
+
+    first = sim.run_ode(config)
+    expected = first.y.copy()
+    first.y[:] = -1.0
+    second = sim.run_ode(config=config)
+    second.timings.clear()
+    third = sim.run_ode(config)
+
+    assert sim.cache.stats()["hits"] == 2
+    assert second is not first and third is not second
+    assert (second.y == expected).all()
+    assert third.timings
+
+
+def test_bulk_write_bumps_version_once(store):
+    """A bulk write advances each touched counter once; outside writes still count."""
+    before = store.table_versions()
+    store.write(
+        [MetaNode(id=f"cpd:x:{i}", kind=KIND_COMPOUND, name=str(i)) for i in range(50)],
+        [MetaEdge(src=f"cpd:x:{i}", rel="SUBSTRATE_OF", dst=RXN) for i in range(50)],
+    )
+    after = store.table_versions()
+    assert after["meta_nodes"] == before["meta_nodes"] + 1
+    assert after["meta_edges"] == before["meta_edges"] + 1
+    assert after["kinetic_parameters"] == before["kinetic_parameters"]
+    assert "write_guard" not in after
+
+    store._conn.execute("DELETE FROM meta_edges WHERE src LIKE 'cpd:x:%'")
+    assert store.table_versions()["meta_edges"] == after["meta_edges"] + 50
+
+
+def test_disk_tier_survives_new_cache(store, tmp_path):
+    """Results written to the SQLite tier are found by a fresh cache instance."""
+    config = SimulationConfig(reaction_ids=[RXN])
+    first = MetabolicSimulator(store, cache=SimulationCache.for_store(store)).run_fba(config)
+
+    fresh = SimulationCache.for_store(store)
+    again = MetabolicSimulator(store, cache=fresh).run_fba(config)
+
+    assert fresh.stats()["hits"] == 1
+    assert dict(again.fluxes) == dict(first.fluxes)
+
+
+def test_store_change_invalidates(store):
+    """Changing kinetic parameters forces a fresh solve."""
+    from metakg.primitives import KineticParam
+
+    sim = MetabolicSimulator(store, cache=SimulationCache())
+    config = SimulationConfig(
+        reaction_ids=[RXN], t_end=1.0, t_points=10, initial_concentrations={GLC: 5.0}
+    )
+    before = sim.run_ode(config)
+
+    store.upsert_kinetic_param(
+        KineticParam(id="kp:hk", enzyme_id=None, reaction_id=RXN, vmax=10.0, km=0.5)
+    )
+    after = sim.run_ode(config)
+
+    assert after is not before
+    assert after.y[after.index[GLC], -1] < before.y[before.index[GLC], -1]
@@ -0,0 +1,120 @@
+"""
+Tests for metakg.similarity — MinHash signatures and the pathway LSH index.
+"""
+
+import random
+
+import numpy as np
+
+from metakg.primitives import (
+    KIND_COMPOUND,
+    KIND_PATHWAY,
+    KIND_REACTION,
+    MetaEdge,
+    MetaNode,
+    node_id,
+)
+from metakg.similarity import PathwayLSH, estimate_jaccard, minhash, similar_pathways
+from metakg.store import MetaStore, pathway_minhash_current
+
+
+def test_minhash_estimates_jaccard():
+    """Signature agreement tracks the exact Jaccard similarity."""
+    rng = random.Random(1)
+    universe = [f"cpd:kegg:C{n:05d}" for n in range(2000)]
+    errors = []
+    for _ in range(50):
+        a = set(rng.sample(universe, 150))
+        b = set(rng.sample(sorted(a), rng.randint(0, 150))) | set(rng.sample(universe, 60))
+        exact = len(a & b) / len(a | b)
+        errors.append(abs(estimate_jaccard(minhash(a), minhash(b)) - exact))
+    # Standard error at 128 hash functions is at most ~0.044
+    assert np.mean(errors) < 0.05 and max(errors) < 0.15
+    assert np.array_equal(minhash(["x", "y"]), minhash(["y", "x", "x"]))
+    assert estimate_jaccard(minhash(["x"]), minhash(["x"])) == 1.0
+
+
+def _pathway(k, reactions):
+    """Pathway *k* containing linear reactions over the given compound numbers."""
+    pwy = node_id(KIND_PATHWAY, "kegg", f"map{k:05d}")
+    nodes = [MetaNode(id=pwy, kind=KIND_PATHWAY, name=f"pathway {k}")]
+    edges = []
+    for a, b in reactions:
+        rxn = node_id(KIND_REACTION, "kegg", f"R{a:05d}_{b:05d}")
+        ca, cb = (node_id(KIND_COMPOUND, "kegg", f"C{c:05d}") for c in (a, b))
+        nodes += [
+            MetaNode(id=rxn, kind=KIND_REACTION, name=rxn),
+            MetaNode(id=ca, kind=KIND_COMPOUND, name=ca),
+            MetaNode(id=cb, kind=KIND_COMPOUND, name=cb),
+        ]
+        edges += [
+            MetaEdge(src=pwy, rel="CONTAINS", dst=rxn),
+            MetaEdge(src=ca, rel="SUBSTRATE_OF", dst=rxn),
+            MetaEdge(src=rxn, rel="PRODUCT_OF", dst=cb),
+        ]
+    return pwy, nodes, edges
+
+
+def test_similar_pathways_ranks_overlap_and_tracks_edits(tmp_path):
+    """Near-duplicates rank first, disjoint pathways are absent, edits rebuild the index."""
+    chain = [(c, c + 1) for c in range(100, 140)]
+    variants = {
+        1: chain,
+        2: chain[:36] + [(c, c + 1) for c in range(500, 504)],  # ~0.8 overlap with 1
+        3: chain[:28] + [(c, c + 1) for c in range(600, 612)],  # ~0.5 overlap with 1
+        4: [(c, c + 1) for c in range(900, 940)],  # disjoint
+    }
+    s = MetaStore(tmp_path / "t.sqlite")
+    ids = {}
+    for k, reactions in variants.items():
+        ids[k], nodes, edges = _pathway(k, reactions)
+        s.write(nodes, edges)
+
+    hits = similar_pathways(s, ids[1], k=5)
+    assert pathway_minhash_current(s._conn)
+    assert [h["pathway_id"] for h in hits] == [ids[2], ids[3]]
+    assert hits[0]["jaccard"] > hits[1]["jaccard"] > 0.3
+    assert (
+        hits[0]["name"] == "pathway 2" and hits[0]["members"] == 40 + 37 + 5
+    )  # reactions + compounds
+    assert similar_pathways(s, ids[1], k=1, min_jaccard=0.95) == []
+    assert similar_pathways(s, "pwy:kegg:nope") == []
+
+    lsh = PathwayLSH.load(s)
+    for pwy in ids.values():
+        assert lsh.similar(pwy, k=5) == similar_pathways(s, pwy, k=5)
+    # A copy of pathway 1 is added; the stale index is rebuilt
+    copy, nodes, edges = _pathway(5, chain)
+    s.write(nodes, edges)
+    assert not pathway_minhash_current(s._conn) and not lsh.current(s)
+    assert similar_pathways(s, ids[1], k=1) == [
+        {"pathway_id": copy, "name": "pathway 5", "jaccard": 1.0, "members": 81}
+    ]
+    assert PathwayLSH.load(s).similar(ids[1], k=1) == similar_pathways(s, ids[1], k=1)
+    s.close()
+
+
+def test_metakg_similar_pathways(tmp_path):
+    """MetaKG resolves the pathway, reports errors and reuses the loaded index."""
+    from metakg.orchestrator import MetaKG
+
+    chain = [(c, c + 1) for c in range(10, 30)]
+    kg = MetaKG(db_path=tmp_path / "kg.sqlite", lancedb_dir=tmp_path / "lancedb")
+    ids = []
+    for k, reactions in enumerate([chain, chain[:18]], 1):
+        pwy, nodes, edges = _pathway(k, reactions)
+        kg.store.write(nodes, edges)
+        ids.append(pwy)
+
+    result = kg.similar_pathways(ids[0], 3)
+    assert result["pathway_id"] == ids[0]
+    assert [h["pathway_id"] for h in result["similar"]] == [ids[1]]
+    lsh = kg._lsh
+    kg.similar_pathways(ids[1])
+    assert kg._lsh is lsh
+    assert "error" in kg.similar_pathways("pwy:kegg:missing")
+    compound = kg.store._conn.execute(
+        "SELECT id FROM meta_nodes WHERE kind = 'compound' LIMIT 1"
+    ).fetchone()[0]
+    assert "not a pathway" in kg.similar_pathways(compound)["error"]
+    kg.close()
@@ -244,6 +244,22 @@ def test_simulate_fba_no_pathway(kkg_with_minimal_pathway):
     assert "status" in result
 
 
+def test_fba_pruning_matches_unpruned(kkg_with_minimal_pathway):
+    """Pruning blocked reactions keeps the optimum and is cached per scope."""
+    from metakg.simulate import SimulationConfig
+
+    pwy = node_id(KIND_PATHWAY, "kegg", "hsa00010")
+    sim = kkg_with_minimal_pathway.simulator
+    pruned = sim.run_fba(SimulationConfig(pathway_id=pwy))
+    sim.run_fba(SimulationConfig(pathway_id=pwy))
+    raw = sim.run_fba(SimulationConfig(pathway_id=pwy, prune_network=False))
+
+    assert pruned.status == raw.status == "optimal"
+    assert pruned.objective_value == pytest.approx(raw.objective_value, abs=1e-9)
+    assert dict(pruned.fluxes) == pytest.approx(dict(raw.fluxes), abs=1e-9)
+    assert len(sim._compress_cache) == 1
+
+
 # =========================================================================
 # ODE Tests (with timeout guards)
 # =========================================================================
@@ -359,6 +375,399 @@ def test_simulate_ode_tolerances(kkg_with_minimal_pathway):
         assert "status" in result
 
 
+@pytest.mark.timeout(5)
+def test_simulate_ode_stops_at_steady_state(kkg_with_minimal_pathway):
+    """The steady-state event ends integration well before t_end."""
+    kwargs = dict(
+        pathway_id=node_id(KIND_PATHWAY, "kegg", "hsa00010"),
+        t_end=5000.0,
+        t_points=200,
+        initial_concentrations={node_id(KIND_COMPOUND, "kegg", "C00031"): 5.0},
+    )
+    full = kkg_with_minimal_pathway.simulate_ode(**kwargs)
+    early = kkg_with_minimal_pathway.simulate_ode(steady_state_rtol=1e-6, **kwargs)
+
+    assert early["status"] == "ok"
+    assert early["t_steady"] is not None
+    assert early["t_steady"] < 5000.0
+    assert early["t"][-1] == pytest.approx(early["t_steady"])
+    assert len(early["t"]) < len(full["t"])
+    for cpd_id, series in full["concentrations"].items():
+        assert early["concentrations"][cpd_id][-1] == pytest.approx(series[-1], abs=1e-3)
+
+
+@pytest.mark.timeout(10)
+def test_simulate_ode_auto_method(kkg_with_minimal_pathway):
+    """ode_method="auto" picks a solver, records it with timings, and matches BDF."""
+    from metakg.simulate import MetabolicSimulator, SimulationConfig
+
+    sim = MetabolicSimulator(kkg_with_minimal_pathway.store)
+    glc = node_id(KIND_COMPOUND, "kegg", "C00031")
+    base = dict(
+        pathway_id=node_id(KIND_PATHWAY, "kegg", "hsa00010"),
+        t_end=5.0,
+        t_points=20,
+        initial_concentrations={glc: 5.0},
+    )
+    auto = sim.run_ode(SimulationConfig(ode_method="auto", **base))
+    bdf = sim.run_ode(SimulationConfig(ode_method="BDF", **base))
+
+    assert auto.status == "ok"
+    assert auto.method in ("RK45", "BDF", "RK45→BDF")
+    assert auto.stiffness_ratio is not None and auto.stiffness_ratio >= 1.0
+    assert {"setup", "stiffness", "integrate", "total"} <= set(auto.timings)
+    assert bdf.method == "BDF" and bdf.stiffness_ratio is None
+    assert len(auto.t) == len(bdf.t)
+    for cpd_id, conc in bdf.final_concentrations().items():
+        assert auto.final_concentrations()[cpd_id] == pytest.approx(conc, rel=1e-2, abs=1e-3)
+
+
+def test_switching_solver_leaves_explicit_method_on_stiff_system():
+    """An explicit run on the stiff Robertson problem switches to BDF mid-course."""
+    import numpy as np
+    from scipy.integrate import solve_ivp
+
+    from metakg.simulate import _SwitchingSolver
+
+    def f(_t, y):
+        return np.array(
+            [
+                -0.04 * y[0] + 1e4 * y[1] * y[2],
+                0.04 * y[0] - 1e4 * y[1] * y[2] - 3e7 * y[1] ** 2,
+                3e7 * y[1] ** 2,
+            ]
+        )
+
+    def jac(_t, y):
+        return np.array(
+            [
+                [-0.04, 1e4 * y[2], 1e4 * y[1]],
+                [0.04, -1e4 * y[2] - 6e7 * y[1], -1e4 * y[1]],
+                [0.0, 6e7 * y[1], 0.0],
+            ]
+        )
+
+    y0 = np.array([1.0, 0.0, 0.0])
+    solver = _SwitchingSolver("RK45", jac)
+    sol = solver(f, (0.0, 40.0), y0, rtol=1e-4, atol=1e-8)
+    ref = solve_ivp(
+        f, (0.0, 40.0), y0, method="BDF", jac=jac, rtol=1e-6, atol=1e-10, dense_output=True
+    )
+
+    assert solver.label == "RK45→BDF"
+    assert sol.success
+    assert np.allclose(sol.y[:, -1], ref.y[:, -1], rtol=1e-2, atol=1e-6)
+    times = np.array([0.5, 20.0])
+    assert np.allclose(sol.sol(times), ref.sol(times), rtol=1e-2, atol=1e-6)
+
+
+@pytest.mark.timeout(5)
+def test_simulate_ode_adaptive_sampling(kkg_with_minimal_pathway):
+    """Adaptive sampling front-loads points into the initial transient."""
+    result = kkg_with_minimal_pathway.simulate_ode(
+        pathway_id=node_id(KIND_PATHWAY, "kegg", "hsa00010"),
+        t_end=500.0,
+        t_points=50,
+        initial_concentrations={node_id(KIND_COMPOUND, "kegg", "C00031"): 5.0},
+        output_sampling="adaptive",
+    )
+
+    t = result["t"]
+    assert result["status"] == "ok"
+    assert 2 <= len(t) <= 50
+    assert t[0] == 0.0
+    assert t[-1] == pytest.approx(500.0)
+    assert all(a < b for a, b in zip(t, t[1:]))
+    # Uniform sampling would put ~10% of points in the first 10% of the run.
+    assert sum(1 for x in t if x < 50.0) > len(t) // 2
+
+
+# =========================================================================
+# Steady-State Tests
+# =========================================================================
+
+
+@pytest.mark.timeout(5)
+def test_simulate_steady_state_converges(kkg_with_minimal_pathway):
+    """Newton continuation reaches a fixed point with negligible residual."""
+    result = kkg_with_minimal_pathway.simulate_steady_state(
+        pathway_id=node_id(KIND_PATHWAY, "kegg", "hsa00010"),
+        initial_concentrations={node_id(KIND_COMPOUND, "kegg", "C00031"): 5.0},
+    )
+
+    assert result["status"] == "converged", result["message"]
+    assert result["method"] == "newton"
+    assert result["residual"] <= 1e-8
+    assert all(abs(v) < 1e-6 for v in result["fluxes"].values())
+
+
+@pytest.mark.timeout(5)
+def test_simulate_steady_state_matches_long_ode(kkg_with_minimal_pathway):
+    """The direct solve agrees with the end point of a long integration."""
+    pwy = node_id(KIND_PATHWAY, "kegg", "hsa00010")
+    init = {node_id(KIND_COMPOUND, "kegg", "C00031"): 5.0}
+    ss = kkg_with_minimal_pathway.simulate_steady_state(pathway_id=pwy, initial_concentrations=init)
+    ode = kkg_with_minimal_pathway.simulate_ode(
+        pathway_id=pwy, t_end=2000.0, t_points=10, initial_concentrations=init
+    )
+
+    for cpd_id, conc in ss["concentrations"].items():
+        assert conc == pytest.approx(ode["concentrations"][cpd_id][-1], abs=1e-4)
+
+
+@pytest.mark.timeout(5)
+def test_simulate_steady_state_conserves_pools(kkg_with_minimal_pathway):
+    """ATP + ADP is a conserved moiety and must keep its initial total."""
+    atp = node_id(KIND_COMPOUND, "kegg", "C00005")
+    adp = node_id(KIND_COMPOUND, "kegg", "C00008")
+    result = kkg_with_minimal_pathway.simulate_steady_state(
+        pathway_id=node_id(KIND_PATHWAY, "kegg", "hsa00010"),
+        initial_concentrations={atp: 3.0, adp: 0.5},
+    )
+
+    concs = result["concentrations"]
+    assert concs[atp] + concs[adp] == pytest.approx(3.5, rel=1e-8)
+
+
+def test_simulate_steady_state_empty_scope(kkg_with_minimal_pathway):
+    """An unknown pathway yields an error result rather than raising."""
+    result = kkg_with_minimal_pathway.simulate_steady_state(pathway_id="pwy:kegg:nonexistent")
+
+    assert result["status"] == "error"
+
+
+# =========================================================================
+# Conservation-Moiety Tests
+# =========================================================================
+
+
+def test_conservation_laws_left_null_space():
+    """Detected moieties span the left null space of S and round-trip states."""
+    import numpy as np
+
+    from metakg.simulate import ConservationLaws
+
+    # Glc + ATP -> G6P + ADP ; G6P -> Pyr
+    S = np.array([[-1, 0], [-1, 0], [1, -1], [1, 0], [0, 1]], dtype=float)
+    laws = ConservationLaws.from_stoichiometry(S)
+
+    assert laws.n_conserved == 3
+    assert len(laws.independent) == 2
+    assert np.allclose(laws.left_null_space() @ S, 0.0)
+    y = np.array([5.0, 3.0, 1.0, 0.5, 0.0])
+    assert np.allclose(laws.expand(laws.reduce(y), laws.totals(y)), y)
+
+
+def test_product_partials_with_zero_factors():
+    """Partials match the product of the other factors, including at zero saturation."""
+    import numpy as np
+
+    from metakg.simulate import _product_partials, _products
+
+    rxn = np.array([0, 0, 1, 1, 1, 2, 2, 3])
+    sat = np.array([0.5, 0.0, 0.0, 0.0, 0.3, 0.2, 0.4, 0.0])
+    dsat = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0])
+    base = np.array([2.0, 3.0, 5.0, 7.0])
+
+    prod, partial = _product_partials(rxn, sat, dsat, base)
+
+    expected = np.array(
+        [
+            base[rxn[k]] * np.prod(sat[(rxn == rxn[k]) & (np.arange(8) != k)]) * dsat[k]
+            for k in range(8)
+        ]
+    )
+    assert np.allclose(prod, [0.0, 0.0, 5.0 * 0.2 * 0.4, 0.0])
+    assert np.allclose(prod, _products(rxn, sat, base))
+    assert np.allclose(partial, expected)
+
+
+def test_newton_steady_state_keeps_dependent_species_feasible():
+    """Damped Newton steps keep every species non-negative and the totals exact."""
+    import numpy as np
+
+    from metakg.simulate import (
+        ConservationLaws,
+        KineticModel,
+        MetabolicSimulator,
+        ReducedKineticModel,
+    )
+
+    # A + E -> C ; C -> B + E   (E + C is a conserved pool)
+    S = np.array([[-1, 0], [-1, 1], [1, -1], [0, 1]], dtype=float)
+    model = KineticModel.from_matrix(
+        ["r1", "r2"],
+        ["A", "E", "C", "B"],
+        S,
+        {"r1": False, "r2": False},
+        {"r1": {"vmax": 50.0, "km": 0.01}, "r2": {"vmax": 0.1, "km": 0.01}},
+        default_vmax=1.0,
+        default_km=1.0,
+        default_keq=1.0,
+    )
+    y0 = np.array([10.0, 1.0, 0.0, 0.0])
+    laws = ConservationLaws.from_stoichiometry(S)
+    reduced = ReducedKineticModel(model, laws, laws.totals(y0))
+
+    x, _, _, converged = MetabolicSimulator._newton_steady_state(
+        reduced, laws.reduce(y0), tol=1e-9, max_iter=200
+    )
+    y = reduced.expand(x)
+
+    assert converged
+    assert np.all(y >= 0.0)
+    assert np.allclose(laws.left_null_space() @ y, laws.left_null_space() @ y0, rtol=1e-12)
+
+
+@pytest.mark.timeout(5)
+def test_ode_reduced_matches_full(kkg_with_minimal_pathway):
+    """Integrating the reduced system reproduces the full trajectories."""
+    from metakg.simulate import SimulationConfig
+
+    kwargs = dict(
+        pathway_id=node_id(KIND_PATHWAY, "kegg", "hsa00010"),
+        t_end=20.0,
+        t_points=25,
+        initial_concentrations={
+            node_id(KIND_COMPOUND, "kegg", "C00031"): 5.0,
+            node_id(KIND_COMPOUND, "kegg", "C00005"): 3.0,
+        },
+        ode_rtol=1e-8,
+        ode_atol=1e-10,
+    )
+    sim = kkg_with_minimal_pathway.simulator
+    reduced = sim.run_ode(SimulationConfig(**kwargs))
+    full = sim.run_ode(SimulationConfig(reduce_conservation=False, **kwargs))
+
+    assert reduced.status == full.status == "ok"
+    assert "conserved moieties eliminated" in reduced.message
+    assert reduced.compound_ids == full.compound_ids
+    assert abs(reduced.y - full.y).max() < 1e-5
+
+
+# =========================================================================
+# Array-Backed Result Tests
+# =========================================================================
+
+
+@pytest.mark.timeout(5)
+def test_ode_result_views_and_npz_roundtrip(kkg_with_minimal_pathway, tmp_path):
+    """ODEResult keeps one array; dict views and .npz export agree with it."""
+    from metakg.simulate import ODEResult, SimulationConfig
+
+    config = SimulationConfig(
+        pathway_id=node_id(KIND_PATHWAY, "kegg", "hsa00010"),
+        t_end=5.0,
+        t_points=20,
+        initial_concentrations={node_id(KIND_COMPOUND, "kegg", "C00031"): 5.0},
+    )
+    result = kkg_with_minimal_pathway.simulator.run_ode(config)
+    glc = node_id(KIND_COMPOUND, "kegg", "C00031")
+
+    assert result.y.shape == (len(result.compound_ids), 20)
+    assert len(result.t) == 20
+    assert result.concentrations[glc] == result.series(glc).tolist()
+    assert result.concentrations[glc][0] == pytest.approx(5.0)
+    assert set(result.concentrations) == set(result.compound_ids)
+    assert result.final_concentrations()[glc] == pytest.approx(result.y[result.index[glc], -1])
+
+    path = tmp_path / "ode.npz"
+    result.to_npz(path)
+    loaded = ODEResult.from_npz(path)
+    assert loaded.compound_ids == result.compound_ids
+    assert loaded.status == result.status
+    assert (loaded.y == result.y).all()
+    assert (loaded.time == result.time).all()
+    assert loaded.method == result.method == "BDF"
+    assert loaded.timings == result.timings
+
+
+@pytest.mark.timeout(5)
+def test_results_float32_output(kkg_with_minimal_pathway):
+    """output_dtype="float32" halves result storage without changing the API."""
+    from metakg.simulate import SimulationConfig
+
+    pwy = node_id(KIND_PATHWAY, "kegg", "hsa00010")
+    config = SimulationConfig(pathway_id=pwy, t_end=5.0, t_points=20, output_dtype="float32")
+    ode = kkg_with_minimal_pathway.simulator.run_ode(config)
+    fba = kkg_with_minimal_pathway.simulator.run_fba(config)
+
+    assert ode.y.dtype.name == "float32"
+    assert fba.flux_values.dtype.name == "float32"
+    assert all(isinstance(v, float) for v in fba.fluxes.values())
+    assert json.loads(json.dumps(dict(ode.concentrations)))
+
+
+@pytest.mark.timeout(5)
+def test_fba_result_npz_roundtrip(kkg_with_minimal_pathway, tmp_path):
+    """FBAResult fluxes survive an .npz round trip."""
+    from metakg.simulate import FBAResult, SimulationConfig
+
+    config = SimulationConfig(pathway_id=node_id(KIND_PATHWAY, "kegg", "hsa00010"))
+    result = kkg_with_minimal_pathway.simulator.run_fba(config)
+    path = tmp_path / "fba.npz"
+    result.to_npz(path)
+    loaded = FBAResult.from_npz(path)
+
+    assert loaded.objective_value == pytest.approx(result.objective_value)
+    assert dict(loaded.fluxes) == dict(result.fluxes)
+    assert dict(loaded.shadow_prices) == dict(result.shadow_prices)
+
+
+def test_results_accept_legacy_keywords_and_pickles():
+    """The pre-array constructor keywords and pickled __dict__ layouts still work."""
+    from metakg.simulate import FBAResult, ODEResult
+
+    fba = FBAResult("optimal", 2.5, fluxes={"r1": 1.0, "r2": -0.5}, shadow_prices={"c1": 0.25})
+    assert fba.reaction_ids == ("r1", "r2")
+    assert dict(fba.fluxes) == {"r1": 1.0, "r2": -0.5}
+    assert dict(fba.shadow_prices) == {"c1": 0.25}
+
+    ode = ODEResult("ok", t=[0.0, 1.0, 2.0], concentrations={"a": [1.0, 0.5, 0.25], "b": [0, 1, 2]})
+    assert ode.y.shape == (2, 3)
+    assert ode.t == [0.0, 1.0, 2.0]
+    assert ode.concentrations["a"] == [1.0, 0.5, 0.25]
+
+    old_fba = object.__new__(FBAResult)
+    old_fba.__setstate__(
+        {
+            "status": "optimal",
+            "objective_value": 1.0,
+            "fluxes": {"r1": 3.0},
+            "shadow_prices": {},
+            "message": "",
+        }
+    )
+    assert dict(old_fba.fluxes) == {"r1": 3.0}
+    assert old_fba.compound_ids == ()
+
+    old_ode = object.__new__(ODEResult)
+    old_ode.__setstate__(
+        {
+            "status": "ok",
+            "t": [0.0, 1.0],
+            "concentrations": {"a": [2.0, 1.0]},
+            "message": "",
+            "t_steady": None,
+        }
+    )
+    assert old_ode.final_concentrations() == {"a": 1.0}
+    assert old_ode.method == "" and old_ode.timings == {}
+
+
+def test_ode_result_to_arrow(kkg_with_minimal_pathway):
+    """Arrow export produces a time column plus one column per compound."""
+    pytest.importorskip("pyarrow")
+    from metakg.simulate import SimulationConfig
+
+    config = SimulationConfig(
+        pathway_id=node_id(KIND_PATHWAY, "kegg", "hsa00010"), t_end=5.0, t_points=10
+    )
+    table = kkg_with_minimal_pathway.simulator.run_ode(config).to_arrow()
+    assert table.num_rows == 10
+    assert table.column_names[0] == "t"
+
+
 # =========================================================================
 # What-If Tests (with timeout guards)
 # =========================================================================
@@ -442,6 +851,58 @@ def test_simulate_whatif_ode_mode(kkg_with_minimal_pathway):
     assert "perturbed" in result
 
 
+def test_apply_scenario_overlays_without_mutating_baseline(kkg_with_minimal_pathway):
+    """Scenario overlays layer deltas over the baseline maps and leave them untouched."""
+    from collections import ChainMap
+
+    from metakg.simulate import MetabolicSimulator, SimulationConfig, WhatIfScenario
+
+    sim = MetabolicSimulator(kkg_with_minimal_pathway.store)
+    hk = node_id(KIND_ENZYME, "ec", "2.7.1.1")
+    r1 = node_id(KIND_REACTION, "kegg", "R01786")
+    r2 = node_id(KIND_REACTION, "kegg", "R02035")
+    base = SimulationConfig(
+        pathway_id=node_id(KIND_PATHWAY, "kegg", "hsa00010"),
+        flux_bounds={r2: (0.0, 10.0)},
+        vmax_factors={r1: 2.0},
+    )
+    scenario = WhatIfScenario(name="s", enzyme_knockouts=[hk], enzyme_factors={hk: 0.5})
+
+    fba_cfg = sim._apply_scenario(base, scenario, "fba")
+    assert isinstance(fba_cfg.flux_bounds, ChainMap)
+    assert fba_cfg.flux_bounds[r1] == (0.0, 0.0)
+    assert fba_cfg.flux_bounds[r2] == (0.0, 10.0)
+    assert base.flux_bounds == {r2: (0.0, 10.0)}
+
+    ode_cfg = sim._apply_scenario(base, scenario, "ode")
+    assert ode_cfg.vmax_overrides[r1] == 0.0
+    assert ode_cfg.vmax_factors[r1] == pytest.approx(1.0)
+    assert base.vmax_factors == {r1: 2.0} and base.vmax_overrides == {}
+    assert sim._reactions_for_enzyme(hk) == [r1]
+    # The knocked-out reaction stays off under the baseline factor
+    assert sim._build_kinetic_params([r1], ode_cfg)[r1]["vmax"] == 0.0
+
+
+def test_apply_scenario_reads_version_once(kkg_with_minimal_pathway, monkeypatch):
+    """Resolving many enzymes costs one content-version query per scenario."""
+    from metakg.simulate import MetabolicSimulator, SimulationConfig, WhatIfScenario
+
+    store = kkg_with_minimal_pathway.store
+    sim = MetabolicSimulator(store)
+    hk = node_id(KIND_ENZYME, "ec", "2.7.1.1")
+    calls = []
+    real = store.content_version
+    monkeypatch.setattr(store, "content_version", lambda *a: calls.append(a) or real(*a))
+    scenario = WhatIfScenario(
+        name="s",
+        enzyme_knockouts=[hk] * 20,
+        enzyme_factors={f"enz:missing:{i}": 0.5 for i in range(20)},
+    )
+
+    sim._apply_scenario(SimulationConfig(), scenario, "fba")
+    assert len(calls) == 1
+
+
 # =========================================================================
 # Kinetics Tests
 # =========================================================================
@@ -579,3 +1040,22 @@ def test_ode_no_hardcoded_max_step_hang(kkg_with_minimal_pathway):
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+@pytest.mark.parametrize("ode_method", ["BDF", "auto"])
+def test_simulate_ode_span_shorter_than_first_step(kkg_with_minimal_pathway, ode_method):
+    """Runs and windows shorter than the default first step still integrate."""
+    kwargs = dict(
+        pathway_id=node_id(KIND_PATHWAY, "kegg", "hsa00010"),
+        t_points=5,
+        initial_concentrations={node_id(KIND_COMPOUND, "kegg", "C00031"): 5.0},
+        ode_method=ode_method,
+    )
+    short = kkg_with_minimal_pathway.simulate_ode(t_end=1e-4, **kwargs)
+    windowed = kkg_with_minimal_pathway.simulate_ode(
+        t_end=1e3, steady_state_rtol=1e-6, steady_state_window=1e-5, **kwargs
+    )
+
+    assert short["status"] == "ok", short["message"]
+    assert short["t"][-1] == pytest.approx(1e-4)
+    assert windowed["status"] == "ok", windowed["message"]
@@ -18,7 +18,7 @@ from metakg.primitives import (
     MetaNode,
     node_id,
 )
-from metakg.store import MetaStore
+from metakg.store import MetaStore, node_degrees_current, pathway_members_current
 
 
 @pytest.fixture()
@@ -292,3 +292,219 @@ class TestNodeCategory:
         assert "category" in row
         assert row["category"] is None
         store.close()
+
+
+# ---------------------------------------------------------------------------
+# Content versioning
+# ---------------------------------------------------------------------------
+
+
+def test_content_version_tracks_graph_and_kinetics(store):
+    """Any node, edge or kinetic-parameter change yields a new content version."""
+    from metakg.primitives import KineticParam
+
+    graph = ["meta_nodes", "meta_edges"]
+    v0 = store.content_version()
+    nodes = _make_nodes()
+    store.write(nodes, [])
+    v1 = store.content_version()
+    g1 = store.content_version(graph)
+    assert v1 != v0
+
+    store.upsert_kinetic_param(
+        KineticParam(id="kp:test", enzyme_id=None, reaction_id=nodes[0].id, km=0.1)
+    )
+    assert store.content_version() != v1
+    assert store.content_version(graph) == g1
+
+
+# ---------------------------------------------------------------------------
+# Bulk kinetic parameters
+# ---------------------------------------------------------------------------
+
+
+def test_kinetic_params_for_reactions_aggregates(store):
+    """One grouped query aggregates per reaction and per substrate."""
+    from metakg.primitives import KineticParam
+
+    rows = [
+        KineticParam(
+            id="kp1",
+            enzyme_id=None,
+            reaction_id="rxn:a",
+            substrate_id="cpd:x",
+            km=1.0,
+            vmax=2.0,
+            confidence_score=1.0,
+        ),
+        KineticParam(
+            id="kp2",
+            enzyme_id=None,
+            reaction_id="rxn:a",
+            substrate_id="cpd:x",
+            km=3.0,
+            vmax=4.0,
+            confidence_score=0.0,
+        ),
+        KineticParam(
+            id="kp3",
+            enzyme_id=None,
+            reaction_id="rxn:a",
+            substrate_id="cpd:y",
+            km=9.0,
+            vmax=None,
+            confidence_score=1.0,
+        ),
+        KineticParam(id="kp4", enzyme_id=None, reaction_id="rxn:b", equilibrium_constant=5.0),
+    ]
+    store.upsert_kinetic_params(rows)
+
+    mean = store.kinetic_params_for_reactions(["rxn:a", "rxn:b", "rxn:none"])
+    assert set(mean) == {"rxn:a", "rxn:b"}
+    assert mean["rxn:a"]["vmax"] == pytest.approx(3.0)
+    assert mean["rxn:a"]["km"] == pytest.approx(13.0 / 3.0)
+    assert mean["rxn:a"]["km_by_substrate"] == {"cpd:x": 2.0, "cpd:y": 9.0}
+    assert mean["rxn:b"]["vmax"] is None
+    assert mean["rxn:b"]["equilibrium_constant"] == pytest.approx(5.0)
+
+    median = store.kinetic_params_for_reactions(["rxn:a"], agg="median")
+    assert median["rxn:a"]["km"] == pytest.approx(3.0)
+
+    weighted = store.kinetic_params_for_reactions(["rxn:a"], agg="weighted")
+    assert weighted["rxn:a"]["vmax"] == pytest.approx(2.0)
+    assert weighted["rxn:a"]["km_by_substrate"]["cpd:x"] == pytest.approx(1.0)
+
+    with pytest.raises(ValueError):
+        store.kinetic_params_for_reactions(["rxn:a"], agg="mode")
+
+
+# ---------------------------------------------------------------------------
+# Materialised pathway membership
+# ---------------------------------------------------------------------------
+
+
+def test_pathway_members_maintained_on_write(tmp_path):
+    """write() refreshes only touched pathways; external edge edits are detected."""
+    pwy = node_id(KIND_PATHWAY, "kegg", "map00010")
+    other = node_id(KIND_PATHWAY, "kegg", "map00020")
+    rxn = node_id(KIND_REACTION, "kegg", "R00001")
+    sub = node_id(KIND_COMPOUND, "kegg", "C00031")
+    prod = node_id(KIND_COMPOUND, "kegg", "C00022")
+    enz = node_id(KIND_ENZYME, "ec", "2.7.1.1")
+
+    with MetaStore(tmp_path / "m.sqlite") as s:
+        s.write(
+            [
+                MetaNode(id=pwy, kind=KIND_PATHWAY, name="P"),
+                MetaNode(id=other, kind=KIND_PATHWAY, name="Q"),
+                MetaNode(id=rxn, kind=KIND_REACTION, name="R"),
+                MetaNode(id=sub, kind=KIND_COMPOUND, name="S"),
+                MetaNode(id=prod, kind=KIND_COMPOUND, name="T"),
+            ],
+            [
+                MetaEdge(src=pwy, rel="CONTAINS", dst=rxn),
+                MetaEdge(src=sub, rel="SUBSTRATE_OF", dst=rxn),
+                MetaEdge(src=rxn, rel="PRODUCT_OF", dst=prod),
+            ],
+        )
+        assert s.pathway_members(pwy) == sorted([rxn, sub, prod])
+        assert s.pathway_members(pwy, kind="reaction") == [rxn]
+        assert s.pathway_members(pwy, via=["product"]) == [prod]
+        assert s.pathway_members(other) == []
+
+        # An enzyme edge on a contained reaction reaches the pathway incrementally
+        s.write([MetaNode(id=enz, kind=KIND_ENZYME, name="E")], [MetaEdge(enz, "CATALYZES", rxn)])
+        assert s.pathway_members(pwy, via=["catalyzes"]) == [enz]
+        assert pathway_members_current(s._conn)
+
+        # Edges changed behind the store's back are noticed and rebuilt
+        s._conn.execute(
+            "INSERT INTO meta_edges (src, rel, dst) VALUES (?, 'CONTAINS', ?)", (other, rxn)
+        )
+        assert not pathway_members_current(s._conn)
+        assert s.pathway_member_map(kind="reaction") == {pwy: {rxn}, other: {rxn}}
+
+
+def test_single_pathway_refresh_cost_is_independent_of_graph_size(tmp_path):
+    """Refreshing one pathway probes edges from its members instead of scanning meta_edges."""
+    pwy = node_id(KIND_PATHWAY, "kegg", "map00010")
+    rxn = node_id(KIND_REACTION, "kegg", "R00001")
+    sub = node_id(KIND_COMPOUND, "kegg", "C00031")
+
+    def refresh_steps(n_unrelated):
+        nodes = [
+            MetaNode(id=pwy, kind=KIND_PATHWAY, name="P"),
+            MetaNode(id=rxn, kind=KIND_REACTION, name="R"),
+            MetaNode(id=sub, kind=KIND_COMPOUND, name="S"),
+        ]
+        edges = [MetaEdge(pwy, "CONTAINS", rxn), MetaEdge(sub, "SUBSTRATE_OF", rxn)]
+        for i in range(n_unrelated):
+            r, c, e = f"rxn:x:{i}", f"cpd:x:{i}", f"enz:x:{i}"
+            edges += [
+                MetaEdge(c, "SUBSTRATE_OF", r),
+                MetaEdge(r, "PRODUCT_OF", c),
+                MetaEdge(e, "CATALYZES", r),
+            ]
+        with MetaStore(tmp_path / f"g{n_unrelated}.sqlite") as s:
+            s.write(nodes, edges)
+            steps = []
+            s._conn.set_progress_handler(lambda: steps.append(1), 1)
+            s.refresh_pathway_members([pwy])
+            s._conn.set_progress_handler(None, 1)
+            assert s.pathway_members(pwy) == sorted([rxn, sub])
+        return len(steps)
+
+    # SQLite VM instructions, not wall time: a scan of 15k edges costs ~100k
+    assert refresh_steps(5000) < 2 * refresh_steps(0)
+
+
+def test_node_degrees_follow_edge_changes(tmp_path):
+    """Triggers keep node_degrees equal to a recount through inserts, deletes and wipes."""
+    rxn = node_id(KIND_REACTION, "kegg", "R00001")
+    a, b, c = (node_id(KIND_COMPOUND, "kegg", f"C0003{k}") for k in range(3))
+    lone = node_id(KIND_COMPOUND, "kegg", "C09999")
+
+    def recount(s):
+        rows = s._conn.execute("SELECT * FROM node_degrees ORDER BY node_id, rel").fetchall()
+        s.rebuild_node_degrees()
+        again = s._conn.execute("SELECT * FROM node_degrees ORDER BY node_id, rel").fetchall()
+        return [tuple(r) for r in rows], [tuple(r) for r in again]
+
+    with MetaStore(tmp_path / "d.sqlite") as s:
+        assert node_degrees_current(s._conn)
+        s.write(
+            [MetaNode(id=n, kind=KIND_COMPOUND, name=n) for n in (a, b, c, lone)]
+            + [MetaNode(id=rxn, kind=KIND_REACTION, name="R")],
+            [
+                MetaEdge(src=a, rel="SUBSTRATE_OF", dst=rxn),
+                MetaEdge(src=b, rel="SUBSTRATE_OF", dst=rxn),
+                MetaEdge(src=rxn, rel="PRODUCT_OF", dst=c),
+                MetaEdge(src=a, rel="SUBSTRATE_OF", dst=rxn),  # duplicate, ignored
+            ],
+        )
+        assert s.degrees(rxn) == {"SUBSTRATE_OF": (2, 0), "PRODUCT_OF": (0, 1)}
+        assert s.degrees(lone) == {}
+        live, rebuilt = recount(s)
+        assert live == rebuilt
+        s.write([], [MetaEdge(src=c, rel="SUBSTRATE_OF", dst=rxn)])  # recounts touched nodes
+        assert s.degrees(rxn) == {"SUBSTRATE_OF": (3, 0), "PRODUCT_OF": (0, 1)}
+        assert s.degrees(c) == {"SUBSTRATE_OF": (0, 1), "PRODUCT_OF": (1, 0)}
+
+        s._conn.execute("DELETE FROM meta_edges WHERE src IN (?, ?)", (b, c))
+        s._conn.execute("UPDATE meta_edges SET dst = ? WHERE rel = 'PRODUCT_OF'", (lone,))
+        assert s.degrees(b) == {} and s.degrees(lone) == {"PRODUCT_OF": (1, 0)}
+        live, rebuilt = recount(s)
+        assert live == rebuilt
+
+        s.write([], [], wipe=True)
+        assert s._conn.execute("SELECT COUNT(*) FROM node_degrees").fetchone()[0] == 0
+
+    # Databases created before the table existed are backfilled on open
+    conn = sqlite3.connect(tmp_path / "d.sqlite")
+    conn.execute("INSERT INTO meta_edges (src, rel, dst) VALUES (?, 'SUBSTRATE_OF', ?)", (a, rxn))
+    conn.execute("DELETE FROM node_degrees")
+    conn.execute("UPDATE meta_version SET version = -1 WHERE scope = 'node_degrees'")
+    conn.commit()
+    conn.close()
+    with MetaStore(tmp_path / "d.sqlite") as s:
+        assert s.degrees(a) == {"SUBSTRATE_OF": (0, 1)}
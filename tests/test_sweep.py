@@ -0,0 +1,119 @@
+"""
+Tests for metakg.sweep — per-pathway FBA over one shared network.
+"""
+
+import csv
+import json
+
+import pytest
+
+from metakg.primitives import (
+    KIND_COMPOUND,
+    KIND_PATHWAY,
+    KIND_REACTION,
+    MetaEdge,
+    MetaNode,
+    node_id,
+)
+from metakg.simulate import MetabolicSimulator, SimulationConfig
+from metakg.store import MetaStore
+from metakg.sweep import sweep_pathways_fba, write_table
+
+A = node_id(KIND_COMPOUND, "kegg", "C00031")
+B = node_id(KIND_COMPOUND, "kegg", "C00092")
+R_IN = node_id(KIND_REACTION, "kegg", "R00001")
+R1 = node_id(KIND_REACTION, "kegg", "R01786")
+R_OUT = node_id(KIND_REACTION, "kegg", "R00002")
+P_OPEN = node_id(KIND_PATHWAY, "kegg", "map00001")
+P_CLOSED = node_id(KIND_PATHWAY, "kegg", "map00002")
+P_EMPTY = node_id(KIND_PATHWAY, "kegg", "map00003")
+
+_IRREV = json.dumps({"direction": "irreversible"})
+
+
+@pytest.fixture()
+def sim(tmp_path):
+    s = MetaStore(tmp_path / "test.sqlite")
+    s.write(
+        [
+            MetaNode(id=A, kind=KIND_COMPOUND, name="A"),
+            MetaNode(id=B, kind=KIND_COMPOUND, name="B"),
+            MetaNode(id=R_IN, kind=KIND_REACTION, name="uptake", stoichiometry=_IRREV),
+            MetaNode(id=R1, kind=KIND_REACTION, name="convert", stoichiometry=_IRREV),
+            MetaNode(id=R_OUT, kind=KIND_REACTION, name="export", stoichiometry=_IRREV),
+            MetaNode(id=P_OPEN, kind=KIND_PATHWAY, name="Open chain"),
+            MetaNode(id=P_CLOSED, kind=KIND_PATHWAY, name="Closed step"),
+            MetaNode(id=P_EMPTY, kind=KIND_PATHWAY, name="Empty"),
+        ],
+        [
+            MetaEdge(src=R_IN, rel="PRODUCT_OF", dst=A),
+            MetaEdge(src=A, rel="SUBSTRATE_OF", dst=R1),
+            MetaEdge(src=R1, rel="PRODUCT_OF", dst=B),
+            MetaEdge(src=B, rel="SUBSTRATE_OF", dst=R_OUT),
+            MetaEdge(src=P_OPEN, rel="CONTAINS", dst=R_IN),
+            MetaEdge(src=P_OPEN, rel="CONTAINS", dst=R1),
+            MetaEdge(src=P_OPEN, rel="CONTAINS", dst=R_OUT),
+            MetaEdge(src=P_OPEN, rel="CONTAINS", dst=A),
+            MetaEdge(src=P_CLOSED, rel="CONTAINS", dst=R1),
+        ],
+    )
+    yield MetabolicSimulator(s)
+    s.close()
+
+
+def test_sweep_matches_per_pathway_fba(sim):
+    """Each row agrees with a standalone run_fba on that pathway."""
+    rows = {r["pathway_id"]: r for r in sweep_pathways_fba(sim)}
+
+    assert list(rows) == [P_OPEN, P_CLOSED, P_EMPTY]
+    for pwy in (P_OPEN, P_CLOSED):
+        single = sim.run_fba(SimulationConfig(pathway_id=pwy))
+        assert rows[pwy]["status"] == single.status
+        assert rows[pwy]["objective_value"] == pytest.approx(single.objective_value)
+    assert rows[P_OPEN]["n_active"] == 3
+    assert rows[P_OPEN]["n_compounds"] == 2
+    assert rows[P_CLOSED]["n_active"] == 0
+    assert rows[P_EMPTY]["status"] == "empty"
+
+
+def test_sweep_worker_pool_and_csv(sim, tmp_path):
+    """Process workers give the same rows; CSV output has one line per pathway."""
+    serial = list(sweep_pathways_fba(sim))
+    out = tmp_path / "sweep.csv"
+    seen = []
+    n = write_table(
+        sweep_pathways_fba(sim, workers=2, progress=lambda d, t, r: seen.append((d, t))), out
+    )
+
+    with open(out, newline="") as fh:
+        table = list(csv.DictReader(fh))
+    assert n == 3 and seen[-1] == (3, 3)
+    assert [r["pathway_id"] for r in table] == [r["pathway_id"] for r in serial]
+    assert float(table[0]["objective_value"]) == pytest.approx(serial[0]["objective_value"])
+
+
+def test_sweep_parquet(sim, tmp_path):
+    """Parquet output round-trips through pyarrow."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    out = tmp_path / "sweep.parquet"
+    write_table(sweep_pathways_fba(sim, pathway_ids=[P_OPEN]), out)
+
+    table = pq.read_table(out)
+    assert table.num_rows == 1
+    assert table.column("pathway_id").to_pylist() == [P_OPEN]
+
+
+def test_sweep_builds_shared_matrix_sparse(sim, monkeypatch):
+    """The genome-wide S comes from COO triplets and equals the dense build."""
+    scope = SimulationConfig(pathway_id=None, reaction_ids=None)
+    rxn_ids, cpd_ids, S_sparse, _ = sim._build_stoich_sparse(scope)
+    dense_ids = sim._build_stoich_matrix(scope)
+
+    assert (rxn_ids, cpd_ids) == (dense_ids[0], dense_ids[1])
+    assert (S_sparse.toarray() == dense_ids[2]).all()
+
+    def _no_dense(*_args):
+        raise AssertionError("dense stoichiometric matrix built")
+
+    monkeypatch.setattr(sim, "_build_stoich_matrix", _no_dense)
+    assert len(list(sweep_pathways_fba(sim))) == 3